@@ -0,0 +1,214 @@
+"""Bounded per-agent memory of recent executions."""
+
+import random
+import sys
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class AgentMemoryConfig:
+    """Process-wide agent memory settings."""
+
+    max_entries: int = 50  # Summaries kept per agent
+    sample_rate: float = 1.0  # Share of successful runs recorded (failures always are)
+    capture_full: bool = False  # Also keep full metadata copies (debugging only)
+    max_full_entries: int = 10  # Full captures kept per agent
+
+
+memory_config = AgentMemoryConfig()
+
+
+def configure_agent_memory(
+    max_entries: int = 50,
+    sample_rate: float = 1.0,
+    capture_full: bool = False,
+    max_full_entries: int = 10,
+) -> AgentMemoryConfig:
+    """Replace the process-wide agent memory settings.
+
+    Existing agents pick the new settings up on their next recorded run.
+
+    Args:
+        max_entries: Summaries kept per agent
+        sample_rate: Share of successful runs recorded (0-1)
+        capture_full: Whether to also keep full metadata copies
+        max_full_entries: Full captures kept per agent
+
+    Returns:
+        The updated configuration
+    """
+    memory_config.max_entries = max(max_entries, 0)
+    memory_config.sample_rate = min(max(sample_rate, 0.0), 1.0)
+    memory_config.capture_full = capture_full
+    memory_config.max_full_entries = max(max_full_entries, 0)
+    if capture_full:
+        logger.warning(
+            "Full agent memory capture enabled; agents will retain state metadata",
+            max_full_entries=memory_config.max_full_entries,
+        )
+    return memory_config
+
+
+def approximate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Approximate the deep size of an object graph in bytes.
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Sum of ``sys.getsizeof`` over every reachable object, counted once
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approximate_size(key, seen) + approximate_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        for item in obj:
+            size += approximate_size(item, seen)
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += approximate_size(vars(obj), seen)
+    return size
+
+
+class AgentMemory:
+    """Fixed-size ring of compact execution summaries.
+
+    Agents are long-lived singletons shared by every session, so memory only
+    keeps small summaries in a ring buffer. Full metadata copies are opt-in
+    (``capture_full``) and kept in a separate, smaller ring.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        sample_rate: Optional[float] = None,
+        capture_full: Optional[bool] = None,
+    ):
+        """Initialize an empty memory.
+
+        Args:
+            max_entries: Summaries kept (defaults to the process-wide setting)
+            sample_rate: Share of successful runs recorded (defaults to the
+                process-wide setting)
+            capture_full: Whether to keep full metadata copies (defaults to the
+                process-wide setting)
+        """
+        self._max_entries = max_entries
+        self._sample_rate = sample_rate
+        self._capture_full = capture_full
+
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=self.max_entries)
+        self._full_entries: Deque[Dict[str, Any]] = deque(
+            maxlen=memory_config.max_full_entries
+        )
+        self.recorded = 0
+        self.sampled_out = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Ring capacity."""
+        if self._max_entries is not None:
+            return self._max_entries
+        return memory_config.max_entries
+
+    @property
+    def sample_rate(self) -> float:
+        """Share of successful runs recorded."""
+        if self._sample_rate is not None:
+            return self._sample_rate
+        return memory_config.sample_rate
+
+    @property
+    def capture_full(self) -> bool:
+        """Whether full metadata copies are kept."""
+        if self._capture_full is not None:
+            return self._capture_full
+        return memory_config.capture_full
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._entries)
+
+    @property
+    def full_entries(self) -> Iterator[Dict[str, Any]]:
+        """Full captures, oldest first (empty unless ``capture_full``)."""
+        return iter(self._full_entries)
+
+    def record(
+        self,
+        summary: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+        failed: bool = False,
+    ) -> bool:
+        """Record one execution.
+
+        Args:
+            summary: Compact execution summary
+            metadata: State metadata, copied only when full capture is enabled
+            failed: Failed runs bypass sampling
+
+        Returns:
+            Whether the execution was recorded
+        """
+        if not failed and random.random() >= self.sample_rate:
+            self.sampled_out += 1
+            return False
+
+        self._resize()
+        timestamp = datetime.now(timezone.utc).isoformat()
+        if self._entries.maxlen:
+            self._entries.append({"timestamp": timestamp, **summary})
+
+        if self.capture_full and metadata is not None and self._full_entries.maxlen:
+            self._full_entries.append(
+                {
+                    "timestamp": timestamp,
+                    "state_summary": summary,
+                    "metadata": metadata.copy(),
+                }
+            )
+
+        self.recorded += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every recorded execution."""
+        self._entries.clear()
+        self._full_entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupancy and approximate footprint of this memory."""
+        return {
+            "entries": len(self._entries),
+            "capacity": self.max_entries,
+            "full_entries": len(self._full_entries),
+            "recorded": self.recorded,
+            "sampled_out": self.sampled_out,
+            "sample_rate": self.sample_rate,
+            "capture_full": self.capture_full,
+            "approx_bytes": approximate_size(self._entries)
+            + approximate_size(self._full_entries),
+        }
+
+    def _resize(self) -> None:
+        """Apply capacity changes made through ``configure_agent_memory``."""
+        if self._entries.maxlen != self.max_entries:
+            self._entries = deque(self._entries, maxlen=self.max_entries)
+        if self._full_entries.maxlen != memory_config.max_full_entries:
+            self._full_entries = deque(
+                self._full_entries, maxlen=memory_config.max_full_entries
+            )
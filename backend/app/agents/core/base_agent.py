@@ -9,6 +9,8 @@ from langchain_core.language_models.base import BaseLanguageModel
 from langchain_core.tools import BaseTool
 
 from ..states.agent_state import AgentState
+from .agent_memory import AgentMemory
+from .tracing import tracer
 
 logger = structlog.get_logger(__name__)
 
@@ -41,7 +43,7 @@ class BaseAgent(ABC):
 
         # Agent state and memory
         self.state: Optional[AgentState] = None
-        self.memory: List[Dict[str, Any]] = []
+        self.memory = AgentMemory()
         self.created_at = datetime.now(timezone.utc)
 
         # Performance tracking
@@ -139,20 +141,14 @@ class BaseAgent(ABC):
             except (ValueError, TypeError):
                 logger.warning("Could not calculate execution time")
 
-        # Store in memory if significant
+        # Store a compact summary if significant (full metadata only when opted in)
         if self._should_store_in_memory(state):
-            self.memory.append(
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "state_summary": self._get_state_summary(state),
-                    "metadata": state.metadata.copy(),
-                }
+            self.memory.record(
+                self._get_state_summary(state),
+                metadata=state.metadata,
+                failed=state.error_message is not None,
             )
 
-            # Keep memory manageable
-            if len(self.memory) > 100:
-                self.memory = self.memory[-50:]  # Keep last 50 items
-
         if self.verbose:
             logger.info(
                 f"Agent {self.name} completed execution in {state.metadata.get('execution_time', 'unknown')}s"
@@ -186,6 +182,7 @@ class BaseAgent(ABC):
             State summary dictionary
         """
         return {
+            "session_id": state.session_id,
             "step": state.current_step,
             "mood_prompt": state.mood_prompt[:50] + "..."
             if len(state.mood_prompt) > 50
@@ -193,6 +190,7 @@ class BaseAgent(ABC):
             "recommendation_count": len(state.recommendations),
             "has_error": state.error_message is not None,
             "playlist_id": state.playlist_id,
+            "execution_time": state.metadata.get("execution_time"),
         }
 
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -215,6 +213,7 @@ class BaseAgent(ABC):
             "error_count": self.error_count,
             "error_rate": self.error_count / max(self.execution_count, 1),
             "memory_size": len(self.memory),
+            "memory": self.memory.stats(),
             "created_at": self.created_at.isoformat(),
         }
 
@@ -250,27 +249,35 @@ class BaseAgent(ABC):
         Returns:
             Updated agent state with error handling
         """
-        try:
-            # Pre-execution
-            state = await self.pre_execute(state)
-
-            # Main execution
-            state = await self.execute(state)
-
-            # Post-execution
-            state = await self.post_execute(state)
+        with tracer.start_span(
+            f"agent.{self.name}",
+            attributes={"agent.name": self.name, "session.id": state.session_id},
+            root=True,
+        ) as span:
+            try:
+                # Pre-execution
+                state = await self.pre_execute(state)
 
-        except Exception as e:
-            logger.error(f"Error in agent {self.name}: {str(e)}", exc_info=True)
-            self.error_count += 1
+                # Main execution
+                state = await self.execute(state)
 
-            # Update state with error
-            state.error_message = str(e)
-            state.current_step = "failed"
-            state.metadata["error_timestamp"] = datetime.now(timezone.utc).isoformat()
-            state.metadata["error_type"] = type(e).__name__
+                # Post-execution
+                state = await self.post_execute(state)
 
-            # Ensure post-execution still runs for cleanup
-            state = await self.post_execute(state)
+            except Exception as e:
+                logger.error(f"Error in agent {self.name}: {str(e)}", exc_info=True)
+                self.error_count += 1
+                span.record_exception(e)
+
+                # Update state with error
+                state.error_message = str(e)
+                state.current_step = "failed"
+                state.metadata["error_timestamp"] = datetime.now(
+                    timezone.utc
+                ).isoformat()
+                state.metadata["error_type"] = type(e).__name__
+
+                # Ensure post-execution still runs for cleanup
+                state = await self.post_execute(state)
 
         return state
@@ -3,6 +3,7 @@
 import asyncio
 import hashlib
 import pickle
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
@@ -16,6 +17,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from .tracing import tracer
+
 try:
     import redis.asyncio as redis
     from redis.exceptions import ConnectionError, RedisError, TimeoutError
@@ -41,6 +44,8 @@ logger = structlog.get_logger(__name__)
 class Cache:
     """Generic cache interface."""
 
+    backend_name = "generic"
+
     def __init__(self):
         """Initialize cache."""
         self.hit_count = 0
@@ -55,6 +60,15 @@ class Cache:
         Returns:
             Cached value or None if not found
         """
+        with tracer.start_span(
+            "cache.get", attributes={"cache.backend": self.backend_name}
+        ) as span:
+            value = await self._get(key)
+            span.set_attribute("cache.hit", value is not None)
+            return value
+
+    async def _get(self, key: str) -> Optional[Any]:
+        """Backend-specific lookup behind get()."""
         raise NotImplementedError
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -90,6 +104,27 @@ class Cache:
         """Clear all cache entries."""
         raise NotImplementedError
 
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """Try to take a short-lived exclusive lock.
+
+        Args:
+            key: Lock key
+            ttl: Seconds after which the lock expires if never released
+
+        Returns:
+            Token needed to release the lock, or None if someone else holds it
+        """
+        raise NotImplementedError
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """Release a lock if it is still held with this token.
+
+        Args:
+            key: Lock key
+            token: Token returned by acquire_lock
+        """
+        raise NotImplementedError
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
 
@@ -110,6 +145,8 @@ class Cache:
 class MemoryCache(Cache):
     """In-memory cache implementation."""
 
+    backend_name = "memory"
+
     def __init__(self, max_size: int = 1000):
         """Initialize memory cache.
 
@@ -120,8 +157,9 @@ class MemoryCache(Cache):
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.max_size = max_size
         self.access_order: List[str] = []
+        self.locks: Dict[str, Tuple[str, datetime]] = {}
 
-    async def get(self, key: str) -> Optional[Any]:
+    async def _get(self, key: str) -> Optional[Any]:
         """Get value from memory cache."""
         if key in self.cache:
             entry = self.cache[key]
@@ -183,6 +221,23 @@ class MemoryCache(Cache):
         self.cache.clear()
         self.access_order.clear()
 
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """Take a process-local lock (only one process shares a memory cache)."""
+        now = datetime.now(timezone.utc)
+        held = self.locks.get(key)
+        if held is not None and held[1] > now:
+            return None
+
+        token = uuid.uuid4().hex
+        self.locks[key] = (token, now + timedelta(seconds=ttl))
+        return token
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """Release a process-local lock."""
+        held = self.locks.get(key)
+        if held is not None and held[0] == token:
+            del self.locks[key]
+
     async def _evict_lru(self):
         """Evict least recently used entries."""
         if not self.access_order:
@@ -206,6 +261,16 @@ class RedisCache(Cache):
     Optimized with a persistent connection pool for better performance.
     """
 
+    backend_name = "redis"
+
+    # Compare-and-delete so an expired lock re-taken by another worker is kept
+    _RELEASE_LOCK_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
     def __init__(
         self, redis_url: str = "redis://localhost:6379", prefix: str = "agentic:"
     ):
@@ -299,7 +364,7 @@ class RedisCache(Cache):
         before_sleep=before_sleep_log(logger, "WARNING"),
         reraise=False,  # Don't fail the application on cache errors
     )
-    async def get(self, key: str) -> Optional[Any]:
+    async def _get(self, key: str) -> Optional[Any]:
         """Get value from Redis cache.
 
         Retries up to 2 times on connection/timeout errors.
@@ -384,6 +449,31 @@ class RedisCache(Cache):
         except Exception as e:
             logger.error(f"Error clearing Redis cache: {e}")
 
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """Take a lock shared by every worker (SET NX with expiry).
+
+        If Valkey/Redis is unreachable the lock is granted, so callers degrade
+        to per-process coordination instead of stalling.
+        """
+        token = uuid.uuid4().hex
+        try:
+            client = await self._get_client()
+            acquired = await client.set(self._make_key(key), token, nx=True, ex=ttl)
+            return token if acquired else None
+
+        except Exception as e:
+            logger.error(f"Error acquiring Redis lock: {e}")
+            return token
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """Release a shared lock only if this token still owns it."""
+        try:
+            client = await self._get_client()
+            await client.eval(self._RELEASE_LOCK_SCRIPT, 1, self._make_key(key), token)
+
+        except Exception as e:
+            logger.error(f"Error releasing Redis lock: {e}")
+
 
 class CacheManager:
     """Manager for different cache types and strategies."""
@@ -408,8 +498,11 @@ class CacheManager:
             "user_profile": 3600,  # 1 hour
             "top_tracks": 1800,  # 30 minutes
             "top_artists": 1800,  # 30 minutes
+            "taste_profile": 86400,  # 1 day - rebuilt in the background every few hours
             "artist_top_tracks": 7200,  # 2 hours - increased to minimize rate limit hits
             "artist_hybrid_tracks": 300,  # 5 minutes - short-lived cache for album sampling
+            "artist_album_catalog": 259200,  # 3 days - artist discographies change rarely
+            "genre_search": 604800,  # 7 days - served stale and revalidated in the background
             "recommendations": 1800,  # 30 minutes - increased from 15 to reduce API load
             "mood_analysis": 3600,  # 1 hour
             "workflow_state": 300,  # 5 minutes
@@ -418,6 +511,9 @@ class CacheManager:
             "validated_seeds": 7200,  # 2 hours - validated seed lists are stable
             "artist_enrichment": 3600,  # 1 hour - increased from 30min for stability
             "popular_mood_cache": 14400,  # 4 hours - popular mood recommendations
+            "track_energy_analysis": 604800,  # 7 days - per-track energy profiles barely change
+            "track_metadata": 86400,  # 1 day - raw /tracks payloads; bounds popularity staleness
+            "presave_artifacts": 3600,  # 1 hour - name/description/cover prepared before save
         }
 
     def _make_cache_key(self, category: str, *args) -> str:
@@ -534,6 +630,30 @@ class CacheManager:
         ttl = self.default_ttl["top_artists"]
         await self.cache.set(key, artists, ttl)
 
+    async def get_taste_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get a user's precomputed taste profile.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Taste profile or None if not built yet
+        """
+        key = self._make_cache_key("taste_profile", user_id)
+        return await self.cache.get(key)
+
+    async def set_taste_profile(self, user_id: str, profile: Dict[str, Any]) -> None:
+        """Cache a user's taste profile.
+
+        Args:
+            user_id: User ID
+            profile: Top tracks with audio features, top artists, genre
+                histogram and feature centroid
+        """
+        key = self._make_cache_key("taste_profile", user_id)
+        ttl = self.default_ttl["taste_profile"]
+        await self.cache.set(key, profile, ttl)
+
     def _normalize_market_for_cache(self, market: Optional[str]) -> str:
         """Normalize market parameter for cache key generation.
 
@@ -564,6 +684,54 @@ class CacheManager:
         ttl = self.default_ttl["artist_top_tracks"]
         await self.cache.set(key, tracks, ttl)
 
+    async def get_genre_search(
+        self, kind: str, query: str, market: Optional[str], limit: int
+    ) -> Optional[Dict[str, Any]]:
+        """Get cached genre search results shared by all users.
+
+        Args:
+            kind: Search type ("artist" or "track")
+            query: Genre query, e.g. 'genre:"indie pop"'
+            market: Optional ISO 3166-1 alpha-2 country code (None for global)
+            limit: Number of results requested
+
+        Returns:
+            Entry with "results" and "fetched_at" (epoch seconds), or None
+        """
+        cache_market = self._normalize_market_for_cache(market)
+        key = self._make_cache_key(
+            "genre_search", kind, query.strip().lower(), cache_market, limit
+        )
+        return await self.cache.get(key)
+
+    async def set_genre_search(
+        self,
+        kind: str,
+        query: str,
+        market: Optional[str],
+        limit: int,
+        results: List[Dict[str, Any]],
+    ) -> None:
+        """Cache genre search results, stamped with their fetch time.
+
+        Args:
+            kind: Search type ("artist" or "track")
+            query: Genre query
+            market: Optional ISO 3166-1 alpha-2 country code (None for global)
+            limit: Number of results requested
+            results: Search results
+        """
+        cache_market = self._normalize_market_for_cache(market)
+        key = self._make_cache_key(
+            "genre_search", kind, query.strip().lower(), cache_market, limit
+        )
+        ttl = self.default_ttl["genre_search"]
+        await self.cache.set(
+            key,
+            {"results": results, "fetched_at": datetime.now(timezone.utc).timestamp()},
+            ttl,
+        )
+
     async def get_artist_hybrid_tracks_cache(
         self,
         artist_id: str,
@@ -612,6 +780,23 @@ class CacheManager:
         ttl = self.default_ttl["artist_hybrid_tracks"]
         await self.cache.set(key, tracks, ttl)
 
+    async def get_artist_album_catalog(
+        self, artist_id: str, market: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the cached album catalog (albums and their track IDs) for an artist."""
+        cache_market = self._normalize_market_for_cache(market)
+        key = self._make_cache_key("artist_album_catalog", artist_id, cache_market)
+        return await self.cache.get(key)
+
+    async def set_artist_album_catalog(
+        self, artist_id: str, catalog: Dict[str, Any], market: Optional[str] = None
+    ) -> None:
+        """Cache an artist's album catalog for hybrid track sampling."""
+        cache_market = self._normalize_market_for_cache(market)
+        key = self._make_cache_key("artist_album_catalog", artist_id, cache_market)
+        ttl = self.default_ttl["artist_album_catalog"]
+        await self.cache.set(key, catalog, ttl)
+
     async def get_anchor_tracks(
         self, user_id: str, mood_prompt: str
     ) -> Optional[List[Dict[str, Any]]]:
@@ -720,6 +905,99 @@ class CacheManager:
         ttl = self.default_ttl["track_details"]
         await self.cache.set(key, track_data, ttl)
 
+    async def get_track_energy_analyses(
+        self, track_ids: List[str], mood_bucket: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get cached per-track energy analyses for the playlist orderer.
+
+        Args:
+            track_ids: Spotify track IDs to look up
+            mood_bucket: Coarse mood bucket the analyses were produced under
+
+        Returns:
+            Mapping of track_id to cached analysis (misses are omitted)
+        """
+        keys = [
+            self._make_cache_key("track_energy_analysis", track_id, mood_bucket)
+            for track_id in track_ids
+        ]
+        values = await asyncio.gather(*(self.cache.get(key) for key in keys))
+        return {
+            track_id: value
+            for track_id, value in zip(track_ids, values)
+            if value is not None
+        }
+
+    async def set_track_energy_analyses(
+        self, analyses: List[Dict[str, Any]], mood_bucket: str
+    ) -> None:
+        """Cache per-track energy analyses for reuse across playlists.
+
+        Args:
+            analyses: Energy analyses, each carrying its ``track_id``
+            mood_bucket: Coarse mood bucket the analyses were produced under
+        """
+        ttl = self.default_ttl["track_energy_analysis"]
+        await asyncio.gather(
+            *(
+                self.cache.set(
+                    self._make_cache_key(
+                        "track_energy_analysis", analysis["track_id"], mood_bucket
+                    ),
+                    analysis,
+                    ttl,
+                )
+                for analysis in analyses
+                if analysis.get("track_id")
+            )
+        )
+
+    async def get_track_metadata(
+        self, track_ids: List[str], market: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get cached raw Spotify track objects for a market.
+
+        Args:
+            track_ids: Spotify track IDs to look up
+            market: Optional ISO 3166-1 alpha-2 country code (None for global)
+
+        Returns:
+            Mapping of requested track_id to cached track object (misses are omitted)
+        """
+        cache_market = self._normalize_market_for_cache(market)
+        keys = [
+            self._make_cache_key("track_metadata", track_id, cache_market)
+            for track_id in track_ids
+        ]
+        values = await asyncio.gather(*(self.cache.get(key) for key in keys))
+        return {
+            track_id: value
+            for track_id, value in zip(track_ids, values)
+            if value is not None
+        }
+
+    async def set_track_metadata(
+        self, tracks: Dict[str, Dict[str, Any]], market: Optional[str] = None
+    ) -> None:
+        """Cache raw Spotify track objects so other users skip the /tracks call.
+
+        Args:
+            tracks: Mapping of requested track_id to Spotify track object
+            market: Optional ISO 3166-1 alpha-2 country code (None for global)
+        """
+        cache_market = self._normalize_market_for_cache(market)
+        ttl = self.default_ttl["track_metadata"]
+        await asyncio.gather(
+            *(
+                self.cache.set(
+                    self._make_cache_key("track_metadata", track_id, cache_market),
+                    track_data,
+                    ttl,
+                )
+                for track_id, track_data in tracks.items()
+            )
+        )
+
     async def invalidate_user_data(self, user_id: str) -> None:
         """Invalidate all cached data for a user.
 
@@ -833,60 +1111,62 @@ class CacheManager:
         await self.cache.set(key, enrichment_data, ttl)
         logger.info(f"Cached enrichment data for {len(artist_ids)} artists")
 
-    async def warm_user_cache(
-        self, user_id: str, spotify_service, reccobeat_service, access_token: str
+    async def get_presave_artifact(
+        self, session_id: str, kind: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a playlist artifact prepared ahead of save-to-Spotify.
+
+        Args:
+            session_id: Workflow session ID
+            kind: Artifact kind (name, description, cover)
+
+        Returns:
+            Prepared artifact or None if not cached
+        """
+        key = self._make_cache_key("presave_artifacts", session_id, kind)
+        return await self.cache.get(key)
+
+    async def set_presave_artifact(
+        self, session_id: str, kind: str, artifact: Dict[str, Any]
     ) -> None:
-        """Proactively warm cache with user data in background.
+        """Cache a playlist artifact prepared ahead of save-to-Spotify.
 
-        Fire-and-forget cache warming to pre-populate frequently accessed data.
+        Each kind lives under its own key so concurrent preparation steps
+        never overwrite each other.
 
         Args:
-            user_id: User ID
-            spotify_service: Spotify service for fetching data
-            reccobeat_service: RecoBeat service for fetching data
-            access_token: Spotify access token
-        """
-
-        async def warm_cache_background():
-            """Background task to warm cache."""
-            try:
-                logger.info(f"Warming cache for user {user_id}")
-
-                # Warm top tracks cache
-                top_tracks = await spotify_service.get_user_top_tracks(
-                    access_token=access_token,
-                    limit=20,
-                    time_range="medium_term",
-                    user_id=user_id,
-                )
+            session_id: Workflow session ID
+            kind: Artifact kind (name, description, cover)
+            artifact: Prepared value plus the inputs it was generated from
+        """
+        key = self._make_cache_key("presave_artifacts", session_id, kind)
+        ttl = self.default_ttl["presave_artifacts"]
+        await self.cache.set(key, artifact, ttl)
 
-                # Warm top artists cache
-                top_artists = await spotify_service.get_user_top_artists(
-                    access_token=access_token,
-                    limit=15,
-                    time_range="medium_term",
-                    user_id=user_id,
-                )
+    async def acquire_lock(self, name: str, *args, ttl: int = 30) -> Optional[str]:
+        """Try to take a lock shared by every worker using this cache.
 
-                # Warm audio features cache for top tracks
-                if top_tracks and reccobeat_service:
-                    track_ids = [
-                        track.get("id") for track in top_tracks if track.get("id")
-                    ]
-                    if track_ids:
-                        await reccobeat_service.get_tracks_audio_features(track_ids)
-
-                logger.info(
-                    f"Successfully warmed cache for user {user_id}: "
-                    f"{len(top_tracks)} tracks, {len(top_artists)} artists"
-                )
+        Args:
+            name: Lock category
+            *args: Key components
+            ttl: Seconds after which the lock expires if never released
+
+        Returns:
+            Token needed to release the lock, or None if it is held elsewhere
+        """
+        key = self._make_cache_key("lock", name, *args)
+        return await self.cache.acquire_lock(key, ttl)
 
-            except Exception as e:
-                logger.warning(f"Error warming cache for user {user_id}: {e}")
+    async def release_lock(self, name: str, *args, token: str) -> None:
+        """Release a lock taken with acquire_lock.
 
-        # Fire and forget - don't await
-        asyncio.create_task(warm_cache_background())
-        logger.info(f"Started background cache warming for user {user_id}")
+        Args:
+            name: Lock category
+            *args: Key components
+            token: Token returned by acquire_lock
+        """
+        key = self._make_cache_key("lock", name, *args)
+        await self.cache.release_lock(key, token)
 
 
 class CacheManagerProxy:
@@ -0,0 +1,387 @@
+"""Critical-path analysis of workflow traces.
+
+Turns the span tree recorded by ``tracing`` into a breakdown of where a workflow
+run spent its wall-clock time: waiting on each upstream (Spotify, RecoBeat, the
+LLM, cache, database), sleeping in throttles, or running our own code.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .tracing import SPAN_KIND_CLIENT, Span
+
+# Label for wall time with no upstream call or throttle sleep in flight
+SELF_TIME = "cpu_or_untraced"
+THROTTLE = "throttle"
+
+TOP_SLOWEST_CALLS = 5
+
+Interval = Tuple[int, int]
+
+
+def _merge(intervals: Iterable[Interval]) -> List[Interval]:
+    """Merge overlapping intervals."""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _union_ms(intervals: Iterable[Interval]) -> float:
+    """Total length covered by a set of intervals, in milliseconds."""
+    return sum(end - start for start, end in _merge(intervals)) / 1_000_000
+
+
+def _peak_overlap(intervals: Iterable[Interval]) -> int:
+    """Maximum number of intervals in flight at the same instant."""
+    events = []
+    for start, end in intervals:
+        events.append((start, 1))
+        events.append((end, -1))
+    # Ends sort before starts at the same timestamp
+    events.sort(key=lambda event: (event[0], event[1]))
+
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def _round(value: float) -> float:
+    return round(value, 2)
+
+
+class TraceAnalyzer:
+    """Computes the critical-path profile of one workflow trace."""
+
+    def __init__(self, spans: List[Span]):
+        """Index the finished spans of a trace.
+
+        Args:
+            spans: Finished spans of a single trace
+        """
+        self.spans = [span for span in spans if span.end_time_ns is not None]
+        self.by_id = {span.span_id: span for span in self.spans}
+        self.children: Dict[str, List[Span]] = defaultdict(list)
+        for span in self.spans:
+            if span.parent_span_id:
+                self.children[span.parent_span_id].append(span)
+
+    def analyze(self) -> Dict[str, Any]:
+        """Build the full profile.
+
+        Returns:
+            Wall time, per-upstream I/O, throttle sleeps, per-stage concurrency,
+            an exclusive attribution of wall time and the slowest calls
+        """
+        if not self.spans:
+            return {"span_count": 0}
+
+        root = self._find_root()
+        if root is not None:
+            window = (root.start_time_ns, root.end_time_ns)
+        else:
+            window = (
+                min(span.start_time_ns for span in self.spans),
+                max(span.end_time_ns for span in self.spans),
+            )
+        wall_ms = (window[1] - window[0]) / 1_000_000
+
+        calls = [span for span in self.spans if self._upstream(span)]
+        throttles = [span for span in self.spans if span.name == "throttle.sleep"]
+
+        return {
+            "trace_id": self.spans[0].trace_id,
+            "complete": root is not None,
+            "span_count": len(self.spans),
+            "wall_time_ms": _round(wall_ms),
+            "upstreams": self._upstream_breakdown(calls, wall_ms),
+            "throttling": self._throttle_breakdown(throttles),
+            "stages": self._stage_breakdown(),
+            "wall_time_attribution_ms": self._attribute_wall_time(
+                calls, throttles, window
+            ),
+            "slowest_calls": self._slowest_calls(calls, window[0]),
+        }
+
+    def _find_root(self) -> Optional[Span]:
+        roots = [span for span in self.spans if not span.parent_span_id]
+        if not roots:
+            return None
+        return max(roots, key=lambda span: span.end_time_ns - span.start_time_ns)
+
+    def _upstream(self, span: Span) -> Optional[str]:
+        """Name of the upstream a span waited on, or None if it is not an I/O call."""
+        if span.name == "cache.get":
+            return "cache"
+        if span.name.startswith("db."):
+            return "database"
+        if span.name in ("llm.ainvoke", "llm.astream"):
+            return "llm"
+        if span.kind != SPAN_KIND_CLIENT or span.attributes.get("cache.hit"):
+            return None
+
+        host = str(span.attributes.get("server.address", ""))
+        if "spotify" in host:
+            return "spotify"
+        if "reccobeat" in host:
+            return "reccobeat"
+        return host or "http"
+
+    def _descendants(self, span: Span) -> Iterable[Span]:
+        stack = list(self.children.get(span.span_id, []))
+        while stack:
+            child = stack.pop()
+            yield child
+            stack.extend(self.children.get(child.span_id, []))
+
+    def _throttle_ns_within(self, span: Span) -> int:
+        """Throttle sleep time nested inside a span (e.g. retry backoff)."""
+        return sum(
+            child.end_time_ns - child.start_time_ns
+            for child in self._descendants(span)
+            if child.name == "throttle.sleep"
+        )
+
+    def _io_wait_ms(self, span: Span) -> float:
+        return (
+            span.end_time_ns - span.start_time_ns - self._throttle_ns_within(span)
+        ) / 1_000_000
+
+    def _upstream_breakdown(
+        self, calls: List[Span], wall_ms: float
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wall time versus summed I/O wait for every upstream."""
+        grouped: Dict[str, List[Span]] = defaultdict(list)
+        for span in calls:
+            grouped[self._upstream(span)].append(span)
+
+        queue_wait = self._queue_wait_by_upstream()
+
+        breakdown = {}
+        for upstream, spans in sorted(grouped.items()):
+            intervals = [(span.start_time_ns, span.end_time_ns) for span in spans]
+            summed_ms = sum(self._io_wait_ms(span) for span in spans)
+            busy_ms = _union_ms(intervals)
+            breakdown[upstream] = {
+                "calls": len(spans),
+                "errors": sum(1 for span in spans if span.status == "error"),
+                "summed_io_wait_ms": _round(summed_ms),
+                "wall_time_ms": _round(busy_ms),
+                "share_of_wall_time": _round(busy_ms / wall_ms) if wall_ms else 0.0,
+                "avg_concurrency": _round(summed_ms / busy_ms) if busy_ms else 0.0,
+                "peak_concurrency": _peak_overlap(intervals),
+                "queue_wait_ms": _round(queue_wait.get(upstream, 0.0)),
+            }
+        return breakdown
+
+    def _queue_wait_by_upstream(self) -> Dict[str, float]:
+        """Time rate-limited tool requests spent queued behind semaphores/locks.
+
+        A ``<tool>.request`` span covers queueing, throttle sleeps and the HTTP
+        call itself; whatever is left after the latter two is queue time.
+        """
+        waits: Dict[str, float] = defaultdict(float)
+        for span in self.spans:
+            if not span.name.endswith(".request") or span.kind == SPAN_KIND_CLIENT:
+                continue
+            http_children = [
+                child
+                for child in self.children.get(span.span_id, [])
+                if child.kind == SPAN_KIND_CLIENT
+            ]
+            if not http_children:
+                continue
+            upstream = self._upstream(http_children[0]) or "http"
+            busy_ns = sum(
+                child.end_time_ns - child.start_time_ns for child in http_children
+            )
+            throttled_ns = sum(
+                child.end_time_ns - child.start_time_ns
+                for child in self.children.get(span.span_id, [])
+                if child.name == "throttle.sleep"
+            )
+            queued_ns = span.end_time_ns - span.start_time_ns - busy_ns - throttled_ns
+            waits[upstream] += max(0, queued_ns) / 1_000_000
+        return waits
+
+    def _throttle_breakdown(self, throttles: List[Span]) -> Dict[str, Any]:
+        """Time lost to deliberate sleeps, by reason and by tool."""
+        by_reason: Dict[str, Dict[str, Any]] = {}
+        by_tool: Dict[str, float] = defaultdict(float)
+        for span in throttles:
+            reason = span.attributes.get("throttle.reason", "unknown")
+            duration_ms = span.duration_ms
+            entry = by_reason.setdefault(reason, {"sleeps": 0, "summed_ms": 0.0})
+            entry["sleeps"] += 1
+            entry["summed_ms"] += duration_ms
+            by_tool[span.attributes.get("tool.name", "unknown")] += duration_ms
+
+        for entry in by_reason.values():
+            entry["summed_ms"] = _round(entry["summed_ms"])
+
+        return {
+            "summed_ms": _round(sum(span.duration_ms for span in throttles)),
+            "wall_time_ms": _round(
+                _union_ms((span.start_time_ns, span.end_time_ns) for span in throttles)
+            ),
+            "by_reason": by_reason,
+            "by_tool_ms": {tool: _round(ms) for tool, ms in sorted(by_tool.items())},
+        }
+
+    def _stage_breakdown(self) -> List[Dict[str, Any]]:
+        """Concurrency achieved inside each agent run."""
+        stages = []
+        for span in sorted(self.spans, key=lambda s: s.start_time_ns):
+            if not span.name.startswith("agent."):
+                continue
+
+            calls = []
+            throttled = []
+            for child in self._descendants(span):
+                if self._upstream(child):
+                    calls.append(child)
+                elif child.name == "throttle.sleep":
+                    throttled.append(child)
+
+            call_intervals = [(c.start_time_ns, c.end_time_ns) for c in calls]
+            throttle_intervals = [(t.start_time_ns, t.end_time_ns) for t in throttled]
+            wall_ms = span.duration_ms
+            summed_ms = sum(self._io_wait_ms(call) for call in calls)
+            waiting_ms = _union_ms(call_intervals + throttle_intervals)
+
+            per_upstream: Dict[str, float] = defaultdict(float)
+            own_calls: Dict[str, int] = defaultdict(int)
+            for call in calls:
+                upstream = self._upstream(call)
+                per_upstream[upstream] += self._io_wait_ms(call)
+                if self._owning_agent(call) is span:
+                    own_calls[upstream] += 1
+
+            stages.append(
+                {
+                    "stage": span.attributes.get("agent.name", span.name),
+                    "depth": self._agent_depth(span),
+                    "wall_time_ms": _round(wall_ms),
+                    "calls": len(calls),
+                    "summed_io_wait_ms": _round(summed_ms),
+                    "io_wall_time_ms": _round(_union_ms(call_intervals)),
+                    "throttle_ms": _round(sum(t.duration_ms for t in throttled)),
+                    "avg_concurrency": _round(summed_ms / wall_ms) if wall_ms else 0.0,
+                    "peak_concurrency": _peak_overlap(call_intervals),
+                    "self_time_ms": _round(max(0.0, wall_ms - waiting_ms)),
+                    "io_wait_by_upstream_ms": {
+                        upstream: _round(ms)
+                        for upstream, ms in sorted(per_upstream.items())
+                    },
+                    # Excludes calls made by nested agent runs, so these sum
+                    # across stages without double counting
+                    "own_calls_by_upstream": dict(sorted(own_calls.items())),
+                    "status": span.status,
+                }
+            )
+        return stages
+
+    def _owning_agent(self, span: Span) -> Optional[Span]:
+        """Closest enclosing agent span."""
+        parent = self.by_id.get(span.parent_span_id)
+        while parent is not None and not parent.name.startswith("agent."):
+            parent = self.by_id.get(parent.parent_span_id)
+        return parent
+
+    def _agent_depth(self, span: Span) -> int:
+        depth = 0
+        parent = self.by_id.get(span.parent_span_id)
+        while parent is not None:
+            if parent.name.startswith("agent."):
+                depth += 1
+            parent = self.by_id.get(parent.parent_span_id)
+        return depth
+
+    def _attribute_wall_time(
+        self, calls: List[Span], throttles: List[Span], window: Interval
+    ) -> Dict[str, float]:
+        """Split every instant of the run between whatever was in flight.
+
+        Instants where several upstreams overlap are shared evenly between them;
+        instants with nothing in flight are counted as our own time. The values
+        add up to the wall time.
+        """
+        events = []
+        for span in calls:
+            events.append((span.start_time_ns, 1, self._upstream(span)))
+            events.append((span.end_time_ns, -1, self._upstream(span)))
+        for span in throttles:
+            events.append((span.start_time_ns, 1, THROTTLE))
+            events.append((span.end_time_ns, -1, THROTTLE))
+        events.sort(key=lambda event: (event[0], event[1]))
+
+        attribution: Dict[str, float] = defaultdict(float)
+        active: Dict[str, int] = defaultdict(int)
+        cursor = window[0]
+        for timestamp, delta, category in events:
+            timestamp = min(max(timestamp, window[0]), window[1])
+            if timestamp > cursor:
+                in_flight = [name for name, count in active.items() if count > 0]
+                segment = timestamp - cursor
+                if in_flight:
+                    for name in in_flight:
+                        attribution[name] += segment / len(in_flight)
+                else:
+                    attribution[SELF_TIME] += segment
+                cursor = timestamp
+            active[category] += delta
+
+        if window[1] > cursor:
+            attribution[SELF_TIME] += window[1] - cursor
+
+        return {
+            name: _round(ns / 1_000_000)
+            for name, ns in sorted(attribution.items(), key=lambda item: -item[1])
+        }
+
+    def _slowest_calls(self, calls: List[Span], origin_ns: int) -> List[Dict]:
+        """The individual upstream calls that took longest."""
+        slowest = sorted(calls, key=lambda span: span.duration_ms, reverse=True)
+        return [
+            {
+                "name": span.name,
+                "upstream": self._upstream(span),
+                "target": span.attributes.get("http.route")
+                or span.attributes.get("llm.model")
+                or span.attributes.get("cache.backend")
+                or span.attributes.get("db.system"),
+                "tool": span.attributes.get("tool.name"),
+                "agent": self._enclosing_agent(span),
+                "duration_ms": _round(span.duration_ms),
+                "io_wait_ms": _round(self._io_wait_ms(span)),
+                "started_at_ms": _round((span.start_time_ns - origin_ns) / 1_000_000),
+                "status": span.status,
+            }
+            for span in slowest[:TOP_SLOWEST_CALLS]
+        ]
+
+    def _enclosing_agent(self, span: Span) -> Optional[str]:
+        parent = self.by_id.get(span.parent_span_id)
+        while parent is not None:
+            if parent.name.startswith("agent."):
+                return parent.attributes.get("agent.name", parent.name)
+            parent = self.by_id.get(parent.parent_span_id)
+        return None
+
+
+def analyze_trace(spans: List[Span]) -> Dict[str, Any]:
+    """Compute the critical-path profile of a trace.
+
+    Args:
+        spans: Finished spans of a single trace
+
+    Returns:
+        Profile dictionary (see TraceAnalyzer.analyze)
+    """
+    return TraceAnalyzer(spans).analyze()
@@ -0,0 +1,109 @@
+"""Constant-memory latency histograms for performance profiling.
+
+Uses log-linear buckets (the same idea as HDR histograms / DDSketch): every bucket
+covers a fixed relative range, so any quantile is reported within ``precision``
+relative error no matter how many samples were recorded.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+
+class LatencyHistogram:
+    """Streaming histogram of durations with bounded relative error.
+
+    Recording a sample is a single dict increment and needs no lock: under the
+    event loop (and the GIL) each update is atomic, and memory grows with the
+    logarithm of the value range rather than with the number of samples.
+    """
+
+    def __init__(self, precision: float = 0.01, min_value: float = 1e-6):
+        """Initialize an empty histogram.
+
+        Args:
+            precision: Maximum relative error of reported quantiles
+            min_value: Smallest distinguishable value (seconds); smaller samples
+                share the lowest bucket
+        """
+        self.precision = precision
+        self.min_value = min_value
+        self._gamma = (1 + precision) / (1 - precision)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Counter = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        """Record one sample."""
+        self._buckets[self._bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Fold another histogram with the same precision into this one."""
+        self._buckets.update(other._buckets)
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1), or None when empty."""
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, Optional[float]]:
+        """Estimate several quantiles in one pass over the buckets."""
+        targets = sorted(qs)
+        results: Dict[float, Optional[float]] = {q: None for q in targets}
+        if self.count == 0:
+            return results
+
+        pending = iter(targets)
+        q = next(pending, None)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            value = min(max(self._bucket_value(index), self.min), self.max)
+            while q is not None and seen > q * (self.count - 1):
+                results[q] = value
+                q = next(pending, None)
+            if q is None:
+                break
+        while q is not None:
+            results[q] = self.max
+            q = next(pending, None)
+        return results
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Arithmetic mean of all samples."""
+        return self.total / self.count if self.count else None
+
+    def _bucket_index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return max(1, math.ceil(math.log(value / self.min_value) / self._log_gamma))
+
+    def _bucket_value(self, index: int) -> float:
+        if index == 0:
+            return self.min_value
+        # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+        return self.min_value * 2 * self._gamma**index / (self._gamma + 1)
@@ -6,61 +6,89 @@ and detect regressions.
 
 import asyncio
 import functools
+import re
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import structlog
 
-from .cache import cache_manager
+from .histogram import LatencyHistogram
 
 logger = structlog.get_logger(__name__)
 
+# Quantiles reported in stats and the Prometheus exposition
+REPORTED_QUANTILES = (0.5, 0.9, 0.99)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def _normalize_labels(labels: Optional[Dict[str, Any]]) -> LabelSet:
+    """Turn a label dict into a hashable, order-independent key."""
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sanitize_label_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
 
 class PerformanceProfiler:
-    """Tracks performance metrics across the application."""
+    """Tracks performance metrics across the application.
+
+    Each (metric, label set) pair keeps a constant-memory latency histogram, so
+    recording a sample is a couple of in-process increments with no I/O and
+    p50/p90/p99 can be reported at any time.
+    """
 
-    # In-memory storage for recent profiling data
-    _metrics: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    _histograms: Dict[str, Dict[LabelSet, LatencyHistogram]] = defaultdict(dict)
+    # Small ring buffer of raw samples for the debugging samples endpoint
+    _recent: Dict[str, Deque[Dict[str, Any]]] = {}
     _max_samples_per_metric = 100  # Keep last 100 samples per metric
 
     @classmethod
-    async def record_metric(
+    def observe(
         cls,
         metric_name: str,
         duration_seconds: float,
         metadata: Optional[Dict[str, Any]] = None,
+        labels: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Record a performance metric.
+        """Record a performance metric synchronously.
 
         Args:
             metric_name: Name of the metric (e.g., "seed_gathering", "artist_search")
             duration_seconds: Duration in seconds
-            metadata: Optional additional metadata
+            metadata: Optional additional metadata (kept with recent samples only)
+            labels: Optional low-cardinality labels that split the histogram
         """
-        record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "duration_seconds": duration_seconds,
-            "metadata": metadata or {},
-        }
-
-        # Store in memory
-        cls._metrics[metric_name].append(record)
-
-        # Trim to max samples
-        if len(cls._metrics[metric_name]) > cls._max_samples_per_metric:
-            cls._metrics[metric_name] = cls._metrics[metric_name][
-                -cls._max_samples_per_metric :
-            ]
-
-        # Also cache for persistence (1 hour TTL)
-        cache_key = f"profiling:{metric_name}:latest"
-        try:
-            await cache_manager.cache.set(cache_key, record, ttl=3600)
-        except Exception as e:
-            logger.warning(f"Failed to cache profiling metric: {e}")
+        label_set = _normalize_labels(labels)
+        histograms = cls._histograms[metric_name]
+        histogram = histograms.get(label_set)
+        if histogram is None:
+            histogram = histograms.setdefault(label_set, LatencyHistogram())
+        histogram.record(duration_seconds)
+
+        recent = cls._recent.get(metric_name)
+        if recent is None:
+            recent = cls._recent.setdefault(
+                metric_name, deque(maxlen=cls._max_samples_per_metric)
+            )
+        recent.append(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "duration_seconds": duration_seconds,
+                "labels": dict(label_set),
+                "metadata": metadata or {},
+            }
+        )
 
         # Log if duration exceeds threshold
         threshold = (
@@ -74,6 +102,24 @@ class PerformanceProfiler:
                 metadata=metadata,
             )
 
+    @classmethod
+    async def record_metric(
+        cls,
+        metric_name: str,
+        duration_seconds: float,
+        metadata: Optional[Dict[str, Any]] = None,
+        labels: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a performance metric.
+
+        Args:
+            metric_name: Name of the metric (e.g., "seed_gathering", "artist_search")
+            duration_seconds: Duration in seconds
+            metadata: Optional additional metadata
+            labels: Optional low-cardinality labels that split the histogram
+        """
+        cls.observe(metric_name, duration_seconds, metadata, labels)
+
     @classmethod
     def get_metrics(cls, metric_name: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent metrics for a given name.
@@ -85,7 +131,7 @@ class PerformanceProfiler:
         Returns:
             List of recent metric records
         """
-        return cls._metrics.get(metric_name, [])[-limit:]
+        return list(cls._recent.get(metric_name, ()))[-limit:]
 
     @classmethod
     def get_metric_stats(cls, metric_name: str) -> Dict[str, Any]:
@@ -95,27 +141,36 @@ class PerformanceProfiler:
             metric_name: Name of the metric
 
         Returns:
-            Dictionary with min, max, avg, and count
+            Dictionary with count, min, max, avg, p50/p90/p99 and per-label-set stats
         """
-        samples = cls._metrics.get(metric_name, [])
-        if not samples:
+        histograms = cls._histograms.get(metric_name, {})
+        if not histograms:
             return {
                 "metric_name": metric_name,
                 "count": 0,
                 "min": None,
                 "max": None,
                 "avg": None,
+                "p50": None,
+                "p90": None,
+                "p99": None,
             }
 
-        durations = [s["duration_seconds"] for s in samples]
-        return {
+        combined = LatencyHistogram()
+        for histogram in histograms.values():
+            combined.merge(histogram)
+
+        stats = {
             "metric_name": metric_name,
-            "count": len(durations),
-            "min": min(durations),
-            "max": max(durations),
-            "avg": sum(durations) / len(durations),
-            "recent_samples": samples[-5:],  # Last 5 samples
+            **cls._summarize(combined),
+            "recent_samples": cls.get_metrics(metric_name, 5),  # Last 5 samples
         }
+        if len(histograms) > 1 or () not in histograms:
+            stats["by_labels"] = [
+                {"labels": dict(label_set), **cls._summarize(histogram)}
+                for label_set, histogram in histograms.items()
+            ]
+        return stats
 
     @classmethod
     def list_all_metrics(cls) -> List[str]:
@@ -124,7 +179,69 @@ class PerformanceProfiler:
         Returns:
             List of metric names
         """
-        return list(cls._metrics.keys())
+        return list(cls._histograms.keys())
+
+    @classmethod
+    def render_prometheus(cls, namespace: str = "moodlist") -> str:
+        """Render all histograms in the Prometheus text exposition format.
+
+        Every metric is exported as a summary named
+        ``<namespace>_profile_duration_seconds`` with a ``metric`` label plus its
+        own labels.
+
+        Args:
+            namespace: Metric name prefix
+
+        Returns:
+            Exposition text (content type ``text/plain; version=0.0.4``)
+        """
+        name = f"{namespace}_profile_duration_seconds"
+        lines = [
+            f"# HELP {name} Duration of profiled operations in seconds.",
+            f"# TYPE {name} summary",
+        ]
+
+        for metric_name, histograms in list(cls._histograms.items()):
+            for label_set, histogram in list(histograms.items()):
+                base_labels = [("metric", metric_name)] + [
+                    (_sanitize_label_name(k), v) for k, v in label_set
+                ]
+                quantiles = histogram.quantiles(REPORTED_QUANTILES)
+                for q in REPORTED_QUANTILES:
+                    value = quantiles[q]
+                    labels = cls._format_labels(base_labels + [("quantile", str(q))])
+                    lines.append(
+                        f"{name}{labels} {value if value is not None else 'NaN'}"
+                    )
+                labels = cls._format_labels(base_labels)
+                lines.append(f"{name}_sum{labels} {histogram.total}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all recorded metrics."""
+        cls._histograms.clear()
+        cls._recent.clear()
+
+    @staticmethod
+    def _format_labels(labels: List[Tuple[str, str]]) -> str:
+        inner = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in labels)
+        return "{" + inner + "}"
+
+    @staticmethod
+    def _summarize(histogram: LatencyHistogram) -> Dict[str, Any]:
+        quantiles = histogram.quantiles(REPORTED_QUANTILES)
+        return {
+            "count": histogram.count,
+            "min": histogram.min,
+            "max": histogram.max,
+            "avg": histogram.mean,
+            "p50": quantiles[0.5],
+            "p90": quantiles[0.9],
+            "p99": quantiles[0.99],
+        }
 
 
 @contextmanager
@@ -140,24 +257,12 @@ def profile(metric_name: str, metadata: Optional[Dict[str, Any]] = None):
             # ... code to profile
             pass
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         yield
     finally:
-        duration = time.time() - start_time
-        # Use asyncio to record metric (will be scheduled)
-        try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(
-                PerformanceProfiler.record_metric(metric_name, duration, metadata)
-            )
-        except RuntimeError:
-            # No event loop, just log
-            logger.info(
-                f"Profile: {metric_name}",
-                duration_seconds=f"{duration:.2f}",
-                metadata=metadata,
-            )
+        duration = time.perf_counter() - start_time
+        PerformanceProfiler.observe(metric_name, duration, metadata)
 
 
 @asynccontextmanager
@@ -173,12 +278,12 @@ async def profile_async(metric_name: str, metadata: Optional[Dict[str, Any]] = N
             # ... async code to profile
             await something()
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         yield
     finally:
-        duration = time.time() - start_time
-        await PerformanceProfiler.record_metric(metric_name, duration, metadata)
+        duration = time.perf_counter() - start_time
+        PerformanceProfiler.observe(metric_name, duration, metadata)
 
 
 def profile_function(metric_name: Optional[str] = None):
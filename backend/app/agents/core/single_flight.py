@@ -0,0 +1,101 @@
+"""Single-flight coalescing of identical concurrent workflow stages.
+
+When several users submit the same prompt at once (a trending mood, a shared
+link), the user-independent stages of their workflows - mood analysis, artist
+discovery searches, genre-based anchor candidates - would otherwise run once
+per workflow. A ``SingleFlight`` runs one execution per key and hands every
+concurrent caller the result.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_flights: Dict[str, "SingleFlight"] = {}
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a mood prompt for use in a coalescing key."""
+    return " ".join((prompt or "").lower().split())
+
+
+def make_flight_key(*parts: Any) -> str:
+    """Build a stable key from JSON-serializable stage inputs."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    __slots__ = ("task", "callers")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.callers = 1
+
+
+class SingleFlight:
+    """Runs at most one execution per key; concurrent callers share its result.
+
+    The shared execution runs as its own task and callers await it through
+    ``asyncio.shield``, so a cancelled workflow never cancels work other
+    workflows are waiting on. When the result was shared, every caller gets a
+    deep copy because the stages mutate what they return.
+    """
+
+    def __init__(self, name: str):
+        """Initialize the flight group and register it for stats.
+
+        Args:
+            name: Stage name used in logs and stats
+        """
+        self.name = name
+        self._inflight: Dict[str, _Flight] = {}
+        self.stats: Dict[str, int] = {"executions": 0, "coalesced": 0}
+        _flights[name] = self
+
+    async def run(self, key: str, work: Callable[[], Awaitable[T]]) -> T:
+        """Run ``work`` for ``key``, or join the execution already in flight.
+
+        Args:
+            key: Coalescing key built from the stage inputs
+            work: Zero-argument coroutine function performing the stage
+
+        Returns:
+            Result of the (possibly shared) execution
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.create_task(self._execute(key, work)))
+            self._inflight[key] = flight
+            self.stats["executions"] += 1
+        else:
+            flight.callers += 1
+            self.stats["coalesced"] += 1
+            logger.debug("Joining in-flight stage execution", stage=self.name)
+
+        result = await asyncio.shield(flight.task)
+        # The key is dropped before the task finishes, so callers is final here
+        return result if flight.callers == 1 else copy.deepcopy(result)
+
+    async def _execute(self, key: str, work: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await work()
+        finally:
+            self._inflight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Execution and coalescing counters."""
+        return {**self.stats, "in_flight": len(self._inflight)}
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Counters of every registered flight group, by stage name."""
+    return {name: flight.get_stats() for name, flight in _flights.items()}
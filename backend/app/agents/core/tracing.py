@@ -0,0 +1,453 @@
+"""Workflow tracing with OpenTelemetry-compatible spans.
+
+Spans form a tree per workflow run: the workflow root span contains one span per
+agent, and those contain the HTTP requests, LLM calls, cache reads and database
+writes made on their behalf. The active span travels in a ``ContextVar`` so
+children created inside ``asyncio.gather`` tasks attach to the right parent.
+
+Finished spans are handed to exporters. The in-memory exporter keeps the most
+recent traces for local inspection and the file exporter appends one OTLP-style
+JSON object per span to a JSONL file, which can be loaded into any OTLP viewer.
+"""
+
+import asyncio
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_CLIENT = "client"
+
+_OTLP_SPAN_KINDS = {
+    SPAN_KIND_INTERNAL: "SPAN_KIND_INTERNAL",
+    SPAN_KIND_CLIENT: "SPAN_KIND_CLIENT",
+}
+
+# Reasons recorded on throttle.sleep spans
+THROTTLE_MIN_INTERVAL = "min_request_interval"
+THROTTLE_RATE_LIMIT_WINDOW = "rate_limit_window"
+THROTTLE_RETRY_AFTER = "retry_after"
+THROTTLE_RETRY_BACKOFF = "retry_backoff"
+THROTTLE_BATCH_SPACING = "batch_spacing"
+
+STATUS_UNSET = "unset"
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+
+class Span:
+    """A single timed operation within a trace."""
+
+    is_recording = True
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str] = None,
+        kind: str = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """Start a span.
+
+        Args:
+            name: Operation name
+            trace_id: 32-hex-digit trace ID shared by the whole tree
+            parent_span_id: Span ID of the parent, None for the root span
+            kind: Span kind (internal or client)
+            attributes: Initial span attributes
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._start_perf = time.perf_counter_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set one attribute."""
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        """Set several attributes at once."""
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """Record a point-in-time event on the span."""
+        self.events.append(
+            {
+                "name": name,
+                "time_unix_nano": time.time_ns(),
+                "attributes": dict(attributes or {}),
+            }
+        )
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span as failed and attach the exception details."""
+        self.status = STATUS_ERROR
+        self.status_message = str(exc) or type(exc).__name__
+        self.add_event(
+            "exception",
+            {"exception.type": type(exc).__name__, "exception.message": str(exc)},
+        )
+
+    def end(self) -> None:
+        """Stop the span clock (idempotent)."""
+        if self.end_time_ns is None:
+            # Monotonic duration, anchored to the wall-clock start time
+            elapsed = time.perf_counter_ns() - self._start_perf
+            self.end_time_ns = self.start_time_ns + elapsed
+            if self.status == STATUS_UNSET:
+                self.status = STATUS_OK
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Span duration in milliseconds, None while the span is open."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize as an OTLP/JSON span."""
+        status: Dict[str, Any] = {"code": f"STATUS_CODE_{self.status.upper()}"}
+        if self.status_message:
+            status["message"] = self.status_message
+
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": _OTLP_SPAN_KINDS.get(self.kind, "SPAN_KIND_INTERNAL"),
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or 0),
+            "attributes": _to_otlp_attributes(self.attributes),
+            "events": [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": str(event["time_unix_nano"]),
+                    "attributes": _to_otlp_attributes(event["attributes"]),
+                }
+                for event in self.events
+            ],
+            "status": status,
+        }
+
+
+class _NonRecordingSpan:
+    """Stand-in span used when tracing is off or a leaf call has no parent trace."""
+
+    is_recording = False
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+_NON_RECORDING_SPAN = _NonRecordingSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _to_otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a flat attribute dict to OTLP key/value pairs."""
+    converted = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        converted.append({"key": key, "value": typed})
+    return converted
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans of the most recent traces in memory."""
+
+    def __init__(self, max_traces: int = 200, max_spans_per_trace: int = 5000):
+        """Initialize the exporter.
+
+        Args:
+            max_traces: Number of traces kept before the oldest is evicted
+            max_spans_per_trace: Spans kept per trace (extra spans are dropped)
+        """
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._dropped: Dict[str, int] = {}
+
+    def export(self, span: Span) -> None:
+        """Store a finished span."""
+        spans = self._traces.get(span.trace_id)
+        if spans is None:
+            spans = self._traces[span.trace_id] = []
+            while len(self._traces) > self.max_traces:
+                evicted, _ = self._traces.popitem(last=False)
+                self._dropped.pop(evicted, None)
+
+        if len(spans) >= self.max_spans_per_trace:
+            self._dropped[span.trace_id] = self._dropped.get(span.trace_id, 0) + 1
+            return
+        spans.append(span)
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """Get the finished spans of a trace, in completion order."""
+        return list(self._traces.get(trace_id, []))
+
+    def dropped_span_count(self, trace_id: str) -> int:
+        """Number of spans dropped for a trace because it hit the span limit."""
+        return self._dropped.get(trace_id, 0)
+
+    def clear(self) -> None:
+        """Forget all stored traces."""
+        self._traces.clear()
+        self._dropped.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter:
+    """Appends finished spans to a JSONL file, one OTLP/JSON span per line."""
+
+    def __init__(self, path: str):
+        """Initialize the exporter.
+
+        Args:
+            path: Output file; parent directories are created when missing
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Write one span."""
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def shutdown(self) -> None:
+        """Close the output file."""
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Creates spans and routes finished ones to the configured exporters."""
+
+    def __init__(self, enabled: bool = True, max_traces: int = 200):
+        """Initialize the tracer.
+
+        Args:
+            enabled: Whether spans are recorded at all
+            max_traces: Traces kept by the in-memory exporter
+        """
+        self.enabled = enabled
+        self.memory_exporter = InMemorySpanExporter(max_traces=max_traces)
+        self.exporters: List[Any] = [self.memory_exporter]
+        self._session_traces: "OrderedDict[str, str]" = OrderedDict()
+
+    def add_exporter(self, exporter: Any) -> None:
+        """Register an additional exporter (anything with export/shutdown)."""
+        self.exporters.append(exporter)
+
+    def current_span(self):
+        """Get the active span, or a non-recording span outside any trace."""
+        return _current_span.get() or _NON_RECORDING_SPAN
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = SPAN_KIND_INTERNAL,
+        root: bool = False,
+    ) -> Iterator[Any]:
+        """Run a block inside a new child span.
+
+        Leaf operations (HTTP, LLM, cache, database) only record when a trace is
+        already active, so calls made outside a workflow stay free of overhead.
+
+        Args:
+            name: Operation name
+            attributes: Initial span attributes
+            kind: Span kind (internal or client)
+            root: Start a new trace when no span is active
+
+        Yields:
+            The span (a non-recording stand-in when nothing is traced)
+        """
+        parent = _current_span.get()
+        if not self.enabled or (parent is None and not root):
+            yield _NON_RECORDING_SPAN
+            return
+
+        if parent is None:
+            span = Span(name, secrets.token_hex(16), None, kind, attributes)
+            session_id = span.attributes.get("session.id")
+            if session_id:
+                self._remember_session(str(session_id), span.trace_id)
+        else:
+            span = Span(name, parent.trace_id, parent.span_id, kind, attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self._export(span)
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """Get the finished spans of a trace from the in-memory exporter."""
+        return self.memory_exporter.get_trace(trace_id)
+
+    def get_session_trace_id(self, session_id: str) -> Optional[str]:
+        """Get the ID of the most recent trace started for a workflow session."""
+        return self._session_traces.get(session_id)
+
+    def get_session_spans(self, session_id: str) -> List[Span]:
+        """Get the finished spans of a workflow session's most recent trace."""
+        trace_id = self._session_traces.get(session_id)
+        return self.get_trace(trace_id) if trace_id else []
+
+    def shutdown(self) -> None:
+        """Flush and close every exporter."""
+        for exporter in self.exporters:
+            try:
+                exporter.shutdown()
+            except Exception as e:
+                logger.warning("Error shutting down span exporter", error=str(e))
+
+    def _remember_session(self, session_id: str, trace_id: str) -> None:
+        self._session_traces[session_id] = trace_id
+        self._session_traces.move_to_end(session_id)
+        while len(self._session_traces) > self.memory_exporter.max_traces:
+            self._session_traces.popitem(last=False)
+
+    def _export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.warning(
+                    "Error exporting span", span_name=span.name, error=str(e)
+                )
+
+
+# Global tracer instance (disabled until configure_tracing() opts in)
+tracer = Tracer(enabled=False)
+
+
+async def traced_sleep(seconds: float, reason: str, **attributes: Any) -> None:
+    """Sleep for a throttle or backoff delay, recorded as a ``throttle.sleep`` span.
+
+    Args:
+        seconds: Delay in seconds
+        reason: Why the caller is waiting (one of the THROTTLE_* constants)
+        **attributes: Extra span attributes (e.g. tool name)
+    """
+    with tracer.start_span(
+        "throttle.sleep",
+        attributes={
+            "throttle.reason": reason,
+            "throttle.requested_ms": round(seconds * 1000, 3),
+            **attributes,
+        },
+    ):
+        await asyncio.sleep(seconds)
+
+
+class UpstreamCallCounter:
+    """External API and LLM calls made within an ``upstream_call_counter()`` block."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+
+_upstream_call_counter: ContextVar[Optional[UpstreamCallCounter]] = ContextVar(
+    "upstream_call_counter", default=None
+)
+
+
+@contextmanager
+def upstream_call_counter() -> Iterator[UpstreamCallCounter]:
+    """Count the upstream calls made by this block and the tasks it starts.
+
+    Unlike the trace, the counter works with tracing disabled, and concurrent
+    workflows never count each other's calls. Cache hits are not calls.
+    """
+    counter = UpstreamCallCounter()
+    token = _upstream_call_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _upstream_call_counter.reset(token)
+
+
+def record_upstream_call() -> None:
+    """Count one external API or LLM call toward the enclosing counter, if any."""
+    counter = _upstream_call_counter.get()
+    if counter is not None:
+        counter.calls += 1
+
+
+def configure_tracing(
+    enabled: bool = True, export_file: Optional[str] = None, max_traces: int = 200
+) -> Tracer:
+    """Replace the global tracer's configuration.
+
+    Args:
+        enabled: Whether spans are recorded
+        export_file: Optional JSONL file that receives every finished span
+        max_traces: Traces kept in memory
+
+    Returns:
+        The configured global tracer
+    """
+    tracer.shutdown()
+    tracer.enabled = enabled
+    tracer.memory_exporter = InMemorySpanExporter(max_traces=max_traces)
+    tracer.exporters = [tracer.memory_exporter]
+    if enabled and export_file:
+        tracer.add_exporter(FileSpanExporter(export_file))
+        logger.info("Exporting trace spans to file", path=export_file)
+    return tracer
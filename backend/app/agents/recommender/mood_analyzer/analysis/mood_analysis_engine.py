@@ -6,6 +6,7 @@ import structlog
 from langchain_core.language_models.base import BaseLanguageModel
 from langchain_core.messages import AIMessage
 
+from ....core.single_flight import SingleFlight, make_flight_key, normalize_prompt
 from ...utils.llm_response_parser import LLMResponseParser
 from ..prompts import get_mood_analysis_system_prompt
 from ..text import TextProcessor
@@ -13,6 +14,8 @@ from .mood_profile_matcher import MoodProfileMatcher
 
 logger = structlog.get_logger(__name__)
 
+_analysis_flight = SingleFlight("mood_analysis")
+
 
 class MoodAnalysisEngine:
     """Engine for analyzing mood prompts using LLM or fallback methods."""
@@ -30,12 +33,19 @@ class MoodAnalysisEngine:
     async def analyze_mood(self, mood_prompt: str) -> Dict[str, Any]:
         """Analyze mood using LLM or fallback method.
 
+        Concurrent workflows with the same (normalized) prompt share one
+        analysis.
+
         Args:
             mood_prompt: User's mood description
 
         Returns:
             Comprehensive mood analysis
         """
+        key = make_flight_key(normalize_prompt(mood_prompt), self.llm is not None)
+        return await _analysis_flight.run(key, lambda: self._analyze(mood_prompt))
+
+    async def _analyze(self, mood_prompt: str) -> Dict[str, Any]:
         if self.llm:
             return await self._analyze_mood_with_llm(mood_prompt)
         else:
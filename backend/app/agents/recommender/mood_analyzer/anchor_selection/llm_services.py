@@ -6,6 +6,7 @@ import structlog
 from langchain_core.language_models.base import BaseLanguageModel
 
 from ...utils.llm_response_parser import LLMResponseParser
+from ...utils.streaming_json import astream_json_array_fields
 from .prompts import (
     get_anchor_finalization_prompt,
     get_anchor_scoring_prompt,
@@ -450,11 +451,15 @@ class LLMServices:
             prompt = get_batch_artist_validation_prompt(
                 artists, mood_prompt, mood_analysis
             )
-            response = await self.llm.ainvoke([{"role": "user", "content": prompt}])
-            result = LLMResponseParser.extract_json_from_response(response)
+            # Only the two arrays are used, so the trailing summary is skipped
+            result = await astream_json_array_fields(
+                self.llm,
+                [{"role": "user", "content": prompt}],
+                keys=("keep_artists", "filtered_artists"),
+            )
 
-            keep_indices = result.get("keep_artists", [])
-            filtered_info = result.get("filtered_artists", [])
+            keep_indices = result["keep_artists"]
+            filtered_info = result["filtered_artists"]
 
             # Log filtered artists
             for filter_info in filtered_info:
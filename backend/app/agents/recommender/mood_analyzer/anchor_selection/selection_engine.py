@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
+from ....core.single_flight import SingleFlight, make_flight_key, normalize_prompt
 from ...utils.config import config
 from .artist_processor import ArtistProcessor
 from .llm_services import LLMServices
@@ -12,6 +13,8 @@ from .track_processor import TrackProcessor
 
 logger = structlog.get_logger(__name__)
 
+_genre_candidates_flight = SingleFlight("genre_anchor_candidates")
+
 
 class AnchorSelectionEngine:
     """Main engine for anchor track selection using modular components."""
@@ -710,6 +713,38 @@ class AnchorSelectionEngine:
     ) -> List[Dict[str, Any]]:
         """Get anchor candidates from genre-based track search.
 
+        Concurrent workflows with the same prompt and inputs share one search.
+        """
+        key = make_flight_key(
+            normalize_prompt(mood_prompt),
+            genres,
+            target_features,
+            temporal_context,
+            skip_audio_features,
+        )
+        return await _genre_candidates_flight.run(
+            key,
+            lambda: self._search_genre_based_candidates(
+                genres,
+                target_features,
+                access_token,
+                mood_prompt,
+                temporal_context,
+                skip_audio_features,
+            ),
+        )
+
+    async def _search_genre_based_candidates(
+        self,
+        genres: List[str],
+        target_features: Dict[str, Any],
+        access_token: str,
+        mood_prompt: str = "",
+        temporal_context: Optional[Dict[str, Any]] = None,
+        skip_audio_features: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Search genre tracks and score them into anchor candidates.
+
         Optimized: All genre searches run in parallel, then audio features are batched
         to avoid rate limit issues.
         """
@@ -7,10 +7,13 @@ from typing import Any, Dict, List, Optional, Set
 import structlog
 from langchain_core.language_models.base import BaseLanguageModel
 
+from .....services.spotify_token_manager import spotify_token_manager
+from ....core.single_flight import SingleFlight, make_flight_key, normalize_prompt
 from ...utils.artist_utils import ArtistDeduplicator
 from ...utils.config import config
 from ...utils.llm_response_parser import LLMResponseParser
 from ...utils.regional_filter import RegionalFilter
+from ...utils.streaming_json import astream_json_array_fields
 from ..prompts import (
     get_artist_filtering_prompt,
     get_batch_artist_validation_prompt,
@@ -19,6 +22,8 @@ from ..text import TextProcessor
 
 logger = structlog.get_logger(__name__)
 
+_search_flight = SingleFlight("artist_discovery_search")
+
 
 class ArtistDiscovery:
     """Handles Spotify artist discovery and filtering for mood-based playlists."""
@@ -90,7 +95,7 @@ class ArtistDiscovery:
         try:
             logger.info("Starting artist discovery for mood")
 
-            access_token = self._get_access_token(state)
+            access_token = await self._get_access_token(state)
             if not access_token:
                 return
 
@@ -122,8 +127,8 @@ class ArtistDiscovery:
             logger.error(f"Error in artist discovery: {str(e)}", exc_info=True)
             # Don't fail the whole pipeline, just continue without artist discovery
 
-    def _get_access_token(self, state) -> Optional[str]:
-        """Extract and validate Spotify access token from state.
+    async def _get_access_token(self, state) -> Optional[str]:
+        """Get a fresh Spotify access token for the workflow.
 
         Args:
             state: Current agent state
@@ -131,7 +136,7 @@ class ArtistDiscovery:
         Returns:
             Access token or None if not available
         """
-        access_token = state.metadata.get("spotify_access_token")
+        access_token = await spotify_token_manager.get_token_for_state(state)
         if not access_token:
             logger.warning("No Spotify access token available for artist discovery")
         return access_token
@@ -150,8 +155,12 @@ class ArtistDiscovery:
             List of unique candidate artists
         """
         search_params = self._extract_search_parameters(state, mood_analysis)
-        all_artists = await self._gather_artists_from_sources(
-            search_params, access_token
+        # The searches depend only on the prompt and its search parameters, so
+        # concurrent workflows for the same prompt share one round of them
+        key = make_flight_key(normalize_prompt(state.mood_prompt), search_params)
+        all_artists = await _search_flight.run(
+            key,
+            lambda: self._gather_artists_from_sources(search_params, access_token),
         )
 
         unique_artists = ArtistDeduplicator.deduplicate(all_artists)
@@ -656,11 +665,15 @@ class ArtistDiscovery:
                 prompt = get_batch_artist_validation_prompt(
                     batch, mood_prompt, mood_analysis
                 )
-                response = await self.llm.ainvoke([{"role": "user", "content": prompt}])
-                result = LLMResponseParser.extract_json_from_response(response)
+                # Only the two arrays are used, so the trailing summary is skipped
+                result = await astream_json_array_fields(
+                    self.llm,
+                    [{"role": "user", "content": prompt}],
+                    keys=("keep_artists", "filtered_artists"),
+                )
 
-                keep_indices = result.get("keep_artists", [])
-                filtered_info = result.get("filtered_artists", [])
+                keep_indices = result["keep_artists"]
+                filtered_info = result["filtered_artists"]
 
                 # Log filtered artists and track their IDs
                 for filter_info in filtered_info:
@@ -4,11 +4,13 @@ from .cohesion_calculator import CohesionCalculator
 from .improvement_strategy import ImprovementStrategy
 from .orchestrator_agent import OrchestratorAgent
 from .quality_evaluator import QualityEvaluator
+from .quality_tracker import QualityTracker
 from .recommendation_processor import RecommendationProcessor
 
 __all__ = [
     "OrchestratorAgent",
     "QualityEvaluator",
+    "QualityTracker",
     "CohesionCalculator",
     "ImprovementStrategy",
     "RecommendationProcessor",
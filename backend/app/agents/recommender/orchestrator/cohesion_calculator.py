@@ -9,6 +9,12 @@ from ..utils.audio_feature_matcher import AudioFeatureMatcher
 
 logger = structlog.get_logger(__name__)
 
+# Cohesion below which a track counts as an outlier. RecoBeat tracks are held to
+# a stricter bar (they are biased to match features); artist tracks are curated
+# and only dropped when clearly off-mood.
+RECCOBEAT_OUTLIER_COHESION = 0.6
+ARTIST_OUTLIER_COHESION = 0.3
+
 
 class CohesionCalculator:
     """Calculates cohesion scores and identifies outlier tracks."""
@@ -163,7 +169,8 @@ class CohesionCalculator:
             if is_reccobeat:
                 # RecoBeat: stricter outlier detection (they're biased to match features)
                 # Outlier if: high weighted violations (>1.2) OR critical feature + moderate cohesion
-                if track_cohesion < 0.6:  # Simplified for now - could be enhanced
+                # (same bar as is_outlier_score, inlined: this loop is hot)
+                if track_cohesion < RECCOBEAT_OUTLIER_COHESION:
                     outliers.append(rec.track_id)
                     logger.debug(
                         f"Outlier detected (RecoBeat): {rec.track_name} by {', '.join(rec.artists)} "
@@ -174,7 +181,7 @@ class CohesionCalculator:
             else:
                 # Artist tracks: relaxed outlier detection (curated by Spotify, more trustworthy)
                 # Outlier only if: extremely low cohesion (let LLM handle cultural/genre mismatches)
-                if track_cohesion < 0.3:
+                if track_cohesion < ARTIST_OUTLIER_COHESION:
                     outliers.append(rec.track_id)
                     logger.debug(
                         f"Outlier detected (Artist): {rec.track_name} by {', '.join(rec.artists)} "
@@ -185,6 +192,22 @@ class CohesionCalculator:
 
         return outliers, cohesion_scores
 
+    def is_outlier_score(
+        self, track: TrackRecommendation, track_cohesion: float
+    ) -> bool:
+        """Whether a track's cohesion score makes it an outlier.
+
+        Args:
+            track: Track recommendation
+            track_cohesion: Its cohesion score against the target mood
+
+        Returns:
+            True if the track would be flagged as an outlier
+        """
+        if track.source == "reccobeat":
+            return track_cohesion < RECCOBEAT_OUTLIER_COHESION
+        return track_cohesion < ARTIST_OUTLIER_COHESION
+
     def calculate_overall_cohesion(self, cohesion_scores: List[float]) -> float:
         """Calculate overall cohesion score from individual track scores.
 
@@ -6,8 +6,12 @@ import structlog
 from langchain_core.language_models.base import BaseLanguageModel
 
 from ...core.base_agent import BaseAgent
-from ...states.agent_state import AgentState
+from ...core.tracing import tracer, upstream_call_counter
+from ...states.agent_state import AgentState, TrackRecommendation
+from ..recommendation_generator.handlers.candidate_reservoir import CandidateReservoir
+from ..recommendation_generator.handlers.diversity import DiversityManager
 from ..utils.llm_response_parser import LLMResponseParser
+from .cohesion_calculator import CohesionCalculator
 from .prompts import get_strategy_decision_prompt
 
 logger = structlog.get_logger(__name__)
@@ -32,6 +36,8 @@ class ImprovementStrategy:
         self.recommendation_generator = recommendation_generator
         self.llm = llm
         self.cohesion_threshold = cohesion_threshold
+        self.cohesion_calculator = CohesionCalculator()
+        self.diversity_manager = DiversityManager()
 
     async def decide_improvement_strategy(
         self, quality_evaluation: Dict[str, Any], state: AgentState
@@ -141,6 +147,7 @@ class ImprovementStrategy:
             Updated agent state
         """
         outlier_ids = set(quality_evaluation.get("outlier_tracks", []))
+        original_count = len(state.recommendations)
 
         # Filter out outliers BUT ALWAYS KEEP protected tracks (user-mentioned)
         good_recommendations = []
@@ -196,9 +203,12 @@ class ImprovementStrategy:
         if new_seeds:
             state.seed_tracks = new_seeds
             state.recommendations = good_recommendations
+            CandidateReservoir.for_state(state).reject(outlier_ids)
 
-            # Generate replacement recommendations
-            state = await self.recommendation_generator.run_with_error_handling(state)
+            # Replace from surplus candidates, regenerating only if that falls short
+            state = await self.replace_or_regenerate(
+                state, original_count - len(good_recommendations), "filter_and_replace"
+            )
 
         return state
 
@@ -241,6 +251,8 @@ class ImprovementStrategy:
                 )
 
         if outlier_ids:
+            CandidateReservoir.for_state(state).reject(outlier_ids)
+
             # Add to negative seeds
             existing_negative_seeds = set(state.negative_seeds)
             existing_negative_seeds.update(outlier_ids)
@@ -258,8 +270,12 @@ class ImprovementStrategy:
         state.recommendations = [rec for rec, _ in top_tracks]
         state.seed_tracks = new_seeds
 
-        # Generate new recommendations
-        state = await self.recommendation_generator.run_with_error_handling(state)
+        # Refill from surplus candidates, regenerating only if that falls short
+        playlist_target = state.metadata.get("playlist_target", {})
+        target_count = playlist_target.get("target_count", 20)
+        state = await self.replace_or_regenerate(
+            state, target_count - len(state.recommendations), "reseed_from_clean"
+        )
 
         return state
 
@@ -307,8 +323,10 @@ class ImprovementStrategy:
 
         previous_count = len(state.recommendations)
 
-        # Generate new recommendations
-        state = await self.recommendation_generator.run_with_error_handling(state)
+        # Draw from surplus candidates first, regenerating only if that falls short
+        state = await self.replace_or_regenerate(
+            state, target_count - current_count, "generate_more"
+        )
 
         logger.info(
             "Generated additional recommendations",
@@ -318,6 +336,124 @@ class ImprovementStrategy:
 
         return state
 
+    async def replace_or_regenerate(
+        self, state: AgentState, needed: int, reason: str
+    ) -> AgentState:
+        """Add ``needed`` tracks from the candidate reservoir or by regenerating.
+
+        The reservoir is tried first; the recommendation generator (and its
+        RecoBeat/Spotify fan-out) only runs when the reservoir cannot supply
+        enough tracks that fit the mood, the artist caps and the current list.
+
+        Args:
+            state: Current agent state
+            needed: Number of tracks to add
+            reason: Caller, for logs and traces
+
+        Returns:
+            Updated agent state
+        """
+        reservoir = CandidateReservoir.for_state(state)
+        drawn = self.draw_from_reservoir(state, needed)
+        satisfied = needed > 0 and len(drawn) >= needed
+        reservoir.record_replacement(needed, satisfied)
+
+        if satisfied:
+            logger.info(
+                "Replaced tracks from candidate reservoir",
+                reason=reason,
+                drawn=len(drawn),
+                reservoir_size=len(reservoir),
+                upstream_calls_avoided=round(reservoir.upstream_calls_per_generation),
+            )
+        else:
+            if drawn:
+                logger.info(
+                    "Candidate reservoir fell short, regenerating",
+                    reason=reason,
+                    needed=needed,
+                    drawn=len(drawn),
+                )
+            state = await self.run_generator(state, reason)
+
+        state.metadata["candidate_reservoir"] = reservoir.summary()
+        return state
+
+    def draw_from_reservoir(
+        self, state: AgentState, needed: int
+    ) -> List[TrackRecommendation]:
+        """Append up to ``needed`` reservoir candidates that fit the playlist.
+
+        Candidates must clear the same cohesion bar the quality evaluator uses
+        for outliers, must not be negative seeds and must respect the artist caps.
+
+        Args:
+            state: Current agent state
+            needed: Number of tracks wanted
+
+        Returns:
+            The tracks that were appended
+        """
+        reservoir = state.candidate_reservoir
+        if reservoir is None or needed <= 0 or not len(reservoir):
+            return []
+
+        target_features = state.metadata.get("target_features", {})
+        feature_weights = (
+            state.metadata.get("feature_weights")
+            or self.cohesion_calculator.get_default_feature_weights()
+        )
+        tolerance_thresholds = self.cohesion_calculator.get_tolerance_thresholds()
+        negative_seeds = set(state.negative_seeds)
+
+        def fits_mood(rec: TrackRecommendation) -> bool:
+            if rec.track_id in negative_seeds:
+                return False
+            if not target_features:
+                return True
+            cohesion = self.cohesion_calculator.calculate_track_cohesion(
+                rec, target_features, feature_weights, tolerance_thresholds
+            )
+            return not self.cohesion_calculator.is_outlier_score(rec, cohesion)
+
+        playlist_target = state.metadata.get("playlist_target", {})
+        diversity_index = self.diversity_manager.create_index(
+            playlist_target.get("target_count")
+        )
+        for rec in state.recommendations:
+            diversity_index.add(rec, count_toward_caps=not rec.user_mentioned)
+
+        drawn = reservoir.draw(
+            needed, state.recommendations, diversity_index, accept=fits_mood
+        )
+        for rec in drawn:
+            state.add_recommendation(rec)
+        return drawn
+
+    async def run_generator(self, state: AgentState, reason: str) -> AgentState:
+        """Run the recommendation generator and record its upstream cost.
+
+        The number of external calls the run made is what a reservoir hit saves;
+        it is counted for every run, whether or not tracing is on.
+
+        Args:
+            state: Current agent state
+            reason: Caller, for logs and traces
+
+        Returns:
+            Updated agent state
+        """
+        with (
+            upstream_call_counter() as upstream_calls,
+            tracer.start_span(
+                "orchestrator.generate", attributes={"generate.reason": reason}
+            ),
+        ):
+            state = await self.recommendation_generator.run_with_error_handling(state)
+
+        CandidateReservoir.for_state(state).record_generation_run(upstream_calls.calls)
+        return state
+
     async def _llm_decide_strategy(
         self, state: AgentState, quality_evaluation: Dict[str, Any]
     ) -> Optional[List[str]]:
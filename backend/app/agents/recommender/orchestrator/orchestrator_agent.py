@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 import structlog
 from langchain_core.language_models.base import BaseLanguageModel
 
+from ....services.spotify_token_manager import spotify_token_manager
 from ...core.base_agent import BaseAgent
 from ...states.agent_state import AgentState, RecommendationStatus
 from ...tools.spotify_service import SpotifyService
@@ -169,7 +170,7 @@ class OrchestratorAgent(BaseAgent):
         # Pass progress callback to recommendation generator
         if hasattr(self, "_progress_callback"):
             self.recommendation_generator._progress_callback = self._progress_callback
-        state = await self.recommendation_generator.run_with_error_handling(state)
+        state = await self.improvement_strategy.run_generator(state, "initial")
 
         return state
 
@@ -584,10 +585,13 @@ class OrchestratorAgent(BaseAgent):
             if state.recommendations:
                 state.seed_tracks = [rec.track_id for rec in state.recommendations[:5]]
 
-            # Generate enough to reach target (recommendation generator will add to existing)
+            # Top up from surplus candidates, or generate enough to reach target
+            # (recommendation generator will add to existing)
             # Store current count to know how many were added
             before_count = len(state.recommendations)
-            state = await self.recommendation_generator.run_with_error_handling(state)
+            state = await self.improvement_strategy.replace_or_regenerate(
+                state, shortfall, "enforce_playlist_targets"
+            )
             added_count = len(state.recommendations) - before_count
 
             logger.info(
@@ -636,7 +640,10 @@ class OrchestratorAgent(BaseAgent):
             logger.info("Enriching tracks with missing Spotify data...")
 
             # Validate enrichment requirements
-            validation_result = self.validate_enrichment_requirements(state)
+            access_token = await spotify_token_manager.get_token_for_state(state)
+            validation_result = self.validate_enrichment_requirements(
+                state, access_token
+            )
             if not validation_result["can_proceed"]:
                 return state
 
@@ -655,10 +662,10 @@ class OrchestratorAgent(BaseAgent):
 
         return state
 
-    def validate_enrichment_requirements(self, state: AgentState) -> Dict[str, Any]:
+    def validate_enrichment_requirements(
+        self, state: AgentState, access_token: Optional[str]
+    ) -> Dict[str, Any]:
         """Validate if track enrichment can proceed."""
-        # Get Spotify access token
-        access_token = state.metadata.get("spotify_access_token")
         if not access_token:
             logger.warning("No Spotify access token available for enrichment")
             return {
@@ -7,33 +7,54 @@ from langchain_core.language_models.base import BaseLanguageModel
 
 from ...states.agent_state import AgentState
 from ..recommendation_generator.handlers.diversity import DiversityManager
+from ..utils.config import config
 from ..utils.llm_response_parser import LLMResponseParser
 from .cohesion_calculator import CohesionCalculator
 from .prompts import get_quality_evaluation_prompt
+from .quality_tracker import QualityTracker
 
 logger = structlog.get_logger(__name__)
 
 
 class QualityEvaluator:
-    """Evaluates the quality of playlists against mood criteria."""
+    """Evaluates the quality of playlists against mood criteria.
+
+    Evaluation is incremental per session: a ``QualityTracker`` on the state
+    keeps per-track scores between calls, so each iteration only scores the
+    tracks that changed, and the LLM assessment is reused until enough of the
+    playlist has changed.
+    """
 
     def __init__(
-        self, llm: Optional[BaseLanguageModel] = None, cohesion_threshold: float = 0.65
+        self,
+        llm: Optional[BaseLanguageModel] = None,
+        cohesion_threshold: float = 0.65,
+        llm_reassessment_change_ratio: Optional[float] = None,
     ):
         """Initialize the quality evaluator.
 
         Args:
             llm: Language model for quality assessment
             cohesion_threshold: Minimum cohesion score threshold
+            llm_reassessment_change_ratio: Share of the playlist that must change
+                since the last LLM assessment before it is requested again
         """
         self.llm = llm
         self.cohesion_threshold = cohesion_threshold
+        self.llm_reassessment_change_ratio = (
+            llm_reassessment_change_ratio
+            if llm_reassessment_change_ratio is not None
+            else config.orchestration.llm_reassessment_change_ratio
+        )
         self.cohesion_calculator = CohesionCalculator()
         self.diversity_manager = DiversityManager()
 
     async def evaluate_playlist_quality(self, state: AgentState) -> Dict[str, Any]:
         """Evaluate the quality of current recommendations against mood criteria.
 
+        The returned ``evaluation_work`` entry reports how many tracks were
+        actually scored and whether the LLM was asked again.
+
         Args:
             state: Current agent state with recommendations
 
@@ -84,46 +105,48 @@ class QualityEvaluator:
         if len(recommendations) == 0:
             return evaluation
 
-        # Calculate cohesion score
-        cohesion_result = self.cohesion_calculator.calculate_cohesion_score(
-            recommendations, target_features, feature_weights
-        )
-        evaluation["cohesion_score"] = cohesion_result["score"]
-        evaluation["outlier_tracks"] = cohesion_result["outliers"]
-        evaluation["track_scores"] = cohesion_result["track_scores"]
+        # Only tracks added or changed since the last evaluation get scored
+        tracker = QualityTracker.for_state(state)
+        work = tracker.sync(recommendations, target_features, feature_weights)
+        evaluation["evaluation_work"] = work
 
-        if cohesion_result["outliers"]:
-            evaluation["issues"].append(
-                f"Found {len(cohesion_result['outliers'])} outlier tracks"
-            )
+        # Cohesion score from the running per-track scores
+        outliers = tracker.outlier_tracks(recommendations)
+        evaluation["cohesion_score"] = tracker.cohesion_score()
+        evaluation["outlier_tracks"] = outliers
+        evaluation["track_scores"] = dict(tracker.track_scores)
 
-        # Calculate average confidence score
-        avg_confidence = sum(r.confidence_score for r in recommendations) / len(
-            recommendations
-        )
+        if outliers:
+            evaluation["issues"].append(f"Found {len(outliers)} outlier tracks")
+
+        # Average confidence score from the running sum
+        avg_confidence = tracker.confidence_score()
         evaluation["confidence_score"] = avg_confidence
 
         if avg_confidence < 0.5:
             evaluation["issues"].append(f"Low average confidence: {avg_confidence:.2f}")
 
-        # Calculate artist diversity score
-        unique_artists = set()
-        for rec in recommendations:
-            unique_artists.update(rec.artists)
+        # The tracker's diversity index already holds exactly these tracks
+        diversity_index = tracker.diversity_index
 
+        # Calculate artist diversity score
         # Good diversity: at least 70% unique artists relative to track count
-        artist_diversity_ratio = len(unique_artists) / max(len(recommendations), 1)
+        artist_diversity_ratio = diversity_index.unique_artist_count / max(
+            len(recommendations), 1
+        )
         artist_diversity_score = min(artist_diversity_ratio / 0.7, 1.0)
 
         # Calculate genre diversity score
         genre_diversity_score = self.diversity_manager.calculate_genre_diversity_score(
-            recommendations
+            recommendations, index=diversity_index
         )
         evaluation["genre_diversity_score"] = genre_diversity_score
 
         # Calculate temporal diversity score
         temporal_diversity_score = (
-            self.diversity_manager.calculate_temporal_diversity_score(recommendations)
+            self.diversity_manager.calculate_temporal_diversity_score(
+                recommendations, index=diversity_index
+            )
         )
         evaluation["temporal_diversity_score"] = temporal_diversity_score
 
@@ -145,8 +168,9 @@ class QualityEvaluator:
         )
 
         # Use LLM to assess playlist quality if available
+        work["llm_assessment"] = "none"
         if self.llm:
-            llm_assessment = await self._llm_evaluate_quality(state, evaluation)
+            llm_assessment = await self._get_llm_assessment(state, evaluation, tracker)
             evaluation["llm_assessment"] = llm_assessment
 
             # Adjust overall score based on LLM assessment
@@ -187,8 +211,48 @@ class QualityEvaluator:
         )
         evaluation["meets_threshold"] = meets_quality
 
+        state.metadata["quality_evaluation_work"] = tracker.summary()
+        logger.debug(
+            "Evaluated playlist quality",
+            session_id=state.session_id,
+            **work,
+        )
+
         return evaluation
 
+    async def _get_llm_assessment(
+        self,
+        state: AgentState,
+        evaluation: Dict[str, Any],
+        tracker: QualityTracker,
+    ) -> Optional[Dict[str, Any]]:
+        """Ask the LLM for a fresh assessment, or reuse the last one if little changed.
+
+        Args:
+            state: Current agent state
+            evaluation: Algorithmic evaluation results
+            tracker: Session's quality tracker
+
+        Returns:
+            LLM assessment with quality score and insights
+        """
+        work = evaluation["evaluation_work"]
+        change_ratio = tracker.change_ratio_since_llm()
+        if change_ratio < self.llm_reassessment_change_ratio:
+            # Outliers are re-matched against the current playlist by the caller
+            tracker.record_llm_skip()
+            work["llm_assessment"] = "reused"
+            logger.info(
+                f"Reusing LLM quality assessment: {change_ratio:.0%} of the playlist "
+                f"changed (< {self.llm_reassessment_change_ratio:.0%})"
+            )
+            return tracker.llm_assessment
+
+        llm_assessment = await self._llm_evaluate_quality(state, evaluation)
+        tracker.record_llm_assessment(llm_assessment)
+        work["llm_assessment"] = "fresh"
+        return llm_assessment
+
     async def _llm_evaluate_quality(
         self, state: AgentState, evaluation: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
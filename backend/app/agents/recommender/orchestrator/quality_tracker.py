@@ -0,0 +1,273 @@
+"""Incremental playlist quality aggregates kept across orchestration iterations."""
+
+import json
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from ...states.agent_state import AgentState, TrackRecommendation
+from ..recommendation_generator.handlers.diversity_index import DiversityIndex
+from .cohesion_calculator import CohesionCalculator
+
+logger = structlog.get_logger(__name__)
+
+
+class QualityTracker:
+    """Per-track quality scores and running aggregates for one workflow session.
+
+    Orchestration iterations usually swap a handful of tracks, so the tracker
+    only scores tracks that were added or changed since the previous
+    evaluation and rolls back the contributions of removed ones. It also
+    remembers which tracks the last LLM assessment saw, so the evaluator can
+    skip the assessment when the playlist barely changed. One tracker lives on
+    each workflow's ``AgentState``.
+    """
+
+    def __init__(self, cohesion_calculator: Optional[CohesionCalculator] = None):
+        """Initialize an empty tracker.
+
+        Args:
+            cohesion_calculator: Calculator used to score individual tracks
+        """
+        self.cohesion_calculator = cohesion_calculator or CohesionCalculator()
+
+        self.diversity_index = DiversityIndex()
+        self.track_scores: Dict[str, float] = {}
+        self.llm_assessment: Optional[Dict[str, Any]] = None
+
+        # track_id -> (track, occurrences, cohesion per occurrence, confidence sum)
+        self._entries: Dict[
+            str, Tuple[TrackRecommendation, int, Optional[float], float]
+        ] = {}
+        self._outliers: Set[str] = set()
+        self._track_count = 0
+        self._confidence_sum = 0.0
+        self._cohesion_sum = 0.0
+        self._cohesion_count = 0
+
+        self._context_key: Optional[str] = None
+        self._has_targets = False
+        self._changed_since_llm: Set[str] = set()
+
+        self.stats: Dict[str, int] = {
+            "evaluations": 0,
+            "full_rebuilds": 0,
+            "tracks_scored": 0,
+            "tracks_reused": 0,
+            "tracks_removed": 0,
+            "llm_assessments": 0,
+            "llm_assessments_skipped": 0,
+        }
+
+    @classmethod
+    def for_state(cls, state: AgentState) -> "QualityTracker":
+        """Get the tracker attached to a workflow state, creating it on first use."""
+        tracker = state.quality_tracker
+        if tracker is None:
+            tracker = cls()
+            state.attach_quality_tracker(tracker)
+        return tracker
+
+    def sync(
+        self,
+        recommendations: List[TrackRecommendation],
+        target_features: Dict[str, Any],
+        feature_weights: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """Bring the aggregates in line with the playlist by applying only the delta.
+
+        Changing the target features or weights invalidates every score, so the
+        tracker is rebuilt from scratch in that case.
+
+        Args:
+            recommendations: Current playlist
+            target_features: Target audio features from mood analysis
+            feature_weights: Importance weights for each feature
+
+        Returns:
+            Work done: tracks scored, reused and removed, and whether the
+            aggregates were rebuilt
+        """
+        feature_weights = (
+            feature_weights or self.cohesion_calculator.get_default_feature_weights()
+        )
+        context_key = self._make_context_key(target_features, feature_weights)
+        full_rebuild = context_key != self._context_key
+        if full_rebuild:
+            if self._context_key is not None:
+                logger.debug("Target features changed, rebuilding quality aggregates")
+            self._reset()
+            self._context_key = context_key
+            self._has_targets = bool(target_features)
+
+        incoming: Dict[str, TrackRecommendation] = {}
+        occurrences: Counter = Counter()
+        confidences: Counter = Counter()
+        for rec in recommendations:
+            incoming[rec.track_id] = rec
+            occurrences[rec.track_id] += 1
+            confidences[rec.track_id] += rec.confidence_score
+
+        removed = 0
+        for track_id in [tid for tid in self._entries if tid not in incoming]:
+            self._remove(track_id)
+            removed += 1
+
+        scored = 0
+        for track_id, rec in incoming.items():
+            entry = self._entries.get(track_id)
+            if entry is not None:
+                existing, count, _, confidence = entry
+                if (
+                    count == occurrences[track_id]
+                    and confidence == confidences[track_id]
+                    and (existing is rec or existing == rec)
+                ):
+                    continue
+                # Same track, different data (enrichment, deep copy with edits)
+                self._remove(track_id)
+            self._add(
+                rec,
+                occurrences[track_id],
+                confidences[track_id],
+                target_features,
+                feature_weights,
+            )
+            scored += 1
+
+        work = {
+            "tracks_scored": scored,
+            "tracks_reused": len(incoming) - scored,
+            "tracks_removed": removed,
+            "full_rebuild": full_rebuild,
+        }
+
+        self.stats["evaluations"] += 1
+        self.stats["full_rebuilds"] += int(full_rebuild)
+        self.stats["tracks_scored"] += scored
+        self.stats["tracks_reused"] += work["tracks_reused"]
+        self.stats["tracks_removed"] += removed
+        return work
+
+    def cohesion_score(self) -> float:
+        """Mean cohesion of non-outlier tracks (protected tracks count as 1.0)."""
+        if not self._has_targets or not self._entries:
+            return 0.5
+        if not self._cohesion_count:
+            return 0.0
+        return self._cohesion_sum / self._cohesion_count
+
+    def confidence_score(self) -> float:
+        """Mean confidence over every playlist entry."""
+        if not self._track_count:
+            return 0.0
+        return self._confidence_sum / self._track_count
+
+    def outlier_tracks(self, recommendations: List[TrackRecommendation]) -> List[str]:
+        """Outlier track IDs in playlist order.
+
+        Args:
+            recommendations: Playlist the tracker was last synced with
+
+        Returns:
+            One ID per outlier playlist entry
+        """
+        if not self._outliers:
+            return []
+        return [
+            rec.track_id for rec in recommendations if rec.track_id in self._outliers
+        ]
+
+    def change_ratio_since_llm(self) -> float:
+        """Share of the playlist added, removed or changed since the last LLM assessment."""
+        if self.llm_assessment is None:
+            return 1.0
+        return len(self._changed_since_llm) / max(len(self._entries), 1)
+
+    def record_llm_assessment(self, assessment: Optional[Dict[str, Any]]) -> None:
+        """Remember a fresh LLM assessment and the playlist it was made for.
+
+        Args:
+            assessment: Parsed assessment, or None if the call failed
+        """
+        self.llm_assessment = assessment
+        self._changed_since_llm.clear()
+        self.stats["llm_assessments"] += 1
+
+    def record_llm_skip(self) -> None:
+        """Record that the previous LLM assessment was reused."""
+        self.stats["llm_assessments_skipped"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters for the workflow metadata."""
+        return {"tracks": len(self._entries), **self.stats}
+
+    def _add(
+        self,
+        rec: TrackRecommendation,
+        count: int,
+        confidence: float,
+        target_features: Dict[str, Any],
+        feature_weights: Dict[str, float],
+    ) -> None:
+        cohesion: Optional[float] = None
+        if self._has_targets:
+            score = self.cohesion_calculator.calculate_track_cohesion(
+                rec, target_features, feature_weights, {}
+            )
+            self.track_scores[rec.track_id] = score
+
+            if rec.protected or rec.user_mentioned or rec.user_mentioned_artist:
+                # Protected tracks are never outliers and don't penalize cohesion
+                cohesion = 1.0
+            elif self.cohesion_calculator.is_outlier_score(rec, score):
+                self._outliers.add(rec.track_id)
+            else:
+                cohesion = score
+
+        if cohesion is not None:
+            self._cohesion_sum += cohesion * count
+            self._cohesion_count += count
+        self._confidence_sum += confidence
+        self._track_count += count
+
+        self._entries[rec.track_id] = (rec, count, cohesion, confidence)
+        self.diversity_index.add(rec)
+        self._changed_since_llm.add(rec.track_id)
+
+    def _remove(self, track_id: str) -> None:
+        # Roll back exactly what _add contributed
+        _, count, cohesion, confidence = self._entries.pop(track_id)
+        self.track_scores.pop(track_id, None)
+        self._outliers.discard(track_id)
+
+        if cohesion is not None:
+            self._cohesion_sum -= cohesion * count
+            self._cohesion_count -= count
+        self._confidence_sum -= confidence
+        self._track_count -= count
+
+        self.diversity_index.remove(track_id)
+        self._changed_since_llm.add(track_id)
+
+    def _reset(self) -> None:
+        """Drop every score and aggregate (targets changed)."""
+        self.diversity_index = DiversityIndex()
+        self.track_scores = {}
+        self.llm_assessment = None
+        self._entries = {}
+        self._outliers = set()
+        self._track_count = 0
+        self._confidence_sum = 0.0
+        self._cohesion_sum = 0.0
+        self._cohesion_count = 0
+        self._changed_since_llm = set()
+
+    @staticmethod
+    def _make_context_key(
+        target_features: Dict[str, Any], feature_weights: Dict[str, float]
+    ) -> str:
+        return json.dumps(
+            [target_features or {}, feature_weights], sort_keys=True, default=str
+        )
@@ -3,12 +3,14 @@
 import math
 from collections import Counter, defaultdict
 from itertools import chain
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 import structlog
 
 from ...states.agent_state import TrackRecommendation
+from ..recommendation_generator.handlers.candidate_reservoir import CandidateReservoir
 from ..recommendation_generator.handlers.diversity import DiversityManager
+from ..recommendation_generator.handlers.diversity_index import DiversityIndex
 from ..utils.track_deduplicator import deduplicate_track_recommendations
 
 logger = structlog.get_logger(__name__)
@@ -57,6 +59,8 @@ class RecommendationProcessor:
         recommendations: List[TrackRecommendation],
         target_count: int = 30,
         artist_ratio: float = 1.0,
+        reservoir: Optional[CandidateReservoir] = None,
+        diversity_index: Optional[DiversityIndex] = None,
     ) -> List[TrackRecommendation]:
         """Enforce source ratio between artist discovery and RecoBeat recommendations.
 
@@ -64,6 +68,10 @@ class RecommendationProcessor:
             recommendations: List of track recommendations (assumed to be pre-deduplicated)
             target_count: Target number of recommendations to return
             artist_ratio: Ratio of artist recommendations (default 1.0 for 100% artist, Recobeat overflow only)
+            reservoir: Optional reservoir that keeps every candidate left out of
+                the final list for later outlier replacement
+            diversity_index: Session candidate-pool index whose recorded
+                popularity tiers are reused by tier balancing
 
         Returns:
             List with enforced source ratio, sorted by confidence
@@ -87,6 +95,7 @@ class RecommendationProcessor:
             capped_sources,
             len(recommendations),
             target_count,
+            diversity_index=diversity_index,
         )
 
         # If we're still short of the desired count, top up from overflow pools
@@ -94,6 +103,12 @@ class RecommendationProcessor:
             final_recommendations, overflow_sources, target_count
         )
 
+        if reservoir is not None:
+            kept_ids = {rec.track_id for rec in final_recommendations}
+            reservoir.add(
+                rec for rec in recommendations if rec.track_id not in kept_ids
+            )
+
         return final_recommendations
 
     def separate_by_source(
@@ -227,6 +242,7 @@ class RecommendationProcessor:
         capped_sources: Dict[str, List[TrackRecommendation]],
         original_count: int,
         target_count: int,
+        diversity_index: Optional[DiversityIndex] = None,
     ) -> List[TrackRecommendation]:
         """Combine sources and sort final list.
 
@@ -244,6 +260,7 @@ class RecommendationProcessor:
             artist_recs = self.diversity_handler.enforce_popularity_tiers(
                 artist_recs,
                 target_count=len(artist_recs),  # Balance within available artist tracks
+                index=diversity_index,
             )
 
         # Combine with anchors first (NEVER re-sort after this!)
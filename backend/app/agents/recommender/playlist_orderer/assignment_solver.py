@@ -0,0 +1,167 @@
+"""Optimal capacity-constrained track-to-phase assignment for playlist ordering."""
+
+from typing import Dict, List, Optional
+
+from ...states.agent_state import TrackRecommendation
+
+
+def solve_max_weight_assignment(score_matrix: List[List[float]]) -> List[int]:
+    """Solve a rectangular assignment problem maximizing the total score.
+
+    Classic O(n^2 * m) Hungarian algorithm with potentials (rows <= columns).
+
+    Args:
+        score_matrix: n x m matrix of scores, n <= m
+
+    Returns:
+        For each row, the index of its assigned column
+    """
+    n = len(score_matrix)
+    if n == 0:
+        return []
+    m = len(score_matrix[0])
+    if n > m:
+        raise ValueError("score_matrix must have at least as many columns as rows")
+
+    inf = float("inf")
+    # 1-indexed potentials; column 0 is the virtual starting column
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    column_owner = [0] * (m + 1)
+    way = [0] * (m + 1)
+
+    for row in range(1, n + 1):
+        column_owner[0] = row
+        current_column = 0
+        min_slack = [inf] * (m + 1)
+        used = [False] * (m + 1)
+
+        while True:
+            used[current_column] = True
+            current_row = column_owner[current_column]
+            row_scores = score_matrix[current_row - 1]
+            row_potential = u[current_row]
+            delta = inf
+            next_column = 0
+
+            for column in range(1, m + 1):
+                if used[column]:
+                    continue
+                # Minimize negated scores to maximize the total
+                slack = -row_scores[column - 1] - row_potential - v[column]
+                if slack < min_slack[column]:
+                    min_slack[column] = slack
+                    way[column] = current_column
+                if min_slack[column] < delta:
+                    delta = min_slack[column]
+                    next_column = column
+
+            for column in range(m + 1):
+                if used[column]:
+                    u[column_owner[column]] += delta
+                    v[column] -= delta
+                else:
+                    min_slack[column] -= delta
+
+            current_column = next_column
+            if column_owner[current_column] == 0:
+                break
+
+        # Augment along the alternating path
+        while current_column:
+            previous_column = way[current_column]
+            column_owner[current_column] = column_owner[previous_column]
+            current_column = previous_column
+
+    assignment = [0] * n
+    for column in range(1, m + 1):
+        if column_owner[column]:
+            assignment[column_owner[column] - 1] = column - 1
+    return assignment
+
+
+def calculate_total_phase_fit(
+    phase_buckets: Dict[str, List[TrackRecommendation]],
+    track_phase_scores: List[tuple],
+) -> float:
+    """Sum each assigned track's score for the phase it was placed in.
+
+    Args:
+        phase_buckets: Phase name to assigned tracks
+        track_phase_scores: List of (track, analysis, scores) tuples
+
+    Returns:
+        Total phase fit (higher is better)
+    """
+    scores_by_track = {rec.track_id: scores for rec, _, scores in track_phase_scores}
+    return sum(
+        scores_by_track.get(rec.track_id, {}).get(phase, 0)
+        for phase, tracks in phase_buckets.items()
+        for rec in tracks
+    )
+
+
+class PhaseAssignmentSolver:
+    """Places tracks into phases so the total phase fit is maximal.
+
+    Each phase is expanded into as many slots as its target count and tracks are
+    matched to slots with the Hungarian algorithm. Unlike the greedy pass, a track
+    that scores well in several phases ends up where it adds the most overall.
+    """
+
+    def solve(
+        self,
+        track_phase_scores: List[tuple],
+        adjusted_distribution: Dict[str, int],
+        phase_order: List[str],
+    ) -> Dict[str, List[TrackRecommendation]]:
+        """Assign tracks to phases respecting the target distribution.
+
+        Args:
+            track_phase_scores: List of (track, analysis, scores) tuples
+            adjusted_distribution: Target track count per phase
+            phase_order: Order in which phase slots are laid out
+
+        Returns:
+            Phase buckets, each sorted by the track's score for that phase
+        """
+        phase_buckets: Dict[str, List[TrackRecommendation]] = {
+            phase: [] for phase in adjusted_distribution.keys()
+        }
+
+        slots = [
+            phase
+            for phase in phase_order
+            if phase in adjusted_distribution
+            for _ in range(max(0, adjusted_distribution[phase]))
+        ]
+        if not slots or not track_phase_scores:
+            return phase_buckets
+
+        # Pad with empty slots so every track has a column (extra tracks are dropped,
+        # matching the greedy behaviour when the distribution is short)
+        padded_slots: List[Optional[str]] = slots + [None] * max(
+            0, len(track_phase_scores) - len(slots)
+        )
+
+        score_matrix = [
+            [scores.get(phase, 0) if phase else 0.0 for phase in padded_slots]
+            for _, _, scores in track_phase_scores
+        ]
+        assignment = solve_max_weight_assignment(score_matrix)
+
+        for (rec, _, scores), slot_index in zip(track_phase_scores, assignment):
+            phase = padded_slots[slot_index]
+            if phase is not None:
+                phase_buckets[phase].append(rec)
+
+        scores_by_track = {
+            rec.track_id: scores for rec, _, scores in track_phase_scores
+        }
+        for phase, tracks in phase_buckets.items():
+            tracks.sort(
+                key=lambda rec: scores_by_track[rec.track_id].get(phase, 0),
+                reverse=True,
+            )
+
+        return phase_buckets
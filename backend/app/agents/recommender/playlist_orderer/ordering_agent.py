@@ -1,6 +1,7 @@
 """Playlist ordering agent for creating energy flow arcs."""
 
 import asyncio
+import math
 from typing import Any, Dict, List
 
 import structlog
@@ -8,6 +9,7 @@ from langchain_core.language_models.base import BaseLanguageModel
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from ...core.base_agent import BaseAgent
+from ...core.cache import cache_manager
 from ...states.agent_state import AgentState, RecommendationStatus, TrackRecommendation
 from ..utils.config import config
 from ..utils.llm_response_parser import LLMResponseParser
@@ -102,6 +104,9 @@ class PlaylistOrderingAgent(BaseAgent):
 
             # Store ordering metadata
             state.metadata["ordering_strategy"] = strategy
+            state.metadata["ordering_phase_assignment"] = dict(
+                self.phase_assigner.last_assignment_stats
+            )
             state.metadata["ordering_applied"] = True
 
             logger.info(
@@ -122,6 +127,8 @@ class PlaylistOrderingAgent(BaseAgent):
     async def _analyze_track_energies(self, state: AgentState) -> List[Dict[str, Any]]:
         """Analyze energy characteristics of all tracks in batches.
 
+        Cached per-track analyses are reused; only cache misses are sent to the LLM.
+
         Args:
             state: Current agent state
 
@@ -129,16 +136,38 @@ class PlaylistOrderingAgent(BaseAgent):
             List of track energy analyses
         """
         batch_size = config.track_energy_analysis_batch_size
-        logger.info(
-            f"Analyzing energy characteristics for {len(state.recommendations)} tracks in batches of {batch_size}"
+        mood_bucket = self._get_mood_bucket(state)
+
+        cached_analyses = await cache_manager.get_track_energy_analyses(
+            [rec.track_id for rec in state.recommendations], mood_bucket
         )
+        uncached_tracks = [
+            rec for rec in state.recommendations if rec.track_id not in cached_analyses
+        ]
 
+        total_batches_needed = math.ceil(len(state.recommendations) / batch_size)
         # Split tracks into batches
         batches = [
-            state.recommendations[i : i + batch_size]
-            for i in range(0, len(state.recommendations), batch_size)
+            uncached_tracks[i : i + batch_size]
+            for i in range(0, len(uncached_tracks), batch_size)
         ]
 
+        state.metadata["energy_analysis_cache"] = {
+            "mood_bucket": mood_bucket,
+            "hits": len(cached_analyses),
+            "misses": len(uncached_tracks),
+            "llm_batches": len(batches),
+            "llm_batches_saved": total_batches_needed - len(batches),
+        }
+        logger.info(
+            f"Analyzing energy characteristics for {len(uncached_tracks)} tracks in batches of {batch_size} "
+            f"({len(cached_analyses)} served from cache)",
+            mood_bucket=mood_bucket,
+        )
+
+        if not batches:
+            return [cached_analyses[rec.track_id] for rec in state.recommendations]
+
         # Analyze batches in parallel
         try:
             total_batches = len(batches)
@@ -148,14 +177,15 @@ class PlaylistOrderingAgent(BaseAgent):
                     total_batches=total_batches,
                     tracks=batch,
                     mood_prompt=state.mood_prompt,
+                    mood_bucket=mood_bucket,
                 )
                 for i, batch in enumerate(batches)
             ]
 
             batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
 
-            # Combine results from all batches
-            all_analyses = []
+            # Combine cached analyses with results from all batches
+            all_analyses = list(cached_analyses.values())
             for i, result in enumerate(batch_results):
                 if isinstance(result, Exception):
                     logger.error(f"Error analyzing batch {i + 1}: {result}")
@@ -177,6 +207,36 @@ class PlaylistOrderingAgent(BaseAgent):
                 state.recommendations
             )
 
+    def _get_mood_bucket(self, state: AgentState) -> str:
+        """Derive a coarse mood bucket used to key cached energy analyses.
+
+        Energy profiles barely depend on the playlist, so the bucket only separates
+        broad energy/valence targets (e.g. calm-dark vs. upbeat-happy prompts).
+
+        Args:
+            state: Current agent state
+
+        Returns:
+            Bucket label such as ``"energy_high:valence_mid"``
+        """
+        target_features = state.metadata.get("target_features") or {}
+        parts = []
+
+        for feature in ("energy", "valence"):
+            value = target_features.get(feature)
+            if isinstance(value, (list, tuple)) and len(value) == 2:
+                value = (value[0] + value[1]) / 2
+            if not isinstance(value, (int, float)):
+                parts.append(f"{feature}_any")
+            elif value < 0.4:
+                parts.append(f"{feature}_low")
+            elif value < 0.7:
+                parts.append(f"{feature}_mid")
+            else:
+                parts.append(f"{feature}_high")
+
+        return ":".join(parts)
+
     async def _analyze_track_batch(
         self, tracks: List[TrackRecommendation], mood_prompt: str
     ) -> List[Dict[str, Any]]:
@@ -222,8 +282,12 @@ class PlaylistOrderingAgent(BaseAgent):
         total_batches: int,
         tracks: List[TrackRecommendation],
         mood_prompt: str,
+        mood_bucket: str,
     ) -> List[Dict[str, Any]]:
-        """Run batch analysis with timeout and automatic fallbacks."""
+        """Run batch analysis with timeout and automatic fallbacks.
+
+        LLM analyses are cached per track; audio-feature fallbacks are not.
+        """
         timeout = config.track_energy_analysis_timeout_seconds
         batch_label = f"{batch_index + 1}/{total_batches}"
         logger.debug(
@@ -234,6 +298,11 @@ class PlaylistOrderingAgent(BaseAgent):
             result = await asyncio.wait_for(
                 self._analyze_track_batch(tracks, mood_prompt), timeout=timeout
             )
+            batch_track_ids = {rec.track_id for rec in tracks}
+            await cache_manager.set_track_energy_analyses(
+                [a for a in result if a.get("track_id") in batch_track_ids],
+                mood_bucket,
+            )
             result = self._ensure_complete_batch_analysis(tracks, result, batch_label)
             logger.info(
                 "Completed energy analysis batch",
@@ -1,10 +1,13 @@
 """Phase assignment logic for playlist ordering."""
 
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 
 import structlog
 
 from ...states.agent_state import TrackRecommendation
+from ..utils.config import config
+from .assignment_solver import PhaseAssignmentSolver, calculate_total_phase_fit
 
 logger = structlog.get_logger(__name__)
 
@@ -12,8 +15,19 @@ logger = structlog.get_logger(__name__)
 class PhaseAssigner:
     """Handles assignment of tracks to energy flow phases."""
 
-    def __init__(self):
-        """Initialize the phase assigner."""
+    def __init__(self, optimal_max_tracks: Optional[int] = None):
+        """Initialize the phase assigner.
+
+        Args:
+            optimal_max_tracks: Largest playlist solved with the optimal assignment
+                solver; bigger playlists use the greedy best-fit pass
+        """
+        if optimal_max_tracks is None:
+            optimal_max_tracks = config.limits.phase_assignment_optimal_max_tracks
+
+        self.optimal_max_tracks = optimal_max_tracks
+        self.solver = PhaseAssignmentSolver()
+        self.last_assignment_stats: Dict[str, Any] = {}
         self.phase_order = ["opening", "build", "mid", "high", "descent", "closure"]
         self.phase_priority_order = [
             "opening",
@@ -50,10 +64,29 @@ class PhaseAssigner:
             recommendations, analysis_map
         )
 
-        # Assign tracks to phases
-        phase_buckets = self._assign_using_greedy_best_fit(
-            track_phase_scores, adjusted_distribution
-        )
+        # Assign tracks to phases (optimal solver, greedy fallback for large playlists)
+        started = time.perf_counter()
+        if len(track_phase_scores) <= self.optimal_max_tracks:
+            method = "optimal"
+            phase_buckets = self._assign_using_optimal_solver(
+                track_phase_scores, adjusted_distribution
+            )
+        else:
+            method = "greedy"
+            phase_buckets = self._assign_using_greedy_best_fit(
+                track_phase_scores, adjusted_distribution
+            )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self.last_assignment_stats = {
+            "method": method,
+            "track_count": len(track_phase_scores),
+            "total_phase_fit": round(
+                calculate_total_phase_fit(phase_buckets, track_phase_scores), 2
+            ),
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+        logger.info("Phase assignment complete", **self.last_assignment_stats)
 
         return phase_buckets
 
@@ -226,6 +259,22 @@ class PhaseAssigner:
 
         return track_phase_scores
 
+    def _assign_using_optimal_solver(
+        self, track_phase_scores: List[tuple], adjusted_distribution: Dict[str, int]
+    ) -> Dict[str, List[TrackRecommendation]]:
+        """Assign tracks to phases maximizing total phase fit.
+
+        Args:
+            track_phase_scores: List of (track, analysis, scores) tuples
+            adjusted_distribution: Target distribution
+
+        Returns:
+            Phase buckets
+        """
+        return self.solver.solve(
+            track_phase_scores, adjusted_distribution, self.phase_priority_order
+        )
+
     def _assign_using_greedy_best_fit(
         self, track_phase_scores: List[tuple], adjusted_distribution: Dict[str, int]
     ) -> Dict[str, List[TrackRecommendation]]:
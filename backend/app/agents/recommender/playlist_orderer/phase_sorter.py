@@ -1,10 +1,12 @@
 """Phase sorting logic for playlist ordering."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import structlog
 
 from ...states.agent_state import TrackRecommendation
+from ..utils.config import config
+from .transition_sequencer import TransitionSequencer
 
 logger = structlog.get_logger(__name__)
 
@@ -12,6 +14,20 @@ logger = structlog.get_logger(__name__)
 class PhaseSorter:
     """Handles sorting of tracks within phases for smooth transitions."""
 
+    def __init__(self, mode: Optional[str] = None):
+        """Initialize the phase sorter.
+
+        Args:
+            mode: "smooth" to sequence phases by transition cost after the
+                phase-specific sort, "sort" to use the sort alone
+        """
+        limits = config.limits
+        self.mode = mode or limits.phase_sequencing_mode
+        self.max_sequenced_tracks = limits.phase_sequencing_max_tracks
+        self.sequencer = TransitionSequencer(
+            time_budget_ms=limits.phase_sequencing_time_budget_ms
+        )
+
     def sort_tracks_within_phase(
         self,
         tracks: List[TrackRecommendation],
@@ -33,7 +49,12 @@ class PhaseSorter:
 
         # Use phase-specific sorting strategy
         sorter = self._get_phase_sorter(phase)
-        return sorter(tracks, analysis_map)
+        sorted_tracks = sorter(tracks, analysis_map)
+
+        # Smooth tempo/key/valence jumps, keeping the sort's first pick as the start
+        if self.mode == "smooth" and len(sorted_tracks) <= self.max_sequenced_tracks:
+            return self.sequencer.sequence(sorted_tracks, analysis_map, phase)
+        return sorted_tracks
 
     def _get_phase_sorter(self, phase: str):
         """Get the appropriate sorting function for a phase."""
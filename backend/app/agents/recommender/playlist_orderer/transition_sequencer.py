@@ -0,0 +1,207 @@
+"""Smooth-transition sequencing of tracks within a playlist phase."""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from ...states.agent_state import TrackRecommendation
+
+logger = structlog.get_logger(__name__)
+
+# Relative weight of each neighbour jump in the transition cost
+TRANSITION_WEIGHTS = {
+    "tempo": 0.3,
+    "key": 0.2,
+    "valence": 0.25,
+    "energy": 0.25,
+}
+
+# Feature differences that count as one "full" jump
+TEMPO_TOLERANCE_BPM = 30.0
+VALENCE_TOLERANCE = 0.25
+ENERGY_TOLERANCE = 0.20
+
+# Penalty per unit of energy moving against the phase direction (build/descent)
+DIRECTION_PENALTY = 2.0
+PHASE_DIRECTIONS = {"build": 1, "descent": -1}
+
+
+class TransitionSequencer:
+    """Orders tracks as a shortest Hamiltonian path over transition costs.
+
+    The first track of the phase's default sort stays fixed as the path start, a
+    nearest-neighbour tour is built from it, and 2-opt segment reversals improve
+    the tour until no move helps or the time budget runs out.
+    """
+
+    def __init__(self, time_budget_ms: float = 5.0):
+        """Initialize the sequencer.
+
+        Args:
+            time_budget_ms: Hard cap on 2-opt improvement time per phase
+        """
+        self.time_budget_ms = time_budget_ms
+
+    def sequence(
+        self,
+        tracks: List[TrackRecommendation],
+        analysis_map: Dict[str, Dict[str, Any]],
+        phase: str,
+    ) -> List[TrackRecommendation]:
+        """Reorder tracks so neighbouring tempo, key, valence and energy jumps are small.
+
+        Args:
+            tracks: Tracks in the phase, already in the phase's default order
+            analysis_map: Track energy analyses
+            phase: Phase name (build/descent also penalise energy moving backwards)
+
+        Returns:
+            Reordered tracks, starting with the same first track
+        """
+        if len(tracks) <= 2:
+            return tracks
+
+        deadline = time.perf_counter() + self.time_budget_ms / 1000
+        vectors = [self._feature_vector(rec, analysis_map) for rec in tracks]
+        cost = self._build_cost_matrix(vectors, PHASE_DIRECTIONS.get(phase, 0))
+
+        initial_order = list(range(len(tracks)))
+        path = self._nearest_neighbour_path(cost)
+        path = self._two_opt(path, cost, deadline)
+
+        initial_cost = self._path_cost(initial_order, cost)
+        final_cost = self._path_cost(path, cost)
+        if final_cost >= initial_cost:
+            return tracks
+
+        logger.debug(
+            "Smoothed phase transitions",
+            phase=phase,
+            track_count=len(tracks),
+            initial_cost=round(initial_cost, 3),
+            final_cost=round(final_cost, 3),
+        )
+        return [tracks[i] for i in path]
+
+    def _feature_vector(
+        self, rec: TrackRecommendation, analysis_map: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Optional[float]]:
+        """Extract the normalized features used by the transition cost."""
+        features = rec.audio_features or {}
+        analysis = analysis_map.get(rec.track_id, {})
+
+        energy = features.get("energy")
+        if energy is None:
+            energy = analysis.get("energy_level", 50) / 100
+
+        key = features.get("key")
+        mode = features.get("mode")
+        camelot = None
+        if isinstance(key, (int, float)) and 0 <= key <= 11:
+            # Circle-of-fifths position; relative minor shares the major's position
+            pitch = int(key) if mode != 0 else (int(key) + 3) % 12
+            camelot = (pitch * 7) % 12
+
+        tempo = features.get("tempo")
+        valence = features.get("valence")
+
+        return {
+            "tempo": (tempo if tempo is not None else 120) / TEMPO_TOLERANCE_BPM,
+            "valence": (valence if valence is not None else 0.5) / VALENCE_TOLERANCE,
+            "energy": energy / ENERGY_TOLERANCE,
+            "raw_energy": energy,
+            "camelot": camelot,
+        }
+
+    def _build_cost_matrix(
+        self, vectors: List[Dict[str, Optional[float]]], direction: int
+    ) -> List[List[float]]:
+        """Compute the full pairwise transition-cost matrix in one pass."""
+        tempo = [v["tempo"] for v in vectors]
+        valence = [v["valence"] for v in vectors]
+        energy = [v["energy"] for v in vectors]
+        raw_energy = [v["raw_energy"] for v in vectors]
+        camelot = [v["camelot"] for v in vectors]
+
+        w_tempo = TRANSITION_WEIGHTS["tempo"]
+        w_key = TRANSITION_WEIGHTS["key"]
+        w_valence = TRANSITION_WEIGHTS["valence"]
+        w_energy = TRANSITION_WEIGHTS["energy"]
+
+        size = len(vectors)
+        matrix = [[0.0] * size for _ in range(size)]
+        for i in range(size):
+            row = matrix[i]
+            for j in range(size):
+                if i == j:
+                    continue
+                if camelot[i] is None or camelot[j] is None:
+                    key_distance = 0.5
+                else:
+                    steps = abs(camelot[i] - camelot[j])
+                    key_distance = min(steps, 12 - steps) / 6
+
+                value = (
+                    w_tempo * abs(tempo[i] - tempo[j])
+                    + w_key * key_distance
+                    + w_valence * abs(valence[i] - valence[j])
+                    + w_energy * abs(energy[i] - energy[j])
+                )
+                if direction:
+                    backwards = (raw_energy[i] - raw_energy[j]) * direction
+                    if backwards > 0:
+                        value += DIRECTION_PENALTY * backwards
+                row[j] = value
+
+        return matrix
+
+    def _nearest_neighbour_path(self, cost: List[List[float]]) -> List[int]:
+        """Greedy path from node 0, always stepping to the cheapest unvisited node."""
+        size = len(cost)
+        path = [0]
+        remaining = set(range(1, size))
+        while remaining:
+            row = cost[path[-1]]
+            next_node = min(remaining, key=row.__getitem__)
+            path.append(next_node)
+            remaining.discard(next_node)
+        return path
+
+    def _two_opt(
+        self, path: List[int], cost: List[List[float]], deadline: float
+    ) -> List[int]:
+        """Improve an open path with segment reversals, keeping the first node fixed."""
+        size = len(path)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, size - 1):
+                if time.perf_counter() > deadline:
+                    return path
+                for j in range(i + 1, size):
+                    delta = self._reversal_delta(path, cost, i, j)
+                    if delta < -1e-9:
+                        path[i : j + 1] = reversed(path[i : j + 1])
+                        improved = True
+        return path
+
+    def _reversal_delta(
+        self, path: List[int], cost: List[List[float]], i: int, j: int
+    ) -> float:
+        """Cost change of reversing path[i..j] (costs may be asymmetric)."""
+        before = path[i - 1]
+        after = path[j + 1] if j + 1 < len(path) else None
+
+        delta = cost[before][path[j]] - cost[before][path[i]]
+        if after is not None:
+            delta += cost[path[i]][after] - cost[path[j]][after]
+
+        # Internal edges flip direction when the segment is reversed
+        for k in range(i, j):
+            delta += cost[path[k + 1]][path[k]] - cost[path[k]][path[k + 1]]
+        return delta
+
+    def _path_cost(self, path: List[int], cost: List[List[float]]) -> float:
+        """Total transition cost along a path."""
+        return sum(cost[path[k]][path[k + 1]] for k in range(len(path) - 1))
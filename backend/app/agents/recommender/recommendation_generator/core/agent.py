@@ -10,7 +10,9 @@ from ....tools.reccobeat_service import RecoBeatService
 from ....tools.spotify_service import SpotifyService
 from ...orchestrator.recommendation_processor import RecommendationProcessor
 from ..handlers.audio_features import AudioFeaturesHandler
+from ..handlers.candidate_reservoir import CandidateReservoir
 from ..handlers.diversity import DiversityManager
+from ..handlers.diversity_index import DiversityIndex
 from ..handlers.scoring import ScoringEngine
 from ..handlers.token import TokenManager
 from ..handlers.track_filter import TrackFilter
@@ -115,6 +117,8 @@ class RecommendationGeneratorAgent(BaseAgent):
                 recommendations=processed_recommendations,
                 target_count=max_recommendations,
                 artist_ratio=1.0,
+                reservoir=CandidateReservoir.for_state(state),
+                diversity_index=DiversityIndex.for_state(state),
             )
 
             # Deduplicate and add to state
@@ -210,7 +214,10 @@ class RecommendationGeneratorAgent(BaseAgent):
         playlist_target = state.metadata.get("playlist_target", {})
         target_count = playlist_target.get("target_count")
         return self.diversity_manager._ensure_diversity(
-            filtered_recommendations, target_count=target_count
+            filtered_recommendations,
+            target_count=target_count,
+            reservoir=CandidateReservoir.for_state(state),
+            index=DiversityIndex.for_state(state),
         )
 
     def _get_max_recommendations(self, state: AgentState) -> int:
@@ -384,4 +391,7 @@ class RecommendationGeneratorAgent(BaseAgent):
             processed_recommendations
         )
         state.metadata["final_recommendation_count"] = len(state.recommendations)
+        state.metadata["candidate_reservoir"] = CandidateReservoir.for_state(
+            state
+        ).summary()
         state.metadata["recommendation_strategy"] = "mood_based_with_seeds"
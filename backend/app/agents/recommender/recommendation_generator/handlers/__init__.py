@@ -2,7 +2,9 @@
 
 from .anchor_track import AnchorTrackHandler
 from .audio_features import AudioFeaturesHandler
+from .candidate_reservoir import CandidateReservoir
 from .diversity import DiversityManager
+from .diversity_index import DiversityIndex
 from .scoring import ScoringEngine
 from .token import TokenManager
 from .track_enrichment import TrackEnrichmentService
@@ -11,6 +13,8 @@ from .track_filter import TrackFilter
 __all__ = [
     "AnchorTrackHandler",
     "AudioFeaturesHandler",
+    "CandidateReservoir",
+    "DiversityIndex",
     "DiversityManager",
     "ScoringEngine",
     "TokenManager",
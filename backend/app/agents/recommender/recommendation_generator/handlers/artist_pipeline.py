@@ -10,13 +10,13 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
+from .....services.spotify_token_manager import spotify_token_manager
 from ....core.cache import cache_manager
 from ....states.agent_state import AgentState, TrackRecommendation
 from ....tools.reccobeat_service import RecoBeatService
 from ....tools.spotify_service import SpotifyService
 from ...utils.config import config
 from .audio_features import AudioFeaturesHandler
-from .token import TokenManager
 
 logger = structlog.get_logger(__name__)
 
@@ -48,7 +48,6 @@ class ArtistRecommendationPipeline:
         self.spotify_service = spotify_service
         self.reccobeat_service = reccobeat_service
         self.audio_features_handler = AudioFeaturesHandler(reccobeat_service)
-        self.token_manager = TokenManager()
         self.use_failed_artist_caching = use_failed_artist_caching
 
     async def process_artists(
@@ -170,17 +169,14 @@ class ArtistRecommendationPipeline:
         Returns:
             Tuple of (access_token, target_features, tracks_per_artist)
         """
-        # Refresh Spotify token before making API calls
-        state = await self.token_manager.refresh_token_from_workflow(state)
-
         # Get target features for filtering
         target_features = state.metadata.get("target_features", {})
 
         # Get artist target
         target_artist_recs = state.metadata.get("_temp_artist_target", 11)
 
-        # Get access token for Spotify API (after refresh)
-        access_token = state.metadata.get("spotify_access_token")
+        # Fresh access token for Spotify API (refreshed if about to expire)
+        access_token = await spotify_token_manager.get_token_for_state(state)
         if not access_token:
             logger.error("No Spotify access token available for artist top tracks")
             return None, {}, 0
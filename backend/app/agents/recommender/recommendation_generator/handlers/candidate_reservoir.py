@@ -0,0 +1,253 @@
+"""Per-session reservoir of surplus recommendation candidates."""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import structlog
+
+from ....states.agent_state import AgentState, TrackRecommendation
+from ...utils import config as recommender_config
+from ...utils.track_deduplicator import _normalize_title_artist_key
+from .diversity_index import DiversityIndex
+
+logger = structlog.get_logger(__name__)
+
+CandidateFilter = Callable[[TrackRecommendation], bool]
+
+
+class CandidateReservoir:
+    """Scored, indexed pool of candidates that generation produced but did not use.
+
+    Every generation run over-fetches: artist caps and the source-ratio trim
+    throw away tracks that already passed the mood filter. The reservoir keeps
+    them, best confidence first, in a ``DiversityIndex`` candidate heap so the
+    improvement loop can replace outliers without another RecoBeat/Spotify
+    fan-out. One reservoir lives on each workflow's ``AgentState``.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        """Initialize an empty reservoir.
+
+        Args:
+            max_size: Maximum number of candidates held; later surplus is ignored
+        """
+        if max_size is None:
+            max_size = recommender_config.orchestration.candidate_reservoir_max_size
+        self.max_size = max_size
+
+        self._queue = DiversityIndex()
+        self._entries: Dict[str, TrackRecommendation] = {}
+        self._uris: Set[str] = set()
+        self._title_keys: Set[str] = set()
+        self._rejected: Set[str] = set()
+
+        self.stats: Dict[str, int] = {
+            "candidates_added": 0,
+            "candidates_drawn": 0,
+            "replacement_requests": 0,
+            "requests_satisfied": 0,
+            "upstream_fallbacks": 0,
+            "generation_runs_avoided": 0,
+            "upstream_calls_avoided": 0,
+        }
+        self._generation_runs = 0
+        self._generation_upstream_calls = 0
+
+    @classmethod
+    def for_state(cls, state: AgentState) -> "CandidateReservoir":
+        """Get the reservoir attached to a workflow state, creating it on first use."""
+        reservoir = state.candidate_reservoir
+        if reservoir is None:
+            reservoir = cls()
+            state.attach_candidate_reservoir(reservoir)
+        return reservoir
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, recommendations: Iterable[TrackRecommendation]) -> int:
+        """Keep surplus candidates for later draws.
+
+        Args:
+            recommendations: Candidates that did not make it into the playlist
+
+        Returns:
+            Number of candidates added
+        """
+        added = 0
+        for rec in recommendations:
+            # Protected tracks are never trimmed, so they never need a second chance
+            if rec.track_id in self._rejected or rec.user_mentioned or rec.protected:
+                continue
+
+            existing = self._entries.get(rec.track_id)
+            if existing is not None:
+                if rec.confidence_score > existing.confidence_score:
+                    self._entries[rec.track_id] = rec
+                    self._queue.push_candidate(rec, (rec.confidence_score,))
+                continue
+
+            if (rec.spotify_uri and rec.spotify_uri in self._uris) or (
+                _normalize_title_artist_key(rec.track_name, rec.artists)
+                in self._title_keys
+            ):
+                continue
+
+            if len(self._entries) >= self.max_size:
+                break
+
+            self._push(rec)
+            added += 1
+
+        self.stats["candidates_added"] += added
+        return added
+
+    def reject(self, track_ids: Iterable[str]) -> None:
+        """Never offer these tracks again (outliers, negative seeds).
+
+        Args:
+            track_ids: Track IDs to exclude
+        """
+        for track_id in track_ids:
+            self._rejected.add(track_id)
+            if track_id in self._entries:
+                self._forget(track_id)
+                self._queue.discard_candidate(track_id)
+
+    def draw(
+        self,
+        count: int,
+        current: Iterable[TrackRecommendation],
+        diversity_index: Optional[DiversityIndex] = None,
+        accept: Optional[CandidateFilter] = None,
+    ) -> List[TrackRecommendation]:
+        """Take up to ``count`` of the best candidates that fit the current playlist.
+
+        Candidates already in the playlist or failing ``accept`` are dropped for
+        good; candidates only blocked by an artist cap stay for later draws.
+
+        Args:
+            count: Number of tracks wanted
+            current: Tracks already in the playlist
+            diversity_index: Index of the current playlist whose artist caps
+                drawn tracks must respect (drawn tracks are added to it)
+            accept: Extra constraint a candidate must satisfy
+
+        Returns:
+            Drawn candidates, best first
+        """
+        if count <= 0 or not self._entries:
+            return []
+
+        seen_ids: Set[str] = set()
+        seen_uris: Set[str] = set()
+        seen_title_keys: Set[str] = set()
+        for rec in current:
+            seen_ids.add(rec.track_id)
+            if rec.spotify_uri:
+                seen_uris.add(rec.spotify_uri)
+            seen_title_keys.add(
+                _normalize_title_artist_key(rec.track_name, rec.artists)
+            )
+
+        drawn: List[TrackRecommendation] = []
+        deferred: List[TrackRecommendation] = []
+        while len(drawn) < count:
+            rec = self._queue.pop_candidate()
+            if rec is None:
+                break
+            self._forget(rec.track_id)
+
+            title_key = _normalize_title_artist_key(rec.track_name, rec.artists)
+            if (
+                rec.track_id in seen_ids
+                or (rec.spotify_uri and rec.spotify_uri in seen_uris)
+                or title_key in seen_title_keys
+            ):
+                continue
+            if accept is not None and not accept(rec):
+                self._rejected.add(rec.track_id)
+                continue
+            if diversity_index is not None and not diversity_index.can_include(rec):
+                deferred.append(rec)
+                continue
+
+            drawn.append(rec)
+            seen_ids.add(rec.track_id)
+            if rec.spotify_uri:
+                seen_uris.add(rec.spotify_uri)
+            seen_title_keys.add(title_key)
+            if diversity_index is not None:
+                diversity_index.add(rec)
+
+        for rec in deferred:
+            self._push(rec)
+
+        self.stats["candidates_drawn"] += len(drawn)
+        return drawn
+
+    def record_generation_run(self, upstream_calls: int) -> None:
+        """Record the upstream cost of a generation run that actually happened.
+
+        Args:
+            upstream_calls: External API and LLM calls made by the run
+        """
+        self._generation_runs += 1
+        self._generation_upstream_calls += upstream_calls
+
+    def record_replacement(self, requested: int, satisfied: bool) -> None:
+        """Record the outcome of a replacement request.
+
+        A satisfied request skipped a whole generation run; its upstream cost is
+        estimated from the runs this session did make.
+
+        Args:
+            requested: Number of tracks requested
+            satisfied: Whether the reservoir covered the whole request
+        """
+        if requested <= 0:
+            return
+
+        self.stats["replacement_requests"] += 1
+        if satisfied:
+            self.stats["requests_satisfied"] += 1
+            self.stats["generation_runs_avoided"] += 1
+            self.stats["upstream_calls_avoided"] += round(
+                self.upstream_calls_per_generation
+            )
+        else:
+            self.stats["upstream_fallbacks"] += 1
+
+    @property
+    def upstream_calls_per_generation(self) -> float:
+        """Average upstream calls per observed generation run."""
+        if not self._generation_runs:
+            return 0.0
+        return self._generation_upstream_calls / self._generation_runs
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters for the workflow metadata."""
+        return {
+            "size": len(self._entries),
+            "rejected": len(self._rejected),
+            "upstream_calls_per_generation": round(
+                self.upstream_calls_per_generation, 1
+            ),
+            **self.stats,
+        }
+
+    def _push(self, rec: TrackRecommendation) -> None:
+        self._entries[rec.track_id] = rec
+        if rec.spotify_uri:
+            self._uris.add(rec.spotify_uri)
+        self._title_keys.add(_normalize_title_artist_key(rec.track_name, rec.artists))
+        self._queue.push_candidate(rec, (rec.confidence_score,))
+
+    def _forget(self, track_id: str) -> None:
+        rec = self._entries.pop(track_id, None)
+        if rec is None:
+            return
+        if rec.spotify_uri:
+            self._uris.discard(rec.spotify_uri)
+        self._title_keys.discard(
+            _normalize_title_artist_key(rec.track_name, rec.artists)
+        )
@@ -1,12 +1,21 @@
 """Diversity management for recommendation lists."""
 
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
+import heapq
+from collections import Counter
+from typing import Dict, List, Optional
 
 import structlog
 
 from ....states.agent_state import TrackRecommendation
 from ...utils import config as recommender_config
+from .candidate_reservoir import CandidateReservoir
+from .diversity_index import (
+    MAINSTREAM_TIER,
+    MID_TIER,
+    NICHE_TIER,
+    DiversityIndex,
+    get_popularity_tier,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -42,6 +51,8 @@ class DiversityManager:
         self,
         recommendations: List[TrackRecommendation],
         target_count: Optional[int] = None,
+        reservoir: Optional[CandidateReservoir] = None,
+        index: Optional[DiversityIndex] = None,
     ) -> List[TrackRecommendation]:
         """Ensure diversity in recommendations to avoid repetition.
 
@@ -49,6 +60,12 @@ class DiversityManager:
 
         Args:
             recommendations: List of recommendations to diversify
+            target_count: Playlist target size used for the user-artist cap
+            reservoir: Optional reservoir that keeps tracks dropped by the
+                artist cap for later outlier replacement
+            index: The session's candidate-pool index; it is synced with
+                ``recommendations`` so repeated generation runs only apply
+                the delta. A one-off index is built when omitted.
 
         Returns:
             Diversified recommendations
@@ -56,12 +73,16 @@ class DiversityManager:
         if not recommendations:
             return recommendations
 
-        # Count artist occurrences across ALL tracks first
-        artist_counts = self._count_artist_occurrences(recommendations)
+        # Artist occurrences across ALL tracks come from the candidate-pool index
+        if index is None:
+            index = DiversityIndex.from_recommendations(recommendations)
+        else:
+            added, removed = index.sync(recommendations)
+            logger.debug("diversity_index_synced", added=added, removed=removed)
 
         # Apply diversity penalties
         diversified_recommendations, protected_count, penalized_count = (
-            self._apply_diversity_penalties(recommendations, artist_counts)
+            self._apply_diversity_penalties(recommendations, index.artist_counts)
         )
 
         # Sort with protected tracks first
@@ -71,7 +92,10 @@ class DiversityManager:
 
         # Apply hard artist limits (default: 2 tracks per artist)
         diversified_recommendations = self._enforce_artist_limits(
-            diversified_recommendations, target_count=target_count
+            diversified_recommendations,
+            target_count=target_count,
+            index=index,
+            reservoir=reservoir,
         )
 
         logger.info(
@@ -92,11 +116,7 @@ class DiversityManager:
         Returns:
             Dictionary mapping artist names to occurrence counts
         """
-        artist_counts = {}
-        for rec in recommendations:
-            for artist in rec.artists:
-                artist_counts[artist] = artist_counts.get(artist, 0) + 1
-        return artist_counts
+        return dict(DiversityIndex.from_recommendations(recommendations).artist_counts)
 
     def _is_penalty_exempt(self, rec: TrackRecommendation) -> bool:
         """Check if a track is protected from diversity penalties."""
@@ -127,29 +147,20 @@ class DiversityManager:
     def _create_diversified_recommendation(
         self, rec: TrackRecommendation, adjusted_confidence: float
     ) -> TrackRecommendation:
-        """Create a new recommendation with adjusted confidence score.
+        """Create a recommendation with adjusted confidence score.
+
+        Unchanged tracks are returned as-is instead of being rebuilt.
 
         Args:
             rec: Original recommendation
             adjusted_confidence: New confidence score
 
         Returns:
-            New TrackRecommendation with adjusted confidence
+            TrackRecommendation with adjusted confidence
         """
-        return TrackRecommendation(
-            track_id=rec.track_id,
-            track_name=rec.track_name,
-            artists=rec.artists,
-            spotify_uri=rec.spotify_uri,
-            confidence_score=adjusted_confidence,
-            audio_features=rec.audio_features,
-            reasoning=rec.reasoning,
-            source=rec.source,
-            user_mentioned=rec.user_mentioned,
-            user_mentioned_artist=rec.user_mentioned_artist,
-            anchor_type=rec.anchor_type,
-            protected=rec.protected,
-        )
+        if adjusted_confidence == rec.confidence_score:
+            return rec
+        return rec.model_copy(update={"confidence_score": adjusted_confidence})
 
     def _apply_diversity_penalties(
         self, recommendations: List[TrackRecommendation], artist_counts: Dict[str, int]
@@ -170,10 +181,7 @@ class DiversityManager:
         for rec in recommendations:
             if self._is_penalty_exempt(rec):
                 # Protected tracks keep original confidence score
-                diversified_rec = self._create_diversified_recommendation(
-                    rec, rec.confidence_score
-                )
-                diversified_recommendations.append(diversified_rec)
+                diversified_recommendations.append(rec)
                 protected_count += 1
                 logger.debug(
                     f"Diversity: EXEMPT '{rec.track_name}' "
@@ -210,42 +218,80 @@ class DiversityManager:
         Returns:
             Sorted recommendations with protected tracks first
         """
-        # Separate protected and non-protected tracks
-        protected_tracks = [r for r in recommendations if self._is_penalty_exempt(r)]
-        non_protected_tracks = [
-            r for r in recommendations if not self._is_penalty_exempt(r)
-        ]
+        # Single stable sort: protected group first, then by confidence score
+        return sorted(
+            recommendations,
+            key=lambda r: (self._is_penalty_exempt(r), r.confidence_score),
+            reverse=True,
+        )
 
-        # Sort each group independently by confidence score
-        protected_tracks.sort(key=lambda x: x.confidence_score, reverse=True)
-        non_protected_tracks.sort(key=lambda x: x.confidence_score, reverse=True)
+    def _user_artist_total_limit(self, target_count: Optional[int]) -> int:
+        """Shared cap for tracks from user-mentioned artists."""
+        target_total = max(target_count or 1, 1)
+        return max(
+            self.max_tracks_per_artist,
+            int(target_total * self.user_mentioned_artist_ratio),
+        )
 
-        # Recombine with protected tracks first
-        return protected_tracks + non_protected_tracks
+    def create_index(self, target_count: Optional[int] = None) -> DiversityIndex:
+        """Create an empty diversity index configured with this manager's caps.
+
+        Args:
+            target_count: Playlist target size used to derive the shared cap
+                for user-mentioned artists
+
+        Returns:
+            DiversityIndex enforcing the per-artist and user-artist caps
+        """
+        return DiversityIndex(
+            max_tracks_per_artist=self.max_tracks_per_artist,
+            user_artist_total_limit=self._user_artist_total_limit(target_count),
+        )
 
     def _enforce_artist_limits(
         self,
         recommendations: List[TrackRecommendation],
         target_count: Optional[int] = None,
+        index: Optional[DiversityIndex] = None,
+        reservoir: Optional[CandidateReservoir] = None,
     ) -> List[TrackRecommendation]:
-        """Ensure no artist exceeds the configured track limit."""
+        """Ensure no artist exceeds the configured track limit.
+
+        Only artists that occur more often than the cap can ever be capped, so
+        the pass counts just those; when the index shows there are none (and
+        the user-artist total fits), the list is returned untouched.
+
+        Args:
+            recommendations: Recommendations in priority order
+            target_count: Playlist target size used for the user-artist cap
+            index: Index holding every one of ``recommendations`` (e.g. the
+                session's candidate-pool index); built when omitted
+            reservoir: Optional reservoir that keeps the dropped tracks
+        """
         if not recommendations or self.max_tracks_per_artist <= 0:
             return recommendations
 
-        target_total = max(target_count or len(recommendations) or 1, 1)
-        user_artist_total_limit = max(
-            self.max_tracks_per_artist,
-            int(target_total * self.user_mentioned_artist_ratio),
+        if index is None:
+            index = DiversityIndex.from_recommendations(recommendations)
+
+        artist_cap = self.max_tracks_per_artist
+        user_artist_cap = self._user_artist_total_limit(
+            target_count or len(recommendations)
         )
+        capped_artists = {
+            artist
+            for artist, count in index.artist_counts.items()
+            if count > artist_cap
+        }
+        if not capped_artists and index.user_artist_total <= user_artist_cap:
+            return recommendations
 
-        artist_usage: Dict[str, int] = defaultdict(int)
-        user_artist_total = 0
         limited_recommendations: List[TrackRecommendation] = []
-        dropped_count = 0
+        dropped: List[TrackRecommendation] = []
+        artist_counts: Counter = Counter()
+        user_artist_total = 0
 
         for rec in recommendations:
-            is_user_artist = bool(rec.user_mentioned_artist)
-
             if self._is_cap_exempt(rec):
                 limited_recommendations.append(rec)
                 logger.debug(
@@ -255,71 +301,52 @@ class DiversityManager:
                 )
                 continue
 
-            if not self._can_include_track(
-                rec,
-                artist_usage,
-                is_user_artist,
-                user_artist_total,
-                user_artist_total_limit,
-            ):
-                dropped_count += 1
+            rec_capped_artists = [a for a in rec.artists if a in capped_artists]
+            if (
+                rec.user_mentioned_artist and user_artist_total >= user_artist_cap
+            ) or any(artist_counts[a] >= artist_cap for a in rec_capped_artists):
+                dropped.append(rec)
                 logger.debug(
                     "artist_limit_skipped",
                     track_name=rec.track_name,
                     artists=rec.artists,
-                    limit=self.max_tracks_per_artist,
-                    user_artist_limit=user_artist_total_limit,
+                    limit=artist_cap,
+                    user_artist_limit=user_artist_cap,
                     reason="artist_cap_exceeded",
                 )
                 continue
 
             limited_recommendations.append(rec)
-            self._increment_artist_usage(artist_usage, rec)
-            if is_user_artist:
+            artist_counts.update(rec_capped_artists)
+            if rec.user_mentioned_artist:
                 user_artist_total += 1
 
-        if dropped_count:
+        if dropped and reservoir is not None:
+            reservoir.add(dropped)
+
+        if dropped:
             logger.info(
                 "artist_limit_enforced",
-                dropped=dropped_count,
-                artist_cap=self.max_tracks_per_artist,
-                user_artist_cap=user_artist_total_limit,
+                dropped=len(dropped),
+                artist_cap=artist_cap,
+                user_artist_cap=user_artist_cap,
             )
 
         return limited_recommendations
 
-    def _can_include_track(
-        self,
-        rec: TrackRecommendation,
-        artist_usage: Dict[str, int],
-        is_user_artist: bool,
-        user_artist_total: int,
-        user_artist_total_limit: int,
-    ) -> bool:
-        """Check if adding this track would violate artist usage limits."""
-        if is_user_artist and user_artist_total >= user_artist_total_limit:
-            return False
-
-        for artist in rec.artists:
-            if artist_usage[artist] >= self.max_tracks_per_artist:
-                return False
-        return True
-
-    def _increment_artist_usage(
-        self, artist_usage: Dict[str, int], rec: TrackRecommendation
-    ) -> None:
-        """Increment usage counters for all artists on the track."""
-        for artist in rec.artists:
-            artist_usage[artist] += 1
-
     def enforce_popularity_tiers(
-        self, recommendations: List[TrackRecommendation], target_count: int
+        self,
+        recommendations: List[TrackRecommendation],
+        target_count: int,
+        index: Optional[DiversityIndex] = None,
     ) -> List[TrackRecommendation]:
         """Enforce popularity tier balancing to ensure mix of mainstream, mid-tier, and niche tracks.
 
         Args:
             recommendations: List of track recommendations
             target_count: Target number of tracks for final playlist
+            index: Session candidate-pool index; the tiers it recorded for its
+                members are reused instead of reclassifying each track
 
         Returns:
             Balanced list of recommendations
@@ -328,8 +355,6 @@ class DiversityManager:
             return recommendations
 
         limits = recommender_config.limits
-        mainstream_threshold = limits.popularity_tier_mainstream_threshold
-        mid_threshold = limits.popularity_tier_mid_threshold
         mainstream_ratio = limits.popularity_tier_mainstream_ratio
         mid_ratio = limits.popularity_tier_mid_ratio
         niche_ratio = limits.popularity_tier_niche_ratio
@@ -338,65 +363,54 @@ class DiversityManager:
         target_count = min(target_count, len(recommendations))
 
         # Calculate tier targets
-        mainstream_target = int(target_count * mainstream_ratio)
-        mid_target = int(target_count * mid_ratio)
-        niche_target = int(target_count * niche_ratio)
-
-        # Group recommendations by popularity tier
-        mainstream = []
-        mid_tier = []
-        niche = []
-
+        tier_targets = {
+            MAINSTREAM_TIER: int(target_count * mainstream_ratio),
+            MID_TIER: int(target_count * mid_ratio),
+            NICHE_TIER: int(target_count * niche_ratio),
+        }
+
+        # Group recommendations by popularity tier (same classification as the index)
+        tier_of = index.tier_of if index is not None else get_popularity_tier
+        tiers: Dict[str, List[TrackRecommendation]] = {
+            MAINSTREAM_TIER: [],
+            MID_TIER: [],
+            NICHE_TIER: [],
+        }
         for rec in recommendations:
-            # Get popularity from audio_features or default to 50
-            popularity = 50  # Default
-            if rec.audio_features and isinstance(rec.audio_features, dict):
-                popularity = rec.audio_features.get("popularity", 50)
-
-            if popularity > mainstream_threshold:
-                mainstream.append(rec)
-            elif popularity >= mid_threshold:
-                mid_tier.append(rec)
-            else:
-                niche.append(rec)
-
-        # Sort each tier by confidence score
-        mainstream.sort(key=lambda r: r.confidence_score, reverse=True)
-        mid_tier.sort(key=lambda r: r.confidence_score, reverse=True)
-        niche.sort(key=lambda r: r.confidence_score, reverse=True)
-
-        # Build balanced list
-        balanced = []
+            tiers[tier_of(rec)].append(rec)
 
-        # Take from each tier according to ratios (with flexibility)
-        selected_mainstream = mainstream[:mainstream_target]
-        selected_mid = mid_tier[:mid_target]
-        selected_niche = niche[:niche_target]
+        # Sort each tier by confidence and take from each according to ratios
+        selected: Dict[str, List[TrackRecommendation]] = {}
+        overflow: List[TrackRecommendation] = []
+        for tier, members in tiers.items():
+            members.sort(key=lambda r: r.confidence_score, reverse=True)
+            selected[tier] = members[: tier_targets[tier]]
+            overflow.extend(members[tier_targets[tier] :])
 
-        balanced.extend(selected_mainstream)
-        balanced.extend(selected_mid)
-        balanced.extend(selected_niche)
+        balanced = selected[MAINSTREAM_TIER] + selected[MID_TIER] + selected[NICHE_TIER]
 
         # Fill remaining slots with overflow from any tier (highest confidence first)
         if len(balanced) < target_count:
-            overflow = (
-                mainstream[mainstream_target:]
-                + mid_tier[mid_target:]
-                + niche[niche_target:]
+            balanced.extend(
+                heapq.nlargest(
+                    target_count - len(balanced),
+                    overflow,
+                    key=lambda r: r.confidence_score,
+                )
             )
-            overflow.sort(key=lambda r: r.confidence_score, reverse=True)
-            balanced.extend(overflow[: target_count - len(balanced)])
 
         logger.info(
-            f"Popularity tier balancing: {len(selected_mainstream)} mainstream, "
-            f"{len(selected_mid)} mid-tier, {len(selected_niche)} niche "
-            f"(target: {mainstream_target}/{mid_target}/{niche_target})"
+            f"Popularity tier balancing: {len(selected[MAINSTREAM_TIER])} mainstream, "
+            f"{len(selected[MID_TIER])} mid-tier, {len(selected[NICHE_TIER])} niche "
+            f"(target: {tier_targets[MAINSTREAM_TIER]}/{tier_targets[MID_TIER]}/{tier_targets[NICHE_TIER]})"
         )
 
         return balanced[:target_count]
 
     def calculate_genre_diversity_score(
-        self, recommendations: List[TrackRecommendation]
+        self,
+        recommendations: List[TrackRecommendation],
+        index: Optional[DiversityIndex] = None,
     ) -> float:
         """Calculate genre diversity score for recommendations.
 
@@ -405,48 +419,27 @@ class DiversityManager:
 
         Args:
             recommendations: List of track recommendations
+            index: Index already holding these recommendations (avoids a rescan)
 
         Returns:
             Diversity score (0-1), where 1 is maximum diversity
         """
-        if not recommendations:
-            return 0.0
-
-        # Extract all genres from audio features
-        all_genres: Set[str] = set()
-        tracks_with_genres = 0
+        if index is None:
+            index = DiversityIndex.from_recommendations(recommendations)
 
-        for rec in recommendations:
-            if rec.audio_features and isinstance(rec.audio_features, dict):
-                genres = rec.audio_features.get("genres", [])
-                if genres:
-                    if isinstance(genres, list):
-                        all_genres.update(g.lower() for g in genres)
-                        tracks_with_genres += 1
-                    elif isinstance(genres, str):
-                        all_genres.add(genres.lower())
-                        tracks_with_genres += 1
-
-        if tracks_with_genres == 0:
-            # No genre data available
-            return 0.5  # Neutral score
-
-        # Calculate diversity metrics
-        unique_genres = len(all_genres)
-
-        # Good diversity: at least 5-8 unique genres for a 20-track playlist
-        # Normalize: 8+ genres = 1.0 score, 0 genres = 0.0 score
-        genre_variety_score = min(unique_genres / 8.0, 1.0)
+        genre_variety_score = index.genre_diversity_score()
 
         logger.debug(
-            f"Genre diversity: {unique_genres} unique genres across {tracks_with_genres} tracks "
-            f"(score: {genre_variety_score:.2f})"
+            f"Genre diversity: {len(index.genre_counts)} unique genres across "
+            f"{index.tracks_with_genres} tracks (score: {genre_variety_score:.2f})"
         )
 
         return genre_variety_score
 
     def calculate_temporal_diversity_score(
-        self, recommendations: List[TrackRecommendation]
+        self,
+        recommendations: List[TrackRecommendation],
+        index: Optional[DiversityIndex] = None,
     ) -> float:
         """Calculate temporal diversity score based on release dates.
 
@@ -455,56 +448,19 @@ class DiversityManager:
 
         Args:
             recommendations: List of track recommendations
+            index: Index already holding these recommendations (avoids a rescan)
 
         Returns:
             Diversity score (0-1), where 1 is maximum diversity
         """
-        if not recommendations:
-            return 0.0
-
-        # Extract release years
-        release_years: List[int] = []
+        if index is None:
+            index = DiversityIndex.from_recommendations(recommendations)
 
-        for rec in recommendations:
-            if rec.audio_features and isinstance(rec.audio_features, dict):
-                release_date = rec.audio_features.get("release_date")
-                if release_date:
-                    try:
-                        # Handle different date formats (YYYY, YYYY-MM-DD, etc.)
-                        if isinstance(release_date, str):
-                            year = int(release_date.split("-")[0])
-                            release_years.append(year)
-                        elif isinstance(release_date, int):
-                            release_years.append(release_date)
-                    except (ValueError, IndexError):
-                        continue
-
-        if not release_years:
-            # No temporal data available
-            return 0.5  # Neutral score
-
-        # Calculate temporal spread
-        min_year = min(release_years)
-        max_year = max(release_years)
-        year_span = max_year - min_year
-
-        # Count unique decades
-        decades = set(year // 10 for year in release_years)
-        unique_decades = len(decades)
-
-        # Good diversity: spans at least 2-3 decades
-        # Excellent diversity: spans 4+ decades
-        decade_score = min(unique_decades / 3.0, 1.0)
-
-        # Year span bonus: 20+ years is excellent
-        span_score = min(year_span / 20.0, 1.0)
-
-        # Combine scores (favor decade diversity slightly more)
-        temporal_score = decade_score * 0.6 + span_score * 0.4
+        temporal_score = index.temporal_diversity_score()
 
         logger.debug(
-            f"Temporal diversity: {year_span} year span, {unique_decades} decades "
-            f"({min_year}-{max_year}, score: {temporal_score:.2f})"
+            f"Temporal diversity: {len(index.decade_counts)} decades across "
+            f"{sum(index.year_counts.values())} dated tracks (score: {temporal_score:.2f})"
         )
 
         return temporal_score
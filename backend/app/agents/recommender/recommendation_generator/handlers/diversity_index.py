@@ -0,0 +1,364 @@
+"""Incremental diversity index for recommendation lists."""
+
+import heapq
+import itertools
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ....states.agent_state import AgentState, TrackRecommendation
+from ...utils import config as recommender_config
+
+MAINSTREAM_TIER = "mainstream"
+MID_TIER = "mid"
+NICHE_TIER = "niche"
+
+
+def get_track_popularity(rec: TrackRecommendation) -> int:
+    """Read a track's popularity from its audio features (defaults to 50)."""
+    if rec.audio_features and isinstance(rec.audio_features, dict):
+        return rec.audio_features.get("popularity", 50)
+    return 50
+
+
+def get_popularity_tier(rec: TrackRecommendation) -> str:
+    """Classify a track into the mainstream, mid or niche popularity tier."""
+    limits = recommender_config.limits
+    popularity = get_track_popularity(rec)
+
+    if popularity > limits.popularity_tier_mainstream_threshold:
+        return MAINSTREAM_TIER
+    if popularity >= limits.popularity_tier_mid_threshold:
+        return MID_TIER
+    return NICHE_TIER
+
+
+def _extract_genres(rec: TrackRecommendation) -> List[str]:
+    """Extract lowercased genres from a track's audio features."""
+    if not rec.audio_features or not isinstance(rec.audio_features, dict):
+        return []
+
+    genres = rec.audio_features.get("genres", [])
+    if not genres:
+        return []
+    if isinstance(genres, list):
+        return [g.lower() for g in genres]
+    if isinstance(genres, str):
+        return [genres.lower()]
+    return []
+
+
+def _extract_release_year(rec: TrackRecommendation) -> Optional[int]:
+    """Extract the release year from a track's audio features."""
+    if not rec.audio_features or not isinstance(rec.audio_features, dict):
+        return None
+
+    release_date = rec.audio_features.get("release_date")
+    if not release_date:
+        return None
+
+    try:
+        # Handle different date formats (YYYY, YYYY-MM-DD, etc.)
+        if isinstance(release_date, str):
+            return int(release_date.split("-")[0])
+        if isinstance(release_date, int):
+            return release_date
+    except (ValueError, IndexError):
+        return None
+    return None
+
+
+class DiversityIndex:
+    """Artist, popularity-tier, genre and era histograms kept up to date incrementally.
+
+    Tracks are added and removed one at a time, so callers that grow or shrink a
+    playlist (diversity capping, orchestration iterations) never have to rescan the
+    whole list to answer "can this track still be included?" or to compute the
+    genre/temporal diversity scores. A track listed more than once counts once
+    per occurrence, exactly as a rescan of the list would count it.
+
+    The index also keeps a lazy-deletion heap of candidate tracks so priorities can
+    be updated in O(log n) and the best remaining candidate popped without resorting.
+    """
+
+    def __init__(
+        self,
+        max_tracks_per_artist: Optional[int] = None,
+        user_artist_total_limit: Optional[int] = None,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            max_tracks_per_artist: Per-artist cap checked by ``can_include``
+                (``None`` or ``<= 0`` disables the cap)
+            user_artist_total_limit: Shared cap for tracks from user-mentioned artists
+        """
+        self.max_tracks_per_artist = max_tracks_per_artist
+        self.user_artist_total_limit = user_artist_total_limit
+
+        self.artist_counts: Counter = Counter()
+        self.tier_counts: Counter = Counter()
+        self.genre_counts: Counter = Counter()
+        self.year_counts: Counter = Counter()
+        self.decade_counts: Counter = Counter()
+        self.tracks_with_genres = 0
+        self.user_artist_total = 0
+
+        self._members: Dict[str, TrackRecommendation] = {}
+        self._occurrences: Dict[str, int] = {}
+        self._member_tiers: Dict[str, str] = {}
+        self._cap_exempt: Set[str] = set()
+
+        # Candidate priority queue (max-heap via negated priorities)
+        self._heap: List[Tuple[Tuple, int, str]] = []
+        self._candidates: Dict[str, Tuple[Tuple, int, TrackRecommendation]] = {}
+        self._sequence = itertools.count()
+
+    @classmethod
+    def from_recommendations(
+        cls, recommendations: Iterable[TrackRecommendation], **kwargs
+    ) -> "DiversityIndex":
+        """Build an index containing every recommendation."""
+        index = cls(**kwargs)
+        index.sync(recommendations)
+        return index
+
+    @classmethod
+    def for_state(cls, state: AgentState) -> "DiversityIndex":
+        """Get the candidate-pool index attached to a workflow state, creating it on first use."""
+        index = state.diversity_index
+        if index is None:
+            index = cls()
+            state.attach_diversity_index(index)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, track_id: str) -> bool:
+        return track_id in self._members
+
+    @property
+    def unique_artist_count(self) -> int:
+        """Number of distinct artists currently in the index."""
+        return len(self.artist_counts)
+
+    def tier_of(self, rec: TrackRecommendation) -> str:
+        """Popularity tier of a track, read from the index when it is a member."""
+        tier = self._member_tiers.get(rec.track_id)
+        return tier if tier is not None else get_popularity_tier(rec)
+
+    def add(self, rec: TrackRecommendation, count_toward_caps: bool = True) -> bool:
+        """Add a track and update all histograms.
+
+        Args:
+            rec: Track to add
+            count_toward_caps: Whether the track's artists count toward the
+                per-artist and user-artist caps
+
+        Returns:
+            False if the track was already present
+        """
+        if rec.track_id in self._members:
+            return False
+
+        self._insert(rec, 1, count_toward_caps)
+        return True
+
+    def _insert(
+        self, rec: TrackRecommendation, occurrences: int, count_toward_caps: bool
+    ) -> None:
+        """Record a new member listed ``occurrences`` times."""
+        tier = get_popularity_tier(rec)
+        self._members[rec.track_id] = rec
+        self._occurrences[rec.track_id] = occurrences
+        self._member_tiers[rec.track_id] = tier
+        if count_toward_caps:
+            for artist in rec.artists:
+                self.artist_counts[artist] += occurrences
+            if rec.user_mentioned_artist:
+                self.user_artist_total += occurrences
+        else:
+            self._cap_exempt.add(rec.track_id)
+
+        self._update_histograms(rec, tier, occurrences)
+
+    def remove(self, track_id: str) -> Optional[TrackRecommendation]:
+        """Remove a track and roll back its histogram contributions."""
+        rec = self._members.pop(track_id, None)
+        if rec is None:
+            return None
+
+        occurrences = self._occurrences.pop(track_id)
+        if track_id in self._cap_exempt:
+            self._cap_exempt.discard(track_id)
+        else:
+            for artist in rec.artists:
+                self._bump(self.artist_counts, artist, -occurrences)
+            if rec.user_mentioned_artist:
+                self.user_artist_total -= occurrences
+
+        self._update_histograms(rec, self._member_tiers.pop(track_id), -occurrences)
+        return rec
+
+    def sync(self, recommendations: Iterable[TrackRecommendation]) -> Tuple[int, int]:
+        """Bring the index in line with a recommendation list by applying only the delta.
+
+        Members whose occurrence count or data changed (enrichment, a deep copy
+        with edits) are replaced, so the histograms always match a rescan of
+        the list.
+
+        Returns:
+            Tuple of (tracks added, tracks removed); a replaced track counts
+            as both
+        """
+        incoming: Dict[str, TrackRecommendation] = {}
+        occurrences: Counter = Counter()
+        for rec in recommendations:
+            incoming[rec.track_id] = rec
+            occurrences[rec.track_id] += 1
+
+        removed = 0
+        for track_id in [tid for tid in self._members if tid not in incoming]:
+            self.remove(track_id)
+            removed += 1
+
+        added = 0
+        for track_id, rec in incoming.items():
+            existing = self._members.get(track_id)
+            if existing is not None:
+                if self._occurrences[track_id] == occurrences[track_id] and (
+                    existing is rec or existing == rec
+                ):
+                    continue
+                self.remove(track_id)
+                removed += 1
+            self._insert(rec, occurrences[track_id], count_toward_caps=True)
+            added += 1
+
+        return added, removed
+
+    def can_include(self, rec: TrackRecommendation) -> bool:
+        """Check if adding this track would violate artist usage limits."""
+        if (
+            rec.user_mentioned_artist
+            and self.user_artist_total_limit is not None
+            and self.user_artist_total >= self.user_artist_total_limit
+        ):
+            return False
+
+        if self.max_tracks_per_artist is None or self.max_tracks_per_artist <= 0:
+            return True
+
+        for artist in rec.artists:
+            if self.artist_counts.get(artist, 0) >= self.max_tracks_per_artist:
+                return False
+        return True
+
+    def _update_histograms(
+        self, rec: TrackRecommendation, tier: str, delta: int
+    ) -> None:
+        """Apply a +1/-1 contribution of a track to the tier, genre and era histograms."""
+        self._bump(self.tier_counts, tier, delta)
+
+        genres = _extract_genres(rec)
+        if genres:
+            self.tracks_with_genres += delta
+            for genre in genres:
+                self._bump(self.genre_counts, genre, delta)
+
+        year = _extract_release_year(rec)
+        if year is not None:
+            self._bump(self.year_counts, year, delta)
+            self._bump(self.decade_counts, year // 10, delta)
+
+    @staticmethod
+    def _bump(counter: Counter, key, delta: int) -> None:
+        counter[key] += delta
+        if counter[key] <= 0:
+            del counter[key]
+
+    # ------------------------------------------------------------------
+    # Candidate priority queue
+    # ------------------------------------------------------------------
+
+    def push_candidate(self, rec: TrackRecommendation, priority: Tuple) -> None:
+        """Queue (or re-prioritise) a candidate track. Higher priorities pop first."""
+        negated = tuple(-p for p in priority)
+        sequence = next(self._sequence)
+        self._candidates[rec.track_id] = (negated, sequence, rec)
+        heapq.heappush(self._heap, (negated, sequence, rec.track_id))
+
+    def update_priority(self, track_id: str, priority: Tuple) -> bool:
+        """Change a queued candidate's priority in O(log n).
+
+        Returns:
+            False if the track is not currently queued
+        """
+        entry = self._candidates.get(track_id)
+        if entry is None:
+            return False
+        self.push_candidate(entry[2], priority)
+        return True
+
+    def discard_candidate(self, track_id: str) -> None:
+        """Drop a queued candidate (its stale heap entry is skipped lazily)."""
+        self._candidates.pop(track_id, None)
+
+    def pop_candidate(self) -> Optional[TrackRecommendation]:
+        """Pop the highest-priority queued candidate, or None when empty."""
+        while self._heap:
+            negated, sequence, track_id = heapq.heappop(self._heap)
+            entry = self._candidates.get(track_id)
+            if entry is None or entry[1] != sequence:
+                continue  # Stale entry from an update or discard
+            del self._candidates[track_id]
+            return entry[2]
+        return None
+
+    def drain_candidates(self) -> Iterator[TrackRecommendation]:
+        """Yield queued candidates in priority order until the queue is empty."""
+        while True:
+            rec = self.pop_candidate()
+            if rec is None:
+                return
+            yield rec
+
+    @property
+    def candidate_count(self) -> int:
+        """Number of candidates still queued."""
+        return len(self._candidates)
+
+    # ------------------------------------------------------------------
+    # Diversity scores
+    # ------------------------------------------------------------------
+
+    def genre_diversity_score(self) -> float:
+        """Genre variety score (0-1) from the genre histogram."""
+        if not self._members:
+            return 0.0
+        if self.tracks_with_genres == 0:
+            # No genre data available
+            return 0.5  # Neutral score
+
+        # Good diversity: at least 5-8 unique genres for a 20-track playlist
+        # Normalize: 8+ genres = 1.0 score, 0 genres = 0.0 score
+        return min(len(self.genre_counts) / 8.0, 1.0)
+
+    def temporal_diversity_score(self) -> float:
+        """Era variety score (0-1) from the release-year and decade histograms."""
+        if not self._members:
+            return 0.0
+        if not self.year_counts:
+            # No temporal data available
+            return 0.5  # Neutral score
+
+        year_span = max(self.year_counts) - min(self.year_counts)
+
+        # Good diversity: spans at least 2-3 decades
+        decade_score = min(len(self.decade_counts) / 3.0, 1.0)
+
+        # Year span bonus: 20+ years is excellent
+        span_score = min(year_span / 20.0, 1.0)
+
+        # Combine scores (favor decade diversity slightly more)
+        return decade_score * 0.6 + span_score * 0.4
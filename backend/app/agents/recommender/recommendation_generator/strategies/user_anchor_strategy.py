@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
+from .....services.spotify_token_manager import spotify_token_manager
 from ....states.agent_state import AgentState
 from ...utils.config import config
 from ...utils.temporal_filter import check_temporal_match
@@ -72,14 +73,14 @@ class UserAnchorStrategy(RecommendationStrategy):
         temporal_context = (
             state.mood_analysis.get("temporal_context") if state.mood_analysis else None
         )
-        access_token = state.metadata.get("spotify_access_token")
-
         if not (user_mentioned_track_ids or user_mentioned_artists):
             logger.info(
                 "No user-mentioned tracks or artists, user anchor strategy skipped"
             )
             return []
 
+        access_token = await spotify_token_manager.get_token_for_state(state)
+
         if not access_token:
             logger.warning("No access token for user anchor strategy")
             return []
@@ -34,11 +34,12 @@ class AudioEnricher:
 
         logger.info(f"Fetching audio features for {len(tracks)} tracks")
 
-        # Extract all track IDs
+        # Extract IDs of tracks that still lack features (taste profile tracks
+        # arrive enriched)
         track_id_to_track = {}
         for track in tracks:
             track_id = track.get("track_id") or track.get("id")
-            if track_id:
+            if track_id and "energy" not in track:
                 track_id_to_track[track_id] = track
 
         # Batch fetch all audio features at once
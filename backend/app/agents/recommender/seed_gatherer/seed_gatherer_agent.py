@@ -13,6 +13,8 @@ import time
 
 import structlog
 
+from ....services.spotify_token_manager import spotify_token_manager
+from ....services.taste_profile_service import taste_profile_service
 from ...core.base_agent import BaseAgent
 from ...states.agent_state import AgentState, RecommendationStatus
 from ...tools.spotify_service import SpotifyService
@@ -94,7 +96,7 @@ class SeedGathererAgent(BaseAgent):
         try:
             logger.info(f"Gathering seeds for user {state.user_id}")
 
-            access_token = self._get_access_token(state)
+            access_token = await self._get_access_token(state)
             intent_analysis = state.metadata.get("intent_analysis", {})
             is_remix, remix_tracks = self.remix_handler.setup_remix_mode(state)
 
@@ -123,9 +125,18 @@ class SeedGathererAgent(BaseAgent):
                 )
             )
 
-            # STEP 4: Fetch top tracks
+            # STEP 4: Fetch top tracks (precomputed taste profile when ready)
+            taste_profile = await taste_profile_service.get_profile(state.user_id)
+            if taste_profile is not None:
+                state.metadata["taste_profile_built_at"] = taste_profile["built_at"]
+
             top_tracks, fetch_time = await self.user_data_fetcher.fetch_top_tracks(
-                state, access_token, is_remix, remix_tracks, self._notify_progress
+                state,
+                access_token,
+                is_remix,
+                remix_tracks,
+                self._notify_progress,
+                taste_profile=taste_profile,
             )
             if fetch_time is not None:
                 timing_metrics["fetch_top_tracks"] = fetch_time
@@ -138,10 +149,18 @@ class SeedGathererAgent(BaseAgent):
             # STEP 5: Fetch top artists
             step_start = time.time()
             top_artists = await self.user_data_fetcher.fetch_top_artists(
-                state, access_token, is_remix, self._notify_progress
+                state,
+                access_token,
+                is_remix,
+                self._notify_progress,
+                taste_profile=taste_profile,
             )
             timing_metrics["fetch_top_artists"] = time.time() - step_start
 
+            if taste_profile is None:
+                # Reuses the top tracks/artists just cached; next run reads it
+                taste_profile_service.schedule_build(state.user_id, access_token)
+
             # STEP 6: Build optimized seed pool
             timing_metrics["build_seed_pool"] = await self._timed_step(
                 self._build_seed_pool(state, top_tracks, top_artists, access_token)
@@ -160,8 +179,8 @@ class SeedGathererAgent(BaseAgent):
 
         return state
 
-    def _get_access_token(self, state: AgentState) -> str:
-        """Get Spotify access token from state.
+    async def _get_access_token(self, state: AgentState) -> str:
+        """Get a fresh Spotify access token for the workflow.
 
         Args:
             state: Current agent state
@@ -173,7 +192,7 @@ class SeedGathererAgent(BaseAgent):
             ValueError: If no access token is available
         """
         if not hasattr(state, "access_token") or not state.access_token:
-            access_token = state.metadata.get("spotify_access_token")
+            access_token = await spotify_token_manager.get_token_for_state(state)
             if not access_token:
                 raise ValueError("No Spotify access token available for seed gathering")
             return access_token
@@ -1,8 +1,8 @@
 """User data fetching and merging.
 
 This module handles:
-- Fetching user's top tracks
-- Fetching user's top artists
+- Fetching user's top tracks (or reading them from the taste profile)
+- Fetching user's top artists (or reading them from the taste profile)
 - Merging user-mentioned tracks into seed pool
 """
 
@@ -34,6 +34,7 @@ class UserDataFetcher:
         is_remix: bool,
         remix_tracks: list,
         notify_progress_callback,
+        taste_profile: dict | None = None,
     ) -> tuple[list, float | None]:
         """Fetch top tracks for seed selection.
 
@@ -43,6 +44,8 @@ class UserDataFetcher:
             is_remix: Whether in remix mode
             remix_tracks: Remix tracks (if applicable)
             notify_progress_callback: Async callback for progress updates
+            taste_profile: Precomputed taste profile; its tracks already carry
+                audio features
 
         Returns:
             Tuple of (top_tracks, fetch_time). fetch_time is None for remix mode.
@@ -61,6 +64,9 @@ class UserDataFetcher:
             else:
                 top_tracks = remix_tracks
             fetch_time = None
+        elif taste_profile is not None:
+            top_tracks = list(taste_profile.get("tracks", []))
+            fetch_time = 0.0
         else:
             # Optimization: Pass user_id to enable caching
             step_start = time.time()
@@ -117,6 +123,7 @@ class UserDataFetcher:
         access_token: str,
         is_remix: bool,
         notify_progress_callback,
+        taste_profile: dict | None = None,
     ) -> list:
         """Fetch top artists and return the list.
 
@@ -125,6 +132,7 @@ class UserDataFetcher:
             access_token: Spotify access token
             is_remix: Whether in remix mode
             notify_progress_callback: Async callback for progress updates
+            taste_profile: Precomputed taste profile to read the artists from
 
         Returns:
             List of top artists
@@ -135,12 +143,15 @@ class UserDataFetcher:
         # Optimization: Reduce top artist fetch for remixing
         top_artist_limit = 5 if is_remix else 15
 
-        top_artists = await self.spotify_service.get_user_top_artists(
-            access_token=access_token,
-            limit=top_artist_limit,
-            time_range="medium_term",
-            user_id=state.user_id,
-        )
+        if taste_profile is not None:
+            top_artists = taste_profile.get("artists", [])[:top_artist_limit]
+        else:
+            top_artists = await self.spotify_service.get_user_top_artists(
+                access_token=access_token,
+                limit=top_artist_limit,
+                time_range="medium_term",
+                user_id=state.user_id,
+            )
 
         # Progress update after fetching artists
         state.current_step = "gathering_seeds_artists_fetched"
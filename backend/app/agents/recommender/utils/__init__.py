@@ -3,12 +3,20 @@
 from .config import RecommenderConfig, config
 from .llm_response_parser import LLMResponseParser
 from .recommendation_validator import RecommendationValidator, ValidationResult
+from .streaming_json import (
+    IncrementalJSONArrayParser,
+    astream_json_array_fields,
+    astream_json_arrays,
+)
 from .token_service import TokenService
 from .track_deduplicator import deduplicate_track_recommendations
 from .track_recommendation_factory import TrackRecommendationFactory
 
 __all__ = [
     "LLMResponseParser",
+    "IncrementalJSONArrayParser",
+    "astream_json_arrays",
+    "astream_json_array_fields",
     "TokenService",
     "RecommenderConfig",
     "config",
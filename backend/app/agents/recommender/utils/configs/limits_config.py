@@ -74,3 +74,11 @@ class LimitsConfig:
     popularity_tier_mainstream_ratio: float = 0.3  # 30% mainstream
     popularity_tier_mid_ratio: float = 0.5  # 50% mid-tier
     popularity_tier_niche_ratio: float = 0.2  # 20% niche
+
+    # Playlist ordering controls
+    phase_assignment_optimal_max_tracks: int = (
+        80  # Above this size the orderer falls back to greedy phase assignment
+    )
+    phase_sequencing_mode: str = "smooth"  # "smooth" = transition-cost path within phases, "sort" = single-key sort
+    phase_sequencing_max_tracks: int = 40  # Larger phases keep the single-key sort
+    phase_sequencing_time_budget_ms: float = 5.0  # 2-opt budget per phase
@@ -11,6 +11,9 @@ class OrchestrationConfig:
     max_iterations: int = 1
     cohesion_threshold: float = 0.65
     quality_threshold: float = 0.75
+    llm_reassessment_change_ratio: float = (
+        0.25  # Share of the playlist that must change before re-asking the LLM
+    )
 
     # Agent settings
     timeout_per_agent: int = 120
@@ -26,3 +29,6 @@ class OrchestrationConfig:
     user_mentioned_artist_ratio: float = (
         0.5  # Max share of playlist for user-mentioned artists
     )
+    candidate_reservoir_max_size: int = (
+        300  # Surplus candidates kept per session for outlier replacement
+    )
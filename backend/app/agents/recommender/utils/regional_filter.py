@@ -1,6 +1,84 @@
 """Centralized regional, language, and theme filtering utilities."""
 
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Unicode blocks used to detect CJK scripts (indicator lists hold (start, end) pairs)
+SCRIPT_LANGUAGES = {"korean", "japanese", "chinese"}
+
+# Space-terminated tokens; word indicators are matched against each token's tail
+_TOKEN_PATTERN = re.compile(r"([^ ]+) ")
+
+
+class LanguageDetector:
+    """Precompiled language detector for track and artist names.
+
+    Word indicators (e.g. ``"el "``) are folded into a suffix table consulted once
+    per space-terminated token, so a single regex pass over the text finds every
+    language with a matching word. Script languages are defined by Unicode ranges
+    and compiled into one character-class regex each.
+    """
+
+    def __init__(self, language_indicators: Dict[str, Sequence[str]]):
+        """Compile the indicators.
+
+        Args:
+            language_indicators: Language name to indicator list. Script languages
+                list range boundaries as consecutive (start, end) characters; every
+                other language lists space-terminated words.
+        """
+        # Dict order is the detection priority when several languages match
+        self.languages = list(language_indicators.keys())
+        self._word_suffixes: Dict[str, Set[str]] = {}
+        self._script_patterns: Dict[str, re.Pattern] = {}
+
+        for language, indicators in language_indicators.items():
+            if language in SCRIPT_LANGUAGES:
+                ranges = "".join(
+                    f"{re.escape(start)}-{re.escape(end)}"
+                    for start, end in zip(indicators[::2], indicators[1::2])
+                )
+                self._script_patterns[language] = re.compile(f"[{ranges}]")
+                continue
+
+            for indicator in indicators:
+                word = indicator.rstrip(" ")
+                if word:
+                    self._word_suffixes.setdefault(word, set()).add(language)
+
+        self._max_word_length = max((len(w) for w in self._word_suffixes), default=0)
+
+    def detect_languages(self, text: str) -> List[str]:
+        """Detect every language with an indicator in the text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Matching languages in priority order
+        """
+        matched: Set[str] = set()
+
+        for language, pattern in self._script_patterns.items():
+            if pattern.search(text):
+                matched.add(language)
+
+        suffixes = self._word_suffixes
+        max_length = self._max_word_length
+        for token in _TOKEN_PATTERN.findall(text):
+            # An indicator like "la " also matches the tail of "hola ", as before
+            for length in range(1, min(len(token), max_length) + 1):
+                languages = suffixes.get(token[-length:])
+                if languages:
+                    matched.update(languages)
+
+        return [language for language in self.languages if language in matched]
+
+    def detect_language(self, text: str) -> Optional[str]:
+        """Detect the highest-priority language in the text, or None."""
+        languages = self.detect_languages(text)
+        return languages[0] if languages else None
 
 
 class RegionalFilter:
@@ -20,6 +98,7 @@ class RegionalFilter:
             "por ",
             "para ",
         ],
+        # Script languages list Unicode ranges as (start, end) pairs
         "korean": ["\u3131", "\u314f", "\uac00", "\ud7a3"],  # Hangul character ranges
         "japanese": ["\u3040", "\u309f", "\u30a0", "\u30ff"],  # Hiragana/Katakana
         "chinese": ["\u4e00", "\u9fff"],  # Common CJK
@@ -96,6 +175,15 @@ class RegionalFilter:
         "european": ["french", "german", "italian", "spanish", "portuguese", "british"],
     }
 
+    _language_detector: Optional[LanguageDetector] = None
+
+    @classmethod
+    def get_language_detector(cls) -> LanguageDetector:
+        """Get the compiled detector for LANGUAGE_INDICATORS (built on first use)."""
+        if cls._language_detector is None:
+            cls._language_detector = LanguageDetector(cls.LANGUAGE_INDICATORS)
+        return cls._language_detector
+
     @classmethod
     def detect_track_region(cls, track_name: str, artists: List[str]) -> Optional[str]:
         """Detect the likely region/origin of a track based on language indicators in track/artist names.
@@ -107,29 +195,37 @@ class RegionalFilter:
         Returns:
             Detected region or None
         """
+        return cls._detect_track_region_cached(track_name, tuple(artists))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _detect_track_region_cached(
+        cls, track_name: str, artists: Tuple[str, ...]
+    ) -> Optional[str]:
+        """Memoized region detection keyed by (track name, artists)."""
         track_and_artists = (track_name + " " + " ".join(artists)).lower()
 
-        # Check for each language's indicators
-        for language, indicators in cls.LANGUAGE_INDICATORS.items():
-            for indicator in indicators:
-                if isinstance(indicator, str):
-                    if indicator in track_and_artists:
-                        return cls.LANGUAGE_TO_REGION.get(
-                            language, language.capitalize()
-                        )
-                else:
-                    # Unicode range check for CJK languages
-                    for char in track_and_artists:
-                        if (
-                            indicator
-                            <= char
-                            <= indicators[indicators.index(indicator) + 1]
-                        ):
-                            return cls.LANGUAGE_TO_REGION.get(
-                                language, language.capitalize()
-                            )
+        language = cls.get_language_detector().detect_language(track_and_artists)
+        if language is None:
+            return None
+        return cls.LANGUAGE_TO_REGION.get(language, language.capitalize())
 
-        return None
+    @classmethod
+    def detect_track_regions(
+        cls, tracks: Iterable[Tuple[str, List[str]]]
+    ) -> List[Optional[str]]:
+        """Detect regions for a whole candidate list.
+
+        Args:
+            tracks: (track_name, artists) pairs
+
+        Returns:
+            Detected region (or None) for each track, in input order
+        """
+        return [
+            cls._detect_track_region_cached(track_name, tuple(artists))
+            for track_name, artists in tracks
+        ]
 
     @classmethod
     def detect_artist_region(cls, artist_name: str, genres: List[str]) -> Optional[str]:
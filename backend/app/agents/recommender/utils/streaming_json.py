@@ -0,0 +1,290 @@
+"""Incremental parsing of JSON arrays from streamed LLM output."""
+
+import json
+from contextlib import aclosing
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import structlog
+from langchain_core.messages import BaseMessage
+
+from .llm_response_parser import LLMResponseParser
+
+logger = structlog.get_logger(__name__)
+
+# (array key, element); the key is None when streaming a top-level array
+StreamedItem = Tuple[Optional[str], Any]
+
+
+class IncrementalJSONArrayParser:
+    """Yield completed array elements while a JSON document is still streaming.
+
+    With ``keys`` the document is expected to be an object and the elements of
+    the arrays stored under those top-level keys are emitted, e.g. the indices
+    of ``{"keep_artists": [0, 2, ...]}`` one by one. Without ``keys`` the
+    elements of a top-level array are emitted. Text before the document (prose,
+    markdown fences) is ignored, mirroring ``LLMResponseParser``.
+
+    Usage:
+        parser = IncrementalJSONArrayParser(keys=["keep_artists"])
+        for chunk in chunks:
+            for key, element in parser.feed(chunk):
+                ...
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None):
+        """Initialize the parser.
+
+        Args:
+            keys: Top-level object keys whose arrays should be streamed, or None
+                to stream the elements of a top-level array
+        """
+        self.keys: Optional[Set[str]] = set(keys) if keys is not None else None
+        self.completed_keys: Set[Optional[str]] = set()
+
+        self._text = ""
+        self._position = 0
+        self._stack: List[str] = []
+        self._started = False
+        self._finished = False
+        self._in_string = False
+        self._escape = False
+
+        self._string_start: Optional[int] = None
+        self._key_candidate: Optional[str] = None
+        self._current_key: Optional[str] = None
+
+        self._active = False
+        self._active_key: Optional[str] = None
+        self._element_depth = 0
+        self._element_start: Optional[int] = None
+        self._element_is_container = False
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return self._text
+
+    @property
+    def finished(self) -> bool:
+        """Whether the top-level JSON value has been closed."""
+        return self._finished
+
+    def is_complete(self, key: Optional[str] = None) -> bool:
+        """Whether the array under ``key`` (None: the top-level array) has closed."""
+        return key in self.completed_keys
+
+    def feed(self, chunk: str) -> List[StreamedItem]:
+        """Consume a chunk of output.
+
+        Args:
+            chunk: Next piece of the streamed completion
+
+        Returns:
+            ``(key, element)`` pairs for every element completed by this chunk
+        """
+        self._text += chunk
+        text = self._text
+        items: List[StreamedItem] = []
+
+        index = self._position
+        while index < len(text) and not self._finished:
+            self._scan(text, index, items)
+            index += 1
+        self._position = index
+        return items
+
+    def parse_document(self, fallback: Optional[Any] = None) -> Any:
+        """Parse everything fed so far as a whole, like the non-streaming path."""
+        if self.keys is None:
+            return LLMResponseParser.extract_json_array_from_response(
+                self.text, fallback=fallback
+            )
+        return LLMResponseParser.extract_json_from_response(
+            self.text, fallback=fallback
+        )
+
+    def _scan(self, text: str, index: int, items: List[StreamedItem]) -> None:
+        """Advance the state machine by one character."""
+        char = text[index]
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._string_start is not None:
+                    self._key_candidate = text[self._string_start + 1 : index]
+                    self._string_start = None
+            return
+
+        if not self._started:
+            if char == ("[" if self.keys is None else "{"):
+                self._started = True
+                self._stack.append(char)
+                if self.keys is None:
+                    self._start_array(None)
+            return
+
+        depth = len(self._stack)
+        if char == '"':
+            self._in_string = True
+            if self._is_element_slot(depth):
+                self._start_element(index, container=False)
+            elif depth == 1 and self.keys is not None:
+                self._string_start = index
+        elif char in "{[":
+            if self._is_element_slot(depth):
+                self._start_element(index, container=True)
+            self._stack.append(char)
+            if (
+                char == "["
+                and self.keys is not None
+                and len(self._stack) == 2
+                and self._current_key in self.keys
+            ):
+                self._start_array(self._current_key)
+        elif char in "}]":
+            self._stack.pop()
+            depth = len(self._stack)
+            if self._active and depth == self._element_depth - 1:
+                self._finish_element(text, index, items)
+                self._active = False
+                self.completed_keys.add(self._active_key)
+            elif (
+                self._active
+                and depth == self._element_depth
+                and self._element_is_container
+            ):
+                self._finish_element(text, index + 1, items)
+            if not self._stack:
+                self._finished = True
+        elif char == ",":
+            if self._active and depth == self._element_depth:
+                self._finish_element(text, index, items)
+            if depth == 1:
+                self._current_key = None
+        elif char == ":":
+            if depth == 1:
+                self._current_key = self._key_candidate
+        elif not char.isspace() and self._is_element_slot(depth):
+            self._start_element(index, container=False)
+
+    def _start_array(self, key: Optional[str]) -> None:
+        self._active = True
+        self._active_key = key
+        self._element_depth = len(self._stack)
+        self._element_start = None
+
+    def _is_element_slot(self, depth: int) -> bool:
+        """Whether the next value starts a new element of the active array."""
+        return (
+            self._active
+            and depth == self._element_depth
+            and self._element_start is None
+        )
+
+    def _start_element(self, index: int, container: bool) -> None:
+        self._element_start = index
+        self._element_is_container = container
+
+    def _finish_element(self, text: str, end: int, items: List[StreamedItem]) -> None:
+        """Decode the pending element ending before ``end``, if any."""
+        if self._element_start is None:
+            return
+        raw = text[self._element_start : end].strip()
+        self._element_start = None
+        try:
+            items.append((self._active_key, json.loads(raw)))
+        except json.JSONDecodeError:
+            logger.debug("Skipping malformed streamed JSON element", element=raw[:200])
+
+
+async def astream_json_arrays(
+    llm: Any,
+    messages: Union[str, List[BaseMessage], List[Dict[str, str]]],
+    on_item: Callable[[Optional[str], Any], Optional[Awaitable[None]]],
+    keys: Optional[Iterable[str]] = None,
+    stop_when_complete: bool = False,
+) -> IncrementalJSONArrayParser:
+    """Stream an LLM completion and hand over array elements as they complete.
+
+    Runs the whole stream inside the calling task, so the stream is closed
+    deterministically even when it is abandoned early.
+
+    Args:
+        llm: Chat model (``LoggingChatModel`` or any LangChain chat model)
+        messages: Prompt in any form ``ainvoke`` accepts
+        on_item: Called with ``(key, element)`` for each completed element; may
+            be a coroutine function
+        keys: Top-level keys whose arrays to stream (None: a top-level array)
+        stop_when_complete: Stop reading once every requested array has closed,
+            skipping whatever the model writes afterwards
+
+    Returns:
+        The parser, for ``parse_document`` fallbacks and completion checks
+    """
+    parser = IncrementalJSONArrayParser(keys)
+    wanted = set(keys) if keys is not None else {None}
+
+    async with aclosing(llm.astream(messages)) as stream:
+        async for chunk in stream:
+            content = chunk.content if hasattr(chunk, "content") else str(chunk)
+            if not isinstance(content, str):
+                continue
+            for key, element in parser.feed(content):
+                result = on_item(key, element)
+                if result is not None:
+                    await result
+            if stop_when_complete and wanted <= parser.completed_keys:
+                break
+
+    return parser
+
+
+async def astream_json_array_fields(
+    llm: Any,
+    messages: Union[str, List[BaseMessage], List[Dict[str, str]]],
+    keys: Iterable[str],
+) -> Dict[str, List[Any]]:
+    """Collect the arrays under ``keys`` and stop reading once they are closed.
+
+    Anything the model writes after the last wanted array (summaries,
+    reasoning) is never waited for. If the output does not have the expected
+    shape the whole text is parsed instead, like the non-streaming path.
+
+    Args:
+        llm: Chat model
+        messages: Prompt in any form ``ainvoke`` accepts
+        keys: Top-level keys holding the arrays to collect
+
+    Returns:
+        Mapping of each key to its elements (empty when absent)
+    """
+    fields: Dict[str, List[Any]] = {key: [] for key in keys}
+    parser = await astream_json_arrays(
+        llm,
+        messages,
+        on_item=lambda key, element: fields[key].append(element),
+        keys=fields,
+        stop_when_complete=True,
+    )
+
+    if not parser.completed_keys:
+        result = parser.parse_document(fallback={})
+        for key in fields:
+            value = result.get(key, [])
+            fields[key] = value if isinstance(value, list) else []
+    return fields
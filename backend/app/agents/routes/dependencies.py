@@ -4,7 +4,12 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Dict
 
-from ...core.llm_factory import create_logged_llm
+from ...core.config import settings
+from ...core.llm_factory import create_logged_llm, create_playlist_llm
+from ...playlists.services.playlist_describer import PlaylistDescriber
+from ...playlists.services.playlist_namer import PlaylistNamer
+from ...playlists.services.presave_preparer import PresavePreparer
+from ...services.taste_profile_service import taste_profile_service
 from ..recommender import (
     IntentAnalyzerAgent,
     MoodAnalyzerAgent,
@@ -36,6 +41,7 @@ def _create_agent_resources() -> AgentResources:
 
     reccobeat_service = RecoBeatService()
     spotify_service = SpotifyService()
+    taste_profile_service.use_services(spotify_service, reccobeat_service)
 
     llm = create_logged_llm(
         model="google/gemini-2.5-flash-lite-preview-09-2025",
@@ -80,6 +86,10 @@ def _create_agent_resources() -> AgentResources:
         max_recommendations=config.max_recommendations,
         enable_human_loop=True,
         require_approval=True,
+        max_concurrent_workflows=settings.WORKFLOW_MAX_CONCURRENT,
+        max_queued_workflows=settings.WORKFLOW_MAX_QUEUED,
+        max_queued_per_user=settings.WORKFLOW_MAX_QUEUED_PER_USER,
+        dispatch_timeout=settings.WORKFLOW_DISPATCH_TIMEOUT,
     )
 
     agents = {
@@ -91,7 +101,21 @@ def _create_agent_resources() -> AgentResources:
         "playlist_orderer": playlist_orderer,
     }
 
-    workflow_manager = WorkflowManager(workflow_config, agents, reccobeat_service.tools)
+    # Same model the save endpoint names playlists with, so prepared names and
+    # descriptions read the same as ones generated at save time
+    playlist_llm = create_playlist_llm()
+    presave_preparer = PresavePreparer(
+        PlaylistNamer(llm=playlist_llm),
+        PlaylistDescriber(llm=playlist_llm),
+        cover_style="modern",
+    )
+
+    workflow_manager = WorkflowManager(
+        workflow_config,
+        agents,
+        reccobeat_service.tools,
+        presave_preparer=presave_preparer,
+    )
 
     return AgentResources(
         llm=llm,
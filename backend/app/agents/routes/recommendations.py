@@ -1,6 +1,5 @@
 """Recommendation workflow API endpoints."""
 
-import asyncio
 from typing import Any, Optional
 
 import structlog
@@ -21,6 +20,8 @@ from ...core.exceptions import (
     NotFoundException,
     UnauthorizedException,
     ValidationException,
+    WorkflowException,
+    WorkflowQueueFullException,
 )
 from ...core.limiter import limiter
 from ...dependencies import get_playlist_repository, get_quota_service
@@ -28,10 +29,9 @@ from ...models.playlist import Playlist
 from ...models.user import User
 from ...repositories.playlist_repository import PlaylistRepository
 from ...services.quota_service import QuotaService
-from ..core.cache import cache_manager
-from ..tools.reccobeat_service import RecoBeatService
+from ...services.taste_profile_service import taste_profile_service
 from ..tools.spotify_service import SpotifyService
-from ..workflows.workflow_manager import WorkflowManager
+from ..workflows.workflow_manager import TERMINAL_STATUSES, WorkflowManager
 from .dependencies import get_llm, get_workflow_manager
 from .serializers import serialize_playlist_status, serialize_workflow_state
 from .streaming import create_sse_stream, handle_websocket_connection
@@ -99,9 +99,12 @@ async def start_recommendation(
             "session_id": session_id,
             "status": "started",
             "mood_prompt": mood_prompt,
+            "queue_position": workflow_manager.get_queue_position(session_id),
             "message": "Recommendation workflow started successfully",
         }
 
+    except WorkflowQueueFullException:
+        raise
     except Exception as exc:
         logger.error(
             "Error starting recommendation workflow", error=str(exc), exc_info=True
@@ -257,6 +260,7 @@ async def remix_playlist(
             "session_id": session_id,
             "status": "started",
             "mood_prompt": final_mood_prompt,
+            "queue_position": workflow_manager.get_queue_position(session_id),
             "message": "Remix workflow started successfully",
             "source_tracks_count": len(remix_tracks),
         }
@@ -264,7 +268,13 @@ async def remix_playlist(
     except Exception as exc:
         logger.error("Error starting remix workflow", error=str(exc), exc_info=True)
         if isinstance(
-            exc, (NotFoundException, ValidationException, UnauthorizedException)
+            exc,
+            (
+                NotFoundException,
+                ValidationException,
+                UnauthorizedException,
+                WorkflowQueueFullException,
+            ),
         ):
             raise
         raise InternalServerError(f"Failed to start remix workflow: {exc}") from exc
@@ -511,6 +521,42 @@ async def get_workflow_cost(
         raise InternalServerError(f"Failed to get workflow cost: {exc}") from exc
 
 
+@router.get("/recommendations/{session_id}/profile")
+async def get_workflow_profile(
+    session_id: str,
+    workflow_manager: WorkflowManager = Depends(get_workflow_manager),
+):
+    """Get the critical-path breakdown of a workflow run.
+
+    Built from the run's trace when the workflow finishes: wall time versus
+    I/O wait per upstream, concurrency per agent stage, throttle sleeps and
+    the slowest calls.
+    """
+    state = workflow_manager.get_workflow_state(session_id)
+    if state is None:
+        raise NotFoundException("Workflow", session_id)
+
+    profile = state.metadata.get("profile")
+    if profile is None:
+        if state.status not in TERMINAL_STATUSES:
+            raise WorkflowException(
+                "Workflow profile is available once the workflow has finished",
+                status_code=409,
+            )
+        raise WorkflowException(
+            "No profile was recorded for this workflow: tracing was disabled "
+            "where it ran (set TRACING_ENABLED=true to profile workflows)",
+            status_code=409,
+        )
+
+    return {
+        "session_id": session_id,
+        **profile,
+        "status": state.status.value,
+        "step_timings": state.metadata.get("step_timings"),
+    }
+
+
 @router.get("/recommendations/{session_id}/playlist")
 async def get_playlist_details(
     session_id: str,
@@ -564,8 +610,8 @@ async def prefetch_user_cache(
 ):
     """Prefetch and warm up user's cache for faster playlist generation.
 
-    Triggered when the user loads the dashboard to hydrate cache with top tracks,
-    artists, and audio features in the background.
+    Triggered when the user loads the dashboard to build the user's taste
+    profile (top tracks, artists, and audio features) in the background.
     """
     try:
         logger.info("Starting cache prefetch", user_id=current_user.id)
@@ -573,18 +619,9 @@ async def prefetch_user_cache(
         # Refresh token if needed
         current_user = await refresh_spotify_token_if_expired(current_user, db)
 
-        # Initialize services (these would normally be injected)
-        spotify_service = SpotifyService()
-        reccobeat_service = RecoBeatService()
-
-        # Launch background cache warming (fire-and-forget)
-        asyncio.create_task(
-            cache_manager.warm_user_cache(
-                user_id=str(current_user.id),
-                spotify_service=spotify_service,
-                reccobeat_service=reccobeat_service,
-                access_token=current_user.access_token,
-            )
+        # Launch background profile build (fire-and-forget)
+        taste_profile_service.schedule_build(
+            str(current_user.id), current_user.access_token
         )
 
         return {
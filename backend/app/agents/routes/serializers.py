@@ -67,6 +67,7 @@ def serialize_workflow_state(
         "user_top_artists_count": len(state.user_top_artists),
         "has_playlist": state.playlist_id is not None,
         "awaiting_input": state.awaiting_user_input,
+        "queue_position": state.metadata.get("queue_position"),
         "error": state.error_message,
         "created_at": state.created_at.isoformat(),
         "updated_at": state.updated_at.isoformat(),
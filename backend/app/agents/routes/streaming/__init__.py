@@ -1,11 +1,12 @@
 """Streaming utilities for workflow status updates."""
 
 from .sse_handler import create_sse_stream
-from .streaming_utils import is_forward_progress
+from .streaming_utils import is_forward_progress, progress_step
 from .websocket_handler import handle_websocket_connection
 
 __all__ = [
     "create_sse_stream",
     "handle_websocket_connection",
     "is_forward_progress",
+    "progress_step",
 ]
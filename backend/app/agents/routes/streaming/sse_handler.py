@@ -10,7 +10,7 @@ from ....core.constants import PlaylistStatus
 from ....models.playlist import Playlist
 from ...workflows.workflow_manager import WorkflowManager
 from ..serializers import serialize_playlist_status, serialize_workflow_state
-from .streaming_utils import is_forward_progress
+from .streaming_utils import is_forward_progress, progress_step
 
 logger = structlog.get_logger(__name__)
 
@@ -55,7 +55,7 @@ async def create_sse_stream(
         if state:
             status_data = serialize_workflow_state(session_id, state)
             last_sent_status = state.status.value
-            last_sent_step = state.current_step
+            last_sent_step = progress_step(state)
 
             yield f"event: status\ndata: {json.dumps(status_data)}\n\n"
 
@@ -113,7 +113,7 @@ async def create_sse_stream(
                 # Only send if status or step actually changed AND it's forward progress
                 if (
                     state_to_send.status.value != last_sent_status
-                    or state_to_send.current_step != last_sent_step
+                    or progress_step(state_to_send) != last_sent_step
                 ):
                     # Check if this is forward progress (prevent backwards updates)
                     if is_forward_progress(
@@ -123,7 +123,7 @@ async def create_sse_stream(
                             session_id, state_to_send
                         )
                         last_sent_status = state_to_send.status.value
-                        last_sent_step = state_to_send.current_step
+                        last_sent_step = progress_step(state_to_send)
 
                         yield f"event: status\ndata: {json.dumps(status_data)}\n\n"
 
@@ -149,7 +149,7 @@ async def create_sse_stream(
                     # Check if state changed while we were waiting AND it's forward progress
                     if (
                         current_state.status.value != last_sent_status
-                        or current_state.current_step != last_sent_step
+                        or progress_step(current_state) != last_sent_step
                     ):
                         # Check if this is forward progress
                         if is_forward_progress(
@@ -159,7 +159,7 @@ async def create_sse_stream(
                                 session_id, current_state
                             )
                             last_sent_status = current_state.status.value
-                            last_sent_step = current_state.current_step
+                            last_sent_step = progress_step(current_state)
 
                             yield f"event: status\ndata: {json.dumps(status_data)}\n\n"
 
@@ -25,3 +25,15 @@ def is_forward_progress(current_status: str, new_status: str) -> bool:
 
     # Allow same order (sub-steps) or forward progress
     return new_order >= current_order
+
+
+def progress_step(state) -> str:
+    """Step marker used to detect changes worth streaming.
+
+    Queued workflows stay on the same step while they move up the queue, so
+    the queue position is part of the marker.
+    """
+    queue_position = state.metadata.get("queue_position")
+    if queue_position is not None:
+        return f"{state.current_step}:{queue_position}"
+    return state.current_step
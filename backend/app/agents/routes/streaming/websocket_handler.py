@@ -8,7 +8,7 @@ from fastapi import WebSocket, WebSocketDisconnect
 from ....core.constants import PlaylistStatus
 from ...workflows.workflow_manager import WorkflowManager
 from ..serializers import serialize_workflow_state
-from .streaming_utils import is_forward_progress
+from .streaming_utils import is_forward_progress, progress_step
 from .websocket_auth import authenticate_websocket
 
 logger = structlog.get_logger(__name__)
@@ -73,7 +73,7 @@ async def handle_websocket_connection(
             if state:
                 status_data = serialize_workflow_state(session_id, state)
                 last_sent_status = state.status.value
-                last_sent_step = state.current_step
+                last_sent_step = progress_step(state)
                 await websocket.send_json({"type": "status", "data": status_data})
 
                 if state.status.value in ["completed", "failed", "cancelled"]:
@@ -153,7 +153,7 @@ async def handle_websocket_connection(
 
                             if (
                                 current_state.status.value != last_sent_status
-                                or current_state.current_step != last_sent_step
+                                or progress_step(current_state) != last_sent_step
                             ):
                                 logger.info(
                                     "WebSocket detected state change",
@@ -171,7 +171,7 @@ async def handle_websocket_connection(
                                         session_id, current_state
                                     )
                                     last_sent_status = current_state.status.value
-                                    last_sent_step = current_state.current_step
+                                    last_sent_step = progress_step(current_state)
 
                                     logger.info(
                                         "WebSocket sending status update",
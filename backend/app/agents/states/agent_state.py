@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class RecommendationStatus(str, Enum):
@@ -132,6 +132,54 @@ class AgentState(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # Surplus generation candidates (a CandidateReservoir); in memory only
+    _candidate_reservoir: Optional[Any] = PrivateAttr(default=None)
+
+    # Per-track quality scores across orchestration iterations; in memory only
+    _quality_tracker: Optional[Any] = PrivateAttr(default=None)
+
+    # Artist and tier histograms of the generation candidate pool; in memory only
+    _diversity_index: Optional[Any] = PrivateAttr(default=None)
+
+    @property
+    def candidate_reservoir(self) -> Optional[Any]:
+        """Surplus candidates kept for outlier replacement, if any."""
+        return self._candidate_reservoir
+
+    def attach_candidate_reservoir(self, reservoir: Any) -> None:
+        """Attach the session's candidate reservoir.
+
+        Args:
+            reservoir: CandidateReservoir for this workflow session
+        """
+        self._candidate_reservoir = reservoir
+
+    @property
+    def quality_tracker(self) -> Optional[Any]:
+        """Incremental quality aggregates for this session, if any."""
+        return self._quality_tracker
+
+    def attach_quality_tracker(self, tracker: Any) -> None:
+        """Attach the session's incremental quality tracker.
+
+        Args:
+            tracker: QualityTracker for this workflow session
+        """
+        self._quality_tracker = tracker
+
+    @property
+    def diversity_index(self) -> Optional[Any]:
+        """Incremental diversity index of the candidate pool, if any."""
+        return self._diversity_index
+
+    def attach_diversity_index(self, index: Any) -> None:
+        """Attach the session's candidate-pool diversity index.
+
+        Args:
+            index: DiversityIndex for this workflow session
+        """
+        self._diversity_index = index
+
     def update_timestamp(self):
         """Update the updated_at timestamp."""
         self.updated_at = datetime.now(timezone.utc)
@@ -6,6 +6,7 @@ import json
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Type
+from urllib.parse import urlparse
 
 import httpx
 import structlog
@@ -13,6 +14,15 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ..core.cache import cache_manager
+from ..core.tracing import (
+    SPAN_KIND_CLIENT,
+    THROTTLE_MIN_INTERVAL,
+    THROTTLE_RATE_LIMIT_WINDOW,
+    THROTTLE_RETRY_BACKOFF,
+    record_upstream_call,
+    traced_sleep,
+    tracer,
+)
 from .rate_limit_handlers import handle_rate_limit_error
 
 logger = structlog.get_logger(__name__)
@@ -295,7 +305,9 @@ class BaseAPITool(BaseTool, ABC):
                     logger.warning(
                         f"Timeout when calling {self.name}, retrying in {wait_time}s..."
                     )
-                    await asyncio.sleep(wait_time)
+                    await traced_sleep(
+                        wait_time, THROTTLE_RETRY_BACKOFF, **{"tool.name": self.name}
+                    )
                     continue
 
             except httpx.HTTPStatusError as e:
@@ -312,7 +324,9 @@ class BaseAPITool(BaseTool, ABC):
                     logger.warning(
                         f"Server error ({e.response.status_code}) when calling {self.name}, retrying in {wait_time}s..."
                     )
-                    await asyncio.sleep(wait_time)
+                    await traced_sleep(
+                        wait_time, THROTTLE_RETRY_BACKOFF, **{"tool.name": self.name}
+                    )
                     continue
 
                 # Handle 429 rate limits with aggressive backoff
@@ -356,7 +370,9 @@ class BaseAPITool(BaseTool, ABC):
                         error=str(e) or e.__class__.__name__,
                         url=request_url,
                     )
-                    await asyncio.sleep(wait_time)
+                    await traced_sleep(
+                        wait_time, THROTTLE_RETRY_BACKOFF, **{"tool.name": self.name}
+                    )
                     continue
                 break
 
@@ -396,45 +412,63 @@ class BaseAPITool(BaseTool, ABC):
         Returns:
             Response JSON data
         """
-        # Check cache first if caching is enabled
-        if use_cache:
-            cache_key = self._make_cache_key(method, endpoint, params, json_data)
-            cached_response = await self._get_cached_response(cache_key)
-            if cached_response is not None:
-                return cached_response
-
-        url = f"{self.base_url}{endpoint}"
-
-        # Default headers
-        request_headers = {
-            "Accept": "application/json",
-            "User-Agent": "MoodList-Agent/1.0",
-        }
-        if headers:
-            request_headers.update(headers)
-
-        if json_data:
-            request_headers["Content-Type"] = "application/json"
-
-        async def _request():
-            response = await self.client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        with tracer.start_span(
+            f"HTTP {method}",
+            attributes={
+                "tool.name": self.name,
+                "http.method": method,
+                "http.route": endpoint,
+                "server.address": urlparse(self.base_url).netloc,
+            },
+            kind=SPAN_KIND_CLIENT,
+        ) as span:
+            # Check cache first if caching is enabled
+            if use_cache:
+                cache_key = self._make_cache_key(method, endpoint, params, json_data)
+                cached_response = await self._get_cached_response(cache_key)
+                if cached_response is not None:
+                    span.set_attribute("cache.hit", True)
+                    return cached_response
+
+            record_upstream_call()
+            url = f"{self.base_url}{endpoint}"
+
+            # Default headers
+            request_headers = {
+                "Accept": "application/json",
+                "User-Agent": "MoodList-Agent/1.0",
+            }
+            if headers:
+                request_headers.update(headers)
+
+            if json_data:
+                request_headers["Content-Type"] = "application/json"
+
+            attempts = 0
+
+            async def _request():
+                nonlocal attempts
+                attempts += 1
+                span.set_attribute("http.attempts", attempts)
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=request_headers,
+                )
+                span.set_attribute("http.status_code", response.status_code)
+                response.raise_for_status()
+                return response.json()
 
-        response = await self._execute_with_retry(_request)
+            response = await self._execute_with_retry(_request)
 
-        # Cache the response if caching is enabled
-        if use_cache:
-            cache_key = self._make_cache_key(method, endpoint, params, json_data)
-            await self._cache_response(cache_key, response, cache_ttl)
+            # Cache the response if caching is enabled
+            if use_cache:
+                cache_key = self._make_cache_key(method, endpoint, params, json_data)
+                await self._cache_response(cache_key, response, cache_ttl)
 
-        return response
+            return response
 
     def _validate_response(
         self, response_data: Dict[str, Any], required_fields: List[str]
@@ -541,7 +575,9 @@ class RateLimitedTool(BaseAPITool):
                 logger.warning(
                     f"Rate limit reached for {self.name} (scope={scope}), waiting {wait_seconds:.1f}s"
                 )
-                await asyncio.sleep(wait_seconds)
+                await traced_sleep(
+                    wait_seconds, THROTTLE_RATE_LIMIT_WINDOW, **{"tool.name": self.name}
+                )
 
     async def _record_request(self, scope: str = "default"):
         """Record a request for rate limiting."""
@@ -590,10 +626,29 @@ class RateLimitedTool(BaseAPITool):
 
         Args mirror BaseAPITool plus optional request_scope to separate rate buckets.
         """
-        # Use global semaphore if enabled (for APIs that don't handle concurrency well)
-        if self.use_global_semaphore:
-            semaphore = get_reccobeat_semaphore()
-            async with semaphore:
+        with tracer.start_span(
+            f"{self.name}.request",
+            attributes={
+                "tool.name": self.name,
+                "http.route": endpoint,
+                "request.scope": request_scope,
+            },
+        ):
+            # Use global semaphore if enabled (for APIs that don't handle concurrency well)
+            if self.use_global_semaphore:
+                semaphore = get_reccobeat_semaphore()
+                async with semaphore:
+                    return await self._make_request_internal(
+                        method,
+                        endpoint,
+                        params,
+                        json_data,
+                        headers,
+                        use_cache,
+                        cache_ttl,
+                        request_scope,
+                    )
+            else:
                 return await self._make_request_internal(
                     method,
                     endpoint,
@@ -604,17 +659,6 @@ class RateLimitedTool(BaseAPITool):
                     cache_ttl,
                     request_scope,
                 )
-        else:
-            return await self._make_request_internal(
-                method,
-                endpoint,
-                params,
-                json_data,
-                headers,
-                use_cache,
-                cache_ttl,
-                request_scope,
-            )
 
     async def _make_request_internal(
         self,
@@ -680,7 +724,11 @@ class RateLimitedTool(BaseAPITool):
                                 f"Enforcing minimum interval for {self.name} (scope={request_scope}), "
                                 f"waiting {wait_time:.2f}s"
                             )
-                            await asyncio.sleep(wait_time)
+                            await traced_sleep(
+                                wait_time,
+                                THROTTLE_MIN_INTERVAL,
+                                **{"tool.name": self.name},
+                            )
 
                     # Update last request time immediately to block other concurrent requests
                     self._scope_last_request_time[request_scope] = datetime.now(
@@ -760,7 +808,9 @@ class RateLimitedTool(BaseAPITool):
                         f"Enforcing minimum interval for {self.name} (scope={request_scope}), "
                         f"waiting {wait_time:.2f}s"
                     )
-                    await asyncio.sleep(wait_time)
+                    await traced_sleep(
+                        wait_time, THROTTLE_MIN_INTERVAL, **{"tool.name": self.name}
+                    )
 
             await self._check_rate_limit(request_scope)
             formatted_params = self._format_params(params)
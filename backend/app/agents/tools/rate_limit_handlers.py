@@ -4,12 +4,13 @@ This module provides utilities for handling HTTP 429 (rate limit) errors
 with appropriate retry logic and backoff strategies.
 """
 
-import asyncio
 from typing import TYPE_CHECKING, Optional, Tuple
 
 import httpx
 import structlog
 
+from ..core.tracing import THROTTLE_RETRY_AFTER, THROTTLE_RETRY_BACKOFF, traced_sleep
+
 if TYPE_CHECKING:
     from .agent_tools import APIError
 
@@ -84,7 +85,11 @@ async def handle_rate_limit_error(
         logger.warning(
             f"Rate limit (429) when calling {tool_name}, retrying in {wait_time_to_use}s..."
         )
-        await asyncio.sleep(wait_time_to_use)
+        await traced_sleep(
+            wait_time_to_use,
+            THROTTLE_RETRY_AFTER if retry_after else THROTTLE_RETRY_BACKOFF,
+            **{"tool.name": tool_name},
+        )
         return None, True
     else:
         # Wait time is too long, fail fast
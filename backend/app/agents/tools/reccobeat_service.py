@@ -19,6 +19,11 @@ import structlog
 from ..core.cache import cache_manager
 from ..core.id_registry import RecoBeatIDRegistry
 from ..core.seed_guardrails import SeedGuardrails
+from ..core.tracing import (
+    THROTTLE_BATCH_SPACING,
+    THROTTLE_RETRY_BACKOFF,
+    traced_sleep,
+)
 from .agent_tools import AgentTools
 from .reccobeat.artist_info import (
     GetArtistTracksTool,
@@ -400,8 +405,8 @@ class RecoBeatService:
                         logger.debug(
                             f"Error converting track IDs chunk (attempt {attempt + 1}/{max_retries}): {e}, retrying..."
                         )
-                        await asyncio.sleep(
-                            retry_delay * (attempt + 1)
+                        await traced_sleep(
+                            retry_delay * (attempt + 1), THROTTLE_RETRY_BACKOFF
                         )  # Exponential backoff
                     else:
                         logger.warning(
@@ -557,7 +562,11 @@ class RecoBeatService:
                     adaptive_throttle = base_throttle + (
                         0.2 if batch_index % 20 == 19 else 0.0
                     )
-                    await asyncio.sleep(adaptive_throttle)
+                    await traced_sleep(
+                        adaptive_throttle,
+                        THROTTLE_BATCH_SPACING,
+                        **{"tool.name": "reccobeat_audio_features"},
+                    )
 
             # Combine results
             for track_id, features in results:
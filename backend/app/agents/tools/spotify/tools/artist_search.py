@@ -7,7 +7,8 @@ import structlog
 from pydantic import BaseModel, Field
 
 from ...agent_tools import RateLimitedTool, ToolResult
-from ..utils.album_operations import get_artist_albums, sample_album_tracks
+from ..utils.album_catalog import get_artist_album_catalog
+from ..utils.album_operations import sample_album_tracks
 from ..utils.params_utils import build_market_params, get_market_label
 from ..utils.rate_limiting import wait_for_artist_top_tracks_rate_limit
 from ..utils.track_operations import search_artist_tracks
@@ -322,7 +323,7 @@ class GetArtistTopTracksTool(RateLimitedTool):
             rate_limit_per_minute=400,
             min_request_interval=0.0,
         )
-        # Limit how many artists can sample albums at once to avoid thundering-herd sleeps.
+        # Limit how many artists can fetch album catalogs at once to avoid thundering-herd sleeps.
         self._album_sampling_semaphore = asyncio.Semaphore(3)
 
     def _get_input_schema(self) -> Type[BaseModel]:
@@ -608,33 +609,36 @@ class GetArtistTopTracksTool(RateLimitedTool):
 
         # Step 2: Get album tracks for diversity (if ratio allows)
         if album_tracks_count > 0:
-            async with self._album_sampling_semaphore:
-                logger.info(f"Fetching albums for artist {artist_id}")
-                albums = await get_artist_albums(
+            # The semaphore is only held while the catalog has to hit Spotify
+            catalog = await get_artist_album_catalog(
+                make_request=self._make_album_request,
+                validate_response=self._validate_response,
+                access_token=access_token,
+                artist_id=artist_id,
+                market=market,
+                album_limit=5,  # Reduced from 10 to 5 albums to reduce API calls and avoid rate limits
+                fetch_semaphore=self._album_sampling_semaphore,
+            )
+            albums = catalog.get("albums", [])
+
+            if albums:
+                logger.info(
+                    f"Found {len(albums)} albums, sampling tracks for diversity"
+                )
+                # Sample tracks from albums
+                album_tracks = await sample_album_tracks(
                     make_request=self._make_album_request,
+                    validate_response=self._validate_response,
                     access_token=access_token,
-                    artist_id=artist_id,
+                    albums=albums,
                     market=market,
-                    limit=5,  # Reduced from 10 to 5 albums to reduce API calls and avoid rate limits
+                    max_tracks=album_tracks_count,
+                    track_ids_seen=track_ids_seen,
+                    min_popularity=min_popularity,
+                    max_popularity=max_popularity,
+                    album_track_map=catalog.get("album_tracks"),
                 )
-
-                if albums:
-                    logger.info(
-                        f"Found {len(albums)} albums, sampling tracks for diversity"
-                    )
-                    # Sample tracks from albums
-                    album_tracks = await sample_album_tracks(
-                        make_request=self._make_album_request,
-                        validate_response=self._validate_response,
-                        access_token=access_token,
-                        albums=albums,
-                        market=market,
-                        max_tracks=album_tracks_count,
-                        track_ids_seen=track_ids_seen,
-                        min_popularity=min_popularity,
-                        max_popularity=max_popularity,
-                    )
-                    all_tracks.extend(album_tracks)
+                all_tracks.extend(album_tracks)
 
         # Deduplicate and limit
         unique_tracks = []
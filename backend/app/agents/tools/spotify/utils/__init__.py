@@ -1,5 +1,6 @@
 """Spotify utility modules for parameter handling, parsing, and operations."""
 
+from .album_catalog import get_artist_album_catalog
 from .album_operations import get_artist_albums, sample_album_tracks
 from .batch_operations import batch_fetch_tracks, create_popularity_filter
 from .params_utils import (
@@ -24,6 +25,7 @@ __all__ = [
     "batch_fetch_tracks",
     "create_popularity_filter",
     "get_artist_albums",
+    "get_artist_album_catalog",
     "sample_album_tracks",
     "get_track_info",
     "search_artist_tracks",
@@ -0,0 +1,218 @@
+"""Cached artist album catalog for hybrid track sampling.
+
+This module keeps an artist -> albums -> track IDs catalog in the shared cache
+so album sampling only touches the Spotify API on a catalog miss. Catalogs of
+frequently requested artists are refreshed in the background before they expire.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import structlog
+
+from ....core.cache import cache_manager
+from .album_operations import fetch_album_track_items, get_artist_albums
+
+logger = structlog.get_logger(__name__)
+
+# Catalogs older than this are refreshed in the background for hot artists
+CATALOG_REFRESH_AFTER_SECONDS = 12 * 3600
+
+# Catalog lookups (per process) before an artist counts as hot
+HOT_ARTIST_MIN_HITS = 3
+
+# Bound on tracked artists before hit counts are reset
+_MAX_TRACKED_ARTISTS = 10000
+
+# Album fields kept in the catalog
+_ALBUM_FIELDS = ("id", "name", "album_type", "release_date", "uri")
+
+_catalog_hits: Counter = Counter()
+_refreshes_in_flight: Set[str] = set()
+_background_tasks: Set[asyncio.Task] = set()
+
+
+async def get_artist_album_catalog(
+    make_request: Callable,
+    validate_response: Callable,
+    access_token: str,
+    artist_id: str,
+    market: Optional[str] = None,
+    album_limit: int = 5,
+    fetch_semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, Any]:
+    """Get an artist's albums and album track listings, served from cache when possible.
+
+    Args:
+        make_request: Async function to make API requests
+        validate_response: Function to validate API responses
+        access_token: Spotify access token
+        artist_id: Spotify artist ID
+        market: Optional ISO 3166-1 alpha-2 country code (None for global)
+        album_limit: Maximum number of albums to include
+        fetch_semaphore: Optional semaphore held only while calling Spotify
+
+    Returns:
+        Catalog dict with ``albums`` (album dicts) and ``album_tracks``
+        (album_id -> track items with ``id``)
+    """
+    refresh_key = f"{artist_id}:{market or 'global'}"
+    if len(_catalog_hits) >= _MAX_TRACKED_ARTISTS:
+        _catalog_hits.clear()
+    _catalog_hits[refresh_key] += 1
+
+    catalog = await cache_manager.get_artist_album_catalog(artist_id, market)
+    if catalog:
+        age = time.time() - catalog.get("fetched_at", 0)
+        if (
+            age > CATALOG_REFRESH_AFTER_SECONDS
+            and _catalog_hits[refresh_key] >= HOT_ARTIST_MIN_HITS
+        ):
+            _schedule_refresh(
+                refresh_key,
+                make_request,
+                validate_response,
+                access_token,
+                artist_id,
+                market,
+                album_limit,
+                fetch_semaphore,
+            )
+        logger.debug(
+            f"Album catalog cache hit for artist {artist_id}",
+            album_count=len(catalog.get("albums", [])),
+            age_seconds=int(age),
+        )
+        return catalog
+
+    return await _fetch_and_cache_catalog(
+        make_request,
+        validate_response,
+        access_token,
+        artist_id,
+        market,
+        album_limit,
+        fetch_semaphore,
+    )
+
+
+async def _fetch_and_cache_catalog(
+    make_request: Callable,
+    validate_response: Callable,
+    access_token: str,
+    artist_id: str,
+    market: Optional[str],
+    album_limit: int,
+    fetch_semaphore: Optional[asyncio.Semaphore],
+) -> Dict[str, Any]:
+    """Fetch an artist's albums plus their track listings and cache the catalog."""
+    if fetch_semaphore is not None:
+        async with fetch_semaphore:
+            catalog = await _fetch_catalog(
+                make_request,
+                validate_response,
+                access_token,
+                artist_id,
+                market,
+                album_limit,
+            )
+    else:
+        catalog = await _fetch_catalog(
+            make_request,
+            validate_response,
+            access_token,
+            artist_id,
+            market,
+            album_limit,
+        )
+
+    # Don't pin an empty catalog for days when Spotify returned nothing
+    if catalog["albums"] and catalog["album_tracks"]:
+        await cache_manager.set_artist_album_catalog(artist_id, catalog, market)
+
+    return catalog
+
+
+async def _fetch_catalog(
+    make_request: Callable,
+    validate_response: Callable,
+    access_token: str,
+    artist_id: str,
+    market: Optional[str],
+    album_limit: int,
+) -> Dict[str, Any]:
+    """Call Spotify for an artist's albums and the albums' track listings."""
+    logger.info(f"Fetching album catalog for artist {artist_id}")
+    albums = await get_artist_albums(
+        make_request=make_request,
+        access_token=access_token,
+        artist_id=artist_id,
+        market=market,
+        limit=album_limit,
+    )
+
+    album_tracks: Dict[str, List[Dict[str, Any]]] = {}
+    album_ids = [album.get("id") for album in albums if album.get("id")]
+    if album_ids:
+        track_items = await fetch_album_track_items(
+            make_request=make_request,
+            validate_response=validate_response,
+            access_token=access_token,
+            album_ids=album_ids,
+            market=market,
+        )
+        album_tracks = {
+            album_id: [{"id": item.get("id")} for item in items if item.get("id")]
+            for album_id, items in track_items.items()
+        }
+
+    return {
+        "artist_id": artist_id,
+        "albums": [
+            {field: album.get(field) for field in _ALBUM_FIELDS} for album in albums
+        ],
+        "album_tracks": album_tracks,
+        "fetched_at": time.time(),
+    }
+
+
+def _schedule_refresh(
+    refresh_key: str,
+    make_request: Callable,
+    validate_response: Callable,
+    access_token: str,
+    artist_id: str,
+    market: Optional[str],
+    album_limit: int,
+    fetch_semaphore: Optional[asyncio.Semaphore],
+) -> None:
+    """Refresh a hot artist's catalog in the background (at most one refresh per artist)."""
+    if refresh_key in _refreshes_in_flight:
+        return
+
+    async def refresh() -> None:
+        try:
+            await _fetch_and_cache_catalog(
+                make_request,
+                validate_response,
+                access_token,
+                artist_id,
+                market,
+                album_limit,
+                fetch_semaphore,
+            )
+            logger.info(f"Refreshed album catalog for hot artist {artist_id}")
+        except Exception as e:
+            logger.warning(
+                f"Background album catalog refresh failed for {artist_id}: {e}"
+            )
+        finally:
+            _refreshes_in_flight.discard(refresh_key)
+            _catalog_hits[refresh_key] = 0
+
+    _refreshes_in_flight.add(refresh_key)
+    task = asyncio.create_task(refresh())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
@@ -71,6 +71,7 @@ async def sample_album_tracks(
     track_ids_seen: Set[str],
     min_popularity: int = 20,
     max_popularity: int = 80,
+    album_track_map: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> List[Dict[str, Any]]:
     """Sample tracks from multiple albums for diversity.
 
@@ -84,6 +85,8 @@ async def sample_album_tracks(
         track_ids_seen: Set of track IDs already included
         min_popularity: Minimum popularity threshold
         max_popularity: Maximum popularity threshold
+        album_track_map: Optional album_id -> track items map (e.g. from the
+            album catalog cache); albums missing from it are fetched
 
     Returns:
         List of sampled track dictionaries
@@ -93,41 +96,26 @@ async def sample_album_tracks(
     random.shuffle(albums_to_sample)
     albums_to_sample = albums_to_sample[:5]  # Sample from up to 5 albums
 
-    # Step 1: Collect track IDs from albums via batched /albums requests
+    # Step 1: Collect track IDs from albums (cached catalog first, then /albums)
     candidate_track_ids: List[str] = []
     tracks_per_album = max(1, max_tracks // max(1, len(albums_to_sample)))
-    album_track_map: Dict[str, List[Dict[str, Any]]] = {}
-    album_ids = [album.get("id") for album in albums_to_sample if album.get("id")]
-
-    for i in range(
-        0, len(album_ids), 20
-    ):  # Spotify allows 20 album IDs per /albums call
-        chunk = album_ids[i : i + 20]
-        if not chunk:
-            continue
-
-        try:
-            params = build_market_params(market=market, ids=",".join(chunk))
-            response_data = await make_request(
-                method="GET",
-                endpoint="/albums",
-                params=params,
-                headers={"Authorization": f"Bearer {access_token}"},
+    album_track_map = dict(album_track_map or {})
+    album_ids = [
+        album.get("id")
+        for album in albums_to_sample
+        if album.get("id") and album.get("id") not in album_track_map
+    ]
+
+    if album_ids:
+        album_track_map.update(
+            await fetch_album_track_items(
+                make_request=make_request,
+                validate_response=validate_response,
+                access_token=access_token,
+                album_ids=album_ids,
+                market=market,
             )
-
-            if not validate_response(response_data, ["albums"]):
-                continue
-
-            for album_data in response_data.get("albums", []):
-                album_id = album_data.get("id")
-                if not album_id:
-                    continue
-                tracks_data = album_data.get("tracks", {})
-                album_track_map[album_id] = tracks_data.get("items", []) or []
-
-        except Exception as e:
-            logger.warning(f"Error fetching album batch {chunk}: {e}")
-            continue
+        )
 
     for album in albums_to_sample:
         album_id = album.get("id")
@@ -182,3 +170,59 @@ async def sample_album_tracks(
     )
 
     return sampled_tracks
+
+
+async def fetch_album_track_items(
+    make_request: Callable,
+    validate_response: Callable,
+    access_token: str,
+    album_ids: List[str],
+    market: Optional[str],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch the simplified track listings for albums via batched /albums requests.
+
+    Args:
+        make_request: Async function to make API requests
+        validate_response: Function to validate API responses
+        access_token: Spotify access token
+        album_ids: Spotify album IDs
+        market: Optional ISO 3166-1 alpha-2 country code (None for global)
+
+    Returns:
+        Mapping of album_id to its track items
+    """
+    album_track_map: Dict[str, List[Dict[str, Any]]] = {}
+
+    for i in range(
+        0, len(album_ids), 20
+    ):  # Spotify allows 20 album IDs per /albums call
+        chunk = album_ids[i : i + 20]
+        if not chunk:
+            continue
+
+        try:
+            params = build_market_params(market=market, ids=",".join(chunk))
+            response_data = await make_request(
+                method="GET",
+                endpoint="/albums",
+                params=params,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+
+            if not validate_response(response_data, ["albums"]):
+                continue
+
+            for album_data in response_data.get("albums", []):
+                if not album_data:
+                    continue
+                album_id = album_data.get("id")
+                if not album_id:
+                    continue
+                tracks_data = album_data.get("tracks", {})
+                album_track_map[album_id] = tracks_data.get("items", []) or []
+
+        except Exception as e:
+            logger.warning(f"Error fetching album batch {chunk}: {e}")
+            continue
+
+    return album_track_map
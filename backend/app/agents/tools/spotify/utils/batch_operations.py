@@ -4,10 +4,12 @@ This module provides utilities for batch fetching and processing
 Spotify API data to reduce API calls and respect rate limits.
 """
 
+import asyncio
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 import structlog
 
+from ....core.cache import cache_manager
 from .params_utils import build_market_params
 from .track_parsing import parse_track_data
 
@@ -16,6 +18,9 @@ logger = structlog.get_logger(__name__)
 # Spotify API batch limit for tracks endpoint
 SPOTIFY_BATCH_LIMIT = 50
 
+# Maximum /tracks chunks in flight per call (the tool's rate limiter still applies)
+SPOTIFY_BATCH_CONCURRENCY = 4
+
 
 async def batch_fetch_tracks(
     track_ids: List[str],
@@ -25,11 +30,16 @@ async def batch_fetch_tracks(
     track_ids_seen: Set[str] = None,
     filter_func: Callable[[Dict[str, Any]], bool] = None,
     max_results: int = None,
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     """Batch fetch full track information for multiple track IDs.
 
-    Fetches tracks in batches of 50 (Spotify API limit) and applies
-    optional filtering and popularity checks.
+    Track objects already in the per-market metadata cache are served from it;
+    the remaining IDs are fetched in chunks of 50 (Spotify API limit) with up to
+    SPOTIFY_BATCH_CONCURRENCY chunks in flight. Results are still consumed in
+    input order, so filtering, de-duplication and ``max_results`` behave exactly
+    as a sequential walk would, and chunks that are no longer needed once
+    ``max_results`` is reached are cancelled.
 
     Args:
         track_ids: List of Spotify track IDs to fetch
@@ -40,6 +50,7 @@ async def batch_fetch_tracks(
         track_ids_seen: Set of track IDs already processed (will be updated)
         filter_func: Optional function to filter tracks (returns True to include)
         max_results: Maximum number of tracks to return (None for all)
+        use_cache: Whether to read and populate the shared track-metadata cache
 
     Returns:
         List of parsed track dictionaries
@@ -50,52 +61,140 @@ async def batch_fetch_tracks(
     if track_ids_seen is None:
         track_ids_seen = set()
 
-    results = []
+    # IDs already seen would be skipped anyway, so don't fetch them
+    pending_ids = list(
+        dict.fromkeys(tid for tid in track_ids if tid and tid not in track_ids_seen)
+    )
+    if not pending_ids:
+        return []
 
-    # Process in batches of 50 (Spotify API limit)
-    for i in range(0, len(track_ids), SPOTIFY_BATCH_LIMIT):
-        batch_ids = track_ids[i : i + SPOTIFY_BATCH_LIMIT]
+    cached_tracks: Dict[str, Dict[str, Any]] = {}
+    if use_cache:
+        cached_tracks = await cache_manager.get_track_metadata(pending_ids, market)
 
-        try:
-            # Build params using utility
-            params = build_market_params(market=market, ids=",".join(batch_ids))
+    missing_ids = [tid for tid in pending_ids if tid not in cached_tracks]
+    chunks = [
+        missing_ids[i : i + SPOTIFY_BATCH_LIMIT]
+        for i in range(0, len(missing_ids), SPOTIFY_BATCH_LIMIT)
+    ]
 
-            response_data = await make_request("/tracks", params)
+    semaphore = asyncio.Semaphore(SPOTIFY_BATCH_CONCURRENCY)
 
-            if not response_data or "tracks" not in response_data:
-                continue
+    async def fetch_chunk(batch_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        async with semaphore:
+            return await _fetch_track_chunk(batch_ids, make_request, market, use_cache)
 
-            for track_data in response_data.get("tracks", []):
-                if not track_data:  # Skip null entries
-                    continue
+    chunk_tasks = [asyncio.create_task(fetch_chunk(chunk)) for chunk in chunks]
+    chunk_index_by_id = {
+        track_id: index for index, chunk in enumerate(chunks) for track_id in chunk
+    }
 
-                track_id = track_data.get("id")
-                if not track_id or track_id in track_ids_seen:
-                    continue
+    results = []
+    try:
+        for requested_id in pending_ids:
+            track_data = cached_tracks.get(requested_id)
+            if track_data is None:
+                chunk_task = chunk_tasks[chunk_index_by_id[requested_id]]
+                track_data = (await chunk_task).get(requested_id)
+            if not track_data:  # Skip null entries and failed chunks
+                continue
 
-                # Apply optional filter function
-                if filter_func and not filter_func(track_data):
-                    continue
+            track_id = track_data.get("id")
+            if not track_id or track_id in track_ids_seen:
+                continue
 
-                # Parse track data using standard parser
-                try:
-                    parsed_track = parse_track_data(track_data)
-                    results.append(parsed_track)
-                    track_ids_seen.add(track_id)
+            # Apply optional filter function
+            if filter_func and not filter_func(track_data):
+                continue
 
-                    if max_results and len(results) >= max_results:
-                        return results
-                except Exception as e:
-                    logger.warning(f"Failed to parse track {track_id}: {e}")
-                    continue
+            # Parse track data using standard parser
+            try:
+                parsed_track = parse_track_data(track_data)
+                results.append(parsed_track)
+                track_ids_seen.add(track_id)
 
-        except Exception as e:
-            logger.warning(f"Error batch fetching track info: {e}")
-            continue
+                if max_results and len(results) >= max_results:
+                    return results
+            except Exception as e:
+                logger.warning(f"Failed to parse track {track_id}: {e}")
+                continue
+    finally:
+        # Cancel chunks that are no longer needed (e.g. max_results reached)
+        for chunk_task in chunk_tasks:
+            if not chunk_task.done():
+                chunk_task.cancel()
+        if chunk_tasks:
+            await asyncio.gather(*chunk_tasks, return_exceptions=True)
+
+    logger.debug(
+        "Batch fetched tracks",
+        requested=len(pending_ids),
+        cache_hits=len(cached_tracks),
+        chunks_fetched=len(chunks),
+        returned=len(results),
+    )
 
     return results
 
 
+async def _fetch_track_chunk(
+    batch_ids: List[str],
+    make_request: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    market: Optional[str],
+    use_cache: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch one /tracks chunk and cache the returned track objects.
+
+    Args:
+        batch_ids: Up to 50 Spotify track IDs
+        make_request: Async function to make API requests
+        market: Optional ISO 3166-1 alpha-2 country code (None for global)
+        use_cache: Whether to write fetched tracks to the metadata cache
+
+    Returns:
+        Mapping of requested track_id to track object (empty on failure)
+    """
+    try:
+        # Build params using utility
+        params = build_market_params(market=market, ids=",".join(batch_ids))
+
+        response_data = await make_request("/tracks", params)
+
+        if not response_data or "tracks" not in response_data:
+            return {}
+
+        # Spotify returns tracks in request order (null for unknown IDs)
+        fetched = {
+            requested_id: _strip_available_markets(track_data)
+            for requested_id, track_data in zip(
+                batch_ids, response_data.get("tracks", [])
+            )
+            if track_data
+        }
+
+        if use_cache and fetched:
+            await cache_manager.set_track_metadata(fetched, market)
+
+        return fetched
+
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"Error batch fetching track info: {e}")
+        return {}
+
+
+def _strip_available_markets(track_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the bulky available_markets lists before caching a track object."""
+    track_data = {k: v for k, v in track_data.items() if k != "available_markets"}
+    album = track_data.get("album")
+    if isinstance(album, dict) and "available_markets" in album:
+        track_data["album"] = {
+            k: v for k, v in album.items() if k != "available_markets"
+        }
+    return track_data
+
+
 def create_popularity_filter(
     min_popularity: int, max_popularity: int
 ) -> Callable[[Dict[str, Any]], bool]:
@@ -10,6 +10,12 @@ from typing import Optional
 
 import structlog
 
+from ....core.tracing import (
+    THROTTLE_MIN_INTERVAL,
+    THROTTLE_RETRY_AFTER,
+    traced_sleep,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -42,7 +48,11 @@ async def wait_for_artist_top_tracks_rate_limit():
                 logger.warning(
                     f"Backoff enforced for artist top-tracks endpoint, waiting {wait_time:.2f}s"
                 )
-                await asyncio.sleep(wait_time)
+                await traced_sleep(
+                    wait_time,
+                    THROTTLE_RETRY_AFTER,
+                    **{"tool.name": "get_artist_top_tracks"},
+                )
             _artist_top_tracks_block_until = None
 
         if _artist_top_tracks_last_request is not None:
@@ -54,7 +64,11 @@ async def wait_for_artist_top_tracks_rate_limit():
                 logger.debug(
                     f"Global rate limit: waiting {wait_time:.2f}s for artist top-tracks endpoint"
                 )
-                await asyncio.sleep(wait_time)
+                await traced_sleep(
+                    wait_time,
+                    THROTTLE_MIN_INTERVAL,
+                    **{"tool.name": "get_artist_top_tracks"},
+                )
         _artist_top_tracks_last_request = datetime.now(timezone.utc)
 
 
@@ -1,7 +1,9 @@
 """Spotify API service that coordinates all Spotify tools."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import contextvars
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import structlog
 
@@ -24,6 +26,17 @@ from .spotify.tools.user_profile import GetUserProfileTool
 
 logger = structlog.get_logger(__name__)
 
+# Genre searches younger than this are served as-is; older ones are served
+# while a background refresh replaces them (the hard TTL is in CacheManager)
+GENRE_SEARCH_FRESH_SECONDS = 86400
+
+# Background genre search refreshes in flight, per process
+_genre_revalidations: Dict[tuple, asyncio.Task] = {}
+
+
+def _is_genre_query(query: str) -> bool:
+    return query.strip().lower().startswith("genre:")
+
 
 class SpotifyService:
     """Service for coordinating Spotify API operations."""
@@ -298,13 +311,18 @@ class SpotifyService:
         if not tool:
             raise ValueError("Search Spotify artists tool not available")
 
-        result = await tool._run(access_token=access_token, query=query, limit=limit)
-
-        if not result.success:
-            logger.error(f"Failed to search Spotify artists: {result.error}")
-            return []
+        async def search() -> List[Dict[str, Any]]:
+            result = await tool._run(
+                access_token=access_token, query=query, limit=limit
+            )
+            if not result.success:
+                logger.error(f"Failed to search Spotify artists: {result.error}")
+                return []
+            return result.data.get("artists", [])
 
-        return result.data.get("artists", [])
+        if _is_genre_query(query):
+            return await self._cached_genre_search("artist", query, None, limit, search)
+        return await search()
 
     async def get_several_spotify_artists(
         self, access_token: str, artist_ids: List[str]
@@ -656,15 +674,99 @@ class SpotifyService:
         if not tool:
             raise ValueError("Search Spotify tracks tool not available")
 
-        result = await tool._run(
-            access_token=access_token, query=query, limit=limit, market=market
-        )
+        async def search() -> List[Dict[str, Any]]:
+            result = await tool._run(
+                access_token=access_token, query=query, limit=limit, market=market
+            )
+            if not result.success:
+                logger.error(f"Failed to search Spotify tracks: {result.error}")
+                return []
+            return result.data.get("tracks", [])
 
-        if not result.success:
-            logger.error(f"Failed to search Spotify tracks: {result.error}")
-            return []
+        if _is_genre_query(query):
+            return await self._cached_genre_search(
+                "track", query, market, limit, search
+            )
+        return await search()
 
-        return result.data.get("tracks", [])
+    async def _cached_genre_search(
+        self,
+        kind: str,
+        query: str,
+        market: Optional[str],
+        limit: int,
+        search: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """Serve a genre search from the shared cache, stale-while-revalidate.
+
+        Genre results do not depend on the user, and the same genres recur
+        across workflows. Fresh entries are returned directly; stale ones are
+        returned immediately while one background refresh replaces them.
+
+        Args:
+            kind: Search type ("artist" or "track")
+            query: Genre query
+            market: Optional ISO 3166-1 alpha-2 country code
+            limit: Number of results requested
+            search: Performs the actual search
+
+        Returns:
+            Search results
+        """
+        cached = await cache_manager.get_genre_search(kind, query, market, limit)
+        if cached is not None:
+            age = datetime.now(timezone.utc).timestamp() - cached["fetched_at"]
+            if age > GENRE_SEARCH_FRESH_SECONDS:
+                self._revalidate_genre_search(kind, query, market, limit, search)
+            # Copies, so callers annotating results never touch the cached entry
+            return [dict(item) for item in cached["results"]]
+
+        results = await search()
+        if results:
+            await cache_manager.set_genre_search(
+                kind, query, market, limit, [dict(item) for item in results]
+            )
+        return results
+
+    def _revalidate_genre_search(
+        self,
+        kind: str,
+        query: str,
+        market: Optional[str],
+        limit: int,
+        search: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> None:
+        """Refresh a stale genre search in the background, once per process."""
+        flight_key = (kind, query.strip().lower(), market, limit)
+        if flight_key in _genre_revalidations:
+            return
+
+        async def revalidate() -> None:
+            # Workers share the cache; only one of them needs to refresh
+            lock = await cache_manager.acquire_lock(
+                "genre_search_refresh", *flight_key, ttl=60
+            )
+            if lock is None:
+                return
+            try:
+                results = await search()
+                if results:
+                    await cache_manager.set_genre_search(
+                        kind, query, market, limit, results
+                    )
+                    logger.debug("Revalidated genre search", kind=kind, query=query)
+            except Exception as e:
+                logger.warning(
+                    "Genre search revalidation failed", query=query, error=str(e)
+                )
+            finally:
+                await cache_manager.release_lock(
+                    "genre_search_refresh", *flight_key, token=lock
+                )
+
+        task = asyncio.create_task(revalidate(), context=contextvars.Context())
+        _genre_revalidations[flight_key] = task
+        task.add_done_callback(lambda done: _genre_revalidations.pop(flight_key, None))
 
     async def search_artists_by_genre(
         self, access_token: str, genre: str, limit: int = 40
@@ -0,0 +1,254 @@
+"""Workflow worker pool.
+
+Executes recommendation workflows dispatched by API processes running with
+``WORKFLOW_EXECUTION_MODE=worker``, so CPU-heavy generation work (scoring,
+JSON parsing, cover rendering) never competes with API requests for the
+API's event loop. State changes are published back through Valkey.
+
+Usage:
+    python -m app.agents.worker --processes 2 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import uuid
+from typing import Optional, Set
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class WorkflowWorker:
+    """Pulls workflow jobs from Valkey and runs them on a local WorkflowManager."""
+
+    def __init__(self, workflow_manager, job_queue, concurrency: int = 4):
+        """Initialize the worker.
+
+        Args:
+            workflow_manager: Manager executing the workflows (inline mode)
+            job_queue: Queue shared with the API
+            concurrency: Workflows this process runs at once
+        """
+        self.workflow_manager = workflow_manager
+        self.job_queue = job_queue
+        self.concurrency = max(concurrency, 1)
+
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._running: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop taking new jobs; running workflows are drained by run()."""
+        if not self._stopping.is_set():
+            logger.info("Worker stopping", running=len(self._running))
+            self._stopping.set()
+
+    async def run(self, drain_timeout: float = 300.0) -> None:
+        """Process jobs until stop() is called, then drain running workflows.
+
+        Args:
+            drain_timeout: Seconds to let running workflows finish on shutdown
+        """
+        await self.job_queue.heartbeat(self.worker_id)
+        control = asyncio.create_task(self._listen_for_cancellations())
+        heartbeat = asyncio.create_task(self._keep_alive())
+        logger.info(
+            "Workflow worker started",
+            worker_id=self.worker_id,
+            concurrency=self.concurrency,
+        )
+
+        try:
+            while not self._stopping.is_set():
+                await self._slots.acquire()
+                try:
+                    job = await self.job_queue.pop(self.worker_id, timeout=1.0)
+                except Exception as e:
+                    self._slots.release()
+                    logger.error("Failed to read workflow job", error=str(e))
+                    await asyncio.sleep(1.0)
+                    continue
+
+                if job is None:
+                    self._slots.release()
+                    continue
+
+                task = asyncio.create_task(self._run_job(job))
+                self._running.add(task)
+                task.add_done_callback(self._job_done)
+        finally:
+            if self._running:
+                logger.info("Draining running workflows", count=len(self._running))
+                await self.workflow_manager.graceful_shutdown(
+                    timeout=int(drain_timeout)
+                )
+                await asyncio.gather(*self._running, return_exceptions=True)
+            control.cancel()
+            heartbeat.cancel()
+            await asyncio.gather(control, heartbeat, return_exceptions=True)
+            try:
+                await self.job_queue.retire(self.worker_id)
+            except Exception as e:
+                logger.warning("Failed to retire worker", error=str(e))
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._slots.release()
+
+    async def _run_job(self, job) -> None:
+        """Run one workflow, publish its state changes and acknowledge the job."""
+        session_id = job["session_id"]
+        try:
+            if await self.job_queue.is_cancel_requested(session_id):
+                logger.info(
+                    "Skipping workflow cancelled before pickup", session_id=session_id
+                )
+                return
+            await self._execute_job(job)
+        finally:
+            try:
+                await self.job_queue.ack(self.worker_id, session_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to acknowledge workflow job",
+                    session_id=session_id,
+                    error=str(e),
+                )
+
+    async def _execute_job(self, job) -> None:
+        """Execute a claimed workflow and publish its state changes."""
+        session_id = job["session_id"]
+
+        async def publish(sid: str, state) -> None:
+            try:
+                await self.job_queue.publish_state(state)
+            except Exception as e:
+                logger.warning(
+                    "Failed to publish workflow state", session_id=sid, error=str(e)
+                )
+
+        logger.info("Picked up workflow", session_id=session_id)
+        self.workflow_manager.subscribe_to_state_changes(session_id, publish)
+        try:
+            final_state = await self.workflow_manager.execute_dispatched(job)
+            # Cancelled workflows skip the final notification; always send it
+            await publish(session_id, final_state)
+        except Exception as e:
+            logger.error(
+                "Workflow job crashed",
+                session_id=session_id,
+                error=str(e),
+                exc_info=True,
+            )
+        finally:
+            self.workflow_manager.unsubscribe_from_state_changes(session_id, publish)
+
+    async def _keep_alive(self) -> None:
+        """Refresh this worker's heartbeat and requeue jobs of dead workers."""
+        interval = max(self.job_queue.heartbeat_ttl / 3, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.job_queue.heartbeat(self.worker_id)
+                await self.job_queue.requeue_orphaned_jobs()
+            except Exception as e:
+                logger.warning("Worker heartbeat failed", error=str(e))
+
+    async def _listen_for_cancellations(self) -> None:
+        async for message in self.job_queue.control_messages():
+            session_id = message.get("cancel")
+            if session_id and self.workflow_manager.get_workflow_state(session_id):
+                self.workflow_manager.cancel_workflow(session_id)
+
+
+async def run_worker(concurrency: int) -> None:
+    """Run one worker process until SIGINT/SIGTERM.
+
+    Args:
+        concurrency: Workflows this process runs at once
+    """
+    from app.agents.routes.dependencies import get_workflow_manager
+    from app.agents.workflows.job_queue import WorkflowJobQueue
+    from app.core.lifespan import initialize_runtime, shutdown_runtime
+    from app.services.taste_profile_service import taste_profile_service
+
+    initialize_runtime()
+    if not settings.REDIS_URL:
+        raise SystemExit("The workflow worker needs REDIS_URL to reach the API")
+
+    # Users whose workflows run here are refreshed from here
+    taste_profile_service.start_refresh()
+
+    job_queue = WorkflowJobQueue(settings.REDIS_URL)
+    worker = WorkflowWorker(get_workflow_manager(), job_queue, concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await job_queue.close()
+        await shutdown_runtime()
+
+
+def _process_main(concurrency: int) -> None:
+    asyncio.run(run_worker(concurrency))
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Start the worker pool."""
+    parser = argparse.ArgumentParser(
+        description="Run the MoodList workflow worker pool"
+    )
+    parser.add_argument(
+        "--processes", type=int, default=1, help="Worker processes to start"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.WORKFLOW_WORKER_CONCURRENCY,
+        help="Workflows each process runs at once",
+    )
+    args = parser.parse_args(argv)
+
+    if args.processes <= 1:
+        _process_main(args.concurrency)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_process_main,
+            args=(args.concurrency,),
+            name=f"workflow-worker-{index}",
+        )
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def _forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, _forward)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # children get SIGINT directly
+
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
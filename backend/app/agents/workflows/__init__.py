@@ -1,5 +1,12 @@
 """Workflow management for the agentic system."""
 
+from .admission_controller import WorkflowAdmissionController
+from .job_queue import WorkflowJobQueue
 from .workflow_manager import WorkflowConfig, WorkflowManager
 
-__all__ = ["WorkflowManager", "WorkflowConfig"]
+__all__ = [
+    "WorkflowManager",
+    "WorkflowConfig",
+    "WorkflowAdmissionController",
+    "WorkflowJobQueue",
+]
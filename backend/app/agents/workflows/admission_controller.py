@@ -0,0 +1,284 @@
+"""Admission control for recommendation workflows."""
+
+import asyncio
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+from ...core.exceptions import WorkflowQueueFullException
+
+logger = structlog.get_logger(__name__)
+
+# Called with {session_id: queue_position} for queued sessions whose position changed
+QueueChangeCallback = Callable[[Dict[str, int]], None]
+
+
+@dataclass
+class _QueuedWorkflow:
+    session_id: str
+    user_key: str
+    sequence: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+    admitted: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class WorkflowAdmissionController:
+    """Caps concurrently running workflows and queues the rest fairly.
+
+    Workflows beyond ``max_concurrent`` wait in a bounded queue. When a slot
+    frees up, the queued workflow of the user with the fewest running
+    workflows goes next (oldest first among equals), so one user submitting a
+    burst cannot hold everyone else back. Requests arriving at a full queue,
+    or from a user who already has ``max_queued_per_user`` workflows waiting,
+    are shed with a 503 and a Retry-After estimate.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_queued: int = 50,
+        max_queued_per_user: int = 2,
+        on_queue_change: Optional[QueueChangeCallback] = None,
+        initial_duration_estimate: float = 60.0,
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_concurrent: Workflows allowed to run at once
+            max_queued: Workflows allowed to wait for a slot
+            max_queued_per_user: Workflows a single user may have waiting
+            on_queue_change: Called when queued sessions move up the queue
+            initial_duration_estimate: Seconds a workflow is assumed to take
+                until real runs have been observed
+        """
+        self.max_concurrent = max(max_concurrent, 1)
+        self.max_queued = max(max_queued, 0)
+        self.max_queued_per_user = max(max_queued_per_user, 1)
+        self.on_queue_change = on_queue_change
+
+        self._running: Dict[str, str] = {}  # session_id -> user key
+        self._started_at: Dict[str, float] = {}
+        self._running_per_user: Counter = Counter()
+        self._queued: Dict[str, _QueuedWorkflow] = {}
+        self._queued_per_user: Counter = Counter()
+        self._positions: Dict[str, int] = {}
+        self._sequence = itertools.count()
+
+        # Exponential moving average of run time, used for Retry-After
+        self._average_duration = initial_duration_estimate
+
+        self.stats: Dict[str, int] = {
+            "admitted_immediately": 0,
+            "admitted_from_queue": 0,
+            "shed": 0,
+            "abandoned_in_queue": 0,
+        }
+
+    @property
+    def running(self) -> int:
+        """Number of workflows holding a slot."""
+        return len(self._running)
+
+    @property
+    def queued(self) -> int:
+        """Number of workflows waiting for a slot."""
+        return len(self._queued)
+
+    def reserve(self, session_id: str, user_id: Optional[str]) -> int:
+        """Take a slot for a new workflow, or a place in the queue.
+
+        Args:
+            session_id: Workflow session ID
+            user_id: User starting the workflow
+
+        Returns:
+            0 if the workflow may start right away, otherwise its 1-based
+            queue position
+
+        Raises:
+            WorkflowQueueFullException: If the workflow cannot be queued
+        """
+        user_key = str(user_id or "")
+
+        if not self._queued and len(self._running) < self.max_concurrent:
+            self._start(session_id, user_key)
+            self.stats["admitted_immediately"] += 1
+            return 0
+
+        if len(self._queued) >= self.max_queued:
+            self._shed(session_id, user_key, "queue_full")
+            raise WorkflowQueueFullException(
+                "Too many playlists are being generated right now. Please try again shortly.",
+                retry_after=self.retry_after(),
+            )
+        if self._queued_per_user[user_key] >= self.max_queued_per_user:
+            self._shed(session_id, user_key, "user_queue_full")
+            raise WorkflowQueueFullException(
+                "You already have playlists waiting to be generated. Please wait for them to start.",
+                retry_after=self.retry_after(),
+            )
+
+        self._queued[session_id] = _QueuedWorkflow(
+            session_id, user_key, next(self._sequence)
+        )
+        self._queued_per_user[user_key] += 1
+        self._refresh_positions(notify_except=session_id)
+
+        position = self._positions[session_id]
+        logger.info(
+            "Workflow queued for admission",
+            session_id=session_id,
+            queue_position=position,
+            running=len(self._running),
+        )
+        return position
+
+    async def wait_for_slot(self, session_id: str) -> float:
+        """Wait until a reserved workflow may start.
+
+        Args:
+            session_id: Workflow session ID passed to reserve()
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        entry = self._queued.get(session_id)
+        if entry is None:
+            return 0.0
+
+        # Shield so a cancelled waiter leaves the future for release() to inspect
+        await asyncio.shield(entry.admitted)
+        return time.monotonic() - entry.enqueued_at
+
+    def release(self, session_id: str) -> None:
+        """Free a workflow's slot or queue place and admit the next workflow.
+
+        Safe to call more than once, and for sessions that never got a slot.
+
+        Args:
+            session_id: Workflow session ID
+        """
+        entry = self._queued.pop(session_id, None)
+        if entry is not None:
+            # Cancelled or failed while waiting
+            self._queued_per_user[entry.user_key] -= 1
+            if self._queued_per_user[entry.user_key] <= 0:
+                del self._queued_per_user[entry.user_key]
+            self._positions.pop(session_id, None)
+            if not entry.admitted.done():
+                entry.admitted.cancel()
+            self.stats["abandoned_in_queue"] += 1
+            self._refresh_positions()
+            return
+
+        user_key = self._running.pop(session_id, None)
+        if user_key is None:
+            return
+
+        self._running_per_user[user_key] -= 1
+        if self._running_per_user[user_key] <= 0:
+            del self._running_per_user[user_key]
+
+        started_at = self._started_at.pop(session_id, None)
+        if started_at is not None:
+            duration = time.monotonic() - started_at
+            self._average_duration = 0.8 * self._average_duration + 0.2 * duration
+
+        self._admit_next()
+
+    def position(self, session_id: str) -> Optional[int]:
+        """Current 1-based queue position, or None if the workflow is not queued."""
+        return self._positions.get(session_id)
+
+    def retry_after(self) -> int:
+        """Seconds a shed client should wait before trying again."""
+        backlog = (len(self._queued) + 1) / self.max_concurrent
+        return int(min(max(self._average_duration * backlog, 5.0), 300.0))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Slot usage, queue depth and admission counters."""
+        return {
+            **self.stats,
+            "running": len(self._running),
+            "queued": len(self._queued),
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "average_duration": round(self._average_duration, 2),
+        }
+
+    def _start(self, session_id: str, user_key: str) -> None:
+        self._running[session_id] = user_key
+        self._running_per_user[user_key] += 1
+        self._started_at[session_id] = time.monotonic()
+
+    def _shed(self, session_id: str, user_key: str, reason: str) -> None:
+        self.stats["shed"] += 1
+        logger.warning(
+            "Shedding workflow start",
+            session_id=session_id,
+            reason=reason,
+            running=len(self._running),
+            queued=len(self._queued),
+            user_queued=self._queued_per_user[user_key],
+        )
+
+    def _admission_order(self) -> List[_QueuedWorkflow]:
+        """Queued workflows in the order they would be admitted if nothing changed."""
+        running = self._running_per_user.copy()
+        pending = sorted(self._queued.values(), key=lambda entry: entry.sequence)
+        order: List[_QueuedWorkflow] = []
+        while pending:
+            best = min(pending, key=lambda e: (running[e.user_key], e.sequence))
+            pending.remove(best)
+            running[best.user_key] += 1
+            order.append(best)
+        return order
+
+    def _admit_next(self) -> None:
+        admitted = False
+        while self._queued and len(self._running) < self.max_concurrent:
+            entry = self._admission_order()[0]
+            del self._queued[entry.session_id]
+            self._queued_per_user[entry.user_key] -= 1
+            if self._queued_per_user[entry.user_key] <= 0:
+                del self._queued_per_user[entry.user_key]
+            self._positions.pop(entry.session_id, None)
+
+            self._start(entry.session_id, entry.user_key)
+            entry.admitted.set_result(None)
+            self.stats["admitted_from_queue"] += 1
+            admitted = True
+            logger.info(
+                "Workflow admitted from queue",
+                session_id=entry.session_id,
+                waited_seconds=round(time.monotonic() - entry.enqueued_at, 2),
+            )
+
+        if admitted:
+            self._refresh_positions()
+
+    def _refresh_positions(self, notify_except: Optional[str] = None) -> None:
+        """Recompute queue positions and report the ones that changed."""
+        positions = {
+            entry.session_id: index
+            for index, entry in enumerate(self._admission_order(), start=1)
+        }
+        changed = {
+            session_id: position
+            for session_id, position in positions.items()
+            if self._positions.get(session_id) != position
+            and session_id != notify_except
+        }
+        self._positions = positions
+
+        if changed and self.on_queue_change is not None:
+            try:
+                self.on_queue_change(changed)
+            except Exception as e:
+                logger.warning("Queue change callback failed", error=str(e))
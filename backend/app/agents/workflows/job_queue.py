@@ -0,0 +1,318 @@
+"""Valkey transport between the API and workflow worker processes."""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+import structlog
+
+from ..states.agent_state import AgentState
+
+try:
+    import redis.asyncio as redis
+    from redis.exceptions import RedisError
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+    class RedisError(Exception):
+        pass
+
+
+logger = structlog.get_logger(__name__)
+
+JOBS_KEY = "jobs"
+PROCESSING_KEY = "processing:{worker_id}"
+HEARTBEAT_KEY = "worker:{worker_id}"
+WORKERS_KEY = "workers"
+STATE_KEY = "state:{session_id}"
+CANCELLED_KEY = "cancelled:{session_id}"
+STATE_CHANNEL = "states"
+CONTROL_CHANNEL = "control"
+
+# Metadata that never goes through Valkey; workers resolve the user's Spotify
+# token with spotify_token_manager.get_token_for_state instead
+PRIVATE_METADATA_KEYS = frozenset({"spotify_access_token"})
+
+
+def encode_state(state: AgentState) -> str:
+    """Serialize a workflow state for another process.
+
+    Per-session helpers (candidate reservoir, quality tracker) and private
+    metadata (access tokens) stay behind; metadata values that are not
+    JSON-serializable are stringified.
+    """
+    return state.model_dump_json(
+        fallback=str, exclude={"metadata": set(PRIVATE_METADATA_KEYS)}
+    )
+
+
+def decode_state(payload: Any) -> AgentState:
+    """Rebuild a workflow state serialized with encode_state()."""
+    return AgentState.model_validate_json(payload)
+
+
+class WorkflowJobQueue:
+    """Job list, state channel and cancel channel shared by API and workers.
+
+    The API pushes workflow jobs onto a Valkey list that worker processes pop
+    from. A popped job moves atomically onto the worker's processing list and
+    stays there until the worker acknowledges it; while running, workers keep
+    a heartbeat key alive, and the processing list of a worker whose heartbeat
+    expired is pushed back onto the job list. Workers publish every state
+    change on a pub/sub channel (and keep the latest copy under a key, for
+    listeners that missed a message), and the API publishes cancellations on
+    a control channel.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        prefix: str = "moodlist:workflows:",
+        state_ttl: int = 3600,
+        heartbeat_ttl: int = 30,
+    ):
+        """Initialize the queue.
+
+        Args:
+            redis_url: Valkey/Redis connection URL
+            prefix: Key and channel prefix
+            state_ttl: Seconds the latest state and cancel markers are kept
+            heartbeat_ttl: Seconds a worker counts as alive after its last
+                heartbeat
+        """
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("Worker mode requires the redis package")
+
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self.state_ttl = state_ttl
+        self.heartbeat_ttl = heartbeat_ttl
+        self._client: Optional[redis.Redis] = None
+
+    def _key(self, name: str, **kwargs: str) -> str:
+        return self.prefix + name.format(**kwargs)
+
+    def _get_client(self) -> "redis.Redis":
+        if self._client is None:
+            self._client = redis.from_url(
+                self.redis_url,
+                socket_keepalive=True,
+                socket_connect_timeout=5,
+                health_check_interval=30,
+                decode_responses=True,
+            )
+        return self._client
+
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        """Hand a workflow job to the workers.
+
+        Private metadata (access tokens) is left out.
+
+        Args:
+            job: JSON-serializable job description
+        """
+        if job.get("metadata"):
+            job = {
+                **job,
+                "metadata": {
+                    key: value
+                    for key, value in job["metadata"].items()
+                    if key not in PRIVATE_METADATA_KEYS
+                },
+            }
+        await self._get_client().lpush(
+            self._key(JOBS_KEY), json.dumps(job, default=str)
+        )
+
+    async def pop(
+        self, worker_id: str, timeout: float = 1.0
+    ) -> Optional[Dict[str, Any]]:
+        """Claim the oldest job, waiting up to ``timeout`` seconds for one.
+
+        The job is moved onto the worker's processing list in the same
+        operation, so it is never lost between the pop and the run; call
+        ack() once it has finished.
+
+        Args:
+            worker_id: ID of the claiming worker
+            timeout: Seconds to block when the queue is empty
+
+        Returns:
+            Job description or None
+        """
+        item = await self._get_client().blmove(
+            self._key(JOBS_KEY),
+            self._key(PROCESSING_KEY, worker_id=worker_id),
+            timeout,
+            src="RIGHT",
+            dest="LEFT",
+        )
+        if item is None:
+            return None
+        return json.loads(item)
+
+    async def ack(self, worker_id: str, session_id: str) -> bool:
+        """Drop a finished job from the worker's processing list.
+
+        Args:
+            worker_id: ID of the worker that ran the job
+            session_id: Workflow session ID of the job
+
+        Returns:
+            False if the job was no longer there (e.g. it was requeued after
+            the worker missed its heartbeats)
+        """
+        client = self._get_client()
+        processing_key = self._key(PROCESSING_KEY, worker_id=worker_id)
+        removed = 0
+        for item in await client.lrange(processing_key, 0, -1):
+            if json.loads(item).get("session_id") == session_id:
+                removed += await client.lrem(processing_key, 1, item)
+        return removed > 0
+
+    async def heartbeat(self, worker_id: str) -> None:
+        """Mark a worker as alive for the next ``heartbeat_ttl`` seconds.
+
+        Args:
+            worker_id: Worker ID
+        """
+        client = self._get_client()
+        await client.set(
+            self._key(HEARTBEAT_KEY, worker_id=worker_id), 1, ex=self.heartbeat_ttl
+        )
+        await client.sadd(self._key(WORKERS_KEY), worker_id)
+
+    async def retire(self, worker_id: str) -> None:
+        """Stop a worker's heartbeat so anything it leaves behind is requeued.
+
+        Args:
+            worker_id: Worker ID
+        """
+        await self._get_client().delete(self._key(HEARTBEAT_KEY, worker_id=worker_id))
+
+    async def requeue_orphaned_jobs(self) -> int:
+        """Push the jobs of workers whose heartbeat expired back onto the job list.
+
+        Requeued jobs are taken next. Each job is moved atomically, so
+        workers sweeping at the same time never duplicate one.
+
+        Returns:
+            Number of jobs requeued
+        """
+        client = self._get_client()
+        jobs_key = self._key(JOBS_KEY)
+        requeued = 0
+        for worker_id in await client.smembers(self._key(WORKERS_KEY)):
+            if await client.exists(self._key(HEARTBEAT_KEY, worker_id=worker_id)):
+                continue
+
+            # Deregister first: a worker that comes back re-registers itself
+            await client.srem(self._key(WORKERS_KEY), worker_id)
+            processing_key = self._key(PROCESSING_KEY, worker_id=worker_id)
+            while await client.lmove(processing_key, jobs_key, "RIGHT", "RIGHT"):
+                requeued += 1
+
+        if requeued:
+            logger.warning("Requeued jobs of unresponsive workers", jobs=requeued)
+        return requeued
+
+    async def pending_jobs(self) -> int:
+        """Number of jobs no worker has picked up yet."""
+        return await self._get_client().llen(self._key(JOBS_KEY))
+
+    async def publish_state(self, state: AgentState) -> None:
+        """Store and broadcast a workflow's latest state.
+
+        Args:
+            state: Workflow state
+        """
+        payload = encode_state(state)
+        client = self._get_client()
+        await client.set(
+            self._key(STATE_KEY, session_id=state.session_id),
+            payload,
+            ex=self.state_ttl,
+        )
+        await client.publish(self._key(STATE_CHANNEL), payload)
+
+    async def get_state(self, session_id: str) -> Optional[AgentState]:
+        """Latest published state of a workflow.
+
+        Args:
+            session_id: Workflow session ID
+
+        Returns:
+            Workflow state or None
+        """
+        payload = await self._get_client().get(
+            self._key(STATE_KEY, session_id=session_id)
+        )
+        return decode_state(payload) if payload else None
+
+    async def request_cancel(self, session_id: str) -> None:
+        """Ask whichever worker runs (or will pick up) a workflow to cancel it.
+
+        Args:
+            session_id: Workflow session ID
+        """
+        client = self._get_client()
+        await client.set(
+            self._key(CANCELLED_KEY, session_id=session_id), 1, ex=self.state_ttl
+        )
+        await client.publish(
+            self._key(CONTROL_CHANNEL), json.dumps({"cancel": session_id})
+        )
+
+    async def is_cancel_requested(self, session_id: str) -> bool:
+        """Whether a workflow was cancelled, e.g. before a worker picked it up."""
+        return bool(
+            await self._get_client().exists(
+                self._key(CANCELLED_KEY, session_id=session_id)
+            )
+        )
+
+    async def state_updates(self) -> AsyncIterator[AgentState]:
+        """Yield every state published by the workers, reconnecting as needed."""
+        async for payload in self._subscribe(STATE_CHANNEL):
+            try:
+                yield decode_state(payload)
+            except ValueError as e:
+                logger.warning("Dropping malformed workflow state", error=str(e))
+
+    async def control_messages(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield control messages (cancellations), reconnecting as needed."""
+        async for payload in self._subscribe(CONTROL_CHANNEL):
+            try:
+                yield json.loads(payload)
+            except ValueError as e:
+                logger.warning("Dropping malformed control message", error=str(e))
+
+    async def _subscribe(self, channel: str) -> AsyncIterator[str]:
+        backoff = 1.0
+        while True:
+            pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._key(channel))
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        yield message["data"]
+            except (RedisError, OSError) as e:
+                logger.warning(
+                    "Workflow channel subscription lost, reconnecting",
+                    channel=channel,
+                    error=str(e),
+                    retry_in=backoff,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                await pubsub.aclose()
+
+    async def close(self) -> None:
+        """Close the Valkey connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,12 +1,9 @@
 """Workflow execution logic."""
 
-from datetime import datetime, timedelta, timezone
 from typing import Dict
 
 import structlog
-from sqlalchemy import select
 
-from ...clients.spotify_client import SpotifyAPIClient
 from ..core.base_agent import BaseAgent
 from ..states.agent_state import AgentState, RecommendationStatus
 
@@ -90,9 +87,6 @@ class WorkflowExecutor:
         Returns:
             Updated state
         """
-        # Refresh token before orchestration
-        state = await self._refresh_spotify_token_if_needed(state)
-
         state.current_step = "evaluating_quality"
         state.status = RecommendationStatus.EVALUATING_QUALITY
 
@@ -128,76 +122,3 @@ class WorkflowExecutor:
             return state
 
         return await ordering_agent.execute(state)
-
-    async def _refresh_spotify_token_if_needed(self, state: AgentState) -> AgentState:
-        """Refresh the Spotify access token if needed during workflow execution.
-
-        Args:
-            state: Current workflow state
-
-        Returns:
-            Updated state with refreshed token if needed
-        """
-        try:
-            # Check if we have a user_id and can refresh the token
-            if not state.user_id:
-                logger.warning("No user_id in state, cannot refresh token")
-                return state
-
-            # Get user from database to check token expiry and refresh
-            from ...core.database import async_session_factory
-            from ...models.user import User
-
-            async with async_session_factory() as db:
-                result = await db.execute(
-                    select(User).where(User.id == int(state.user_id))
-                )
-                user = result.scalar_one_or_none()
-
-                if not user:
-                    logger.warning(f"User {state.user_id} not found for token refresh")
-                    return state
-
-                # Check if token is expired or will expire soon (within 5 minutes)
-                now = datetime.now(timezone.utc)
-                token_expires_at = user.token_expires_at
-
-                # Handle both timezone-aware and naive datetimes
-                if token_expires_at.tzinfo is None:
-                    token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
-
-                # If token is still valid (more than 5 minutes remaining), no need to refresh
-                if token_expires_at > now + timedelta(minutes=5):
-                    return state
-
-                logger.info(f"Refreshing expired Spotify token for user {user.id}")
-
-                # Refresh the token
-                spotify_client = SpotifyAPIClient()
-                token_data = await spotify_client.refresh_token(user.refresh_token)
-
-                # Update user's tokens in database
-                user.access_token = token_data["access_token"]
-                if "refresh_token" in token_data:
-                    user.refresh_token = token_data["refresh_token"]
-
-                # Update expiration time
-                expires_in = token_data.get("expires_in", 3600)
-                user.token_expires_at = datetime.now(timezone.utc).replace(
-                    microsecond=0
-                ) + timedelta(seconds=expires_in)
-
-                await db.commit()
-
-                # Update the state with new token
-                state.metadata["spotify_access_token"] = user.access_token
-
-                logger.info(
-                    f"Successfully refreshed Spotify token for user {user.id}, "
-                    f"expires at {user.token_expires_at}"
-                )
-
-        except Exception as e:
-            logger.error(f"Failed to refresh Spotify token: {str(e)}", exc_info=True)
-
-        return state
@@ -1,6 +1,7 @@
 """Workflow manager for coordinating agentic recommendation process."""
 
 import asyncio
+import contextvars
 import json
 import os
 import uuid
@@ -10,14 +11,30 @@ from typing import Any, Dict, List, Optional
 import structlog
 
 from ...core.config import settings
+from ...services.spotify_token_manager import spotify_token_manager
+from ...services.taste_profile_service import taste_profile_service
 from ..core.base_agent import BaseAgent
+from ..core.critical_path import analyze_trace
+from ..core.single_flight import get_single_flight_stats
+from ..core.tracing import tracer
 from ..states.agent_state import AgentState, RecommendationStatus
 from ..tools.agent_tools import AgentTools
+from .admission_controller import WorkflowAdmissionController
+from .job_queue import WorkflowJobQueue
 from .workflow_executor import WorkflowExecutor
 from .workflow_state_manager import StateChangeCallback, WorkflowStateManager
 
 logger = structlog.get_logger(__name__)
 
+TERMINAL_STATUSES = (
+    RecommendationStatus.COMPLETED,
+    RecommendationStatus.FAILED,
+    RecommendationStatus.CANCELLED,
+)
+
+# How often a dispatched workflow re-reads its state in case an update was missed
+REMOTE_STATE_POLL_INTERVAL = 30.0
+
 
 class WorkflowConfig:
     """Configuration for the recommendation workflow."""
@@ -29,6 +46,10 @@ class WorkflowConfig:
         max_recommendations: int = 30,
         enable_human_loop: bool = True,
         require_approval: bool = False,
+        max_concurrent_workflows: int = 8,
+        max_queued_workflows: int = 50,
+        max_queued_per_user: int = 2,
+        dispatch_timeout: float = 300.0,
     ):
         """Initialize workflow configuration.
 
@@ -38,12 +59,21 @@ class WorkflowConfig:
             max_recommendations: Maximum number of recommendations
             enable_human_loop: Whether to enable human-in-the-loop
             require_approval: Whether to require final approval
+            max_concurrent_workflows: Workflows allowed to run at once
+            max_queued_workflows: Workflows allowed to wait for a slot
+            max_queued_per_user: Workflows a single user may have waiting
+            dispatch_timeout: Seconds a dispatched workflow may go without a
+                state from a worker before it is failed (worker mode only)
         """
         self.max_retries = max_retries
         self.timeout_per_agent = timeout_per_agent
         self.max_recommendations = max_recommendations
         self.enable_human_loop = enable_human_loop
         self.require_approval = require_approval
+        self.max_concurrent_workflows = max_concurrent_workflows
+        self.max_queued_workflows = max_queued_workflows
+        self.max_queued_per_user = max_queued_per_user
+        self.dispatch_timeout = dispatch_timeout
 
 
 class WorkflowManager:
@@ -53,7 +83,11 @@ class WorkflowManager:
     """
 
     def __init__(
-        self, config: WorkflowConfig, agents: Dict[str, BaseAgent], tools: AgentTools
+        self,
+        config: WorkflowConfig,
+        agents: Dict[str, BaseAgent],
+        tools: AgentTools,
+        presave_preparer: Optional[Any] = None,
     ):
         """Initialize the workflow manager.
 
@@ -61,18 +95,34 @@ class WorkflowManager:
             config: Workflow configuration
             agents: Dictionary of available agents
             tools: Available tools
+            presave_preparer: Optional ``PresavePreparer`` that prepares the
+                playlist name, description and cover while the workflow runs
         """
         self.config = config
         self.agents = agents
         self.tools = tools
+        self.presave_preparer = presave_preparer
 
         # Initialize specialized managers
         self.state_manager = WorkflowStateManager()
         self.executor = WorkflowExecutor(agents)
+        self.admission = WorkflowAdmissionController(
+            max_concurrent=config.max_concurrent_workflows,
+            max_queued=config.max_queued_workflows,
+            max_queued_per_user=config.max_queued_per_user,
+            on_queue_change=self._publish_queue_positions,
+        )
 
         # Track running tasks
         self.active_tasks: Dict[str, asyncio.Task] = {}
 
+        # Worker mode: workflows run in worker processes fed through Valkey
+        self.job_queue: Optional[WorkflowJobQueue] = None
+        self._remote_waiters: Dict[str, asyncio.Future] = {}
+        # session_id -> loop time a worker state last arrived (or the dispatch)
+        self._remote_activity: Dict[str, float] = {}
+        self._state_listener: Optional[asyncio.Task] = None
+
         # Performance tracking
         self.workflow_count = 0
         self.success_count = 0
@@ -149,9 +199,16 @@ class WorkflowManager:
 
         Returns:
             Workflow session ID (UUID string)
+
+        Raises:
+            WorkflowQueueFullException: If every slot is taken and the
+                admission queue is full
         """
         session_id = str(uuid.uuid4())
 
+        # Claim a slot or queue place first so shed requests leave no trace
+        queue_position = self.admission.reserve(session_id, user_id)
+
         # Create initial state
         state = AgentState(
             session_id=session_id,
@@ -162,6 +219,10 @@ class WorkflowManager:
             status=RecommendationStatus.PENDING,
         )
 
+        if queue_position:
+            state.current_step = "queued"
+            state.metadata["queue_position"] = queue_position
+
         # Store remix tracks in metadata if provided
         if remix_tracks:
             state.metadata["remix_playlist_tracks"] = remix_tracks
@@ -173,11 +234,16 @@ class WorkflowManager:
         self.state_manager.active_workflows[session_id] = state
         self.workflow_count += 1
 
-        logger.info(f"Started workflow {session_id} for mood: {mood_prompt[:50]}...")
+        logger.info(
+            f"Started workflow {session_id} for mood: {mood_prompt[:50]}...",
+            queue_position=queue_position,
+        )
 
         # Start workflow execution and track the task
-        task = asyncio.create_task(self._execute_workflow(session_id))
+        task = asyncio.create_task(self._run_admitted_workflow(session_id))
         self.active_tasks[session_id] = task
+        # Also covers tasks cancelled before they ever ran
+        task.add_done_callback(lambda _: self.admission.release(session_id))
 
         return session_id
 
@@ -204,6 +270,9 @@ class WorkflowManager:
             state.current_step = "cancelled"
             state.update_timestamp()
 
+            self._cancel_presave(session_id)
+            self._cancel_remote(session_id)
+
             # Cancel the asyncio task if it exists
             if session_id in self.active_tasks:
                 task = self.active_tasks[session_id]
@@ -230,6 +299,8 @@ class WorkflowManager:
                 state.error_message = "Workflow cancelled by user"
                 state.current_step = "cancelled"
                 state.update_timestamp()
+                self._cancel_presave(session_id)
+                self._cancel_remote(session_id)
                 logger.info(
                     f"Updated completed workflow {session_id} to cancelled status"
                 )
@@ -238,6 +309,335 @@ class WorkflowManager:
         logger.warning(f"Attempted to cancel non-existent workflow {session_id}")
         return False
 
+    def get_queue_position(self, session_id: str) -> Optional[int]:
+        """Get a workflow's position in the admission queue.
+
+        Args:
+            session_id: Workflow session ID
+
+        Returns:
+            1-based queue position, or None if the workflow is not waiting
+        """
+        return self.admission.position(session_id)
+
+    def _publish_queue_positions(self, positions: Dict[str, int]) -> None:
+        """Record new queue positions on the states and notify subscribers.
+
+        Args:
+            positions: New 1-based position per queued session
+        """
+        for session_id, position in positions.items():
+            state = self.state_manager.active_workflows.get(session_id)
+            if state is None:
+                continue
+            state.metadata["queue_position"] = position
+            state.update_timestamp()
+            asyncio.create_task(
+                self.state_manager.notify_state_change(session_id, state)
+            )
+
+    async def _run_admitted_workflow(self, session_id: str):
+        """Wait for an admission slot, then execute the workflow.
+
+        Queue time happens outside the workflow trace so it does not show up
+        on the critical path. The slot is released by the task's done callback.
+
+        Args:
+            session_id: Workflow session ID
+        """
+        if self.admission.position(session_id) is not None:
+            waited = await self.admission.wait_for_slot(session_id)
+
+            state = self.state_manager.active_workflows.get(session_id)
+            if state is None or state.status == RecommendationStatus.CANCELLED:
+                return
+            state.metadata.pop("queue_position", None)
+            state.metadata["queue_wait_seconds"] = round(waited, 3)
+            state.current_step = "initializing"
+            state.update_timestamp()
+            await self.state_manager.notify_state_change(session_id, state)
+
+        if self.job_queue is not None:
+            await self._run_remote_workflow(session_id)
+        else:
+            await self._run_traced_workflow(session_id)
+
+    def enable_worker_dispatch(self, job_queue: WorkflowJobQueue) -> None:
+        """Run admitted workflows in worker processes instead of this one.
+
+        States published by the workers are mirrored into this manager and
+        passed to the usual state-change subscribers, so status, SSE and save
+        endpoints work unchanged. Must be called from the running event loop.
+
+        Args:
+            job_queue: Queue shared with ``python -m app.agents.worker``
+        """
+        self.job_queue = job_queue
+        if self._state_listener is None:
+            self._state_listener = asyncio.create_task(
+                self._listen_for_remote_states(), context=contextvars.Context()
+            )
+        logger.info("Workflow execution delegated to worker processes")
+
+    async def execute_dispatched(self, job: Dict[str, Any]) -> AgentState:
+        """Execute a workflow job received from the API (worker side).
+
+        Args:
+            job: Job built by the dispatching manager
+
+        Returns:
+            Final workflow state
+        """
+        session_id = job["session_id"]
+        state = AgentState(
+            session_id=session_id,
+            user_id=job["user_id"],
+            mood_prompt=job["mood_prompt"],
+            spotify_user_id=job.get("spotify_user_id"),
+            current_step="initializing",
+            status=RecommendationStatus.PENDING,
+            metadata=job.get("metadata") or {},
+        )
+        self.state_manager.active_workflows[session_id] = state
+        self.workflow_count += 1
+
+        task = asyncio.create_task(self._run_traced_workflow(session_id))
+        self.active_tasks[session_id] = task
+        await asyncio.gather(task, return_exceptions=True)
+
+        return self.get_workflow_state(session_id) or state
+
+    async def _run_remote_workflow(self, session_id: str):
+        """Dispatch an admitted workflow to the workers and wait for it to finish.
+
+        The workflow is failed when no worker publishes a new state for it
+        within ``dispatch_timeout`` seconds (no worker running, or its worker
+        died and nobody requeued the job), or when its published state
+        expires, so the admission slot is never held by a workflow nobody runs.
+
+        Args:
+            session_id: Workflow session ID
+        """
+        state = self.state_manager.active_workflows.get(session_id)
+        if state is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._remote_waiters[session_id] = waiter
+        dispatched_at = self._remote_activity[session_id] = loop.time()
+        poll_interval = min(REMOTE_STATE_POLL_INTERVAL, self.config.dispatch_timeout)
+        try:
+            await self.job_queue.enqueue(
+                {
+                    "session_id": session_id,
+                    "user_id": state.user_id,
+                    "mood_prompt": state.mood_prompt,
+                    "spotify_user_id": state.spotify_user_id,
+                    "metadata": state.metadata,
+                }
+            )
+            logger.info(f"Dispatched workflow {session_id} to workers")
+
+            while not waiter.done():
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), poll_interval)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+                remote_state = await self.job_queue.get_state(session_id)
+                if remote_state is not None:
+                    await self._apply_remote_state(remote_state)
+                    if waiter.done():
+                        continue
+
+                last_activity = self._remote_activity[session_id]
+                idle = loop.time() - last_activity
+                if remote_state is None and last_activity > dispatched_at:
+                    error = "its state expired"
+                elif idle >= self.config.dispatch_timeout:
+                    error = f"no state from a worker for {int(idle)}s"
+                else:
+                    continue
+
+                await self._fail_remote_workflow(
+                    session_id, f"Workflow worker unavailable: {error}"
+                )
+                return
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to dispatch workflow {session_id}: {e}")
+            await self._fail_remote_workflow(
+                session_id, f"Failed to dispatch workflow: {e}"
+            )
+        finally:
+            self._remote_waiters.pop(session_id, None)
+            self._remote_activity.pop(session_id, None)
+
+    async def _fail_remote_workflow(self, session_id: str, error: str):
+        """Fail a dispatched workflow locally and tell the workers to drop it.
+
+        Args:
+            session_id: Workflow session ID
+            error: Error message shown to the user
+        """
+        state = self.state_manager.active_workflows.get(session_id)
+        if state is None or state.status == RecommendationStatus.CANCELLED:
+            return
+
+        logger.error(error, session_id=session_id)
+        state.set_error(error)
+        self.state_manager.move_to_completed(session_id, state)
+        self.failure_count += 1
+        await self.state_manager.notify_state_change(session_id, state)
+        # A worker that picks the job up late skips it
+        self._cancel_remote(session_id)
+
+    async def _listen_for_remote_states(self):
+        """Mirror states published by the workers until the manager shuts down."""
+        async for remote_state in self.job_queue.state_updates():
+            try:
+                await self._apply_remote_state(remote_state)
+            except Exception as e:
+                logger.error(
+                    "Failed to apply workflow state from worker",
+                    session_id=remote_state.session_id,
+                    error=str(e),
+                    exc_info=True,
+                )
+
+    async def _apply_remote_state(self, remote_state: AgentState):
+        """Adopt a state published by a worker and notify local subscribers.
+
+        Args:
+            remote_state: State received from a worker
+        """
+        session_id = remote_state.session_id
+
+        # Finished sessions are owned locally from here on (cancel, save); only
+        # the profile, computed after the worker's final notification, is adopted
+        completed = self.state_manager.completed_workflows.get(session_id)
+        if completed is not None:
+            profile = remote_state.metadata.get("profile")
+            if profile is not None:
+                completed.metadata.setdefault("profile", profile)
+            return
+
+        # Only a state newer than the mirrored one shows the worker is alive
+        current = self.state_manager.active_workflows.get(session_id)
+        if session_id in self._remote_activity and (
+            current is None or current.updated_at != remote_state.updated_at
+        ):
+            self._remote_activity[session_id] = asyncio.get_running_loop().time()
+
+        if remote_state.status in TERMINAL_STATUSES:
+            self.state_manager.active_workflows.pop(session_id, None)
+            self.state_manager.completed_workflows[session_id] = remote_state
+            if remote_state.status == RecommendationStatus.COMPLETED:
+                self.success_count += 1
+            else:
+                self.failure_count += 1
+
+            waiter = self._remote_waiters.get(session_id)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(remote_state)
+        else:
+            self.state_manager.active_workflows[session_id] = remote_state
+
+        await self.state_manager.notify_state_change(session_id, remote_state)
+
+    async def _stop_worker_dispatch(self):
+        """Stop mirroring worker states; dispatched workflows keep running there."""
+        dispatched = len(self._remote_waiters)
+        queued = len(self.active_tasks) - dispatched
+        logger.info(
+            "Stopping worker dispatch",
+            dispatched_workflows=dispatched,
+            undispatched_workflows=queued,
+        )
+
+        tasks = list(self.active_tasks.values())
+        if self._state_listener is not None:
+            tasks.append(self._state_listener)
+            self._state_listener = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self.job_queue.close()
+        self.job_queue = None
+
+    def _cancel_remote(self, session_id: str) -> None:
+        """Forward a cancellation to the workers (worker mode only).
+
+        Args:
+            session_id: Workflow session ID
+        """
+        if self.job_queue is None:
+            return
+
+        async def _request_cancel():
+            try:
+                await self.job_queue.request_cancel(session_id)
+            except Exception as e:
+                logger.error(
+                    f"Failed to forward cancellation of workflow {session_id}: {e}"
+                )
+
+        asyncio.create_task(_request_cancel())
+
+    async def _run_traced_workflow(self, session_id: str):
+        """Execute a workflow inside the root span of its trace.
+
+        Args:
+            session_id: Workflow session ID
+        """
+        with tracer.start_span(
+            "workflow", attributes={"session.id": session_id}, root=True
+        ) as span:
+            state = self.state_manager.active_workflows.get(session_id)
+            if state is not None and span.is_recording:
+                state.metadata["trace_id"] = span.trace_id
+
+            await self._execute_workflow(session_id)
+
+            final_state = self.get_workflow_state(session_id)
+            if final_state is not None:
+                span.set_attribute("workflow.status", final_state.status.value)
+
+        if span.is_recording:
+            self._record_profile(session_id, span.trace_id)
+
+    def _record_profile(self, session_id: str, trace_id: str) -> None:
+        """Store the critical-path profile of a finished run in its state.
+
+        Only the tracer of the process that ran the workflow holds its spans,
+        so the profile is computed here and travels with the state metadata
+        (published to the API process in worker mode).
+
+        Args:
+            session_id: Workflow session ID
+            trace_id: ID of the run's trace
+        """
+        state = self.get_workflow_state(session_id)
+        spans = tracer.get_trace(trace_id)
+        if state is None or not spans:
+            return
+
+        try:
+            profile = analyze_trace(spans)
+            profile["dropped_spans"] = tracer.memory_exporter.dropped_span_count(
+                trace_id
+            )
+            state.metadata["profile"] = profile
+        except Exception as e:
+            logger.warning(
+                "Failed to profile workflow", session_id=session_id, error=str(e)
+            )
+
     async def _execute_workflow(self, session_id: str):
         """Execute the complete workflow for a session.
 
@@ -267,6 +667,9 @@ class WorkflowManager:
                 return True
             return False
 
+        # Renew the user's Spotify token in the background while the workflow runs
+        spotify_token_manager.hold(state.user_id)
+
         try:
             logger.info(f"Executing workflow {session_id}")
 
@@ -306,6 +709,10 @@ class WorkflowManager:
             if check_cancellation():
                 return
 
+            # Name and cover only need the mood; prepare them while tracks are found
+            if self.presave_preparer and state.mood_analysis:
+                self.presave_preparer.prepare_for_mood(state)
+
             # STEP 3-5: Execute orchestration (handles seed gathering, recommendations, and quality improvement)
             async def notify_progress(updated_state: AgentState):
                 """Callback to notify SSE clients of state changes."""
@@ -388,6 +795,9 @@ class WorkflowManager:
                 await self._update_state(session_id, state)
                 self.success_count += 1
 
+                if self.presave_preparer:
+                    self.presave_preparer.prepare_for_recommendations(state)
+
                 # Dump the state to a file if DEBUG is enabled
                 if settings.DEBUG:
                     self._save_workflow_state_to_file(session_id, state)
@@ -412,6 +822,8 @@ class WorkflowManager:
             self.failure_count += 1
 
         finally:
+            spotify_token_manager.release(state.user_id)
+
             # Clean up task reference
             if session_id in self.active_tasks:
                 del self.active_tasks[session_id]
@@ -432,6 +844,10 @@ class WorkflowManager:
                     state.current_step = "cancelled"
                     state.update_timestamp()
 
+                # Nothing will be saved from a cancelled or failed session
+                if is_cancelled or state.status == RecommendationStatus.FAILED:
+                    self._cancel_presave(session_id)
+
                 completion_time = datetime.now(timezone.utc)
                 state.metadata["completion_time"] = completion_time.isoformat()
                 state.metadata["total_duration"] = (
@@ -465,6 +881,15 @@ class WorkflowManager:
                     step_timings=enhanced_step_timings,
                 )
 
+    def _cancel_presave(self, session_id: str) -> None:
+        """Stop speculative pre-save preparation for an abandoned session.
+
+        Args:
+            session_id: Workflow session ID
+        """
+        if self.presave_preparer:
+            self.presave_preparer.cancel(session_id)
+
     def _save_workflow_state_to_file(self, session_id: str, state: AgentState):
         """Save workflow state to a JSON file for debugging.
 
@@ -569,6 +994,11 @@ class WorkflowManager:
             "failure_count": self.failure_count,
             "success_rate": success_rate,
             "average_completion_time": self._calculate_average_completion_time(),
+            "execution_mode": "worker" if self.job_queue else "inline",
+            "admission": self.admission.get_stats(),
+            "spotify_tokens": spotify_token_manager.get_stats(),
+            "taste_profiles": taste_profile_service.get_stats(),
+            "stage_coalescing": get_single_flight_stats(),
         }
 
     def _calculate_average_completion_time(self) -> float:
@@ -626,6 +1056,10 @@ class WorkflowManager:
         Args:
             timeout: Maximum time to wait in seconds (default: 5 minutes)
         """
+        if self.job_queue is not None:
+            await self._stop_worker_dispatch()
+            return
+
         if not self.active_tasks:
             logger.info("No active workflows, proceeding with shutdown")
             return
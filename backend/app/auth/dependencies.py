@@ -1,5 +1,4 @@
 import hashlib
-from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import jwt
@@ -9,7 +8,6 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.security import verify_token
-from app.clients import SpotifyAPIClient
 from app.core.config import settings
 from app.core.exceptions import (
     InternalServerError,
@@ -27,6 +25,7 @@ from app.models.user import User
 from app.repositories.session_repository import SessionRepository
 from app.repositories.user_repository import UserRepository
 from app.services.quota_service import QuotaService
+from app.services.spotify_token_manager import spotify_token_manager
 
 logger = structlog.get_logger(__name__)
 security = HTTPBearer(auto_error=False)
@@ -153,9 +152,12 @@ async def require_auth(
 async def refresh_spotify_token_if_expired(user: User, db: AsyncSession) -> User:
     """Check if Spotify token is expired and refresh if needed.
 
+    Refreshes go through the shared ``SpotifyTokenManager``: concurrent
+    requests for the same user share one refresh across all workers.
+
     Args:
         user: User object with token information
-        user_repo: User repository for database operations
+        db: Database session the user was loaded with
 
     Returns:
         User object with refreshed token if needed
@@ -163,62 +165,13 @@ async def refresh_spotify_token_if_expired(user: User, db: AsyncSession) -> User
     Raises:
         HTTPException: If token refresh fails
     """
-    # Check if token is expired or will expire in the next 5 minutes
-    now = datetime.now(timezone.utc)
-
-    # Validate token expiration exists
-    token_expires_at = user.token_expires_at
-    if not token_expires_at:
-        logger.error("User has no token expiration time", user_id=user.id)
-        raise SpotifyAuthError("Invalid token state. Please log in again.")
-
-    # Handle both timezone-aware and naive datetimes
-    if token_expires_at.tzinfo is None:
-        token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
-
-    # Add 5 minute buffer to refresh before actual expiration
-    if token_expires_at > now:
-        # Token is still valid
-        logger.debug(
-            "Spotify token still valid", user_id=user.id, expires_at=token_expires_at
-        )
-        return user
-
-    logger.info(
-        "Spotify token expired, refreshing",
-        user_id=user.id,
-        expired_at=token_expires_at,
-    )
-
-    # Refresh the token using SpotifyAPIClient
-    spotify_client = SpotifyAPIClient()
     try:
-        token_data = await spotify_client.refresh_token(user.refresh_token)
-
-        # Update expiration time
-        expires_in = token_data.get("expires_in", 3600)
-        new_token_expires_at = datetime.now(timezone.utc).replace(
-            microsecond=0
-        ) + timedelta(seconds=expires_in)
-
-        user_repo = UserRepository(db)
-        updated_user = await user_repo.update_tokens_and_commit(
-            user_id=user.id,
-            access_token=token_data["access_token"],
-            refresh_token=token_data.get("refresh_token", user.refresh_token),
-            token_expires_at=new_token_expires_at,
-        )
-
-        logger.info(
-            "Spotify token refreshed successfully",
-            user_id=updated_user.id,
-            new_expires_at=updated_user.token_expires_at,
-        )
-
-        return updated_user
+        return await spotify_token_manager.ensure_fresh_user(user, db)
 
     except SpotifyAuthError as e:
         logger.error("Failed to refresh Spotify token", user_id=user.id, error=str(e))
+        if not user.token_expires_at:
+            raise
         raise SpotifyAuthError("Failed to refresh Spotify token. Please log in again.")
     except Exception as e:
         logger.error(
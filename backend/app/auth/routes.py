@@ -31,6 +31,7 @@ from app.repositories.session_repository import SessionRepository
 from app.repositories.user_repository import UserRepository
 from app.services.auth_service import AuthService
 from app.services.quota_service import QuotaService
+from app.services.taste_profile_service import taste_profile_service
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -58,6 +59,9 @@ async def login(
         user_agent=request.headers.get("user-agent"),
     )
 
+    # Precompute the user's taste profile so their first workflow starts warm
+    taste_profile_service.schedule_build(str(user.id), user.access_token)
+
     # Set session cookie using utility (pass origin for localhost detection)
     origin = request.headers.get("origin")
     set_session_cookie(response, session_token, origin)
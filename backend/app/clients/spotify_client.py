@@ -1,7 +1,7 @@
 """Centralized Spotify API client with built-in error handling and retry logic."""
 
-import asyncio
 from typing import Any, Dict, Optional
+from urllib.parse import urlparse
 
 import httpx
 import structlog
@@ -14,6 +14,14 @@ from tenacity import (
 )
 
 from app.agents.core.cache import cache_manager
+from app.agents.core.tracing import (
+    SPAN_KIND_CLIENT,
+    THROTTLE_RETRY_AFTER,
+    THROTTLE_RETRY_BACKOFF,
+    record_upstream_call,
+    traced_sleep,
+    tracer,
+)
 from app.core.config import settings
 from app.core.constants import HTTPTimeouts, SpotifyEndpoints
 from app.core.exceptions import (
@@ -212,7 +220,11 @@ class SpotifyAPIClient:
         )
 
     async def remove_tracks_from_playlist(
-        self, access_token: str, playlist_id: str, track_uris: list[str]
+        self,
+        access_token: str,
+        playlist_id: str,
+        track_uris: list[str],
+        snapshot_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Remove tracks from a playlist.
 
@@ -220,11 +232,14 @@ class SpotifyAPIClient:
             access_token: Spotify access token
             playlist_id: Spotify playlist ID
             track_uris: List of track URIs to remove
+            snapshot_id: Playlist snapshot the removal applies to (optional)
 
         Returns:
             Response data
         """
         json_data = {"tracks": [{"uri": uri} for uri in track_uris]}
+        if snapshot_id:
+            json_data["snapshot_id"] = snapshot_id
         return await self._delete(
             f"/playlists/{playlist_id}/tracks", access_token, json=json_data
         )
@@ -236,6 +251,7 @@ class SpotifyAPIClient:
         range_start: int,
         insert_before: int,
         range_length: int = 1,
+        snapshot_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Reorder tracks in a playlist.
 
@@ -245,6 +261,7 @@ class SpotifyAPIClient:
             range_start: Position of first track to move
             insert_before: Position to insert tracks
             range_length: Number of tracks to move
+            snapshot_id: Playlist snapshot the positions refer to (optional)
 
         Returns:
             Response data
@@ -254,6 +271,8 @@ class SpotifyAPIClient:
             "insert_before": insert_before,
             "range_length": range_length,
         }
+        if snapshot_id:
+            json_data["snapshot_id"] = snapshot_id
         return await self._put(
             f"/playlists/{playlist_id}/tracks", access_token, json=json_data
         )
@@ -302,17 +321,21 @@ class SpotifyAPIClient:
             f"/playlists/{playlist_id}/tracks", access_token, params=params
         )
 
-    async def get_playlist(self, access_token: str, playlist_id: str) -> Dict[str, Any]:
+    async def get_playlist(
+        self, access_token: str, playlist_id: str, fields: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Get playlist details.
 
         Args:
             access_token: Spotify access token
             playlist_id: Spotify playlist ID
+            fields: Optional Spotify field filter (e.g. "snapshot_id,tracks.total")
 
         Returns:
             Playlist details including snapshot_id
         """
-        return await self._get(f"/playlists/{playlist_id}", access_token)
+        params = {"fields": fields} if fields else None
+        return await self._get(f"/playlists/{playlist_id}", access_token, params=params)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -384,6 +407,23 @@ class SpotifyAPIClient:
 
     async def _request(
         self, method: str, endpoint: str, access_token: str, **kwargs
+    ) -> Dict[str, Any]:
+        """Make HTTP request inside a client span of the active workflow trace."""
+        with tracer.start_span(
+            f"HTTP {method}",
+            attributes={
+                "tool.name": "spotify_client",
+                "http.method": method,
+                "http.route": endpoint,
+                "server.address": urlparse(SpotifyEndpoints.API_BASE).netloc,
+            },
+            kind=SPAN_KIND_CLIENT,
+        ):
+            record_upstream_call()
+            return await self._send_request(method, endpoint, access_token, **kwargs)
+
+    async def _send_request(
+        self, method: str, endpoint: str, access_token: str, **kwargs
     ) -> Dict[str, Any]:
         """Make HTTP request with error handling and retries.
 
@@ -482,7 +522,13 @@ class SpotifyAPIClient:
                             attempt=attempt + 1,
                             has_retry_after_header=retry_after is not None,
                         )
-                        await asyncio.sleep(wait_time)
+                        await traced_sleep(
+                            wait_time,
+                            THROTTLE_RETRY_AFTER
+                            if retry_after
+                            else THROTTLE_RETRY_BACKOFF,
+                            **{"tool.name": "spotify_client"},
+                        )
                         continue
 
                     # Either out of retries or wait time too long
@@ -498,7 +544,11 @@ class SpotifyAPIClient:
                             wait_time=wait_time,
                             attempt=attempt + 1,
                         )
-                        await asyncio.sleep(wait_time)
+                        await traced_sleep(
+                            wait_time,
+                            THROTTLE_RETRY_BACKOFF,
+                            **{"tool.name": "spotify_client"},
+                        )
                         continue
                     raise SpotifyServerError("Spotify server error")
                 else:
@@ -523,7 +573,11 @@ class SpotifyAPIClient:
                         wait_time=wait_time,
                         attempt=attempt + 1,
                     )
-                    await asyncio.sleep(wait_time)
+                    await traced_sleep(
+                        wait_time,
+                        THROTTLE_RETRY_BACKOFF,
+                        **{"tool.name": "spotify_client"},
+                    )
                     continue
 
                 raise SpotifyConnectionError(f"Failed to connect to Spotify: {str(e)}")
@@ -96,6 +96,44 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
 
+    # Tracing (opt-in: a workflow trace holds thousands of spans in memory)
+    TRACING_ENABLED: bool = Field(default=False, env="TRACING_ENABLED")
+    TRACING_EXPORT_FILE: Optional[str] = Field(default=None, env="TRACING_EXPORT_FILE")
+    TRACING_MAX_TRACES: int = Field(default=200, env="TRACING_MAX_TRACES")
+
+    # Agent memory (per-agent ring of recent execution summaries)
+    AGENT_MEMORY_MAX_ENTRIES: int = Field(default=50, env="AGENT_MEMORY_MAX_ENTRIES")
+    AGENT_MEMORY_SAMPLE_RATE: float = Field(default=1.0, env="AGENT_MEMORY_SAMPLE_RATE")
+    AGENT_MEMORY_CAPTURE_FULL: bool = Field(
+        default=False, env="AGENT_MEMORY_CAPTURE_FULL"
+    )
+
+    # Workflow admission (per worker process)
+    WORKFLOW_MAX_CONCURRENT: int = Field(default=8, env="WORKFLOW_MAX_CONCURRENT")
+    WORKFLOW_MAX_QUEUED: int = Field(default=50, env="WORKFLOW_MAX_QUEUED")
+    WORKFLOW_MAX_QUEUED_PER_USER: int = Field(
+        default=2, env="WORKFLOW_MAX_QUEUED_PER_USER"
+    )
+    # "inline" runs workflows in the API process; "worker" hands them to
+    # `python -m app.agents.worker` processes through Valkey
+    WORKFLOW_EXECUTION_MODE: str = Field(
+        default="inline", env="WORKFLOW_EXECUTION_MODE"
+    )
+    WORKFLOW_WORKER_CONCURRENCY: int = Field(
+        default=4, env="WORKFLOW_WORKER_CONCURRENCY"
+    )
+    # Seconds a dispatched workflow may go without a new state from a worker
+    # (including time waiting for a free worker) before it is failed
+    WORKFLOW_DISPATCH_TIMEOUT: float = Field(
+        default=300.0, env="WORKFLOW_DISPATCH_TIMEOUT"
+    )
+
+    # Per-user taste profiles (top tracks/artists precomputed for seed gathering)
+    TASTE_PROFILE_ENABLED: bool = Field(default=True, env="TASTE_PROFILE_ENABLED")
+    TASTE_PROFILE_REFRESH_HOURS: float = Field(
+        default=6.0, env="TASTE_PROFILE_REFRESH_HOURS"
+    )
+
     # LLM Providers
     OPENROUTER_API_KEY: Optional[str] = Field(default=None, env="OPENROUTER_API_KEY")
     GROQ_API_KEY: Optional[str] = Field(default=None, env="GROQ_API_KEY")
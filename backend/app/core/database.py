@@ -3,6 +3,7 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from app.agents.core.tracing import tracer
 from app.core.config import settings
 
 
@@ -12,6 +13,18 @@ class Base(DeclarativeBase):
     pass
 
 
+class TracedAsyncSession(AsyncSession):
+    """Async session that records flushes and commits as workflow trace spans."""
+
+    async def flush(self, objects=None) -> None:
+        with tracer.start_span("db.flush", attributes={"db.system": "postgresql"}):
+            await super().flush(objects)
+
+    async def commit(self) -> None:
+        with tracer.start_span("db.commit", attributes={"db.system": "postgresql"}):
+            await super().commit()
+
+
 # Create async engine with asyncpg driver and optimized connection pool settings
 engine = create_async_engine(
     settings.get_database_url().replace("postgresql://", "postgresql+asyncpg://"),
@@ -38,7 +51,7 @@ engine = create_async_engine(
 # Create async session factory
 async_session_factory = async_sessionmaker(
     engine,
-    class_=AsyncSession,
+    class_=TracedAsyncSession,
     expire_on_commit=False,
 )
 
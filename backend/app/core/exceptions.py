@@ -89,6 +89,25 @@ class RateLimitException(HTTPException):
         )
 
 
+class WorkflowQueueFullException(HTTPException):
+    """Workflow admission queue is full; the client should retry later."""
+
+    def __init__(
+        self,
+        detail: str = "Too many workflows are waiting to start",
+        retry_after: int = 30,
+    ):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "Workflow queue full",
+                "message": detail,
+                "retry_after": retry_after,
+            },
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 class InternalServerError(HTTPException):
     """Internal server error."""
 
@@ -30,19 +30,13 @@ def _initialize_cache_manager():
         return CacheManager()
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan context manager."""
+def initialize_runtime() -> None:
+    """Configure process-wide services shared by the API and workflow workers."""
     # Configure logging first
     from app.core.logging_config import configure_logging
 
     configure_logging(log_level=settings.LOG_LEVEL, app_env=settings.APP_ENV)
 
-    # Startup
-    logger.info(
-        "Starting application", app_name=settings.APP_NAME, environment=settings.APP_ENV
-    )
-
     # Validate required secrets before proceeding
     validate_required_secrets()
 
@@ -52,6 +46,89 @@ async def lifespan(app: FastAPI):
     new_cache_manager = _initialize_cache_manager()
     set_cache_manager(new_cache_manager)
 
+    # Configure workflow tracing (in-memory, plus optional JSONL export)
+    from app.agents.core.tracing import configure_tracing
+
+    configure_tracing(
+        enabled=settings.TRACING_ENABLED,
+        export_file=settings.TRACING_EXPORT_FILE,
+        max_traces=settings.TRACING_MAX_TRACES,
+    )
+
+    # Configure per-agent execution memory
+    from app.agents.core.agent_memory import configure_agent_memory
+
+    configure_agent_memory(
+        max_entries=settings.AGENT_MEMORY_MAX_ENTRIES,
+        sample_rate=settings.AGENT_MEMORY_SAMPLE_RATE,
+        capture_full=settings.AGENT_MEMORY_CAPTURE_FULL,
+    )
+
+    # Configure precomputed per-user taste profiles
+    from app.services.taste_profile_service import configure_taste_profiles
+
+    configure_taste_profiles(
+        enabled=settings.TASTE_PROFILE_ENABLED,
+        refresh_hours=settings.TASTE_PROFILE_REFRESH_HOURS,
+    )
+
+
+async def shutdown_runtime() -> None:
+    """Release process-wide services set up by initialize_runtime()."""
+    # Stop background profile builds and token renewal before the cache goes away
+    from app.services.spotify_token_manager import spotify_token_manager
+    from app.services.taste_profile_service import taste_profile_service
+
+    await taste_profile_service.shutdown()
+    await spotify_token_manager.shutdown()
+
+    # Close cache manager connection
+    from app.agents.core.cache import get_cache_manager
+
+    cache_manager = get_cache_manager()
+    if hasattr(cache_manager, "close"):
+        logger.info("Closing cache manager connection")
+        await cache_manager.close()
+
+    # Flush trace exporters
+    from app.agents.core.tracing import tracer
+
+    tracer.shutdown()
+
+
+def _enable_worker_dispatch() -> None:
+    """Hand workflow execution to worker processes when configured."""
+    if settings.WORKFLOW_EXECUTION_MODE != "worker":
+        return
+    if not settings.REDIS_URL:
+        logger.warning(
+            "WORKFLOW_EXECUTION_MODE=worker needs REDIS_URL; running workflows in-process"
+        )
+        return
+
+    from app.agents.routes.dependencies import get_workflow_manager
+    from app.agents.workflows.job_queue import WorkflowJobQueue
+
+    get_workflow_manager().enable_worker_dispatch(WorkflowJobQueue(settings.REDIS_URL))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan context manager."""
+    initialize_runtime()
+
+    # Startup
+    logger.info(
+        "Starting application", app_name=settings.APP_NAME, environment=settings.APP_ENV
+    )
+
+    _enable_worker_dispatch()
+
+    # Keep taste profiles of users active in this process fresh
+    from app.services.taste_profile_service import taste_profile_service
+
+    taste_profile_service.start_refresh()
+
     # Create database tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -73,10 +150,4 @@ async def lifespan(app: FastAPI):
             "Error during workflow graceful shutdown", error=str(e), exc_info=True
         )
 
-    # Close cache manager connection
-    from app.agents.core.cache import get_cache_manager
-
-    cache_manager = get_cache_manager()
-    if hasattr(cache_manager, "close"):
-        logger.info("Closing cache manager connection")
-        await cache_manager.close()
+    await shutdown_runtime()
@@ -51,6 +51,23 @@ def create_logged_llm(
     return logged_llm
 
 
+def create_playlist_llm() -> LoggingChatModel:
+    """Create the LLM that names and describes playlists.
+
+    Shared by the save endpoint and the pre-save preparer so names prepared
+    ahead of time match ones generated at save time.
+
+    Returns:
+        LoggingChatModel instance wrapping the Groq-hosted model
+    """
+    return create_logged_llm(
+        model="openai/gpt-oss-120b",
+        temperature=1,
+        base_url="https://api.groq.com/openai/v1",
+        api_key=settings.GROQ_API_KEY,
+    )
+
+
 def create_llm_for_agent(
     agent_name: str,
     session_id: Optional[str] = None,
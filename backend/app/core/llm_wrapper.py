@@ -1,13 +1,14 @@
 """Wrapper for LangChain LLMs to log invocations to database."""
 
 import time
+from contextlib import aclosing
 from contextvars import ContextVar
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import structlog
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage, BaseMessageChunk
 from langchain_core.outputs import ChatGeneration, ChatResult
 from openai import (
     APIConnectionError,
@@ -25,6 +26,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from app.agents.core.tracing import SPAN_KIND_CLIENT, record_upstream_call, tracer
 from app.repositories.llm_invocation_repository import LLMInvocationRepository
 
 logger = structlog.get_logger(__name__)
@@ -224,6 +226,24 @@ class LoggingChatModel(BaseChatModel):
 
         return messages
 
+    def _input_to_messages(
+        self, input: Union[str, List[BaseMessage], List[Dict[str, str]]]
+    ) -> List[BaseMessage]:
+        """Normalize any accepted invocation input to messages for logging."""
+        if isinstance(input, str):
+            from langchain_core.messages import HumanMessage
+
+            return [HumanMessage(content=input)]
+        return self._convert_to_messages(input)
+
+    def _span_attributes(self) -> Dict[str, Any]:
+        """Attributes shared by the invocation spans."""
+        return {
+            "llm.provider": self.provider,
+            "llm.model": self._extract_model_config()["model_name"],
+            "agent.name": current_agent_name.get() or "unknown",
+        }
+
     def _extract_prompt_from_messages(self, messages: List[BaseMessage]) -> str:
         """Extract a string representation of the prompt from messages."""
         return "\n".join([f"{msg.type}: {msg.content}" for msg in messages])
@@ -491,19 +511,26 @@ class LoggingChatModel(BaseChatModel):
         Retries up to 5 times on transient API errors (rate limits, timeouts, server errors)
         with exponential backoff + jitter.
         """
-        if isinstance(input, str):
-            from langchain_core.messages import HumanMessage
-
-            logged_messages: List[BaseMessage] = [HumanMessage(content=input)]
-        else:
-            logged_messages = self._convert_to_messages(input)
+        logged_messages = self._input_to_messages(input)
 
         start_time = time.time()
         error = None
         result = None
 
         try:
-            result = await self.wrapped_llm.ainvoke(input, config, **kwargs)
+            record_upstream_call()
+            with tracer.start_span(
+                "llm.ainvoke", attributes=self._span_attributes(), kind=SPAN_KIND_CLIENT
+            ) as span:
+                result = await self.wrapped_llm.ainvoke(input, config, **kwargs)
+                usage = getattr(result, "usage_metadata", None) or {}
+                if usage:
+                    span.set_attributes(
+                        {
+                            "llm.prompt_tokens": usage.get("input_tokens", 0),
+                            "llm.completion_tokens": usage.get("output_tokens", 0),
+                        }
+                    )
             return result
         except Exception as e:
             error = e
@@ -519,3 +546,99 @@ class LoggingChatModel(BaseChatModel):
             else:
                 chat_result = None
             await self._log_invocation(logged_messages, chat_result, latency_ms, error)
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(initial=1, max=60),
+        retry=retry_if_exception_type(
+            (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+        ),
+        before_sleep=before_sleep_log(logger, "WARNING"),
+        reraise=True,
+    )
+    async def _open_stream(
+        self,
+        input: Union[str, List[BaseMessage], List[Dict[str, str]]],
+        config: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[AsyncIterator[BaseMessageChunk], Optional[BaseMessageChunk]]:
+        """Start a stream and wait for its first chunk.
+
+        Retried like ``ainvoke``: until the first chunk arrives nothing has
+        reached the caller, so a failed attempt can simply be replaced.
+
+        Returns:
+            The open stream and its first chunk (None when the stream is empty)
+        """
+        record_upstream_call()
+        stream = self.wrapped_llm.astream(input, config, **kwargs)
+        return stream, await anext(stream, None)
+
+    async def astream(
+        self,
+        input: Union[str, List[BaseMessage], List[Dict[str, str]]],
+        config: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[BaseMessageChunk]:
+        """Stream the LLM response chunk by chunk (async version).
+
+        The invocation is logged once the stream ends, with the text received so
+        far. Transient API errors are retried like in ``ainvoke`` until the first
+        chunk arrives; after that nothing is retried, since chunks already handed
+        to the caller cannot be taken back. Callers that stop early should close the
+        stream in their own task (``contextlib.aclosing``) so the span and log
+        entry are finished there, not by the garbage collector.
+        """
+        logged_messages = self._input_to_messages(input)
+
+        start_time = time.time()
+        error = None
+        aggregated: Optional[BaseMessageChunk] = None
+        completed = False
+
+        try:
+            with tracer.start_span(
+                "llm.astream", attributes=self._span_attributes(), kind=SPAN_KIND_CLIENT
+            ) as span:
+                try:
+                    stream, chunk = await self._open_stream(input, config, **kwargs)
+                    async with aclosing(stream):
+                        while chunk is not None:
+                            aggregated = (
+                                chunk if aggregated is None else aggregated + chunk
+                            )
+                            yield chunk
+                            chunk = await anext(stream, None)
+                    completed = True
+                except GeneratorExit:
+                    # The caller stopped reading early; that is not a failure
+                    pass
+                finally:
+                    usage = getattr(aggregated, "usage_metadata", None) or {}
+                    span.set_attributes(
+                        {
+                            "llm.stream.completed": completed,
+                            "llm.prompt_tokens": usage.get("input_tokens", 0),
+                            "llm.completion_tokens": usage.get("output_tokens", 0),
+                        }
+                    )
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            latency_ms = int((time.time() - start_time) * 1000)
+            if aggregated is not None:
+                chat_result = ChatResult(
+                    generations=[
+                        ChatGeneration(
+                            message=AIMessage(
+                                content=aggregated.content,
+                                usage_metadata=aggregated.usage_metadata,
+                            )
+                        )
+                    ],
+                    llm_output=getattr(aggregated, "response_metadata", {}),
+                )
+            else:
+                chat_result = None
+            await self._log_invocation(logged_messages, chat_result, latency_ms, error)
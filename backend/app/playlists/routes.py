@@ -7,7 +7,7 @@ import structlog
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.llm_factory import create_logged_llm
+from app.core.llm_factory import create_playlist_llm
 
 from ..agents.states.agent_state import (
     AgentState,
@@ -18,7 +18,6 @@ from ..agents.tools.reccobeat_service import RecoBeatService
 from ..agents.tools.spotify_service import SpotifyService
 from ..agents.workflows.workflow_manager import WorkflowManager
 from ..auth.dependencies import refresh_spotify_token_if_expired, require_auth
-from ..core.config import settings
 from ..core.database import get_db
 from ..core.exceptions import (
     ForbiddenException,
@@ -39,12 +38,7 @@ router = APIRouter()
 reccobeat_service = RecoBeatService()
 spotify_service = SpotifyService()
 
-llm = create_logged_llm(
-    model="openai/gpt-oss-120b",
-    temperature=1,
-    base_url="https://api.groq.com/openai/v1",
-    api_key=settings.GROQ_API_KEY,
-)
+llm = create_playlist_llm()
 
 # Initialize playlist services
 completed_playlist_editor = CompletedPlaylistEditor()
@@ -442,10 +436,10 @@ async def save_playlist_to_spotify(
 
         # If not in cache, load from database
         if not state:
-            playlist = (
-                await playlist_service.playlist_repository.get_by_session_id_for_update(
-                    session_id
-                )
+            # No row lock here: creating the playlist on Spotify takes seconds, and
+            # the final write only applies if no other save got there first
+            playlist = await playlist_service.playlist_repository.get_by_session_id(
+                session_id
             )
 
             if not playlist:
@@ -548,6 +542,11 @@ async def save_playlist_to_spotify(
             logger.info(
                 f"Updated playlist with session_id {session_id} with Spotify info"
             )
+        else:
+            logger.warning(
+                f"Playlist with session_id {session_id} was saved by another request; "
+                f"kept its Spotify info"
+            )
 
         return {
             "session_id": session_id,
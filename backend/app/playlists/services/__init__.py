@@ -2,6 +2,12 @@
 
 from .playlist_creation_service import PlaylistCreationService
 from .playlist_edit_service import CompletedPlaylistEditor
+from .presave_preparer import PresavePreparer
 from .spotify_edit_service import SpotifyEditService
 
-__all__ = ["PlaylistCreationService", "CompletedPlaylistEditor", "SpotifyEditService"]
+__all__ = [
+    "PlaylistCreationService",
+    "CompletedPlaylistEditor",
+    "PresavePreparer",
+    "SpotifyEditService",
+]
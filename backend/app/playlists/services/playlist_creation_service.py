@@ -10,10 +10,12 @@ from ...agents.states.agent_state import AgentState, RecommendationStatus
 from ...agents.tools.spotify_service import SpotifyService
 from ...core.exceptions import InternalServerError, ValidationException
 from ...services.cover_image_generator import CoverImageGenerator
+from ...services.spotify_token_manager import spotify_token_manager
 from .playlist_describer import PlaylistDescriber
 from .playlist_namer import PlaylistNamer
 from .playlist_summarizer import PlaylistSummarizer
 from .playlist_validator import PlaylistValidator
+from .presave_preparer import PresavePreparer, get_cover_colors
 from .track_adder import TrackAdder
 
 logger = structlog.get_logger(__name__)
@@ -48,6 +50,12 @@ class PlaylistCreationService:
         self.playlist_validator = PlaylistValidator()
         self.playlist_summarizer = PlaylistSummarizer()
         self.cover_generator = CoverImageGenerator()
+        self.presave_preparer = PresavePreparer(
+            self.playlist_namer,
+            self.playlist_describer,
+            self.cover_generator,
+            cover_style,
+        )
 
     async def create_playlist(self, state: AgentState) -> AgentState:
         """Execute playlist creation.
@@ -67,18 +75,15 @@ class PlaylistCreationService:
                     "No recommendations available for playlist creation"
                 )
 
-            # Generate playlist name and description in parallel (they don't depend on each other)
+            # Use the name and description prepared during the workflow,
+            # generating whatever is missing in parallel
             playlist_name, playlist_description = await asyncio.gather(
-                self.playlist_namer.generate_name(
-                    state.mood_prompt, len(state.recommendations)
-                ),
-                self.playlist_describer.generate_description(
-                    state.mood_prompt, len(state.recommendations)
-                ),
+                self._get_playlist_name(state),
+                self._get_playlist_description(state),
             )
 
             # Create playlist on Spotify
-            access_token = state.metadata.get("spotify_access_token")
+            access_token = await spotify_token_manager.get_token_for_state(state)
             if not access_token:
                 raise ValidationException(
                     "No Spotify access token available for playlist creation"
@@ -150,23 +155,28 @@ class PlaylistCreationService:
             color_scheme = state.mood_analysis["color_scheme"]
 
             # Validate color scheme has all required colors
-            if not all(
-                key in color_scheme for key in ["primary", "secondary", "tertiary"]
-            ):
+            colors = get_cover_colors(state.mood_analysis)
+            if not colors:
                 logger.warning(
                     "Incomplete color scheme, skipping cover image generation"
                 )
                 return
 
-            logger.info(f"Generating cover image with colors: {color_scheme}")
-
-            # Generate cover image as base64
-            cover_base64 = self.cover_generator.generate_cover_base64(
-                primary_color=color_scheme["primary"],
-                secondary_color=color_scheme["secondary"],
-                tertiary_color=color_scheme["tertiary"],
-                style=self.cover_style,
+            # Reuse the cover rendered during the workflow when the colors match
+            cover_base64 = await self.presave_preparer.get_cover(
+                state.session_id, colors, self.cover_style
             )
+            if cover_base64:
+                logger.info("Using prepared cover image", session_id=state.session_id)
+            else:
+                logger.info(f"Generating cover image with colors: {color_scheme}")
+                cover_base64 = await asyncio.to_thread(
+                    self.cover_generator.generate_cover_base64,
+                    primary_color=colors["primary"],
+                    secondary_color=colors["secondary"],
+                    tertiary_color=colors["tertiary"],
+                    style=self.cover_style,
+                )
 
             # Upload to Spotify
             success = await self.spotify_service.upload_playlist_cover_image(
@@ -211,6 +221,42 @@ class PlaylistCreationService:
                     "style": self.cover_style,
                 }
 
+    async def _get_playlist_name(self, state: AgentState) -> str:
+        """Get the prepared playlist name or generate one.
+
+        Args:
+            state: Current agent state
+
+        Returns:
+            Playlist name
+        """
+        name = await self.presave_preparer.get_name(state)
+        if name:
+            logger.info("Using prepared playlist name", session_id=state.session_id)
+            return name
+        return await self.playlist_namer.generate_name(
+            state.mood_prompt, len(state.recommendations)
+        )
+
+    async def _get_playlist_description(self, state: AgentState) -> str:
+        """Get the prepared playlist description or generate one.
+
+        Args:
+            state: Current agent state
+
+        Returns:
+            Playlist description
+        """
+        description = await self.presave_preparer.get_description(state)
+        if description:
+            logger.info(
+                "Using prepared playlist description", session_id=state.session_id
+            )
+            return description
+        return await self.playlist_describer.generate_description(
+            state.mood_prompt, len(state.recommendations)
+        )
+
     def get_playlist_summary(self, state: AgentState):
         """Get a summary of the created playlist.
 
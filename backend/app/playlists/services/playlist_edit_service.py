@@ -13,9 +13,11 @@ from ...agents.states.agent_state import TrackRecommendation
 from ...core.exceptions import (
     ForbiddenException,
     NotFoundException,
+    SpotifyAPIException,
     ValidationException,
 )
 from ...models.playlist import Playlist
+from .playlist_mutation_executor import PlaylistMutationExecutor
 from .spotify_edit_service import SpotifyEditService
 
 logger = structlog.get_logger(__name__)
@@ -27,6 +29,9 @@ class CompletedPlaylistEditor:
     def __init__(self):
         """Initialize the completed playlist editor."""
         self.spotify_edit_service = SpotifyEditService()
+        self.mutation_executor = PlaylistMutationExecutor(
+            self.spotify_edit_service.spotify_client
+        )
         # Dictionary to store locks per session_id to prevent concurrent edits
         self._edit_locks: Dict[str, asyncio.Lock] = {}
 
@@ -152,6 +157,8 @@ class CompletedPlaylistEditor:
         if not track_id:
             raise ValidationException("track_id is required for remove operation")
 
+        previous = list(recommendations)
+
         # Find and remove track
         track_to_remove = None
         for i, rec in enumerate(recommendations):
@@ -164,8 +171,8 @@ class CompletedPlaylistEditor:
 
         # Remove from Spotify if playlist is saved
         if is_saved_to_spotify:
-            await self.spotify_edit_service.remove_track_from_spotify(
-                spotify_playlist_id, track_to_remove.get("spotify_uri"), access_token
+            await self._apply_to_spotify(
+                spotify_playlist_id, previous, recommendations, access_token
             )
             logger.info(
                 f"Removed track {track_id} from Spotify playlist {spotify_playlist_id}"
@@ -192,6 +199,8 @@ class CompletedPlaylistEditor:
                 "track_id and new_position are required for reorder operation"
             )
 
+        previous = list(recommendations)
+
         # Find track index
         old_index = None
         for i, rec in enumerate(recommendations):
@@ -208,8 +217,8 @@ class CompletedPlaylistEditor:
 
         # Reorder in Spotify if playlist is saved
         if is_saved_to_spotify:
-            await self.spotify_edit_service.reorder_track_in_spotify(
-                spotify_playlist_id, old_index, new_position, access_token
+            await self._apply_to_spotify(
+                spotify_playlist_id, previous, recommendations, access_token
             )
             logger.info(
                 f"Reordered track {track_id} from position {old_index} to {new_position} in Spotify"
@@ -253,6 +262,8 @@ class CompletedPlaylistEditor:
             "source": "user_added",
         }
 
+        previous = list(recommendations)
+
         # Add to position or end of list
         if new_position is not None:
             recommendations.insert(new_position, new_track)
@@ -261,8 +272,8 @@ class CompletedPlaylistEditor:
 
         # Add to Spotify if playlist is saved
         if is_saved_to_spotify:
-            await self.spotify_edit_service.add_track_to_spotify(
-                spotify_playlist_id, track_uri, access_token, new_position
+            await self._apply_to_spotify(
+                spotify_playlist_id, previous, recommendations, access_token
             )
             logger.info(
                 f"Added track {track_uri} to Spotify playlist {spotify_playlist_id}"
@@ -274,6 +285,44 @@ class CompletedPlaylistEditor:
 
         return recommendations
 
+    async def _apply_to_spotify(
+        self,
+        spotify_playlist_id: str,
+        previous: List[Dict],
+        recommendations: List[Dict],
+        access_token: str,
+    ) -> Dict[str, Any]:
+        """Push the difference between two track lists to the Spotify playlist.
+
+        Args:
+            spotify_playlist_id: Spotify playlist ID
+            previous: Recommendations before the edit
+            recommendations: Recommendations after the edit
+            access_token: Spotify access token
+
+        Returns:
+            Mutation result with per-operation timings
+
+        Raises:
+            SpotifyAPIException: If any Spotify write failed
+        """
+        result = await self.mutation_executor.apply(
+            access_token=access_token,
+            playlist_id=spotify_playlist_id,
+            current_uris=[
+                rec["spotify_uri"] for rec in previous if rec.get("spotify_uri")
+            ],
+            target_uris=[
+                rec["spotify_uri"] for rec in recommendations if rec.get("spotify_uri")
+            ],
+        )
+        if result["failed_operations"]:
+            errors = [
+                op.get("error") for op in result["operations"] if not op["success"]
+            ]
+            raise SpotifyAPIException(f"Failed to update Spotify playlist: {errors[0]}")
+        return result
+
     async def update_in_memory_state(
         self, workflow_manager, session_id: str, recommendations: List[Dict]
     ) -> None:
@@ -0,0 +1,427 @@
+"""Batched add/remove/reorder executor for Spotify playlist writes."""
+
+import asyncio
+import bisect
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from ...clients.spotify_client import SpotifyAPIClient
+
+logger = structlog.get_logger(__name__)
+
+# Spotify accepts at most 100 URIs per add/remove request
+SPOTIFY_MUTATION_CHUNK = 100
+
+# Maximum independent add/remove requests in flight per playlist
+MUTATION_CONCURRENCY = 4
+
+
+@dataclass
+class PlaylistOperation:
+    """A single Spotify playlist write."""
+
+    op_type: str  # "remove", "add" or "reorder"
+    uris: List[str] = field(default_factory=list)
+    position: Optional[int] = None
+    range_start: Optional[int] = None
+    range_length: int = 1
+    insert_before: Optional[int] = None
+
+
+def _tokenize(uris: List[str]) -> List[Tuple[str, int]]:
+    """Tag each URI with its occurrence number so duplicates stay distinguishable."""
+    seen: Counter = Counter()
+    tokens = []
+    for uri in uris:
+        tokens.append((uri, seen[uri]))
+        seen[uri] += 1
+    return tokens
+
+
+def _longest_increasing_subsequence(values: List[int]) -> List[int]:
+    """Return the indices of one longest strictly increasing subsequence."""
+    tails: List[int] = []
+    tail_indices: List[int] = []
+    previous = [-1] * len(values)
+
+    for index, value in enumerate(values):
+        slot = bisect.bisect_left(tails, value)
+        if slot > 0:
+            previous[index] = tail_indices[slot - 1]
+        if slot == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[slot] = value
+            tail_indices[slot] = index
+
+    result = []
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        result.append(index)
+        index = previous[index]
+    return result[::-1]
+
+
+def _chunk(uris: List[str], size: int = SPOTIFY_MUTATION_CHUNK) -> List[List[str]]:
+    """Split URIs into request-sized chunks."""
+    return [uris[i : i + size] for i in range(0, len(uris), size)]
+
+
+def plan_removals(
+    current_uris: List[str], target_uris: List[str]
+) -> Tuple[List[PlaylistOperation], List[str]]:
+    """Plan URI removals needed to move from the current to the target playlist.
+
+    Spotify removes every occurrence of a URI, so a URI whose count shrinks is
+    removed completely and the copies still needed are re-added later.
+
+    Args:
+        current_uris: Track URIs currently in the playlist, in order
+        target_uris: Desired track URIs, in order
+
+    Returns:
+        Tuple of (remove operations, URIs remaining after the removals)
+    """
+    current_counts = Counter(current_uris)
+    target_counts = Counter(target_uris)
+
+    removed = [
+        uri
+        for uri in dict.fromkeys(current_uris)
+        if target_counts[uri] < current_counts[uri]
+    ]
+    removed_set = set(removed)
+    remaining = [uri for uri in current_uris if uri not in removed_set]
+
+    operations = [
+        PlaylistOperation(op_type="remove", uris=chunk) for chunk in _chunk(removed)
+    ]
+    return operations, remaining
+
+
+def plan_additions(
+    remaining_uris: List[str], target_uris: List[str]
+) -> Tuple[List[PlaylistOperation], Optional[List[str]]]:
+    """Plan the add requests for URIs missing after removals.
+
+    A single chunk of new tracks that sits contiguously in the target is inserted
+    at its position directly. Larger additions are appended in concurrent chunks.
+
+    Args:
+        remaining_uris: URIs left after removals, in playlist order
+        target_uris: Desired track URIs, in order
+
+    Returns:
+        Tuple of (add operations, predicted playlist order afterwards or None
+        when concurrent appends make the order unknown)
+    """
+    available = Counter(remaining_uris)
+    new_indices = []
+    for index, uri in enumerate(target_uris):
+        if available[uri] > 0:
+            available[uri] -= 1
+        else:
+            new_indices.append(index)
+
+    if not new_indices:
+        return [], list(remaining_uris)
+
+    new_uris = [target_uris[i] for i in new_indices]
+    chunks = _chunk(new_uris)
+    if len(chunks) > 1:
+        return [PlaylistOperation(op_type="add", uris=chunk) for chunk in chunks], None
+
+    position = None
+    is_contiguous = new_indices[-1] - new_indices[0] == len(new_indices) - 1
+    if is_contiguous and new_indices[0] < len(target_uris) - len(new_indices):
+        # Number of kept tracks that precede the new run in the target
+        position = new_indices[0]
+
+    predicted = list(remaining_uris)
+    insert_at = len(predicted) if position is None else position
+    predicted[insert_at:insert_at] = new_uris
+    return [
+        PlaylistOperation(op_type="add", uris=new_uris, position=position)
+    ], predicted
+
+
+def plan_reorders(
+    current_uris: List[str], target_uris: List[str]
+) -> List[PlaylistOperation]:
+    """Plan range moves that turn one permutation of tracks into another.
+
+    Tracks on a longest increasing subsequence (relative to the target order)
+    stay put; every other track is moved right after its target predecessor,
+    and runs that are already adjacent move together as one range.
+
+    Args:
+        current_uris: Track URIs in current playlist order
+        target_uris: Same tracks in the desired order
+
+    Returns:
+        Reorder operations, with positions valid when applied in sequence
+
+    Raises:
+        ValueError: If the two lists are not permutations of each other
+    """
+    sim = _tokenize(current_uris)
+    target = _tokenize(target_uris)
+    if sim == target:
+        return []
+    if Counter(sim) != Counter(target):
+        raise ValueError("Reorder requires both lists to contain the same tracks")
+
+    target_index = {token: index for index, token in enumerate(target)}
+    sequence = [target_index[token] for token in sim]
+    fixed = {sim[i] for i in _longest_increasing_subsequence(sequence)}
+
+    operations = []
+    i = 0
+    while i < len(target):
+        token = target[i]
+        if token in fixed:
+            i += 1
+            continue
+
+        range_start = sim.index(token)
+        range_length = 1
+        while (
+            i + range_length < len(target)
+            and target[i + range_length] not in fixed
+            and range_start + range_length < len(sim)
+            and sim[range_start + range_length] == target[i + range_length]
+        ):
+            range_length += 1
+
+        insert_before = 0 if i == 0 else sim.index(target[i - 1]) + 1
+        block = sim[range_start : range_start + range_length]
+
+        if not range_start <= insert_before <= range_start + range_length:
+            del sim[range_start : range_start + range_length]
+            destination = (
+                insert_before - range_length
+                if insert_before > range_start
+                else insert_before
+            )
+            sim[destination:destination] = block
+            operations.append(
+                PlaylistOperation(
+                    op_type="reorder",
+                    range_start=range_start,
+                    range_length=range_length,
+                    insert_before=insert_before,
+                )
+            )
+
+        fixed.update(block)
+        i += range_length
+
+    return operations
+
+
+class PlaylistMutationExecutor:
+    """Applies the minimal set of Spotify writes to reach a target track order.
+
+    Removals and additions are order-independent chunks, so they are sent
+    concurrently. Reorders depend on positions and are sent one after another,
+    each carrying the snapshot_id returned by the previous write.
+    """
+
+    def __init__(
+        self,
+        spotify_client: Optional[SpotifyAPIClient] = None,
+        max_concurrency: int = MUTATION_CONCURRENCY,
+    ):
+        """Initialize the executor.
+
+        Args:
+            spotify_client: Client used for Spotify playlist writes
+            max_concurrency: Maximum add/remove requests in flight
+        """
+        self.spotify_client = spotify_client or SpotifyAPIClient()
+        self.max_concurrency = max_concurrency
+
+    async def apply(
+        self,
+        access_token: str,
+        playlist_id: str,
+        current_uris: List[str],
+        target_uris: List[str],
+    ) -> Dict[str, Any]:
+        """Mutate a Spotify playlist from its current track order to the target.
+
+        Args:
+            access_token: Spotify access token
+            playlist_id: Spotify playlist ID
+            current_uris: Track URIs currently in the Spotify playlist
+            target_uris: Desired track URIs, in order
+
+        Returns:
+            Result with snapshot_id, per-operation timings and failure count
+        """
+        started = time.perf_counter()
+        records: List[Dict[str, Any]] = []
+
+        remove_ops, remaining = plan_removals(current_uris, target_uris)
+        await self._run_concurrently(access_token, playlist_id, remove_ops, records)
+
+        add_ops, predicted = plan_additions(remaining, target_uris)
+        await self._run_concurrently(access_token, playlist_id, add_ops, records)
+
+        failed = [record for record in records if not record["success"]]
+        reorder_ops: List[PlaylistOperation] = []
+        if not failed and target_uris:
+            if predicted is None:
+                # Concurrent appends landed in completion order; read it back
+                predicted = await self._fetch_playlist_uris(access_token, playlist_id)
+            reorder_ops = plan_reorders(predicted, target_uris)
+
+        snapshot_id = self._latest_snapshot(records)
+        for operation in reorder_ops:
+            record = await self._execute(
+                access_token, playlist_id, operation, snapshot_id
+            )
+            records.append(record)
+            if not record["success"]:
+                break
+            snapshot_id = record.get("snapshot_id") or snapshot_id
+
+        failed = [record for record in records if not record["success"]]
+        result = {
+            "snapshot_id": snapshot_id,
+            "operations": records,
+            "failed_operations": len(failed),
+            "tracks_removed": sum(len(op.uris) for op in remove_ops),
+            "tracks_added": sum(len(op.uris) for op in add_ops),
+            "reorder_operations": len(reorder_ops),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+        logger.info(
+            "Applied playlist mutations",
+            playlist_id=playlist_id,
+            operation_count=len(records),
+            failed_operations=result["failed_operations"],
+            tracks_removed=result["tracks_removed"],
+            tracks_added=result["tracks_added"],
+            reorder_operations=result["reorder_operations"],
+            elapsed_ms=result["elapsed_ms"],
+        )
+        return result
+
+    async def _run_concurrently(
+        self,
+        access_token: str,
+        playlist_id: str,
+        operations: List[PlaylistOperation],
+        records: List[Dict[str, Any]],
+    ) -> None:
+        """Run order-independent operations with bounded concurrency."""
+        if not operations:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(operation: PlaylistOperation) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._execute(access_token, playlist_id, operation)
+
+        records.extend(await asyncio.gather(*(run(op) for op in operations)))
+
+    async def _execute(
+        self,
+        access_token: str,
+        playlist_id: str,
+        operation: PlaylistOperation,
+        snapshot_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one operation and record its timing and resulting snapshot."""
+        record: Dict[str, Any] = {
+            "op": operation.op_type,
+            "tracks": len(operation.uris) or operation.range_length,
+        }
+        started = time.perf_counter()
+
+        try:
+            if operation.op_type == "remove":
+                response = await self.spotify_client.remove_tracks_from_playlist(
+                    access_token=access_token,
+                    playlist_id=playlist_id,
+                    track_uris=operation.uris,
+                )
+            elif operation.op_type == "add":
+                response = await self.spotify_client.add_tracks_to_playlist(
+                    access_token=access_token,
+                    playlist_id=playlist_id,
+                    track_uris=operation.uris,
+                    position=operation.position,
+                )
+            else:
+                response = await self.spotify_client.reorder_playlist_tracks(
+                    access_token=access_token,
+                    playlist_id=playlist_id,
+                    range_start=operation.range_start,
+                    insert_before=operation.insert_before,
+                    range_length=operation.range_length,
+                    snapshot_id=snapshot_id,
+                )
+            record["success"] = True
+            record["snapshot_id"] = (response or {}).get("snapshot_id")
+        except Exception as e:
+            logger.error(
+                f"Playlist {operation.op_type} operation failed: {str(e)}",
+                playlist_id=playlist_id,
+            )
+            record["success"] = False
+            record["error"] = str(e)
+
+        record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return record
+
+    async def _fetch_playlist_uris(
+        self, access_token: str, playlist_id: str
+    ) -> List[str]:
+        """Read the playlist's current track URIs in order."""
+        first_page = await self.spotify_client.get_playlist_tracks(
+            access_token, playlist_id, limit=SPOTIFY_MUTATION_CHUNK, offset=0
+        )
+        total = first_page.get("total", 0)
+        pages = [first_page]
+        if total > SPOTIFY_MUTATION_CHUNK:
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        self.spotify_client.get_playlist_tracks(
+                            access_token,
+                            playlist_id,
+                            limit=SPOTIFY_MUTATION_CHUNK,
+                            offset=offset,
+                        )
+                        for offset in range(
+                            SPOTIFY_MUTATION_CHUNK, total, SPOTIFY_MUTATION_CHUNK
+                        )
+                    )
+                )
+            )
+
+        return [
+            (item.get("track") or {}).get("uri")
+            for page in pages
+            for item in page.get("items", [])
+            if (item.get("track") or {}).get("uri")
+        ]
+
+    def _latest_snapshot(self, records: List[Dict[str, Any]]) -> Optional[str]:
+        """Snapshot to chain the first reorder onto.
+
+        After several concurrent writes the server-side order of their snapshots
+        is unknown, so reorders then start from the playlist's latest state.
+        """
+        if len(records) == 1 and records[0]["success"]:
+            return records[0]["snapshot_id"]
+        return None
@@ -1,6 +1,8 @@
 """Service for syncing playlist data from Spotify."""
 
-from typing import Any, Dict, List
+import asyncio
+from collections import Counter
+from typing import Any, Dict, List, Optional
 
 import structlog
 
@@ -10,6 +12,11 @@ from app.repositories.playlist_repository import PlaylistRepository
 
 logger = structlog.get_logger(__name__)
 
+# Spotify returns at most 100 playlist items per page
+SYNC_PAGE_SIZE = 100
+SYNC_PAGE_CONCURRENCY = 4
+PLAYLIST_META_FIELDS = "snapshot_id,tracks.total"
+
 
 class PlaylistSyncService:
     """Service for syncing playlist data from Spotify to local database."""
@@ -32,6 +39,10 @@ class PlaylistSyncService:
     ) -> Dict[str, Any]:
         """Sync playlist tracks from Spotify to local database.
 
+        The Spotify snapshot_id is stored in playlist_data so unchanged playlists
+        short-circuit after a single lightweight request. Spotify is read without
+        holding the row lock; the lock is only taken for the final write.
+
         Args:
             session_id: Playlist session ID
             access_token: Spotify access token
@@ -46,10 +57,8 @@ class PlaylistSyncService:
         """
         self.logger.info("Starting playlist sync from Spotify", session_id=session_id)
 
-        # Get playlist from database
-        playlist = await self.playlist_repository.get_by_session_id_for_update(
-            session_id
-        )
+        # Get playlist from database (no lock while talking to Spotify)
+        playlist = await self.playlist_repository.get_by_session_id(session_id)
 
         if not playlist:
             raise NotFoundException("Playlist", session_id)
@@ -72,9 +81,28 @@ class PlaylistSyncService:
         spotify_playlist_id = playlist.spotify_playlist_id
 
         try:
-            # Fetch all tracks from Spotify playlist (handle pagination)
+            playlist_meta = await self.spotify_client.get_playlist(
+                access_token, spotify_playlist_id, fields=PLAYLIST_META_FIELDS
+            )
+            snapshot_id = playlist_meta.get("snapshot_id")
+            total_tracks = (playlist_meta.get("tracks") or {}).get("total")
+
+            stored_snapshot_id = (playlist.playlist_data or {}).get(
+                "spotify_snapshot_id"
+            )
+            if snapshot_id and snapshot_id == stored_snapshot_id:
+                self.logger.info(
+                    "Spotify snapshot unchanged, skipping track fetch",
+                    session_id=session_id,
+                    snapshot_id=snapshot_id,
+                )
+                return await self._build_unchanged_result(
+                    playlist, access_token, snapshot_id
+                )
+
+            # Fetch all tracks from Spotify playlist (pages fetched concurrently)
             spotify_tracks = await self._fetch_all_playlist_tracks(
-                access_token, spotify_playlist_id
+                access_token, spotify_playlist_id, total_tracks
             )
 
             self.logger.info(
@@ -83,6 +111,13 @@ class PlaylistSyncService:
                 track_count=len(spotify_tracks),
             )
 
+            # Take the row lock only for diffing against fresh data and writing
+            playlist = await self.playlist_repository.get_by_session_id_for_update(
+                session_id
+            )
+            if not playlist:
+                raise NotFoundException("Playlist", session_id)
+
             # Get current local recommendations
             current_recommendations = playlist.recommendations_data or []
 
@@ -90,25 +125,32 @@ class PlaylistSyncService:
             updated_recommendations = self._build_updated_recommendations(
                 spotify_tracks, current_recommendations
             )
+            changes = self._diff_recommendations(
+                current_recommendations, updated_recommendations
+            )
 
-            # Prepare update data
-            update_data = {
-                "recommendations_data": updated_recommendations,
-                "track_count": len(
-                    updated_recommendations
-                ),  # Update the track_count column
-            }
+            update_data: Dict[str, Any] = {}
+            if changes["tracks_changed"]:
+                update_data["recommendations_data"] = updated_recommendations
+                update_data["track_count"] = len(updated_recommendations)
 
             # Also update playlist_data if it exists
             if playlist.playlist_data:
                 updated_playlist_data = playlist.playlist_data.copy()
                 updated_playlist_data["track_count"] = len(updated_recommendations)
-                update_data["playlist_data"] = updated_playlist_data
-
-            # Update playlist in database using repository update method
-            await self.playlist_repository.update(playlist.id, **update_data)
+                if snapshot_id:
+                    updated_playlist_data["spotify_snapshot_id"] = snapshot_id
+                if updated_playlist_data != playlist.playlist_data:
+                    update_data["playlist_data"] = updated_playlist_data
+
+            # Update playlist in database using repository update method (commits)
+            if update_data:
+                await self.playlist_repository.update(playlist.id, **update_data)
+            else:
+                # Nothing to write: end the transaction to release the row lock
+                await self.playlist_repository.session.commit()
 
-            # Retry cover upload if needed
+            # Retry cover upload if needed (outside the row lock)
             cover_retry_result = await self._retry_cover_upload_if_needed(
                 playlist, access_token
             )
@@ -118,6 +160,10 @@ class PlaylistSyncService:
                 session_id=session_id,
                 old_count=len(current_recommendations),
                 new_count=len(updated_recommendations),
+                tracks_added=changes["tracks_added"],
+                tracks_removed=changes["tracks_removed"],
+                tracks_moved=changes["tracks_moved"],
+                snapshot_id=snapshot_id,
                 cover_retry_attempted=cover_retry_result["attempted"],
                 cover_retry_success=cover_retry_result["success"],
             )
@@ -125,15 +171,13 @@ class PlaylistSyncService:
             result = {
                 "session_id": session_id,
                 "synced": True,
+                "snapshot_unchanged": False,
                 "changes": {
                     "tracks_before": len(current_recommendations),
                     "tracks_after": len(updated_recommendations),
-                    "tracks_added": max(
-                        0, len(updated_recommendations) - len(current_recommendations)
-                    ),
-                    "tracks_removed": max(
-                        0, len(current_recommendations) - len(updated_recommendations)
-                    ),
+                    "tracks_added": changes["tracks_added"],
+                    "tracks_removed": changes["tracks_removed"],
+                    "tracks_moved": changes["tracks_moved"],
                 },
                 "recommendations": updated_recommendations,
                 "playlist_data": playlist.playlist_data,
@@ -148,7 +192,7 @@ class PlaylistSyncService:
 
             return result
 
-        except SpotifyAPIException as e:
+        except (SpotifyAPIException, NotFoundException) as e:
             self.logger.error(
                 "Failed to sync from Spotify", session_id=session_id, error=str(e)
             )
@@ -162,11 +206,100 @@ class PlaylistSyncService:
             )
             raise SpotifyAPIException(f"Failed to sync playlist: {str(e)}")
 
+    async def _build_unchanged_result(
+        self, playlist, access_token: str, snapshot_id: str
+    ) -> Dict[str, Any]:
+        """Build the sync result for a playlist whose Spotify snapshot is unchanged.
+
+        Args:
+            playlist: Playlist model instance
+            access_token: Spotify access token
+            snapshot_id: Current Spotify snapshot ID
+
+        Returns:
+            Sync result reporting no track changes
+        """
+        current_recommendations = playlist.recommendations_data or []
+        track_count = len(current_recommendations)
+
+        cover_retry_result = await self._retry_cover_upload_if_needed(
+            playlist, access_token
+        )
+
+        result = {
+            "session_id": playlist.session_id,
+            "synced": True,
+            "snapshot_unchanged": True,
+            "changes": {
+                "tracks_before": track_count,
+                "tracks_after": track_count,
+                "tracks_added": 0,
+                "tracks_removed": 0,
+                "tracks_moved": 0,
+            },
+            "recommendations": current_recommendations,
+            "playlist_data": playlist.playlist_data,
+        }
+
+        if cover_retry_result["attempted"]:
+            result["cover_upload_retry"] = {
+                "success": cover_retry_result["success"],
+                "message": cover_retry_result["message"],
+            }
+
+        return result
+
     async def _fetch_all_playlist_tracks(
-        self, access_token: str, playlist_id: str
+        self,
+        access_token: str,
+        playlist_id: str,
+        total_tracks: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch all tracks from a Spotify playlist, handling pagination.
 
+        When the total is known, every page is requested concurrently (bounded by
+        SYNC_PAGE_CONCURRENCY); otherwise pages are followed sequentially.
+
+        Args:
+            access_token: Spotify access token
+            playlist_id: Spotify playlist ID
+            total_tracks: Total track count reported by Spotify, if known
+
+        Returns:
+            List of all tracks in the playlist
+        """
+        limit = SYNC_PAGE_SIZE
+
+        if total_tracks is None:
+            return await self._fetch_playlist_tracks_sequential(
+                access_token, playlist_id
+            )
+        if total_tracks <= 0:
+            return []
+
+        semaphore = asyncio.Semaphore(SYNC_PAGE_CONCURRENCY)
+
+        async def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                response = await self.spotify_client.get_playlist_tracks(
+                    access_token, playlist_id, limit=limit, offset=offset
+                )
+            return response.get("items", [])
+
+        pages = await asyncio.gather(
+            *(fetch_page(offset) for offset in range(0, total_tracks, limit))
+        )
+
+        all_tracks = []
+        for items in pages:
+            all_tracks.extend(items)
+        return all_tracks
+
+    async def _fetch_playlist_tracks_sequential(
+        self, access_token: str, playlist_id: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch playlist tracks page by page, following Spotify's next links.
+
         Args:
             access_token: Spotify access token
             playlist_id: Spotify playlist ID
@@ -176,7 +309,7 @@ class PlaylistSyncService:
         """
         all_tracks = []
         offset = 0
-        limit = 100
+        limit = SYNC_PAGE_SIZE
 
         while True:
             response = await self.spotify_client.get_playlist_tracks(
@@ -367,3 +500,55 @@ class PlaylistSyncService:
             updated_recommendations.append(recommendation)
 
         return updated_recommendations
+
+    def _diff_recommendations(
+        self,
+        current_recommendations: List[Dict[str, Any]],
+        updated_recommendations: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Compare stored and synced recommendations by track URI/ID.
+
+        Args:
+            current_recommendations: Recommendations stored locally
+            updated_recommendations: Recommendations rebuilt from Spotify
+
+        Returns:
+            Dict with tracks_added, tracks_removed, tracks_moved and tracks_changed
+        """
+
+        def track_key(rec: Dict[str, Any]) -> Optional[str]:
+            spotify_uri = rec.get("spotify_uri")
+            if spotify_uri and spotify_uri.startswith("spotify:track:"):
+                return spotify_uri.split(":")[-1]
+            return rec.get("track_id") or spotify_uri
+
+        current_keys = [track_key(rec) for rec in current_recommendations]
+        updated_keys = [track_key(rec) for rec in updated_recommendations]
+
+        current_counts = Counter(current_keys)
+        updated_counts = Counter(updated_keys)
+        tracks_added = sum((updated_counts - current_counts).values())
+        tracks_removed = sum((current_counts - updated_counts).values())
+
+        # Tracks present in both lists whose relative order changed
+        kept = current_counts & updated_counts
+        remaining = kept.copy()
+        current_kept = []
+        for key in current_keys:
+            if remaining[key] > 0:
+                remaining[key] -= 1
+                current_kept.append(key)
+        remaining = kept.copy()
+        updated_kept = []
+        for key in updated_keys:
+            if remaining[key] > 0:
+                remaining[key] -= 1
+                updated_kept.append(key)
+        tracks_moved = sum(1 for a, b in zip(current_kept, updated_kept) if a != b)
+
+        return {
+            "tracks_added": tracks_added,
+            "tracks_removed": tracks_removed,
+            "tracks_moved": tracks_moved,
+            "tracks_changed": updated_recommendations != current_recommendations,
+        }
@@ -0,0 +1,316 @@
+"""Speculative preparation of playlist artifacts ahead of save-to-Spotify."""
+
+import asyncio
+import contextvars
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import structlog
+
+from ...agents.core.cache import cache_manager
+from ...agents.core.tracing import tracer
+from ...agents.states.agent_state import AgentState
+from ...services.cover_image_generator import CoverImageGenerator
+from .playlist_describer import PlaylistDescriber
+from .playlist_namer import PlaylistNamer
+
+logger = structlog.get_logger(__name__)
+
+PRESAVE_NAME = "name"
+PRESAVE_DESCRIPTION = "description"
+PRESAVE_COVER = "cover"
+
+COVER_COLOR_KEYS = ("primary", "secondary", "tertiary")
+
+DEFAULT_TARGET_COUNT = 20
+
+
+def get_cover_colors(
+    mood_analysis: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, str]]:
+    """Extract a complete cover color scheme from a mood analysis.
+
+    Args:
+        mood_analysis: Mood analysis from the workflow state
+
+    Returns:
+        Primary, secondary and tertiary colors, or None if any is missing
+    """
+    color_scheme = (mood_analysis or {}).get("color_scheme") or {}
+    if not all(color_scheme.get(key) for key in COVER_COLOR_KEYS):
+        return None
+    return {key: color_scheme[key] for key in COVER_COLOR_KEYS}
+
+
+class PresavePreparer:
+    """Prepares the playlist name, description and cover while a workflow runs.
+
+    Each artifact is cached per session next to the inputs it was generated
+    from, so the save endpoint (possibly served by another process) can reuse
+    it when those inputs still match and generate on demand otherwise.
+    """
+
+    def __init__(
+        self,
+        playlist_namer: PlaylistNamer,
+        playlist_describer: PlaylistDescriber,
+        cover_generator: Optional[CoverImageGenerator] = None,
+        cover_style: str = "modern",
+    ):
+        """Initialize the preparer.
+
+        Args:
+            playlist_namer: Namer used for the speculative playlist name
+            playlist_describer: Describer used for the speculative description
+            cover_generator: Cover renderer
+            cover_style: Style the save path uploads covers with
+        """
+        self.playlist_namer = playlist_namer
+        self.playlist_describer = playlist_describer
+        self.cover_generator = cover_generator or CoverImageGenerator()
+        self.cover_style = cover_style
+
+        # Speculative tasks per session, so abandoned sessions can be cancelled
+        self._tasks: Dict[str, Set[asyncio.Task]] = {}
+
+    def prepare_for_mood(self, state: AgentState) -> None:
+        """Start preparing the name and cover once mood analysis is available.
+
+        The name is generated against the planned playlist size; the final
+        count is only known once recommendations are ready.
+
+        Args:
+            state: Workflow state with mood analysis
+        """
+        playlist_target = state.metadata.get("playlist_target", {})
+        target_count = playlist_target.get("target_count", DEFAULT_TARGET_COUNT)
+
+        self._spawn(
+            state.session_id,
+            "mood",
+            partial(
+                self._prepare_mood_artifacts,
+                state.session_id,
+                state.mood_prompt,
+                target_count,
+                get_cover_colors(state.mood_analysis),
+            ),
+        )
+
+    def prepare_for_recommendations(self, state: AgentState) -> None:
+        """Start preparing the description once the final track list is known.
+
+        Args:
+            state: Workflow state with final recommendations
+        """
+        if not state.recommendations:
+            return
+
+        self._spawn(
+            state.session_id,
+            "recommendations",
+            partial(
+                self._prepare_description,
+                state.session_id,
+                state.mood_prompt,
+                len(state.recommendations),
+            ),
+        )
+
+    def cancel(self, session_id: str) -> int:
+        """Cancel speculative work for an abandoned session.
+
+        Args:
+            session_id: Workflow session ID
+
+        Returns:
+            Number of tasks cancelled
+        """
+        tasks = self._tasks.pop(session_id, set())
+        cancelled = 0
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+
+        if cancelled:
+            logger.info(
+                "Cancelled speculative pre-save preparation",
+                session_id=session_id,
+                tasks=cancelled,
+            )
+        return cancelled
+
+    async def get_name(self, state: AgentState) -> Optional[str]:
+        """Get the prepared playlist name if it matches the state.
+
+        Args:
+            state: State being saved
+
+        Returns:
+            Prepared name or None
+        """
+        artifact = await self._load(state.session_id, PRESAVE_NAME)
+        if artifact and artifact.get("mood_prompt") == state.mood_prompt:
+            return artifact.get("value")
+        return None
+
+    async def get_description(self, state: AgentState) -> Optional[str]:
+        """Get the prepared description if it matches the state.
+
+        The description quotes the track count, so it is only reused when the
+        playlist still has the number of tracks it was written for.
+
+        Args:
+            state: State being saved
+
+        Returns:
+            Prepared description or None
+        """
+        artifact = await self._load(state.session_id, PRESAVE_DESCRIPTION)
+        if (
+            artifact
+            and artifact.get("mood_prompt") == state.mood_prompt
+            and artifact.get("track_count") == len(state.recommendations)
+        ):
+            return artifact.get("value")
+        return None
+
+    async def get_cover(
+        self, session_id: str, colors: Dict[str, str], style: str
+    ) -> Optional[str]:
+        """Get the prepared cover if it was rendered with these colors and style.
+
+        Args:
+            session_id: Workflow session ID
+            colors: Primary, secondary and tertiary colors
+            style: Cover style
+
+        Returns:
+            Base64-encoded JPEG or None
+        """
+        artifact = await self._load(session_id, PRESAVE_COVER)
+        if (
+            artifact
+            and artifact.get("colors") == colors
+            and artifact.get("style") == style
+        ):
+            return artifact.get("value")
+        return None
+
+    def _spawn(
+        self,
+        session_id: str,
+        stage: str,
+        work: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Run speculative work in the background for a session.
+
+        The task starts from an empty context so its spans form their own trace
+        instead of counting towards the workflow's critical path.
+        """
+        task = asyncio.create_task(
+            self._run(session_id, stage, work), context=contextvars.Context()
+        )
+        tasks = self._tasks.setdefault(session_id, set())
+        tasks.add(task)
+
+        def _forget(done: asyncio.Task) -> None:
+            session_tasks = self._tasks.get(session_id)
+            if session_tasks is None:
+                return
+            session_tasks.discard(done)
+            if not session_tasks:
+                self._tasks.pop(session_id, None)
+
+        task.add_done_callback(_forget)
+
+    async def _run(
+        self, session_id: str, stage: str, work: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Execute one speculative stage, never letting failures escape."""
+        with tracer.start_span(
+            "presave.prepare",
+            attributes={"presave.session_id": session_id, "presave.stage": stage},
+            root=True,
+        ):
+            try:
+                await work()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Speculative pre-save preparation failed",
+                    session_id=session_id,
+                    stage=stage,
+                    error=str(e),
+                )
+
+    async def _prepare_mood_artifacts(
+        self,
+        session_id: str,
+        mood_prompt: str,
+        target_count: int,
+        colors: Optional[Dict[str, str]],
+    ) -> None:
+        """Generate the name and render the cover concurrently."""
+        jobs = [self._prepare_name(session_id, mood_prompt, target_count)]
+        if colors:
+            jobs.append(self._prepare_cover(session_id, colors))
+        await asyncio.gather(*jobs)
+
+    async def _prepare_name(
+        self, session_id: str, mood_prompt: str, track_count: int
+    ) -> None:
+        name = await self.playlist_namer.generate_name(mood_prompt, track_count)
+        await cache_manager.set_presave_artifact(
+            session_id, PRESAVE_NAME, {"value": name, "mood_prompt": mood_prompt}
+        )
+        logger.debug("Prepared playlist name", session_id=session_id)
+
+    async def _prepare_description(
+        self, session_id: str, mood_prompt: str, track_count: int
+    ) -> None:
+        description = await self.playlist_describer.generate_description(
+            mood_prompt, track_count
+        )
+        await cache_manager.set_presave_artifact(
+            session_id,
+            PRESAVE_DESCRIPTION,
+            {
+                "value": description,
+                "mood_prompt": mood_prompt,
+                "track_count": track_count,
+            },
+        )
+        logger.debug("Prepared playlist description", session_id=session_id)
+
+    async def _prepare_cover(self, session_id: str, colors: Dict[str, str]) -> None:
+        # Rendering is CPU-bound; keep it off the event loop
+        cover_base64 = await asyncio.to_thread(
+            self.cover_generator.generate_cover_base64,
+            primary_color=colors["primary"],
+            secondary_color=colors["secondary"],
+            tertiary_color=colors["tertiary"],
+            style=self.cover_style,
+        )
+        await cache_manager.set_presave_artifact(
+            session_id,
+            PRESAVE_COVER,
+            {"value": cover_base64, "colors": colors, "style": self.cover_style},
+        )
+        logger.debug("Prepared playlist cover", session_id=session_id)
+
+    async def _load(self, session_id: str, kind: str) -> Optional[Dict[str, Any]]:
+        """Read a prepared artifact; cache failures just mean a cold save."""
+        try:
+            artifact = await cache_manager.get_presave_artifact(session_id, kind)
+        except Exception as e:
+            logger.warning(
+                "Failed to read prepared playlist artifact",
+                session_id=session_id,
+                kind=kind,
+                error=str(e),
+            )
+            return None
+        return artifact if isinstance(artifact, dict) else None
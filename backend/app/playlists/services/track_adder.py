@@ -1,6 +1,5 @@
 """Track adder component for adding tracks to Spotify playlists."""
 
-import asyncio
 from typing import TYPE_CHECKING
 
 import structlog
@@ -9,6 +8,8 @@ if TYPE_CHECKING:
     from ...agents.states.agent_state import AgentState
 
 from ...agents.tools.spotify_service import SpotifyService
+from ...services.spotify_token_manager import spotify_token_manager
+from .playlist_mutation_executor import PlaylistMutationExecutor
 
 logger = structlog.get_logger(__name__)
 
@@ -23,6 +24,7 @@ class TrackAdder:
             spotify_service: Service for Spotify API operations
         """
         self.spotify_service = spotify_service
+        self.mutation_executor = PlaylistMutationExecutor()
 
     async def add_tracks_to_playlist(self, state: "AgentState", playlist_id: str):
         """Add recommended tracks to the Spotify playlist.
@@ -68,25 +70,28 @@ class TrackAdder:
             logger.info(f"Adding {len(track_uris)} tracks to playlist {playlist_id}")
             logger.debug(f"First 3 URIs: {track_uris[:3]}")
 
-            # Split into chunks to respect API limits (100 tracks per request)
-            chunk_size = 100
-            for i in range(0, len(track_uris), chunk_size):
-                chunk = track_uris[i : i + chunk_size]
-
-                # Add tracks to playlist
-                access_token = state.metadata.get("spotify_access_token")
-                success = await self.spotify_service.add_tracks_to_playlist(
-                    access_token=access_token, playlist_id=playlist_id, track_uris=chunk
+            # Chunks of 100 are sent concurrently; the executor restores the order
+            access_token = await spotify_token_manager.get_token_for_state(state)
+            result = await self.mutation_executor.apply(
+                access_token=access_token,
+                playlist_id=playlist_id,
+                current_uris=[],
+                target_uris=track_uris,
+            )
+            state.metadata["playlist_write_stats"] = {
+                "elapsed_ms": result["elapsed_ms"],
+                "operations": [
+                    {key: op[key] for key in ("op", "tracks", "elapsed_ms", "success")}
+                    for op in result["operations"]
+                ],
+            }
+
+            if result["failed_operations"]:
+                logger.error(
+                    f"Failed {result['failed_operations']} write operation(s) "
+                    f"while adding tracks to playlist {playlist_id}"
                 )
-
-                if not success:
-                    logger.error(
-                        f"Failed to add track chunk {i // chunk_size} to playlist"
-                    )
-                    continue
-
-                # Add delay between chunks to respect rate limits
-                await asyncio.sleep(0.1)
+                return
 
             logger.info(f"Successfully added tracks to playlist {playlist_id}")
 
@@ -450,6 +450,9 @@ class PlaylistRepository(BaseRepository[Playlist]):
     async def get_by_session_id_for_update(self, session_id: str) -> Optional[Playlist]:
         """Get playlist by session ID for update operations (no user check needed for internal operations).
 
+        Locks the row (SELECT ... FOR UPDATE) until the transaction ends and
+        reloads it from the database even if this session already holds it.
+
         Args:
             session_id: Session ID
 
@@ -457,7 +460,12 @@ class PlaylistRepository(BaseRepository[Playlist]):
             Playlist instance or None if not found
         """
         try:
-            query = select(Playlist).where(Playlist.session_id == session_id)
+            query = (
+                select(Playlist)
+                .where(Playlist.session_id == session_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
             result = await self.session.execute(query)
             playlist = result.scalar_one_or_none()
 
@@ -1000,6 +1008,10 @@ class PlaylistRepository(BaseRepository[Playlist]):
     ) -> bool:
         """Update playlist with Spotify information after saving to Spotify.
 
+        The update is conditional on the playlist not being saved yet, so
+        concurrent saves cannot overwrite each other and no row lock has to
+        be held while the playlist is created on Spotify.
+
         Args:
             session_id: Playlist session ID
             spotify_playlist_id: Spotify playlist ID
@@ -1008,7 +1020,8 @@ class PlaylistRepository(BaseRepository[Playlist]):
             spotify_uri: Spotify playlist URI (optional)
 
         Returns:
-            True if updated successfully, False if playlist not found
+            True if updated successfully, False if playlist not found or
+            already saved
         """
         try:
             from datetime import datetime, timezone
@@ -1033,7 +1046,10 @@ class PlaylistRepository(BaseRepository[Playlist]):
 
             query = (
                 update(Playlist)
-                .where(Playlist.session_id == session_id)
+                .where(
+                    Playlist.session_id == session_id,
+                    Playlist.spotify_playlist_id.is_(None),
+                )
                 .values(**update_data)
             )
 
@@ -1050,7 +1066,8 @@ class PlaylistRepository(BaseRepository[Playlist]):
                 )
             else:
                 self.logger.warning(
-                    "Playlist not found for Spotify info update", session_id=session_id
+                    "Playlist not found or already saved for Spotify info update",
+                    session_id=session_id,
                 )
 
             return updated
@@ -1,7 +1,9 @@
 """Root application routes."""
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
+from app.agents.core.profiling import PerformanceProfiler
 from app.core.config import settings
 
 router = APIRouter()
@@ -24,3 +26,12 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus exposition of profiling latency summaries (p50/p90/p99)."""
+    return PlainTextResponse(
+        PerformanceProfiler.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
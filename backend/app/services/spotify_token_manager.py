@@ -0,0 +1,368 @@
+"""Single-flight Spotify access token refresh with proactive renewal."""
+
+import asyncio
+import contextvars
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.agents.core.cache import cache_manager
+from app.clients.spotify_client import SpotifyAPIClient
+from app.core.database import async_session_factory
+from app.core.exceptions import SpotifyAuthError
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+
+logger = structlog.get_logger(__name__)
+
+REFRESH_LOCK = "spotify_token_refresh"
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes from the database as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _user_key(user_id: Optional[Any]) -> Optional[int]:
+    """Database user ID from a workflow user_id (None for anonymous runs)."""
+    try:
+        return int(user_id) if user_id not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SpotifyTokenManager:
+    """Owns Spotify access token refresh for every user.
+
+    Concurrent callers needing a refresh for the same user share one in-flight
+    refresh per process, and a Valkey lock makes sure only one worker calls
+    Spotify and commits the new token; the others wait for it to land in the
+    database. While a user has workflows running the token is renewed in the
+    background before it expires, so workflow steps never pay for a refresh.
+    """
+
+    def __init__(
+        self,
+        refresh_margin: timedelta = timedelta(minutes=5),
+        renewal_lead: timedelta = timedelta(minutes=10),
+        lock_ttl: int = 15,
+        peer_poll_interval: float = 0.25,
+    ):
+        """Initialize the token manager.
+
+        Args:
+            refresh_margin: Tokens expiring within this window are refreshed
+            renewal_lead: How long before expiry held users are renewed
+            lock_ttl: Seconds the cross-worker refresh lock is held at most
+            peer_poll_interval: Seconds between checks while another worker refreshes
+        """
+        self.refresh_margin = refresh_margin
+        self.renewal_lead = renewal_lead
+        self.lock_ttl = lock_ttl
+        self.peer_poll_interval = peer_poll_interval
+
+        # Last token seen per user, so fresh tokens are served without a DB read
+        self._tokens: Dict[int, Tuple[str, datetime]] = {}
+        self._inflight: Dict[int, asyncio.Task] = {}
+        self._holders: Counter = Counter()
+        self._renewals: Dict[int, asyncio.Task] = {}
+
+        self.stats: Dict[str, int] = {
+            "refreshes": 0,
+            "coalesced": 0,
+            "peer_refreshes": 0,
+            "proactive_renewals": 0,
+            "failures": 0,
+        }
+
+    async def get_access_token(self, user_id: int) -> Optional[str]:
+        """Get a valid access token for a user, refreshing it if needed.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Access token, or None if the user does not exist
+
+        Raises:
+            SpotifyAuthError: If the token had to be refreshed and Spotify refused
+        """
+        cached = self._tokens.get(user_id)
+        if cached and self._is_fresh(cached[1]):
+            return cached[0]
+
+        async with async_session_factory() as db:
+            user = await UserRepository(db).get_by_id(user_id)
+        if user is None:
+            return None
+
+        if self._is_fresh(user.token_expires_at):
+            self._remember(user)
+            return user.access_token
+
+        return await self.refresh(user_id)
+
+    async def get_token_for_state(self, state: Any) -> Optional[str]:
+        """Get the access token a workflow should use right now.
+
+        Falls back to the token captured when the workflow started when the
+        user cannot be resolved (anonymous runs, database unavailable).
+
+        Args:
+            state: Workflow state
+
+        Returns:
+            Access token or None
+        """
+        user_key = _user_key(state.user_id)
+        if user_key is not None:
+            try:
+                token = await self.get_access_token(user_key)
+                if token:
+                    return token
+            except Exception as e:
+                logger.warning(
+                    "Falling back to workflow token",
+                    session_id=state.session_id,
+                    error=str(e),
+                )
+        return state.metadata.get("spotify_access_token")
+
+    async def ensure_fresh_user(self, user: User, db: AsyncSession) -> User:
+        """Make sure a request's user has a usable token.
+
+        Args:
+            user: User loaded in the request's session
+            db: The request's database session
+
+        Returns:
+            The same user, reloaded if its token was refreshed
+
+        Raises:
+            SpotifyAuthError: If the token is missing or the refresh failed
+        """
+        if not user.token_expires_at:
+            logger.error("User has no token expiration time", user_id=user.id)
+            raise SpotifyAuthError("Invalid token state. Please log in again.")
+
+        if self._is_fresh(user.token_expires_at):
+            self._remember(user)
+            return user
+
+        await self.refresh(user.id)
+        # The refresh committed through another session; pick up its values
+        await db.refresh(user)
+        return user
+
+    async def refresh(
+        self,
+        user_id: int,
+        force: bool = False,
+        margin: Optional[timedelta] = None,
+    ) -> str:
+        """Refresh a user's token, sharing the refresh with concurrent callers.
+
+        Args:
+            user_id: User ID
+            force: Refresh even if the stored token is still fresh
+            margin: Remaining validity below which the stored token is replaced
+                (defaults to ``refresh_margin``)
+
+        Returns:
+            The new access token
+
+        Raises:
+            SpotifyAuthError: If Spotify refused the refresh
+        """
+        task = self._inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(
+                self._refresh_exclusive(user_id, force, margin),
+                context=contextvars.Context(),
+            )
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda done: self._finish_refresh(user_id, done))
+        else:
+            self.stats["coalesced"] += 1
+
+        # A cancelled caller must not cancel the refresh other callers wait on
+        return await asyncio.shield(task)
+
+    def hold(self, user_id: Optional[str]) -> None:
+        """Keep a user's token renewed in the background (e.g. while a workflow runs).
+
+        Args:
+            user_id: User ID; anonymous workflows are ignored
+        """
+        user_key = _user_key(user_id)
+        if user_key is None:
+            return
+        self._holders[user_key] += 1
+        if user_key not in self._renewals:
+            self._renewals[user_key] = asyncio.create_task(
+                self._renew_loop(user_key), context=contextvars.Context()
+            )
+
+    def release(self, user_id: Optional[str]) -> None:
+        """Stop background renewal once the last holder is done.
+
+        Args:
+            user_id: User ID passed to hold()
+        """
+        user_key = _user_key(user_id)
+        if user_key is None:
+            return
+        if self._holders[user_key] <= 1:
+            self._holders.pop(user_key, None)
+            task = self._renewals.pop(user_key, None)
+            if task is not None:
+                task.cancel()
+        else:
+            self._holders[user_key] -= 1
+
+    async def shutdown(self) -> None:
+        """Cancel every background renewal."""
+        tasks = list(self._renewals.values())
+        self._renewals.clear()
+        self._holders.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Refresh counters and background renewal state."""
+        return {
+            **self.stats,
+            "inflight": len(self._inflight),
+            "renewing_users": len(self._renewals),
+        }
+
+    def _is_fresh(
+        self, expires_at: Optional[datetime], margin: Optional[timedelta] = None
+    ) -> bool:
+        if not expires_at:
+            return False
+        margin = self.refresh_margin if margin is None else margin
+        return _as_utc(expires_at) > datetime.now(timezone.utc) + margin
+
+    def _remember(self, user: User) -> None:
+        if user.access_token and user.token_expires_at:
+            self._tokens[user.id] = (user.access_token, _as_utc(user.token_expires_at))
+
+    def _finish_refresh(self, user_id: int, task: asyncio.Task) -> None:
+        if self._inflight.get(user_id) is task:
+            del self._inflight[user_id]
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["failures"] += 1
+
+    async def _refresh_exclusive(
+        self, user_id: int, force: bool, margin: Optional[timedelta]
+    ) -> str:
+        """Refresh under the cross-worker lock, or wait for the worker holding it."""
+        known_token = self._tokens.get(user_id, (None,))[0]
+        while True:
+            lock = await cache_manager.acquire_lock(
+                REFRESH_LOCK, user_id, ttl=self.lock_ttl
+            )
+            if lock is not None:
+                try:
+                    return await self._refresh_locked(
+                        user_id, force, margin, known_token
+                    )
+                finally:
+                    await cache_manager.release_lock(REFRESH_LOCK, user_id, token=lock)
+
+            # Another worker is refreshing; its commit ends the wait, the lock
+            # TTL bounds it if that worker dies
+            await asyncio.sleep(self.peer_poll_interval)
+            async with async_session_factory() as db:
+                user = await UserRepository(db).get_by_id(user_id)
+            if (
+                user is not None
+                and self._is_fresh(user.token_expires_at, margin)
+                and (not force or user.access_token != known_token)
+            ):
+                self.stats["peer_refreshes"] += 1
+                self._remember(user)
+                return user.access_token
+
+    async def _refresh_locked(
+        self,
+        user_id: int,
+        force: bool,
+        margin: Optional[timedelta],
+        known_token: Optional[str],
+    ) -> str:
+        """Call Spotify and commit the new token (caller holds the lock)."""
+        async with async_session_factory() as db:
+            user_repo = UserRepository(db)
+            user = await user_repo.get_by_id_or_fail(user_id)
+
+            # Someone may have refreshed between our check and taking the lock
+            if self._is_fresh(user.token_expires_at, margin) and (
+                not force or user.access_token != known_token
+            ):
+                self._remember(user)
+                return user.access_token
+
+            if not user.refresh_token:
+                raise SpotifyAuthError(
+                    "No refresh token available. Please log in again."
+                )
+
+            logger.info("Refreshing Spotify token", user_id=user_id)
+            token_data = await SpotifyAPIClient().refresh_token(user.refresh_token)
+
+            expires_in = token_data.get("expires_in", 3600)
+            updated_user = await user_repo.update_tokens_and_commit(
+                user_id=user_id,
+                access_token=token_data["access_token"],
+                refresh_token=token_data.get("refresh_token", user.refresh_token),
+                token_expires_at=datetime.now(timezone.utc).replace(microsecond=0)
+                + timedelta(seconds=expires_in),
+            )
+
+        self.stats["refreshes"] += 1
+        self._remember(updated_user)
+        logger.info(
+            "Spotify token refreshed",
+            user_id=user_id,
+            expires_at=updated_user.token_expires_at,
+        )
+        return updated_user.access_token
+
+    async def _renew_loop(self, user_id: int) -> None:
+        """Renew a held user's token shortly before it expires."""
+        while True:
+            try:
+                cached = self._tokens.get(user_id)
+                if cached is None:
+                    await self.get_access_token(user_id)
+                    cached = self._tokens.get(user_id)
+                if cached is None:
+                    return
+
+                if not self._is_fresh(cached[1], margin=self.renewal_lead):
+                    await self.refresh(user_id, margin=self.renewal_lead)
+                    self.stats["proactive_renewals"] += 1
+                    cached = self._tokens[user_id]
+
+                delay = (
+                    cached[1] - self.renewal_lead - datetime.now(timezone.utc)
+                ).total_seconds()
+                await asyncio.sleep(max(delay, 30.0))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Background Spotify token renewal failed",
+                    user_id=user_id,
+                    error=str(e),
+                )
+                await asyncio.sleep(60.0)
+
+
+spotify_token_manager = SpotifyTokenManager()
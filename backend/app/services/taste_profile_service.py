@@ -0,0 +1,351 @@
+"""Precomputed per-user taste profiles for seed gathering."""
+
+import asyncio
+import contextvars
+import statistics
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.agents.core.cache import cache_manager
+from app.services.spotify_token_manager import spotify_token_manager
+
+logger = structlog.get_logger(__name__)
+
+REFRESH_LOCK = "taste_profile_refresh"
+
+TOP_TRACK_LIMIT = 20
+TOP_ARTIST_LIMIT = 15
+GENRE_HISTOGRAM_SIZE = 20
+
+# Audio features kept on profile tracks; the centroid skips key and mode,
+# whose averages mean nothing
+TRACK_FEATURE_KEYS = (
+    "acousticness",
+    "danceability",
+    "energy",
+    "instrumentalness",
+    "key",
+    "liveness",
+    "loudness",
+    "mode",
+    "speechiness",
+    "tempo",
+    "valence",
+)
+CENTROID_FEATURE_KEYS = tuple(
+    key for key in TRACK_FEATURE_KEYS if key not in ("key", "mode")
+)
+
+
+def _is_registered_user(user_id: Optional[Any]) -> bool:
+    """Whether a workflow user_id refers to a database user (not an anonymous run)."""
+    try:
+        return user_id not in (None, "") and int(user_id) >= 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _compact_features(features: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: round(features[key], 4)
+        if isinstance(features[key], float)
+        else features[key]
+        for key in TRACK_FEATURE_KEYS
+        if features.get(key) is not None
+    }
+
+
+def _genre_histogram(artists: List[Dict[str, Any]]) -> Dict[str, int]:
+    counts = Counter(
+        genre.lower() for artist in artists for genre in artist.get("genres") or []
+    )
+    return dict(counts.most_common(GENRE_HISTOGRAM_SIZE))
+
+
+def _feature_centroid(tracks: List[Dict[str, Any]]) -> Dict[str, float]:
+    centroid = {}
+    for key in CENTROID_FEATURE_KEYS:
+        values = [
+            track[key] for track in tracks if isinstance(track.get(key), (int, float))
+        ]
+        if values:
+            centroid[key] = round(statistics.fmean(values), 4)
+    return centroid
+
+
+class TasteProfileService:
+    """Builds, stores and refreshes per-user taste profiles.
+
+    A taste profile holds a user's top tracks (with audio features), top
+    artists, a genre histogram and the audio-feature centroid of the top
+    tracks. Profiles are built in the background at login and rebuilt
+    periodically for recently active users, so workflows read a ready-made
+    profile instead of calling Spotify and RecoBeat when they start.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: timedelta = timedelta(hours=6),
+        active_window: timedelta = timedelta(days=3),
+        check_interval: float = 900.0,
+        lock_ttl: int = 120,
+    ):
+        """Initialize the service.
+
+        Args:
+            refresh_interval: Age after which a profile is rebuilt
+            active_window: Users not seen for this long stop being refreshed
+            check_interval: Seconds between passes of the refresh loop
+            lock_ttl: Seconds the cross-worker build lock is held at most
+        """
+        self.enabled = True
+        self.refresh_interval = refresh_interval
+        self.active_window = active_window
+        self.check_interval = check_interval
+        self.lock_ttl = lock_ttl
+
+        self._spotify_service = None
+        self._reccobeat_service = None
+
+        # user_id -> last time the user logged in or ran a workflow
+        self._active_users: Dict[str, float] = {}
+        self._builds: Dict[str, asyncio.Task] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        self.stats: Dict[str, int] = {
+            "builds": 0,
+            "scheduled_refreshes": 0,
+            "failures": 0,
+            "hits": 0,
+            "misses": 0,
+        }
+
+    def use_services(self, spotify_service, reccobeat_service) -> None:
+        """Build profiles with the given services instead of default instances.
+
+        Args:
+            spotify_service: SpotifyService for top tracks and artists
+            reccobeat_service: RecoBeatService for audio features
+        """
+        self._spotify_service = spotify_service
+        self._reccobeat_service = reccobeat_service
+
+    async def get_profile(self, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get a user's precomputed profile and mark the user as active.
+
+        Args:
+            user_id: Workflow user ID
+
+        Returns:
+            Taste profile, or None if none is ready
+        """
+        if not self.enabled or not _is_registered_user(user_id):
+            return None
+
+        user_id = str(user_id)
+        self._active_users[user_id] = time.time()
+        try:
+            profile = await cache_manager.get_taste_profile(user_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to read taste profile", user_id=user_id, error=str(e)
+            )
+            profile = None
+
+        if profile is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return profile
+
+    def schedule_build(
+        self, user_id: Optional[str], access_token: Optional[str] = None
+    ) -> None:
+        """Build a user's profile in the background (e.g. right after login).
+
+        Args:
+            user_id: User ID; anonymous users are ignored
+            access_token: Spotify token to use; resolved through the token
+                manager when omitted
+        """
+        if not self.enabled or not _is_registered_user(user_id):
+            return
+
+        user_id = str(user_id)
+        self._active_users[user_id] = time.time()
+        if user_id in self._builds:
+            return
+
+        task = asyncio.create_task(
+            self._build_exclusive(user_id, access_token), context=contextvars.Context()
+        )
+        self._builds[user_id] = task
+        task.add_done_callback(lambda done: self._builds.pop(user_id, None))
+
+    async def build(self, user_id: str, access_token: str) -> Dict[str, Any]:
+        """Fetch a user's top tracks and artists and store a fresh profile.
+
+        Args:
+            user_id: User ID
+            access_token: Spotify access token
+
+        Returns:
+            The stored taste profile
+        """
+        spotify_service, reccobeat_service = self._services()
+
+        top_tracks, top_artists = await asyncio.gather(
+            spotify_service.get_user_top_tracks(
+                access_token=access_token,
+                limit=TOP_TRACK_LIMIT,
+                time_range="medium_term",
+                user_id=user_id,
+            ),
+            spotify_service.get_user_top_artists(
+                access_token=access_token,
+                limit=TOP_ARTIST_LIMIT,
+                time_range="medium_term",
+                user_id=user_id,
+            ),
+        )
+
+        track_ids = [track["id"] for track in top_tracks if track.get("id")]
+        features_map = (
+            await reccobeat_service.get_tracks_audio_features(track_ids)
+            if track_ids
+            else {}
+        )
+
+        tracks = [
+            {**track, **_compact_features(features_map.get(track.get("id")) or {})}
+            for track in top_tracks
+        ]
+        profile = {
+            "user_id": user_id,
+            "built_at": datetime.now(timezone.utc).isoformat(),
+            "tracks": tracks,
+            "artists": top_artists,
+            "genre_histogram": _genre_histogram(top_artists),
+            "feature_centroid": _feature_centroid(tracks),
+        }
+
+        await cache_manager.set_taste_profile(user_id, profile)
+        self.stats["builds"] += 1
+        logger.info(
+            "Built taste profile",
+            user_id=user_id,
+            tracks=len(tracks),
+            tracks_with_features=len(features_map),
+            artists=len(top_artists),
+        )
+        return profile
+
+    def start_refresh(self) -> None:
+        """Start the periodic refresh loop (once per process)."""
+        if self.enabled and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(
+                self._refresh_loop(), context=contextvars.Context()
+            )
+
+    async def shutdown(self) -> None:
+        """Stop the refresh loop and any builds in progress."""
+        tasks = list(self._builds.values())
+        if self._refresh_task is not None:
+            tasks.append(self._refresh_task)
+            self._refresh_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Build counters and refresh state."""
+        return {
+            **self.stats,
+            "active_users": len(self._active_users),
+            "building": len(self._builds),
+        }
+
+    def _services(self):
+        if self._spotify_service is None:
+            from app.agents.tools.reccobeat_service import RecoBeatService
+            from app.agents.tools.spotify_service import SpotifyService
+
+            self._spotify_service = SpotifyService()
+            self._reccobeat_service = RecoBeatService()
+        return self._spotify_service, self._reccobeat_service
+
+    async def _build_exclusive(self, user_id: str, access_token: Optional[str]) -> None:
+        """Build under the cross-worker lock; skip if another worker is building."""
+        lock = await cache_manager.acquire_lock(
+            REFRESH_LOCK, user_id, ttl=self.lock_ttl
+        )
+        if lock is None:
+            return
+        try:
+            if access_token is None:
+                access_token = await spotify_token_manager.get_access_token(
+                    int(user_id)
+                )
+            if access_token:
+                await self.build(user_id, access_token)
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.warning(
+                "Failed to build taste profile", user_id=user_id, error=str(e)
+            )
+        finally:
+            await cache_manager.release_lock(REFRESH_LOCK, user_id, token=lock)
+
+    async def _refresh_loop(self) -> None:
+        """Rebuild stale profiles of recently active users."""
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self._refresh_stale_profiles()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Taste profile refresh pass failed", error=str(e))
+
+    async def _refresh_stale_profiles(self) -> None:
+        now = time.time()
+        cutoff = now - self.active_window.total_seconds()
+        for user_id, last_seen in list(self._active_users.items()):
+            if last_seen < cutoff:
+                del self._active_users[user_id]
+                continue
+
+            profile = await cache_manager.get_taste_profile(user_id)
+            if profile is not None:
+                built_at = datetime.fromisoformat(profile["built_at"])
+                if datetime.now(timezone.utc) - built_at < self.refresh_interval:
+                    continue
+
+            # One at a time, so refreshes never burst against the rate limits
+            self.stats["scheduled_refreshes"] += 1
+            await self._build_exclusive(user_id, None)
+
+
+taste_profile_service = TasteProfileService()
+
+
+def configure_taste_profiles(
+    enabled: bool = True, refresh_hours: float = 6.0
+) -> TasteProfileService:
+    """Apply process-wide taste profile settings.
+
+    Args:
+        enabled: Whether profiles are built and read at all
+        refresh_hours: Age in hours after which a profile is rebuilt
+
+    Returns:
+        The configured service
+    """
+    taste_profile_service.enabled = enabled
+    taste_profile_service.refresh_interval = timedelta(hours=max(refresh_hours, 0.25))
+    return taste_profile_service
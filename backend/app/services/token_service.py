@@ -8,6 +8,7 @@ import structlog
 from app.clients.spotify_client import SpotifyAPIClient
 from app.core.exceptions import ValidationException
 from app.repositories.user_repository import UserRepository
+from app.services.spotify_token_manager import spotify_token_manager
 
 logger = structlog.get_logger(__name__)
 
@@ -50,31 +51,23 @@ class TokenService:
 
             self.logger.info("Refreshing Spotify token", user_id=user_id)
 
-            # Refresh token via Spotify API
-            token_data = await self.spotify_client.refresh_token(user.refresh_token)
+            # Shared with every other caller refreshing this user, across workers
+            await spotify_token_manager.refresh(user_id, force=True)
+            await self.user_repository.session.refresh(user)
 
-            # Calculate new expiration time
-            expires_in = token_data.get("expires_in", 3600)
-            token_expires_at = datetime.now(timezone.utc) + timedelta(
-                seconds=expires_in
-            )
-
-            # Update user tokens in database
-            updated_user = await self.user_repository.update_tokens(
-                user_id=user_id,
-                access_token=token_data["access_token"],
-                refresh_token=token_data.get(
-                    "refresh_token", user.refresh_token
-                ),  # May not be returned
-                token_expires_at=token_expires_at,
+            token_expires_at = user.token_expires_at
+            if token_expires_at.tzinfo is None:
+                token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
+            expires_in = int(
+                (token_expires_at - datetime.now(timezone.utc)).total_seconds()
             )
 
             self.logger.info("Successfully refreshed Spotify token", user_id=user_id)
 
             return {
-                "access_token": updated_user.access_token,
-                "refresh_token": updated_user.refresh_token,
-                "expires_at": updated_user.token_expires_at.isoformat(),
+                "access_token": user.access_token,
+                "refresh_token": user.refresh_token,
+                "expires_at": token_expires_at.isoformat(),
                 "expires_in": expires_in,
             }
 
@@ -121,16 +114,8 @@ class TokenService:
             SpotifyAuthError: If token refresh fails
         """
         try:
-            # Check if current token is valid
-            if await self.validate_token(user_id):
-                user = await self.user_repository.get_by_id_or_fail(user_id)
-                return user.access_token
-
-            # Token is invalid/expired, refresh it
-            self.logger.info("Token expired, refreshing", user_id=user_id)
-            token_data = await self.refresh_user_token(user_id)
-
-            return token_data["access_token"]
+            await self.user_repository.get_by_id_or_fail(user_id)
+            return await spotify_token_manager.get_access_token(user_id)
 
         except Exception as e:
             self.logger.error(
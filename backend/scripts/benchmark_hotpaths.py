@@ -0,0 +1,464 @@
+"""Micro-benchmarks for the CPU-bound recommender hot paths.
+
+Times deduplication, diversity, scoring, cohesion, outlier detection, regional
+filtering, phase assignment/sorting and cover generation on synthetic candidate
+sets, and compares the results with a tracked baseline so slowdowns fail loudly.
+
+Every timed call is paired with a run of a fixed pure-Python calibration loop
+right before it, and cases are compared by the median ratio of the two. The
+calibration sees the same machine speed as the call it is paired with, so the
+ratio holds across machines and across load or frequency changes during a run.
+The baseline also records each case's spread (interquartile range of the
+ratios, relative to their median), and --check allows every case a tolerance
+derived from that spread, so cases that are inherently noisy do not fail the
+guard at random.
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_hotpaths                      # print timings
+    python -m scripts.benchmark_hotpaths --check              # exit 1 on slowdowns
+    python -m scripts.benchmark_hotpaths --update-baseline    # re-record baseline
+    python -m scripts.benchmark_hotpaths --only diversity scoring --sizes 1000
+"""
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.agents.recommender.orchestrator.cohesion_calculator import (
+    CohesionCalculator,
+)
+from app.agents.recommender.playlist_orderer.phase_assigner import PhaseAssigner
+from app.agents.recommender.playlist_orderer.phase_sorter import PhaseSorter
+from app.agents.recommender.recommendation_generator.handlers.diversity import (
+    DiversityManager,
+)
+from app.agents.recommender.recommendation_generator.handlers.scoring import (
+    ScoringEngine,
+)
+from app.agents.recommender.utils.audio_feature_matcher import AudioFeatureMatcher
+from app.agents.recommender.utils.regional_filter import RegionalFilter
+from app.agents.recommender.utils.track_deduplicator import (
+    deduplicate_track_recommendations,
+)
+from app.agents.states.agent_state import AgentState, TrackRecommendation
+from app.core.logging_config import configure_logging
+from app.services.cover_image_generator import CoverImageGenerator
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "hotpaths.json"
+DEFAULT_SIZES = [100, 1000, 5000]
+COVER_SIZES = [160, 320]
+PHASES = ["opening", "build", "mid", "high", "descent", "closure"]
+
+# Differences below this are timer noise, whatever the relative slowdown
+NOISE_FLOOR_MS = 0.05
+
+DEFAULT_REPEATS = 31
+# Slow cases stop early once they have MIN_REPEATS samples and used the budget
+MIN_REPEATS = 7
+CASE_TIME_BUDGET_S = 3.0
+# A case may be this many spreads slower than its baseline before it regresses
+SPREAD_TOLERANCE_FACTOR = 3.0
+
+TARGET_FEATURES: Dict[str, Any] = {
+    "energy": [0.6, 0.85],
+    "valence": [0.4, 0.7],
+    "danceability": [0.5, 0.8],
+    "acousticness": [0.0, 0.3],
+    "instrumentalness": 0.1,
+    "speechiness": 0.05,
+    "tempo": [110, 130],
+    "liveness": 0.15,
+}
+
+_TITLE_WORDS = ["night", "drive", "neon", "river", "glass", "summer", "echo", "gold"]
+_LOCALIZED_TITLES = [
+    "la noche de mi vida",
+    "aku dan kamu",
+    "meu amor está bem",
+    "사랑해",
+    "さくら",
+    "月亮",
+]
+
+# A case builds its inputs for one size and returns the callable to time
+CaseSetup = Callable[[int, random.Random], Callable[[], Any]]
+
+
+def _audio_features(rng: random.Random) -> Dict[str, Any]:
+    """Random but plausible audio features."""
+    return {
+        "energy": rng.random(),
+        "valence": rng.random(),
+        "danceability": rng.random(),
+        "acousticness": rng.random(),
+        "instrumentalness": rng.random() * 0.5,
+        "speechiness": rng.random() * 0.3,
+        "tempo": rng.uniform(60, 180),
+        "loudness": rng.uniform(-20, -2),
+        "liveness": rng.random() * 0.6,
+        "key": rng.randrange(12),
+        "mode": rng.randrange(2),
+    }
+
+
+def _synthetic_tracks(size: int, rng: random.Random) -> List[TrackRecommendation]:
+    """Create a candidate set with repeated artists and ~10% duplicates."""
+    artist_pool = max(8, size // 6)
+    tracks: List[TrackRecommendation] = []
+    for i in range(size):
+        if tracks and rng.random() < 0.1:
+            # Re-emit an earlier track under a new ID, as a second source would
+            original = rng.choice(tracks)
+            tracks.append(
+                original.model_copy(
+                    update={"track_id": f"dup_{i}", "source": "spotify"}
+                )
+            )
+            continue
+
+        if rng.random() < 0.15:
+            title = rng.choice(_LOCALIZED_TITLES)
+        else:
+            title = " ".join(rng.sample(_TITLE_WORDS, 2))
+        track_id = f"track_{i}"
+        tracks.append(
+            TrackRecommendation(
+                track_id=track_id,
+                track_name=f"{title} {i}",
+                artists=[f"Artist {rng.randrange(artist_pool)}"],
+                spotify_uri=f"spotify:track:{track_id}",
+                confidence_score=rng.random(),
+                audio_features=_audio_features(rng),
+                reasoning="benchmark",
+                source=rng.choice(["reccobeat", "artist_discovery", "anchor_track"]),
+                protected=rng.random() < 0.02,
+            )
+        )
+    return tracks
+
+
+def _analysis_map(
+    tracks: List[TrackRecommendation], rng: random.Random
+) -> Dict[str, Dict[str, Any]]:
+    """Energy analyses in the shape the playlist orderer produces."""
+    return {
+        track.track_id: {
+            "track_id": track.track_id,
+            "energy_level": rng.uniform(10, 95),
+            "momentum": rng.uniform(10, 95),
+            "emotional_intensity": rng.uniform(10, 95),
+            "opening_potential": rng.uniform(20, 90),
+            "closing_potential": rng.uniform(20, 90),
+            "peak_potential": rng.uniform(20, 90),
+            "phase_assignment": rng.choice(PHASES + [None]),
+        }
+        for track in tracks
+    }
+
+
+def _setup_deduplicate(size: int, rng: random.Random):
+    tracks = _synthetic_tracks(size, rng)
+    return lambda: deduplicate_track_recommendations(tracks)
+
+
+def _setup_diversity(size: int, rng: random.Random):
+    tracks = _synthetic_tracks(size, rng)
+    manager = DiversityManager()
+    return lambda: manager._ensure_diversity(tracks, target_count=max(20, size // 5))
+
+
+def _setup_scoring(size: int, rng: random.Random):
+    engine = ScoringEngine()
+    state = AgentState(
+        session_id="benchmark",
+        user_id="benchmark",
+        mood_prompt="benchmark",
+        metadata={"target_features": TARGET_FEATURES},
+    )
+    candidates = [
+        {
+            "track_id": track.track_id,
+            "popularity": rng.randrange(0, 100),
+            "audio_features": track.audio_features,
+            "source": track.source,
+        }
+        for track in _synthetic_tracks(size, rng)
+    ]
+
+    def run():
+        for candidate in candidates:
+            engine.calculate_confidence_score(candidate, state)
+            engine.calculate_track_cohesion(
+                candidate["audio_features"], TARGET_FEATURES
+            )
+
+    return run
+
+
+def _setup_cohesion(size: int, rng: random.Random):
+    tracks = _synthetic_tracks(size, rng)
+    weights = CohesionCalculator().get_default_feature_weights()
+
+    def run():
+        for track in tracks:
+            AudioFeatureMatcher.calculate_cohesion(
+                track.audio_features, TARGET_FEATURES, weights, source=track.source
+            )
+
+    return run
+
+
+def _setup_outliers(size: int, rng: random.Random):
+    calculator = CohesionCalculator()
+    tracks = _synthetic_tracks(size, rng)
+    weights = calculator.get_default_feature_weights()
+    critical = calculator.get_critical_features(weights)
+    tolerances = calculator.get_tolerance_thresholds()
+    track_scores = {
+        track.track_id: calculator.calculate_track_cohesion(
+            track, TARGET_FEATURES, weights, tolerances
+        )
+        for track in tracks
+    }
+    return lambda: calculator.detect_outliers(tracks, track_scores, critical)
+
+
+def _setup_regional(size: int, rng: random.Random):
+    tracks = _synthetic_tracks(size, rng)
+    pairs = [(track.track_name, track.artists) for track in tracks]
+
+    def run():
+        # Cold cache each run: the memo would otherwise make every repeat trivial
+        RegionalFilter._detect_track_region_cached.cache_clear()
+        for region in RegionalFilter.detect_track_regions(pairs):
+            RegionalFilter.validate_regional_compatibility(
+                region, ["Western"], ["East Asian"]
+            )
+
+    return run
+
+
+def _setup_phase_assigner(size: int, rng: random.Random):
+    tracks = _synthetic_tracks(size, rng)
+    analysis_map = _analysis_map(tracks, rng)
+    assigner = PhaseAssigner()
+    return lambda: assigner.assign_tracks_to_phases(tracks, analysis_map, {})
+
+
+def _setup_phase_sorter(size: int, rng: random.Random):
+    tracks = _synthetic_tracks(size, rng)
+    analysis_map = _analysis_map(tracks, rng)
+    phases = PhaseAssigner().assign_tracks_to_phases(tracks, analysis_map, {})
+    sorter = PhaseSorter()
+
+    def run():
+        for phase, phase_tracks in phases.items():
+            sorter.sort_tracks_within_phase(phase_tracks, analysis_map, phase)
+
+    return run
+
+
+def _setup_cover(size: int, rng: random.Random):
+    generator = CoverImageGenerator(size=size)
+
+    def run():
+        for style in ("diagonal", "radial", "mesh", "waves", "minimal", "modern"):
+            generator.generate_cover("#FF5733", "#33C1FF", "#8D33FF", style)
+
+    return run
+
+
+CASES: Dict[str, Tuple[CaseSetup, List[int]]] = {
+    "deduplicate": (_setup_deduplicate, DEFAULT_SIZES),
+    "diversity": (_setup_diversity, DEFAULT_SIZES),
+    "scoring": (_setup_scoring, DEFAULT_SIZES),
+    "cohesion": (_setup_cohesion, DEFAULT_SIZES),
+    "outliers": (_setup_outliers, DEFAULT_SIZES),
+    "regional": (_setup_regional, DEFAULT_SIZES),
+    "phase_assigner": (_setup_phase_assigner, DEFAULT_SIZES),
+    "phase_sorter": (_setup_phase_sorter, DEFAULT_SIZES),
+    "cover": (_setup_cover, COVER_SIZES),
+}
+
+
+def _calibration_workload() -> int:
+    """Fixed interpreter-bound workload timed next to every case run."""
+    total = 0
+    for i in range(50_000):
+        total += (i * 7) % 13
+    return total
+
+
+def _time_once_ms(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def _measure(fn: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    """Time ``fn`` against the calibration loop.
+
+    ``fn`` is called once to warm up, then up to ``repeats`` times with the
+    garbage collector paused (as ``timeit`` does), each call right after a
+    calibration run.
+
+    Returns:
+        Median wall time in ms, median time relative to the calibration
+        loop, and the spread of that ratio (interquartile range / median)
+    """
+    fn()
+    _calibration_workload()
+    timings: List[float] = []
+    ratios: List[float] = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        deadline = time.perf_counter() + CASE_TIME_BUDGET_S
+        while len(timings) < repeats:
+            calibration_ms = _time_once_ms(_calibration_workload)
+            elapsed_ms = _time_once_ms(fn)
+            timings.append(elapsed_ms)
+            ratios.append(elapsed_ms / calibration_ms)
+            if len(timings) >= MIN_REPEATS and time.perf_counter() > deadline:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    relative = statistics.median(ratios)
+    spread = 0.0
+    if len(ratios) >= 4:
+        q1, _, q3 = statistics.quantiles(ratios, n=4)
+        spread = (q3 - q1) / relative
+    return {
+        "ms": round(statistics.median(timings), 4),
+        "relative": round(relative, 6),
+        "spread": round(spread, 4),
+    }
+
+
+def _run_cases(
+    names: List[str], sizes: Optional[List[int]], repeats: int, seed: int
+) -> Dict[str, Dict[str, float]]:
+    """Run the selected cases and return ``{"case[size]": measurement}``."""
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        setup, default_sizes = CASES[name]
+        for size in sizes if sizes and setup is not _setup_cover else default_sizes:
+            fn = setup(size, random.Random(seed))
+            results[f"{name}[{size}]"] = _measure(fn, repeats)
+    return results
+
+
+def _compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[str]:
+    """Print each case against the baseline and return the regressed keys.
+
+    A case regresses when it is slower than its baseline by more than
+    ``threshold`` and by more than ``SPREAD_TOLERANCE_FACTOR`` times the larger
+    of the spreads measured now and at baseline time.
+    """
+    regressions = []
+
+    print(
+        f"{'case':<22} | {'ms':>10} | {'baseline':>10} | {'change':>8} | {'allowed':>8}"
+    )
+    for key, result in results.items():
+        elapsed_ms = result["ms"]
+        expected = baseline["results"].get(key)
+        if expected is None:
+            print(f"{key:<22} | {elapsed_ms:>10.3f} | {'-':>10} | {'new':>8} |")
+            continue
+
+        # Baseline ratio at this run's calibration speed
+        expected_ms = elapsed_ms * expected["relative"] / result["relative"]
+        tolerance = max(
+            threshold,
+            SPREAD_TOLERANCE_FACTOR * max(expected["spread"], result["spread"]),
+        )
+        change = result["relative"] / expected["relative"] - 1
+        regressed = change > tolerance and elapsed_ms - expected_ms > NOISE_FLOOR_MS
+        if regressed:
+            regressions.append(key)
+        print(
+            f"{key:<22} | {elapsed_ms:>10.3f} | {expected_ms:>10.3f} | "
+            f"{change:>+7.1%} | {tolerance:>7.0%}{' !' if regressed else ''}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="Cases to run")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="Candidate set sizes (default 100-5000)"
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help="Timed runs per case (slow cases stop early after a time budget)",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Minimum allowed slowdown before --check fails (0.25 = 25%%); "
+        "noisy cases get a wider, spread-derived tolerance",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 if any case regressed"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Record this run as baseline"
+    )
+    args = parser.parse_args()
+
+    configure_logging(log_level="ERROR")
+
+    results = _run_cases(args.only or list(CASES), args.sizes, args.repeats, args.seed)
+
+    if args.update_baseline:
+        baseline: Dict[str, Any] = {"results": {}}
+        if args.baseline.exists():
+            # Keep cases not run this time (ratios do not depend on the machine)
+            baseline["results"] = json.loads(args.baseline.read_text())["results"]
+        baseline["results"].update(results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline} ({len(results)} cases)")
+        return
+
+    if not args.baseline.exists():
+        for key, result in results.items():
+            print(
+                f"{key:<22} | {result['ms']:>10.3f} ms (spread {result['spread']:.0%})"
+            )
+        print(f"No baseline at {args.baseline}; run with --update-baseline")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = _compare(results, baseline, args.threshold)
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than baseline by more than "
+            f"their tolerance: {', '.join(regressions)}"
+        )
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark optimal vs greedy phase assignment for the playlist orderer.
+
+Generates synthetic energy analyses, assigns tracks to phases with both the
+Hungarian solver and the greedy best-fit pass, and reports runtime and total
+phase fit (sum of each track's score for the phase it landed in).
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_phase_assignment --sizes 20 30 50 80 --runs 20
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from app.agents.recommender.playlist_orderer.assignment_solver import (
+    calculate_total_phase_fit,
+)
+from app.agents.recommender.playlist_orderer.phase_assigner import PhaseAssigner
+from app.agents.states.agent_state import TrackRecommendation
+
+PHASES = ["opening", "build", "mid", "high", "descent", "closure"]
+
+
+def _synthetic_playlist(size: int, rng: random.Random):
+    """Create recommendations plus an analysis map with random energy profiles."""
+    recommendations: List[TrackRecommendation] = []
+    analysis_map: Dict[str, Dict[str, Any]] = {}
+
+    for i in range(size):
+        track_id = f"track_{i}"
+        recommendations.append(
+            TrackRecommendation(
+                track_id=track_id,
+                track_name=f"Track {i}",
+                artists=[f"Artist {i % 17}"],
+                confidence_score=rng.random(),
+                reasoning="benchmark",
+                source="artist_discovery",
+            )
+        )
+        analysis_map[track_id] = {
+            "track_id": track_id,
+            "energy_level": rng.uniform(10, 95),
+            "momentum": rng.uniform(10, 95),
+            "emotional_intensity": rng.uniform(10, 95),
+            "opening_potential": rng.uniform(20, 90),
+            "closing_potential": rng.uniform(20, 90),
+            "peak_potential": rng.uniform(20, 90),
+            "phase_assignment": rng.choice(PHASES + [None]),
+        }
+
+    return recommendations, analysis_map
+
+
+def _run(assigner: PhaseAssigner, method: str, recommendations, analysis_map):
+    """Run one assignment method and return (elapsed_ms, total_fit)."""
+    distribution = assigner._calculate_phase_distribution({}, len(recommendations))
+    scores = assigner._score_tracks_for_phases(recommendations, analysis_map)
+
+    started = time.perf_counter()
+    if method == "optimal":
+        buckets = assigner._assign_using_optimal_solver(scores, distribution)
+    else:
+        buckets = assigner._assign_using_greedy_best_fit(scores, distribution)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    return elapsed_ms, calculate_total_phase_fit(buckets, scores)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 30, 50, 80])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    assigner = PhaseAssigner()
+
+    print(
+        f"{'tracks':>6} | {'greedy ms':>9} | {'optimal ms':>10} | "
+        f"{'greedy fit':>10} | {'optimal fit':>11} | {'fit gain':>8}"
+    )
+    for size in args.sizes:
+        results = {"greedy": ([], []), "optimal": ([], [])}
+        for _ in range(args.runs):
+            recommendations, analysis_map = _synthetic_playlist(size, rng)
+            for method, (timings, fits) in results.items():
+                elapsed_ms, fit = _run(assigner, method, recommendations, analysis_map)
+                timings.append(elapsed_ms)
+                fits.append(fit)
+
+        greedy_fit = statistics.mean(results["greedy"][1])
+        optimal_fit = statistics.mean(results["optimal"][1])
+        gain = (optimal_fit - greedy_fit) / greedy_fit * 100 if greedy_fit else 0.0
+        print(
+            f"{size:>6} | {statistics.median(results['greedy'][0]):>9.3f} | "
+            f"{statistics.median(results['optimal'][0]):>10.3f} | "
+            f"{greedy_fit:>10.1f} | {optimal_fit:>11.1f} | {gain:>7.2f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
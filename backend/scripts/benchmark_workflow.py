@@ -0,0 +1,442 @@
+"""Benchmark the full recommendation workflow offline against fake upstreams.
+
+Builds the same agents and WorkflowManager as the API, but points every
+Spotify/RecoBeat tool at in-process fakes (seeded catalog, configurable latency
+and 429 injection, optional fixture replay) and wraps a deterministic fake chat
+model in LoggingChatModel. Runs N workflow sessions with bounded concurrency and
+reports throughput, p50/p99 workflow latency and upstream calls per stage (from
+the workflow traces).
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_workflow --sessions 8 --concurrency 4
+    python -m scripts.benchmark_workflow --reccobeat-429-rate 0.05 --llm-latency-ms 400
+    python -m scripts.benchmark_workflow --record-fixtures fixtures/run.jsonl
+    python -m scripts.benchmark_workflow --fixtures fixtures/run.jsonl
+
+The tools' client-side request spacing (minimum intervals between calls, meant
+for the real APIs) is scaled by --throttle-scale, 0.01 by default, so results
+measure the pipeline rather than sleep pacing. Pass --throttle-scale 1.0 to
+reproduce production pacing, e.g. when tuning those intervals against the
+fakes' 429 injection; expect minutes per session.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.agents.core.cache import CacheManager, set_cache_manager
+from app.agents.core.critical_path import analyze_trace
+from app.agents.core.single_flight import get_single_flight_stats
+from app.agents.core.tracing import configure_tracing, tracer
+from app.agents.recommender import (
+    IntentAnalyzerAgent,
+    MoodAnalyzerAgent,
+    OrchestratorAgent,
+    RecommendationGeneratorAgent,
+    SeedGathererAgent,
+)
+from app.agents.recommender.playlist_orderer import PlaylistOrderingAgent
+from app.agents.recommender.utils.config import config
+from app.agents.tools.agent_tools import BaseAPITool, RateLimitedTool
+from app.agents.tools.reccobeat_service import RecoBeatService
+from app.agents.tools.spotify.utils import rate_limiting as spotify_rate_limiting
+from app.agents.tools.spotify_service import SpotifyService
+from app.agents.workflows.workflow_manager import WorkflowConfig, WorkflowManager
+from app.core.llm_wrapper import LoggingChatModel
+from app.core.logging_config import configure_logging
+from app.playlists.services.playlist_describer import PlaylistDescriber
+from app.playlists.services.playlist_namer import PlaylistNamer
+from app.playlists.services.presave_preparer import PresavePreparer
+from scripts.fakes import (
+    FakeCatalog,
+    FakeChatModel,
+    FakeRecoBeatAPI,
+    FakeSpotifyAPI,
+    FixtureStore,
+)
+
+MOOD_PROMPTS = [
+    "late night drive through the city with neon lights",
+    "lazy sunday morning coffee and rain on the window",
+    "high energy workout to push through the last mile",
+    "melancholic autumn walk thinking about old friends",
+    "sunset beach party with friends and warm vibes",
+    "deep focus coding session without distractions",
+    "road trip singalong with the windows down",
+    "cozy evening reading by the fireplace",
+]
+
+UPSTREAMS = ["spotify", "reccobeat", "llm", "cache", "database"]
+
+
+@dataclass
+class SessionResult:
+    session_id: str
+    prompt: str
+    latency_s: float
+    status: str
+    recommendations: int
+    error: Optional[str] = None
+    candidate_reservoir: Optional[Dict[str, Any]] = None
+    quality_evaluation_work: Optional[Dict[str, Any]] = None
+    queue_wait_s: Optional[float] = None
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(q * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def _scale_tool_throttle(tool: RateLimitedTool, scale: float) -> None:
+    """Shrink (or stretch) a tool's client-side request spacing.
+
+    The real tools pace themselves for the production quotas, which dominates
+    wall time against local fakes. Scaling keeps the relative pacing intact.
+    """
+    tool.min_request_interval *= scale
+    tool._scope_min_intervals = {
+        scope: interval * scale for scope, interval in tool._scope_min_intervals.items()
+    }
+    if scale > 0:
+        tool.rate_limit_per_minute = max(1, int(tool.rate_limit_per_minute / scale))
+        tool._scope_rate_limits = {
+            scope: max(1, int(limit / scale))
+            for scope, limit in tool._scope_rate_limits.items()
+        }
+
+
+def _build_pipeline(args, catalog, fixtures, recorder):
+    """Create services, fakes, agents and the WorkflowManager."""
+    common = dict(
+        catalog=catalog,
+        latency_jitter=args.latency_jitter,
+        retry_after_seconds=args.retry_after,
+        fixtures=fixtures,
+        recorder=recorder,
+        seed=args.seed,
+    )
+    spotify_api = FakeSpotifyAPI(
+        latency_ms=args.spotify_latency_ms,
+        rate_limit_probability=args.spotify_429_rate,
+        **common,
+    )
+    reccobeat_api = FakeRecoBeatAPI(
+        latency_ms=args.reccobeat_latency_ms,
+        rate_limit_probability=args.reccobeat_429_rate,
+        **common,
+    )
+
+    reccobeat_service = RecoBeatService()
+    spotify_service = SpotifyService()
+    for service, transport in (
+        (spotify_service, spotify_api),
+        (reccobeat_service, reccobeat_api),
+    ):
+        for name in service.tools.list_tools():
+            tool = service.tools.get_tool(name)
+            if isinstance(tool, BaseAPITool):
+                tool.client = httpx.AsyncClient(transport=transport)
+            if isinstance(tool, RateLimitedTool):
+                _scale_tool_throttle(tool, args.throttle_scale)
+    reccobeat_service.AUDIO_FEATURE_THROTTLE_SECONDS *= args.throttle_scale
+    spotify_rate_limiting._ARTIST_TOP_TRACKS_MIN_INTERVAL *= args.throttle_scale
+
+    fake_llm = FakeChatModel(catalog, latency_ms=args.llm_latency_ms, seed=args.seed)
+    llm = LoggingChatModel(wrapped_llm=fake_llm, provider="fake", enable_logging=False)
+
+    mood_analyzer = MoodAnalyzerAgent(
+        llm=llm, spotify_service=spotify_service, reccobeat_service=reccobeat_service
+    )
+    seed_gatherer = SeedGathererAgent(
+        spotify_service=spotify_service, reccobeat_service=reccobeat_service, llm=llm
+    )
+    recommendation_generator = RecommendationGeneratorAgent(
+        reccobeat_service,
+        spotify_service,
+        max_recommendations=config.max_recommendations,
+    )
+    agents = {
+        "intent_analyzer": IntentAnalyzerAgent(llm=llm),
+        "mood_analyzer": mood_analyzer,
+        "seed_gatherer": seed_gatherer,
+        "recommendation_generator": recommendation_generator,
+        "orchestrator": OrchestratorAgent(
+            mood_analyzer=mood_analyzer,
+            recommendation_generator=recommendation_generator,
+            seed_gatherer=seed_gatherer,
+            llm=llm,
+            max_iterations=config.max_iterations,
+            cohesion_threshold=config.cohesion_threshold,
+        ),
+        "playlist_orderer": PlaylistOrderingAgent(llm=llm),
+    }
+    workflow_config = WorkflowConfig(
+        max_retries=config.max_retries,
+        timeout_per_agent=config.timeout_per_agent,
+        max_recommendations=config.max_recommendations,
+        enable_human_loop=True,
+        require_approval=True,
+        max_concurrent_workflows=args.max_running or args.concurrency,
+        # Every benchmark session runs as the same anonymous user
+        max_queued_per_user=args.sessions,
+    )
+    presave_preparer = PresavePreparer(
+        PlaylistNamer(llm=llm), PlaylistDescriber(llm=llm), cover_style="modern"
+    )
+    manager = WorkflowManager(
+        workflow_config,
+        agents,
+        reccobeat_service.tools,
+        presave_preparer=presave_preparer,
+    )
+
+    if not args.with_db:
+        # Playlist rows only exist when a request came through the API
+        async def skip_playlist_db(session_id, state):
+            return None
+
+        manager.state_manager.update_playlist_db = skip_playlist_db
+
+    return manager, spotify_api, reccobeat_api, fake_llm
+
+
+async def _run_session(manager, prompt: str, semaphore) -> SessionResult:
+    async with semaphore:
+        started = time.perf_counter()
+        # Empty user_id: there is no DB user, so token refresh is skipped
+        session_id = await manager.start_workflow(mood_prompt=prompt, user_id="")
+        state = manager.get_workflow_state(session_id)
+        state.metadata["spotify_access_token"] = "benchmark-token"
+
+        task = manager.active_tasks.get(session_id)
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+        latency = time.perf_counter() - started
+
+    state = manager.get_workflow_state(session_id)
+    return SessionResult(
+        session_id=session_id,
+        prompt=prompt,
+        latency_s=latency,
+        status=state.status.value if state else "missing",
+        recommendations=len(state.recommendations) if state else 0,
+        error=state.error_message if state else None,
+        candidate_reservoir=state.metadata.get("candidate_reservoir")
+        if state
+        else None,
+        quality_evaluation_work=state.metadata.get("quality_evaluation_work")
+        if state
+        else None,
+        queue_wait_s=state.metadata.get("queue_wait_seconds") if state else None,
+    )
+
+
+def _stage_calls(results: List[SessionResult]) -> Dict[str, Dict[str, Any]]:
+    """Mean upstream calls and wall time per stage, per session."""
+    totals: Dict[str, Counter] = defaultdict(Counter)
+    wall_ms: Dict[str, List[float]] = defaultdict(list)
+    workflow_calls: Counter = Counter()
+    traced = 0
+
+    for result in results:
+        profile = analyze_trace(tracer.get_session_spans(result.session_id))
+        if not profile.get("span_count"):
+            continue
+        traced += 1
+
+        staged: Counter = Counter()
+        for stage in profile["stages"]:
+            name = stage["stage"]
+            wall_ms[name].append(stage["wall_time_ms"])
+            totals[name].update(stage["own_calls_by_upstream"])
+            staged.update(stage["own_calls_by_upstream"])
+        for upstream, entry in profile["upstreams"].items():
+            # Calls made outside any agent (workflow-level bookkeeping)
+            remainder = entry["calls"] - staged.get(upstream, 0)
+            if remainder > 0:
+                workflow_calls[upstream] += remainder
+
+    if workflow_calls:
+        totals["(workflow)"] = workflow_calls
+
+    return {
+        name: {
+            "runs_per_session": len(wall_ms.get(name, [])) / traced if traced else 0,
+            "wall_time_ms_p50": _percentile(wall_ms[name], 0.5)
+            if wall_ms.get(name)
+            else None,
+            "calls_per_session": {
+                upstream: round(count / traced, 1) for upstream, count in calls.items()
+            },
+        }
+        for name, calls in totals.items()
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    summary = report["summary"]
+    print(
+        f"\nsessions={summary['sessions']} concurrency={summary['concurrency']} "
+        f"completed={summary['completed']} failed={summary['failed']}"
+    )
+    print(
+        f"wall={summary['wall_time_s']:.2f}s "
+        f"throughput={summary['throughput_per_min']:.2f} workflows/min"
+    )
+    print(
+        f"latency p50={summary['latency_p50_s']:.2f}s "
+        f"p99={summary['latency_p99_s']:.2f}s "
+        f"mean={summary['latency_mean_s']:.2f}s max={summary['latency_max_s']:.2f}s"
+    )
+
+    print(
+        f"\n{'stage':<26} | {'runs':>4} | {'p50 ms':>9} | "
+        + " | ".join(f"{name:>9}" for name in UPSTREAMS)
+    )
+    for name, stage in report["stages"].items():
+        p50 = stage["wall_time_ms_p50"]
+        calls = stage["calls_per_session"]
+        print(
+            f"{name:<26} | {stage['runs_per_session']:>4.1f} | "
+            f"{p50 if p50 is not None else '-':>9} | "
+            + " | ".join(f"{calls.get(upstream, 0):>9}" for upstream in UPSTREAMS)
+        )
+
+    print("\nHTTP requests served (including retries), per session:")
+    for upstream, endpoints in report["endpoints"].items():
+        for endpoint, count in endpoints.items():
+            print(f"  {upstream:<10} {endpoint:<40} {count:>8.1f}")
+    print(f"\nHTTP status counts: {report['status_counts']}")
+    print(f"LLM calls by prompt, per session: {report['llm_calls']}")
+
+
+async def _main(args) -> Dict[str, Any]:
+    # Fresh in-process cache so every run starts equally cold
+    set_cache_manager(CacheManager())
+    configure_tracing(enabled=True, max_traces=max(200, args.sessions))
+
+    catalog = FakeCatalog(seed=args.seed)
+    fixtures = FixtureStore.load(args.fixtures) if args.fixtures else None
+    recorder = FixtureStore() if args.record_fixtures else None
+    manager, spotify_api, reccobeat_api, fake_llm = _build_pipeline(
+        args, catalog, fixtures, recorder
+    )
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    if args.same_prompt:
+        prompts = [MOOD_PROMPTS[0]] * args.sessions
+    else:
+        prompts = [MOOD_PROMPTS[i % len(MOOD_PROMPTS)] for i in range(args.sessions)]
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_run_session(manager, prompt, semaphore) for prompt in prompts)
+    )
+    wall_time = time.perf_counter() - started
+
+    latencies = [result.latency_s for result in results]
+    completed = [result for result in results if result.status == "completed"]
+    sessions = len(results)
+    report = {
+        "summary": {
+            "sessions": sessions,
+            "concurrency": args.concurrency,
+            "completed": len(completed),
+            "failed": sessions - len(completed),
+            "wall_time_s": round(wall_time, 3),
+            "throughput_per_min": round(sessions / wall_time * 60, 3),
+            "latency_p50_s": round(_percentile(latencies, 0.5), 3),
+            "latency_p99_s": round(_percentile(latencies, 0.99), 3),
+            "latency_mean_s": round(statistics.mean(latencies), 3),
+            "latency_max_s": round(max(latencies), 3),
+        },
+        "stages": _stage_calls(results),
+        "endpoints": {
+            "spotify": {
+                endpoint: count / sessions
+                for endpoint, count in spotify_api.calls.most_common()
+            },
+            "reccobeat": {
+                endpoint: count / sessions
+                for endpoint, count in reccobeat_api.calls.most_common()
+            },
+        },
+        "status_counts": dict(spotify_api.status_counts + reccobeat_api.status_counts),
+        "llm_calls": {
+            kind: round(count / sessions, 1)
+            for kind, count in sorted(fake_llm.calls.items())
+        },
+        "fixtures_replayed": spotify_api.replayed + reccobeat_api.replayed,
+        "admission": manager.admission.get_stats(),
+        "stage_coalescing": get_single_flight_stats(),
+        "sessions_detail": [asdict(result) for result in results],
+    }
+
+    if recorder is not None:
+        recorder.save(args.record_fixtures)
+        print(f"Recorded {len(recorder)} exchanges to {args.record_fixtures}")
+
+    await manager.graceful_shutdown(timeout=5)
+    tracer.shutdown()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--max-running",
+        type=int,
+        help="Workflow admission limit (defaults to --concurrency, i.e. no queueing)",
+    )
+    parser.add_argument(
+        "--same-prompt",
+        action="store_true",
+        help="Give every session the same prompt (exercises stage coalescing)",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--spotify-latency-ms", type=float, default=60.0)
+    parser.add_argument("--reccobeat-latency-ms", type=float, default=120.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.3)
+    parser.add_argument("--spotify-429-rate", type=float, default=0.0)
+    parser.add_argument("--reccobeat-429-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--retry-after", type=float, default=1.0, help="Retry-After on injected 429s"
+    )
+    parser.add_argument(
+        "--throttle-scale",
+        type=float,
+        default=0.01,
+        help="Multiplier for the tools' own request spacing; 1.0 keeps production pacing",
+    )
+    parser.add_argument("--fixtures", help="JSONL fixtures to replay before the fakes")
+    parser.add_argument("--record-fixtures", help="Write every exchange to this JSONL")
+    parser.add_argument(
+        "--with-db", action="store_true", help="Keep playlist DB persistence enabled"
+    )
+    parser.add_argument("--json", help="Also write the full report to this file")
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args()
+
+    configure_logging(log_level=args.log_level)
+    report = asyncio.run(_main(args))
+    _print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
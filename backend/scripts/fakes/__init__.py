@@ -0,0 +1,20 @@
+"""Offline stand-ins for the workflow's upstreams, used by the benchmarks."""
+
+from .catalog import GENRES, FakeAlbum, FakeArtist, FakeCatalog, FakeTrack
+from .chat_model import FakeChatModel
+from .fixtures import FixtureStore, RecordingTransport
+from .upstreams import FakeRecoBeatAPI, FakeSpotifyAPI, FakeUpstream
+
+__all__ = [
+    "GENRES",
+    "FakeAlbum",
+    "FakeArtist",
+    "FakeCatalog",
+    "FakeTrack",
+    "FakeChatModel",
+    "FixtureStore",
+    "RecordingTransport",
+    "FakeRecoBeatAPI",
+    "FakeSpotifyAPI",
+    "FakeUpstream",
+]
@@ -0,0 +1,414 @@
+"""Deterministic synthetic music catalog shared by the fake upstream APIs.
+
+Every artist, album and track is derived from a seeded RNG, so two runs with the
+same seed see byte-identical upstream responses. IDs are shaped like the real
+ones: 22-character base62 Spotify IDs and UUID RecoBeat IDs.
+"""
+
+import hashlib
+import random
+import string
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+GENRES = [
+    "indie pop",
+    "indie rock",
+    "dream pop",
+    "synthwave",
+    "nu disco",
+    "french house",
+    "deep house",
+    "lo-fi beats",
+    "neo soul",
+    "r&b",
+    "jazz fusion",
+    "acoustic folk",
+    "post-rock",
+    "alternative rock",
+    "hip hop",
+    "ambient",
+]
+
+_ADJECTIVES = [
+    "Velvet",
+    "Neon",
+    "Quiet",
+    "Golden",
+    "Midnight",
+    "Paper",
+    "Silver",
+    "Hollow",
+    "Electric",
+    "Crimson",
+    "Lunar",
+    "Wild",
+    "Glass",
+    "Static",
+    "Amber",
+    "Northern",
+]
+_NOUNS = [
+    "Harbor",
+    "Echoes",
+    "Parade",
+    "Orchard",
+    "Signal",
+    "Tides",
+    "Lanterns",
+    "Canyon",
+    "Satellites",
+    "Meadow",
+    "Arcade",
+    "Rivers",
+    "Motel",
+    "Horizon",
+    "Foxes",
+    "Garden",
+]
+_TITLE_WORDS = [
+    "Summer",
+    "Rain",
+    "Heart",
+    "Drive",
+    "Light",
+    "Fever",
+    "Nights",
+    "Ocean",
+    "Dance",
+    "Waves",
+    "Home",
+    "Slow",
+    "Fire",
+    "Stars",
+    "Run",
+    "Dreams",
+    "City",
+    "Blue",
+    "Gold",
+    "Alone",
+    "Forever",
+    "Sunset",
+    "Window",
+    "Ghost",
+    "Radio",
+    "Morning",
+]
+
+_BASE62 = string.digits + string.ascii_letters
+
+
+def _spotify_id(*parts: object) -> str:
+    """Derive a stable 22-character base62 ID from arbitrary parts."""
+    digest = int.from_bytes(
+        hashlib.sha256("|".join(map(str, parts)).encode()).digest(), "big"
+    )
+    chars = []
+    for _ in range(22):
+        digest, index = divmod(digest, 62)
+        chars.append(_BASE62[index])
+    return "".join(chars)
+
+
+def _reccobeat_id(spotify_id: str) -> str:
+    """Derive a stable RecoBeat UUID from a Spotify ID."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"reccobeat:{spotify_id}"))
+
+
+@dataclass
+class FakeArtist:
+    """Artist with Spotify and RecoBeat identities."""
+
+    id: str
+    reccobeat_id: str
+    name: str
+    genres: List[str]
+    popularity: int
+    followers: int
+    album_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FakeAlbum:
+    """Album belonging to a single artist."""
+
+    id: str
+    name: str
+    artist_id: str
+    release_date: str
+    track_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FakeTrack:
+    """Track with its audio features."""
+
+    id: str
+    reccobeat_id: str
+    name: str
+    artist_id: str
+    album_id: str
+    track_number: int
+    duration_ms: int
+    popularity: int
+    features: Dict[str, float]
+
+
+class FakeCatalog:
+    """Seeded artists, albums and tracks plus the lookups the fake APIs need."""
+
+    def __init__(
+        self,
+        seed: int = 7,
+        artist_count: int = 240,
+        albums_per_artist: int = 3,
+        tracks_per_album: int = 6,
+    ):
+        """Generate the catalog.
+
+        Args:
+            seed: RNG seed; the same seed always yields the same catalog
+            artist_count: Number of artists
+            albums_per_artist: Albums generated per artist
+            tracks_per_album: Tracks generated per album
+        """
+        self.seed = seed
+        rng = random.Random(seed)
+
+        self.artists: Dict[str, FakeArtist] = {}
+        self.albums: Dict[str, FakeAlbum] = {}
+        self.tracks: Dict[str, FakeTrack] = {}
+        self.tracks_by_reccobeat_id: Dict[str, FakeTrack] = {}
+        self.artists_by_reccobeat_id: Dict[str, FakeArtist] = {}
+        self.artists_by_genre: Dict[str, List[FakeArtist]] = {g: [] for g in GENRES}
+        self._artists_by_name: Dict[str, FakeArtist] = {}
+
+        for index in range(artist_count):
+            name = self._unique_artist_name(rng, index)
+            artist_id = _spotify_id(seed, "artist", index)
+            genres = rng.sample(GENRES, rng.randint(1, 3))
+            artist = FakeArtist(
+                id=artist_id,
+                reccobeat_id=_reccobeat_id(artist_id),
+                name=name,
+                genres=genres,
+                popularity=rng.randint(15, 90),
+                followers=rng.randint(1_000, 5_000_000),
+            )
+            self.artists[artist_id] = artist
+            self.artists_by_reccobeat_id[artist.reccobeat_id] = artist
+            self._artists_by_name[name.lower()] = artist
+            for genre in genres:
+                self.artists_by_genre[genre].append(artist)
+
+            # Artists keep a recognisable sound: features jitter around a profile
+            profile = {
+                "energy": rng.uniform(0.15, 0.95),
+                "danceability": rng.uniform(0.2, 0.9),
+                "valence": rng.uniform(0.1, 0.9),
+                "acousticness": rng.uniform(0.0, 0.9),
+                "tempo": rng.uniform(70, 170),
+            }
+            for album_index in range(albums_per_artist):
+                self._add_album(rng, artist, album_index, tracks_per_album, profile)
+
+    def _unique_artist_name(self, rng: random.Random, index: int) -> str:
+        name = f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)}"
+        if name.lower() in self._artists_by_name:
+            name = f"{name} {index}"
+        return name
+
+    def _add_album(
+        self,
+        rng: random.Random,
+        artist: FakeArtist,
+        album_index: int,
+        track_count: int,
+        profile: Dict[str, float],
+    ) -> None:
+        album_id = _spotify_id(self.seed, "album", artist.id, album_index)
+        album = FakeAlbum(
+            id=album_id,
+            name=" ".join(rng.sample(_TITLE_WORDS, 2)),
+            artist_id=artist.id,
+            release_date=f"{rng.randint(1975, 2024)}-{rng.randint(1, 12):02d}-01",
+        )
+        self.albums[album_id] = album
+        artist.album_ids.append(album_id)
+
+        for number in range(1, track_count + 1):
+            track_id = _spotify_id(self.seed, "track", album_id, number)
+
+            def jitter(value: float, spread: float = 0.12) -> float:
+                return round(
+                    min(1.0, max(0.0, value + rng.uniform(-spread, spread))), 3
+                )
+
+            track = FakeTrack(
+                id=track_id,
+                reccobeat_id=_reccobeat_id(track_id),
+                name=" ".join(rng.sample(_TITLE_WORDS, rng.randint(1, 3))),
+                artist_id=artist.id,
+                album_id=album_id,
+                track_number=number,
+                duration_ms=rng.randint(140_000, 320_000),
+                popularity=max(0, min(100, artist.popularity + rng.randint(-20, 10))),
+                features={
+                    "energy": jitter(profile["energy"]),
+                    "danceability": jitter(profile["danceability"]),
+                    "valence": jitter(profile["valence"]),
+                    "acousticness": jitter(profile["acousticness"]),
+                    "instrumentalness": round(rng.uniform(0.0, 0.6), 3),
+                    "liveness": round(rng.uniform(0.05, 0.4), 3),
+                    "speechiness": round(rng.uniform(0.02, 0.2), 3),
+                    "loudness": round(rng.uniform(-16.0, -3.0), 2),
+                    "tempo": round(profile["tempo"] + rng.uniform(-10, 10), 1),
+                    "key": rng.randint(0, 11),
+                    "mode": rng.randint(0, 1),
+                },
+            )
+            self.tracks[track_id] = track
+            self.tracks_by_reccobeat_id[track.reccobeat_id] = track
+            album.track_ids.append(track_id)
+
+    # ------------------------------------------------------------------ lookups
+
+    def find_track(self, any_id: str) -> Optional[FakeTrack]:
+        """Resolve a Spotify ID, RecoBeat ID, Spotify URI or URL to a track."""
+        key = any_id.rsplit(":", 1)[-1].rsplit("/", 1)[-1]
+        return self.tracks.get(key) or self.tracks_by_reccobeat_id.get(key)
+
+    def find_artist(self, any_id: str) -> Optional[FakeArtist]:
+        """Resolve a Spotify or RecoBeat artist ID."""
+        return self.artists.get(any_id) or self.artists_by_reccobeat_id.get(any_id)
+
+    def artist_by_name(self, name: str) -> Optional[FakeArtist]:
+        return self._artists_by_name.get(name.strip().strip('"').lower())
+
+    def artist_tracks(self, artist: FakeArtist) -> List[FakeTrack]:
+        return [
+            self.tracks[track_id]
+            for album_id in artist.album_ids
+            for track_id in self.albums[album_id].track_ids
+        ]
+
+    def top_tracks(self, artist: FakeArtist, limit: int = 10) -> List[FakeTrack]:
+        tracks = self.artist_tracks(artist)
+        tracks.sort(key=lambda track: (-track.popularity, track.id))
+        return tracks[:limit]
+
+    def search_artists(self, query: str, limit: int) -> List[FakeArtist]:
+        """Resolve a Spotify-style search query (``genre:``/``artist:`` filters)."""
+        text = query.strip()
+        lowered = text.lower()
+
+        if lowered.startswith("genre:"):
+            genre = lowered[len("genre:") :].strip().strip('"')
+            matches = [
+                artist
+                for candidate, artists in self.artists_by_genre.items()
+                if genre in candidate or candidate in genre
+                for artist in artists
+            ]
+            return self._rank(_dedupe(matches), query)[:limit]
+
+        if lowered.startswith("artist:"):
+            lowered = lowered[len("artist:") :]
+
+        exact = self.artist_by_name(lowered)
+        if exact:
+            return [exact]
+
+        matches = [
+            artist
+            for name, artist in self._artists_by_name.items()
+            if name in lowered or lowered in name
+        ]
+        matches += [
+            artist
+            for genre, artists in self.artists_by_genre.items()
+            if genre in lowered
+            for artist in artists
+        ]
+        if not matches:
+            matches = self._sample(list(self.artists.values()), query, limit)
+        return self._rank(_dedupe(matches), query)[:limit]
+
+    def search_tracks(self, query: str, limit: int) -> List[FakeTrack]:
+        """Resolve ``track:X artist:Y`` style and free-text track searches."""
+        lowered = query.lower()
+        artist_name = None
+        if "artist:" in lowered:
+            lowered, artist_name = lowered.split("artist:", 1)
+        title = lowered.replace("track:", "").strip().strip('"')
+
+        if artist_name:
+            artists = self.search_artists(artist_name, 3)
+        else:
+            artists = self.search_artists(title, 5)
+
+        tracks = [track for artist in artists for track in self.artist_tracks(artist)]
+        if title:
+            titled = [track for track in tracks if title in track.name.lower()]
+            tracks = titled or tracks
+        tracks.sort(key=lambda track: (-track.popularity, track.id))
+        return tracks[:limit]
+
+    def recommend(
+        self, seed_ids: Iterable[str], size: int, targets: Dict[str, float]
+    ) -> List[FakeTrack]:
+        """Tracks from the seeds' genres whose features sit closest to the seeds."""
+        seeds = [track for track in map(self.find_track, seed_ids) if track]
+        if not seeds:
+            return []
+
+        genres = {
+            genre for track in seeds for genre in self.artists[track.artist_id].genres
+        }
+        seed_ids_set = {track.id for track in seeds}
+        pool = _dedupe(
+            track
+            for genre in sorted(genres)
+            for artist in self.artists_by_genre[genre]
+            for track in self.artist_tracks(artist)
+            if track.id not in seed_ids_set
+        )
+
+        centre = {
+            name: targets.get(
+                name, sum(track.features[name] for track in seeds) / len(seeds)
+            )
+            for name in ("energy", "danceability", "valence", "acousticness")
+        }
+
+        def distance(track: FakeTrack) -> float:
+            return sum(abs(track.features[name] - centre[name]) for name in centre)
+
+        pool.sort(key=lambda track: (distance(track), track.id))
+        return pool[:size]
+
+    def _rank(self, artists: List[FakeArtist], query: str) -> List[FakeArtist]:
+        salt = _stable_hash(query)
+        return sorted(
+            artists, key=lambda a: (-a.popularity, (_stable_hash(a.id) ^ salt))
+        )
+
+    def _sample(self, items: List, key: str, count: int) -> List:
+        return random.Random(_stable_hash(key)).sample(items, min(count, len(items)))
+
+
+def _stable_hash(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def _dedupe(items: Iterable) -> List:
+    seen = set()
+    unique = []
+    for item in items:
+        if id(item) not in seen:
+            seen.add(id(item))
+            unique.append(item)
+    return unique
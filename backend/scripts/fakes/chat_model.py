@@ -0,0 +1,388 @@
+"""Deterministic chat model standing in for the real LLM behind LoggingChatModel.
+
+Each agent prompt is recognised by a phrase from its template and answered with
+JSON shaped like a well-behaved model's reply, built from the prompt itself
+(the numbered candidate lists, the track IDs to analyse, the target counts) and
+from the synthetic catalog, so downstream searches resolve to real fake artists.
+Scores are hashed from the prompt, so the same prompt always gets the same answer.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from .catalog import GENRES, FakeCatalog
+
+PHASES = ["opening", "build", "mid", "high", "descent", "closure"]
+PHASE_SHARES = [0.08, 0.2, 0.3, 0.22, 0.12, 0.08]
+STREAM_CHUNK_CHARS = 16
+
+
+def _fraction(*parts: object) -> float:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big") / 2**64
+
+
+def _numbered_items(prompt: str, marker: str = "") -> List[int]:
+    """Numbers of the ``N. ...`` list entries (optionally containing a marker)."""
+    return [
+        int(match.group(1))
+        for match in re.finditer(r"^\s*(\d+)\. (.*)$", prompt, re.MULTILINE)
+        if marker in match.group(2)
+    ]
+
+
+def _int_after(prompt: str, label: str, default: int) -> int:
+    match = re.search(re.escape(label) + r"\D*(\d+)", prompt)
+    return int(match.group(1)) if match else default
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that answers the workflow's prompts without any network I/O."""
+
+    catalog: Any
+    latency_ms: float = 0.0
+    seed: int = 7
+    model_name: str = "fake-deterministic"
+    temperature: float = 0.0
+    calls: Dict[str, int] = {}
+
+    def __init__(self, catalog: FakeCatalog, **kwargs):
+        """Initialize the fake model.
+
+        Args:
+            catalog: Catalog used to pick genres and artists for mood analysis
+            **kwargs: ``latency_ms`` per call and ``seed`` for hashed scores
+        """
+        super().__init__(catalog=catalog, calls={}, **kwargs)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-deterministic"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self._result(messages)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._result(messages)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """Stream the same reply in small chunks.
+
+        A fifth of ``latency_ms`` passes before the first chunk and the rest is
+        spread evenly over the output, like a model generating tokens.
+        """
+        message = self._result(messages).generations[0].message
+        content = str(message.content)
+        pieces = [
+            content[start : start + STREAM_CHUNK_CHARS]
+            for start in range(0, len(content), STREAM_CHUNK_CHARS)
+        ] or [""]
+        first_token_s = self.latency_ms / 1000 * 0.2
+        per_chunk_s = self.latency_ms / 1000 * 0.8 / len(pieces)
+
+        if first_token_s > 0:
+            await asyncio.sleep(first_token_s)
+        for index, piece in enumerate(pieces):
+            if index and per_chunk_s > 0:
+                await asyncio.sleep(per_chunk_s)
+            is_last = index == len(pieces) - 1
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content=piece,
+                    usage_metadata=message.usage_metadata if is_last else None,
+                )
+            )
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        kind, responder = self._route(prompt)
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+
+        content = json.dumps(responder(prompt))
+        input_tokens = len(prompt) // 4
+        output_tokens = len(content) // 4
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _route(self, prompt: str) -> Tuple[str, Callable[[str], Dict[str, Any]]]:
+        routes = [
+            ("analyzing user intent", "intent", self._intent),
+            ("expert music curator and audio analyst", "mood", self._mood),
+            ("extract any SPECIFIC TRACK NAMES", "track_extraction", self._no_tracks),
+            (
+                "optimal strategy for selecting ANCHOR",
+                "anchor_strategy",
+                self._anchor_strategy,
+            ),
+            ("Score these track candidates", "anchor_scoring", self._anchor_scores),
+            ("Finalize the selection of ANCHOR", "anchor_final", self._anchor_final),
+            (
+                "Evaluate which artists are culturally",
+                "artist_validation",
+                self._keep_artists,
+            ),
+            (
+                "selecting artists that match a specific mood",
+                "artist_filter",
+                self._select_artists,
+            ),
+            ("Filter these tracks for cultural", "track_filter", self._relevant_tracks),
+            ("Validate whether this artist", "artist_check", self._artist_valid),
+            ("selecting seed tracks", "seed_selection", self._seed_selection),
+            ("STRICT music curator", "quality", self._quality),
+            ("deciding how to improve a playlist", "strategy", self._strategy),
+            ("Determine the optimal ordering strategy", "ordering", self._ordering),
+            ("Analyze the energy characteristics", "track_energy", self._track_energy),
+        ]
+        for marker, kind, responder in routes:
+            if marker in prompt:
+                return kind, responder
+        return "unknown", lambda prompt: {}
+
+    # ------------------------------------------------------------- responders
+
+    def _genres_for(self, prompt: str) -> List[str]:
+        """Two adjacent catalog genres picked from the user's mood text."""
+        match = re.search(r"(?:Now analyze: \"|Analyze this mood: ')(.*)[\"']", prompt)
+        mood = match.group(1) if match else prompt
+        start = int(_fraction(self.seed, "genre", mood) * len(GENRES))
+        return [GENRES[start], GENRES[(start + 1) % len(GENRES)]]
+
+    def _intent(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "intent_type": "mood_variety",
+            "user_mentioned_tracks": [],
+            "user_mentioned_artists": [],
+            "primary_genre": self._genres_for(prompt)[0],
+            "genre_strictness": 0.6,
+            "language_preferences": ["english"],
+            "exclude_regions": [],
+            "allow_obscure_artists": True,
+            "quality_threshold": 0.6,
+            "reasoning": "Mood-driven request without specific artists or tracks.",
+        }
+
+    def _mood(self, prompt: str) -> Dict[str, Any]:
+        genres = self._genres_for(prompt)
+        artists = [
+            artist.name
+            for artist in self.catalog.search_artists(f"genre:{genres[0]}", 4)
+        ]
+        energy = round(0.3 + _fraction(self.seed, "energy", prompt) * 0.5, 2)
+        valence = round(0.2 + _fraction(self.seed, "valence", prompt) * 0.6, 2)
+        return {
+            "mood_interpretation": f"A {genres[0]} mood with {genres[1]} touches",
+            "primary_emotion": "nostalgic",
+            "energy_level": "medium",
+            "target_features": {
+                "energy": [max(0.0, energy - 0.2), min(1.0, energy + 0.2)],
+                "valence": [max(0.0, valence - 0.2), min(1.0, valence + 0.2)],
+                "danceability": [0.3, 0.8],
+                "acousticness": [0.0, 0.7],
+            },
+            "feature_weights": {
+                "energy": 0.9,
+                "valence": 0.8,
+                "danceability": 0.6,
+                "acousticness": 0.4,
+            },
+            "search_keywords": genres,
+            "artist_recommendations": artists,
+            "genre_keywords": genres,
+            "preferred_regions": [],
+            "excluded_regions": [],
+            "excluded_themes": [],
+            "temporal_context": {"is_temporal": False},
+            "color_scheme": {
+                "primary": "#6B9BD1",
+                "secondary": "#B5D16B",
+                "tertiary": "#D16B9B",
+            },
+            "reasoning": "Deterministic benchmark analysis.",
+        }
+
+    def _no_tracks(self, prompt: str) -> Dict[str, Any]:
+        return {"mentioned_tracks": [], "reasoning": "No specific tracks mentioned."}
+
+    def _anchor_strategy(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "anchor_count": 5,
+            "selection_criteria": {
+                "prioritize_user_mentioned": True,
+                "feature_weights": {"energy": 0.9, "valence": 0.8, "danceability": 0.7},
+                "popularity_weight": 0.3,
+                "genre_diversity": True,
+            },
+            "strategy_notes": "Balance feature fit and popularity.",
+        }
+
+    def _anchor_scores(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "track_scores": [
+                {
+                    "track_index": number - 1,
+                    "score": round(0.5 + _fraction(self.seed, prompt, number) * 0.5, 3),
+                    "confidence": 0.8,
+                    "reasoning": "Good feature alignment.",
+                }
+                for number in _numbered_items(prompt, "(Source:")
+            ]
+        }
+
+    def _anchor_final(self, prompt: str) -> Dict[str, Any]:
+        target = _int_after(prompt, "Target number of anchors:", 5)
+        scores = [
+            (float(score), position)
+            for position, (_, score) in enumerate(
+                re.findall(r"^Track (\d+): .* - Score: ([\d.]+)", prompt, re.MULTILINE)
+            )
+        ]
+        ranked = sorted(scores, key=lambda item: (-item[0], item[1]))
+        return {
+            "selected_indices": [position for _, position in ranked[:target]],
+            "selection_reasoning": "Highest scoring candidates.",
+        }
+
+    def _keep_artists(self, prompt: str) -> Dict[str, Any]:
+        numbers = _numbered_items(prompt, "| Genres:")
+        dropped = {n for n in numbers if _fraction(self.seed, "drop", prompt, n) < 0.1}
+        return {
+            "keep_artists": [n for n in numbers if n not in dropped],
+            "filtered_artists": [
+                {"index": n, "name": "", "reason": "Genre mismatch"} for n in dropped
+            ],
+            "summary": f"Kept {len(numbers) - len(dropped)} artists that fit the mood, "
+            f"filtered {len(dropped)} genre mismatches",
+        }
+
+    def _select_artists(self, prompt: str) -> Dict[str, Any]:
+        numbers = _numbered_items(prompt, "- Genres:")
+        return {
+            "selected_artist_indices": numbers[:16],
+            "reasoning": "Closest genre and popularity fit.",
+        }
+
+    def _relevant_tracks(self, prompt: str) -> Dict[str, Any]:
+        numbers = _numbered_items(prompt, "' by ")
+        return {"relevant_tracks": [n - 1 for n in numbers], "filtered_out": []}
+
+    def _artist_valid(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "is_valid": True,
+            "confidence": 0.9,
+            "reasoning": "Genres align with the request.",
+            "match_score": 0.85,
+            "concerns": [],
+        }
+
+    def _seed_selection(self, prompt: str) -> Dict[str, Any]:
+        ideal = _int_after(prompt, "Select approximately", 5)
+        numbers = _numbered_items(prompt, "Track ")
+        return {
+            "selected_indices": numbers[:ideal],
+            "reasoning": "Top ranked candidates with some variety.",
+        }
+
+    def _quality(self, prompt: str) -> Dict[str, Any]:
+        score = round(0.7 + _fraction(self.seed, "quality", prompt) * 0.25, 3)
+        return {
+            "quality_score": score,
+            "meets_expectations": score >= 0.75,
+            "strengths": ["Consistent energy"],
+            "issues": [] if score >= 0.75 else ["A few tracks drift from the mood"],
+            "specific_concerns": [],
+            "reasoning": "Deterministic benchmark evaluation.",
+        }
+
+    def _strategy(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "strategies": ["filter_and_replace", "generate_more"],
+            "reasoning": "Replace outliers, then top up to the target count.",
+        }
+
+    def _ordering(self, prompt: str) -> Dict[str, Any]:
+        total = _int_after(prompt, "Track Count:", 20)
+        counts = [int(total * share) for share in PHASE_SHARES]
+        counts[2] += total - sum(counts)
+        return {
+            "strategy": "classic_build",
+            "reasoning": "Gradual build to a peak, then a gentle landing.",
+            "phase_distribution": dict(zip(PHASES, counts)),
+            "special_considerations": [],
+            "transition_notes": "Keep neighbouring tempos close.",
+        }
+
+    def _track_energy(self, prompt: str) -> Dict[str, Any]:
+        start = prompt.find("Tracks to analyze:")
+        end = prompt.find("Provide energy analysis", start)
+        try:
+            tracks = json.loads(prompt[start + len("Tracks to analyze:") : end])
+        except ValueError:
+            tracks = [
+                {"track_id": track_id}
+                for track_id in re.findall(r'"track_id": "([^"]+)"', prompt)
+            ]
+
+        analyses = []
+        for track in tracks:
+            track_id = track.get("track_id")
+            features = track.get("audio_features") or {}
+            energy = features.get("energy")
+            if energy is None:
+                energy = _fraction(self.seed, "track_energy", track_id)
+            level = round(energy * 100)
+            analyses.append(
+                {
+                    "track_id": track_id,
+                    "track_name": track.get("track_name", ""),
+                    "energy_level": level,
+                    "momentum": level,
+                    "emotional_intensity": round(
+                        (features.get("valence", 0.5) * 50) + level / 2
+                    ),
+                    "opening_potential": max(0, 100 - level),
+                    "closing_potential": max(0, 90 - level),
+                    "peak_potential": level,
+                    "phase_assignment": PHASES[min(5, int(energy * 6))],
+                    "reasoning": "Derived from audio features.",
+                }
+            )
+        return {"track_analyses": analyses}
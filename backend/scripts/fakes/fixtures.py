@@ -0,0 +1,152 @@
+"""Recorded HTTP exchanges that the fake upstreams can replay.
+
+Fixtures are JSONL files with one exchange per line::
+
+    {"method": "GET", "host": "api.spotify.com", "path": "/v1/search",
+     "query": "limit=10&q=genre%3Aindie&type=artist", "status": 200,
+     "headers": {"Retry-After": "1"}, "body": {...}}
+
+Requests are matched on method, host, path and the sorted query string, so a
+recording made against the real APIs (via ``RecordingTransport``) or against the
+synthetic catalog replays byte-for-byte regardless of parameter order.
+"""
+
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+FixtureKey = Tuple[str, str, str, str]
+
+# Never persisted: credentials and per-connection noise
+_DROPPED_HEADERS = {"authorization", "set-cookie", "date", "content-length"}
+
+
+def request_key(request: httpx.Request) -> FixtureKey:
+    """Order-independent identity of a request."""
+    query = urlencode(sorted(request.url.params.multi_items()))
+    return request.method, request.url.host, request.url.path, query
+
+
+class FixtureStore:
+    """In-memory index of recorded exchanges with optional JSONL persistence."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._exchanges: Dict[FixtureKey, List[Dict[str, Any]]] = defaultdict(list)
+        self._replay_cursor: Dict[FixtureKey, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self._exchanges.values())
+
+    @classmethod
+    def load(cls, path: str) -> "FixtureStore":
+        """Read a JSONL fixture file.
+
+        Args:
+            path: File written by ``save`` or by hand
+
+        Returns:
+            Store holding every exchange in the file
+        """
+        store = cls()
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                key = (
+                    exchange["method"].upper(),
+                    exchange["host"],
+                    exchange["path"],
+                    exchange.get("query", ""),
+                )
+                store._exchanges[key].append(exchange)
+        return store
+
+    def save(self, path: str) -> None:
+        """Write every exchange as JSONL."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(path, "w", encoding="utf-8") as handle:
+            for exchanges in self._exchanges.values():
+                for exchange in exchanges:
+                    handle.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+
+    def lookup(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """Replay the recorded response for a request, if there is one.
+
+        Several recordings of the same request (e.g. a 429 followed by a 200) are
+        replayed in order, and the last one repeats once they are exhausted.
+        """
+        key = request_key(request)
+        with self._lock:
+            exchanges = self._exchanges.get(key)
+            if not exchanges:
+                return None
+            cursor = self._replay_cursor[key]
+            self._replay_cursor[key] = cursor + 1
+            exchange = exchanges[min(cursor, len(exchanges) - 1)]
+
+        return httpx.Response(
+            exchange.get("status", 200),
+            headers=exchange.get("headers") or {},
+            json=exchange.get("body"),
+            request=request,
+        )
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Store an exchange; non-JSON bodies are recorded as null."""
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+
+        method, host, path, query = request_key(request)
+        exchange = {
+            "method": method,
+            "host": host,
+            "path": path,
+            "query": query,
+            "status": response.status_code,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+                and name.lower() != "content-type"
+            },
+            "body": body,
+        }
+        with self._lock:
+            self._exchanges[(method, host, path, query)].append(exchange)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass-through transport that records every exchange into a FixtureStore.
+
+    Wrap a real transport (``httpx.AsyncHTTPTransport()``) to capture fixtures
+    from the live APIs once, then replay them offline with the fakes.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, store: FixtureStore):
+        """Initialize the transport.
+
+        Args:
+            inner: Transport that actually serves the requests
+            store: Destination for the recorded exchanges
+        """
+        self.inner = inner
+        self.store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        await response.aread()
+        self.store.record(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
@@ -0,0 +1,491 @@
+"""Local stand-ins for the Spotify Web API and the RecoBeat API.
+
+Both fakes are ``httpx`` transports: install them on the tools' existing
+``AsyncClient`` instances and every request the workflow makes is answered
+in-process from the synthetic catalog (or from replayed fixtures), after a
+configurable latency and with optional 429 injection.
+"""
+
+import asyncio
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+import httpx
+
+from .catalog import FakeAlbum, FakeArtist, FakeCatalog, FakeTrack
+from .fixtures import FixtureStore, request_key
+
+Handler = Callable[[httpx.Request, re.Match], Tuple[int, Any]]
+
+# Injected 429s never hit the same request more than this many times in a row,
+# so the tools' retry budget (3 attempts) always gets through eventually.
+MAX_CONSECUTIVE_429 = 2
+
+
+class FakeUpstream(httpx.AsyncBaseTransport):
+    """Base transport: routing, latency, 429 injection, fixtures and counters."""
+
+    host: str = ""
+
+    def __init__(
+        self,
+        catalog: FakeCatalog,
+        latency_ms: float = 0.0,
+        latency_jitter: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        retry_after_seconds: float = 1.0,
+        fixtures: Optional[FixtureStore] = None,
+        recorder: Optional[FixtureStore] = None,
+        seed: int = 7,
+    ):
+        """Initialize the fake API.
+
+        Args:
+            catalog: Synthetic catalog answering the requests
+            latency_ms: Mean simulated round-trip time per request
+            latency_jitter: Relative latency spread (0.2 = +/-20%)
+            rate_limit_probability: Chance that a request is answered with a 429
+            retry_after_seconds: Retry-After header sent with injected 429s
+            fixtures: Recorded exchanges replayed before falling back to the catalog
+            recorder: Store that receives every exchange served
+            seed: Seed for latency jitter and 429 injection
+        """
+        self.catalog = catalog
+        self.latency_ms = latency_ms
+        self.latency_jitter = latency_jitter
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after_seconds = retry_after_seconds
+        self.fixtures = fixtures
+        self.recorder = recorder
+        self.seed = seed
+
+        self.calls: Counter = Counter()
+        self.status_counts: Counter = Counter()
+        self.replayed = 0
+        self._attempts: Counter = Counter()
+        self._consecutive_429: Counter = Counter()
+        self._routes: List[Tuple[str, Pattern, str, Handler]] = []
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        raise NotImplementedError
+
+    def route(self, method: str, template: str, handler: Handler) -> None:
+        """Register a handler for a path template such as ``/artists/{id}``."""
+        pattern = re.compile(
+            "^" + re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template)) + "$"
+        )
+        self._routes.append((method, pattern, template, handler))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        attempt = self._attempts[key]
+        self._attempts[key] += 1
+
+        await asyncio.sleep(self._latency_seconds(key, attempt))
+
+        response, template = self._respond(request, key, attempt)
+        self.calls[f"{request.method} {template}"] += 1
+        self.status_counts[response.status_code] += 1
+        if self.recorder is not None:
+            self.recorder.record(request, response)
+        return response
+
+    def _respond(
+        self, request: httpx.Request, key: Tuple, attempt: int
+    ) -> Tuple[httpx.Response, str]:
+        path = self._route_path(request)
+        matched = self._match(request.method, path)
+        template = matched[0] if matched else path
+
+        if self._should_rate_limit(key, attempt):
+            self._consecutive_429[key] += 1
+            return (
+                httpx.Response(
+                    429,
+                    headers={"Retry-After": f"{self.retry_after_seconds:g}"},
+                    json={
+                        "error": {"status": 429, "message": "API rate limit exceeded"}
+                    },
+                    request=request,
+                ),
+                template,
+            )
+        self._consecutive_429[key] = 0
+
+        if self.fixtures is not None:
+            replayed = self.fixtures.lookup(request)
+            if replayed is not None:
+                self.replayed += 1
+                return replayed, template
+
+        if not matched:
+            return self._error(request, 404, f"No fake route for {path}"), template
+
+        _, handler, match = matched
+        status, body = handler(request, match)
+        if status >= 400:
+            return self._error(request, status, body), template
+        return httpx.Response(status, json=body, request=request), template
+
+    def _route_path(self, request: httpx.Request) -> str:
+        return request.url.path
+
+    def _match(self, method: str, path: str):
+        for route_method, pattern, template, handler in self._routes:
+            if route_method == method:
+                match = pattern.match(path)
+                if match:
+                    return template, handler, match
+        return None
+
+    def _fraction(self, *parts: object) -> float:
+        """Deterministic value in [0, 1) so runs replay identically."""
+        digest = hashlib.blake2b(
+            "|".join(map(str, (self.seed, *parts))).encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big") / 2**64
+
+    def _latency_seconds(self, key: Tuple, attempt: int) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        spread = (self._fraction("latency", key, attempt) * 2 - 1) * self.latency_jitter
+        return max(0.0, self.latency_ms * (1 + spread)) / 1000
+
+    def _should_rate_limit(self, key: Tuple, attempt: int) -> bool:
+        if self.rate_limit_probability <= 0:
+            return False
+        if self._consecutive_429[key] >= MAX_CONSECUTIVE_429:
+            return False
+        return self._fraction("429", key, attempt) < self.rate_limit_probability
+
+    def _error(
+        self, request: httpx.Request, status: int, message: Any
+    ) -> httpx.Response:
+        return httpx.Response(
+            status,
+            json={"error": {"status": status, "message": str(message)}},
+            request=request,
+        )
+
+    @staticmethod
+    def _ids(request: httpx.Request) -> List[str]:
+        """``ids`` as sent by either API: repeated params or comma-joined."""
+        return [
+            value
+            for raw in request.url.params.get_list("ids")
+            for value in raw.split(",")
+            if value
+        ]
+
+    @staticmethod
+    def _int_param(request: httpx.Request, name: str, default: int) -> int:
+        try:
+            return int(request.url.params.get(name, default))
+        except ValueError:
+            return default
+
+
+class FakeSpotifyAPI(FakeUpstream):
+    """The subset of the Spotify Web API the recommendation workflow calls."""
+
+    host = "api.spotify.com"
+
+    def _route_path(self, request: httpx.Request) -> str:
+        path = request.url.path
+        return path[len("/v1") :] if path.startswith("/v1") else path
+
+    def _register_routes(self) -> None:
+        self.route("GET", "/search", self._search)
+        self.route("GET", "/me", self._me)
+        self.route("GET", "/me/top/tracks", self._top_tracks)
+        self.route("GET", "/me/top/artists", self._top_artists)
+        self.route("GET", "/me/playlists", self._my_playlists)
+        self.route("GET", "/artists", self._several_artists)
+        self.route("GET", "/artists/{id}", self._artist)
+        self.route("GET", "/artists/{id}/top-tracks", self._artist_top_tracks)
+        self.route("GET", "/artists/{id}/albums", self._artist_albums)
+        self.route("GET", "/albums", self._several_albums)
+        self.route("GET", "/albums/{id}/tracks", self._album_tracks)
+        self.route("GET", "/tracks", self._several_tracks)
+        self.route("GET", "/tracks/{id}", self._track)
+        self.route("POST", "/users/{id}/playlists", self._create_playlist)
+        self.route("POST", "/playlists/{id}/tracks", self._playlist_snapshot)
+        self.route("PUT", "/playlists/{id}/tracks", self._playlist_snapshot)
+        self.route("DELETE", "/playlists/{id}/tracks", self._playlist_snapshot)
+
+    # ---------------------------------------------------------------- objects
+
+    def _artist_json(self, artist: FakeArtist) -> Dict[str, Any]:
+        return {
+            "id": artist.id,
+            "name": artist.name,
+            "uri": f"spotify:artist:{artist.id}",
+            "genres": artist.genres,
+            "popularity": artist.popularity,
+            "followers": {"total": artist.followers},
+            "images": [],
+        }
+
+    def _album_json(self, album: FakeAlbum) -> Dict[str, Any]:
+        artist = self.catalog.artists[album.artist_id]
+        return {
+            "id": album.id,
+            "name": album.name,
+            "uri": f"spotify:album:{album.id}",
+            "album_type": "album",
+            "release_date": album.release_date,
+            "total_tracks": len(album.track_ids),
+            "artists": [self._artist_ref(artist)],
+            "images": [],
+        }
+
+    def _artist_ref(self, artist: FakeArtist) -> Dict[str, Any]:
+        return {
+            "id": artist.id,
+            "name": artist.name,
+            "uri": f"spotify:artist:{artist.id}",
+        }
+
+    def _track_json(self, track: FakeTrack, with_album: bool = True) -> Dict[str, Any]:
+        data = {
+            "id": track.id,
+            "name": track.name,
+            "uri": f"spotify:track:{track.id}",
+            "duration_ms": track.duration_ms,
+            "popularity": track.popularity,
+            "explicit": False,
+            "preview_url": None,
+            "track_number": track.track_number,
+            "disc_number": 1,
+            "artists": [self._artist_ref(self.catalog.artists[track.artist_id])],
+            "external_urls": {"spotify": f"https://open.spotify.com/track/{track.id}"},
+        }
+        if with_album:
+            data["album"] = self._album_json(self.catalog.albums[track.album_id])
+        return data
+
+    # --------------------------------------------------------------- handlers
+
+    def _search(self, request, match):
+        params = request.url.params
+        query = params.get("q", "")
+        limit = self._int_param(request, "limit", 20)
+        types = params.get("type", "track").split(",")
+        body: Dict[str, Any] = {}
+        if "artist" in types:
+            artists = self.catalog.search_artists(query, limit)
+            body["artists"] = {
+                "items": [self._artist_json(a) for a in artists],
+                "total": len(artists),
+            }
+        if "track" in types:
+            tracks = self.catalog.search_tracks(query, limit)
+            body["tracks"] = {
+                "items": [self._track_json(t) for t in tracks],
+                "total": len(tracks),
+            }
+        return 200, body
+
+    def _me(self, request, match):
+        return 200, {
+            "id": "benchmark_user",
+            "display_name": "Benchmark User",
+            "country": "US",
+            "product": "premium",
+        }
+
+    def _favourite_artists(self, limit: int) -> List[FakeArtist]:
+        return self.catalog.search_artists("benchmark_user", limit)
+
+    def _top_tracks(self, request, match):
+        limit = self._int_param(request, "limit", 20)
+        tracks = [
+            track
+            for artist in self._favourite_artists(limit)
+            for track in self.catalog.top_tracks(artist, 2)
+        ][:limit]
+        return 200, {
+            "items": [self._track_json(t) for t in tracks],
+            "total": len(tracks),
+        }
+
+    def _top_artists(self, request, match):
+        artists = self._favourite_artists(self._int_param(request, "limit", 20))
+        return 200, {
+            "items": [self._artist_json(a) for a in artists],
+            "total": len(artists),
+        }
+
+    def _my_playlists(self, request, match):
+        return 200, {"items": [], "total": 0}
+
+    def _several_artists(self, request, match):
+        artists = [self.catalog.find_artist(i) for i in self._ids(request)]
+        return 200, {"artists": [self._artist_json(a) if a else None for a in artists]}
+
+    def _artist(self, request, match):
+        artist = self.catalog.find_artist(match["id"])
+        if not artist:
+            return 404, "Artist not found"
+        return 200, self._artist_json(artist)
+
+    def _artist_top_tracks(self, request, match):
+        artist = self.catalog.find_artist(match["id"])
+        if not artist:
+            return 404, "Artist not found"
+        tracks = self.catalog.top_tracks(artist)
+        return 200, {"tracks": [self._track_json(t) for t in tracks]}
+
+    def _artist_albums(self, request, match):
+        artist = self.catalog.find_artist(match["id"])
+        if not artist:
+            return 404, "Artist not found"
+        limit = self._int_param(request, "limit", 20)
+        albums = [self.catalog.albums[a] for a in artist.album_ids][:limit]
+        return 200, {
+            "items": [self._album_json(a) for a in albums],
+            "total": len(albums),
+        }
+
+    def _album_with_tracks(self, album: FakeAlbum) -> Dict[str, Any]:
+        data = self._album_json(album)
+        data["tracks"] = {
+            "items": [
+                self._track_json(self.catalog.tracks[t], with_album=False)
+                for t in album.track_ids
+            ]
+        }
+        return data
+
+    def _several_albums(self, request, match):
+        albums = [self.catalog.albums.get(i) for i in self._ids(request)]
+        return 200, {
+            "albums": [self._album_with_tracks(a) if a else None for a in albums]
+        }
+
+    def _album_tracks(self, request, match):
+        album = self.catalog.albums.get(match["id"])
+        if not album:
+            return 404, "Album not found"
+        return 200, self._album_with_tracks(album)["tracks"]
+
+    def _several_tracks(self, request, match):
+        tracks = [self.catalog.find_track(i) for i in self._ids(request)]
+        return 200, {"tracks": [self._track_json(t) if t else None for t in tracks]}
+
+    def _track(self, request, match):
+        track = self.catalog.find_track(match["id"])
+        if not track:
+            return 404, "Track not found"
+        return 200, self._track_json(track)
+
+    def _create_playlist(self, request, match):
+        playlist_id = f"bench{self.calls['POST /users/{id}/playlists']:018d}"
+        return 201, {
+            "id": playlist_id,
+            "uri": f"spotify:playlist:{playlist_id}",
+            "snapshot_id": "snapshot-0",
+            "external_urls": {
+                "spotify": f"https://open.spotify.com/playlist/{playlist_id}"
+            },
+        }
+
+    def _playlist_snapshot(self, request, match):
+        return 201, {"snapshot_id": f"snapshot-{sum(self.calls.values())}"}
+
+
+class FakeRecoBeatAPI(FakeUpstream):
+    """The RecoBeat endpoints used for recommendations, ID lookup and features."""
+
+    host = "api.reccobeats.com"
+
+    def _register_routes(self) -> None:
+        self.route("GET", "/v1/track/recommendation", self._recommendation)
+        self.route("GET", "/v1/track", self._several_tracks)
+        self.route("GET", "/v1/track/{id}/audio-features", self._audio_features)
+        self.route("GET", "/v1/artist/search", self._artist_search)
+        self.route("GET", "/v1/artist", self._several_artists)
+        self.route("GET", "/v1/artist/{id}/track", self._artist_tracks)
+
+    def _artist_json(self, artist: FakeArtist) -> Dict[str, Any]:
+        return {
+            "id": artist.reccobeat_id,
+            "name": artist.name,
+            "href": f"https://open.spotify.com/artist/{artist.id}",
+        }
+
+    def _track_json(self, track: FakeTrack) -> Dict[str, Any]:
+        return {
+            "id": track.reccobeat_id,
+            "trackTitle": track.name,
+            "artists": [self._artist_json(self.catalog.artists[track.artist_id])],
+            "durationMs": track.duration_ms,
+            "isrc": f"QZ{track.id[:10].upper()}",
+            "href": f"https://open.spotify.com/track/{track.id}",
+            "availableCountries": "US,GB,DE,FR,CA,AU",
+            "popularity": track.popularity,
+        }
+
+    def _page(self, request, items: List[Dict[str, Any]], default_size: int):
+        page = self._int_param(request, "page", 0)
+        size = self._int_param(request, "size", default_size)
+        return {
+            "content": items[page * size : (page + 1) * size],
+            "page": page,
+            "size": size,
+            "totalElements": len(items),
+            "totalPages": (len(items) + size - 1) // size if size else 0,
+        }
+
+    def _recommendation(self, request, match):
+        params = request.url.params
+        seeds = [s for raw in params.get_list("seeds") for s in raw.split(",") if s]
+        size = self._int_param(request, "size", 20)
+        targets = {}
+        for name in ("energy", "danceability", "valence", "acousticness"):
+            if name in params:
+                try:
+                    targets[name] = float(params[name])
+                except ValueError:
+                    pass
+
+        tracks = self.catalog.recommend(seeds, size, targets)
+        content = []
+        for rank, track in enumerate(tracks):
+            item = self._track_json(track)
+            item["relevanceScore"] = round(1.0 - rank / max(len(tracks), 1) * 0.5, 3)
+            content.append(item)
+        return 200, {"content": content}
+
+    def _several_tracks(self, request, match):
+        tracks = [self.catalog.find_track(i) for i in self._ids(request)]
+        return 200, {"content": [self._track_json(t) for t in tracks if t]}
+
+    def _audio_features(self, request, match):
+        track = self.catalog.find_track(match["id"])
+        if not track:
+            return 404, "Track not found"
+        return 200, {
+            "id": track.reccobeat_id,
+            "href": f"https://open.spotify.com/track/{track.id}",
+            **track.features,
+        }
+
+    def _artist_search(self, request, match):
+        text = request.url.params.get("searchText", "")
+        artists = self.catalog.search_artists(text, 50)
+        return 200, self._page(request, [self._artist_json(a) for a in artists], 25)
+
+    def _several_artists(self, request, match):
+        artists = [self.catalog.find_artist(i) for i in self._ids(request)]
+        return 200, {"content": [self._artist_json(a) for a in artists if a]}
+
+    def _artist_tracks(self, request, match):
+        artist = self.catalog.find_artist(match["id"])
+        if not artist:
+            return 404, "Artist not found"
+        tracks = [self._track_json(t) for t in self.catalog.artist_tracks(artist)]
+        return 200, self._page(request, tracks, 25)